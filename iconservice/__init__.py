@@ -11,20 +11,70 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Package for objects which are related with Icon Services"""
-
-from abc import ABCMeta, abstractmethod, ABC
-from functools import wraps
-from inspect import isfunction
-
-from iconcommons.logger import Logger
-
-from .base.address import Address, AddressPrefix, ZERO_SCORE_ADDRESS
-from .base.exception import IconScoreException
-from .icon_constant import IconServiceFlag
-from .iconscore.icon_container_db import VarDB, DictDB, ArrayDB
-from .iconscore.icon_score_base import interface, eventlog, external, payable, IconScoreBase, IconScoreDatabase
-from .iconscore.icon_score_base2 import (InterfaceScore, revert, sha3_256, json_loads, json_dumps,
-                                         get_main_prep_info, get_sub_prep_info, recover_key,
-                                         create_address_with_key, create_interface_score)
-from .iconscore.icon_system_score_base import IconSystemScoreBase
+"""Package for objects which are related with Icon Services
+
+SCORE APIs exported here are imported on first access,
+so that importing a submodule like iconservice.base.address does not load the whole SCORE runtime.
+"""
+
+import sys
+from importlib import import_module
+
+# name: module which has the name
+# Names in the relative modules are allowed to be imported explicitly by SCOREs
+SCORE_API_MODULES = {
+    "ABCMeta": "abc",
+    "abstractmethod": "abc",
+    "ABC": "abc",
+    "wraps": "functools",
+    "isfunction": "inspect",
+    "Logger": "iconcommons.logger",
+    "Address": ".base.address",
+    "AddressPrefix": ".base.address",
+    "ZERO_SCORE_ADDRESS": ".base.address",
+    "IconScoreException": ".base.exception",
+    "IconServiceFlag": ".icon_constant",
+    "VarDB": ".iconscore.icon_container_db",
+    "DictDB": ".iconscore.icon_container_db",
+    "ArrayDB": ".iconscore.icon_container_db",
+    "interface": ".iconscore.icon_score_base",
+    "eventlog": ".iconscore.icon_score_base",
+    "external": ".iconscore.icon_score_base",
+    "payable": ".iconscore.icon_score_base",
+    "IconScoreBase": ".iconscore.icon_score_base",
+    "IconScoreDatabase": ".iconscore.icon_score_base",
+    "InterfaceScore": ".iconscore.icon_score_base2",
+    "revert": ".iconscore.icon_score_base2",
+    "sha3_256": ".iconscore.icon_score_base2",
+    "json_loads": ".iconscore.icon_score_base2",
+    "json_dumps": ".iconscore.icon_score_base2",
+    "get_main_prep_info": ".iconscore.icon_score_base2",
+    "get_sub_prep_info": ".iconscore.icon_score_base2",
+    "recover_key": ".iconscore.icon_score_base2",
+    "create_address_with_key": ".iconscore.icon_score_base2",
+    "create_interface_score": ".iconscore.icon_score_base2",
+    "IconSystemScoreBase": ".iconscore.icon_system_score_base",
+}
+
+__all__ = tuple(SCORE_API_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = SCORE_API_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache it not to call __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported before python 3.7
+    for _name in __all__:
+        __getattr__(_name)
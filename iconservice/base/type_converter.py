@@ -15,7 +15,7 @@
 # limitations under the License.
 
 from copy import deepcopy
-from typing import Union, Any, get_type_hints
+from typing import Union, Any, Optional, get_type_hints
 
 from .address import Address, MalformedAddress, is_icon_address_valid
 from .exception import InvalidParamsException
@@ -286,6 +286,17 @@ class TypeConverter:
             value = TypeConverter._convert_bytes_reverse(value)
         return value
 
+    @staticmethod
+    def convert_value_reverse(key: Optional[str], value: Any) -> Any:
+        """Convert a scalar value like convert_type_reverse() without modifying its container
+
+        :param key: the key of value in dict, None in list
+        :param value:
+        """
+        if isinstance(value, bytes):
+            return TypeConverter._convert_bytes_reverse(value, key in HASH_TYPE_TABLE)
+        return TypeConverter.convert_type_reverse(value)
+
     @staticmethod
     def _convert_bytes_reverse(value: bytes, is_hash: bool = False):
         if is_hash:
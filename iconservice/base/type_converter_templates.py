@@ -60,6 +60,7 @@ class ParamType(IntEnum):
     IISS_GET_MAIN_PREP_LIST = 712
     IISS_GET_PREP_LIST = 713
     IISS_SET_GOVERNANCE_VARIABLES = 714
+    IISS_QUERY_ISCORE_BATCH = 715
 
 
 class ValueType(IntEnum):
@@ -92,6 +93,7 @@ class ConstantKeys:
 
     NAME = "name"
     ADDRESS = "address"
+    ADDRESSES = "addresses"
     BALANCE = "balance"
 
     METHOD = "method"
@@ -358,6 +360,10 @@ type_convert_templates[ParamType.IISS_CLAIM_ISCORE] = {}
 
 type_convert_templates[ParamType.IISS_QUERY_ISCORE] = type_convert_templates[ParamType.IISS_GET_STAKE]
 
+type_convert_templates[ParamType.IISS_QUERY_ISCORE_BATCH] = {
+    ConstantKeys.ADDRESSES: [ValueType.ADDRESS]
+}
+
 type_convert_templates[ParamType.IISS_REG_PREP] = {
     ConstantKeys.NAME: ValueType.STRING,
     ConstantKeys.COUNTRY: ValueType.STRING,
@@ -15,9 +15,10 @@
 # limitations under the License.
 
 
+from array import array
 from collections import OrderedDict, namedtuple
 from collections.abc import MutableMapping
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 from iconcommons.logger import Logger
 
@@ -25,6 +26,7 @@ from ..base.exception import DatabaseException, AccessDeniedException
 from ..utils import sha3_256
 
 from ..base.block import Block
+from ..icon_constant import DATA_BYTE_ORDER
 from ..icx import IcxStorage
 
 
@@ -184,3 +186,81 @@ class BlockBatch(Batch):
     def clear(self) -> None:
         self.block = None
         super().clear()
+
+
+class RewardCalcBatch(object):
+    """Contains the rc_db entries of a transaction or a block
+
+    Entries are encoded on append and kept in a single bytearray with an offset index
+    so that they are not encoded again on commit.
+    The keys of indexed entries are suffixed with a sequential index when they are iterated.
+    """
+    def __init__(self):
+        self._buffer = bytearray()
+        # The end offsets of the key and the value of each entry in _buffer
+        self._key_ends = array("Q")
+        self._value_ends = array("Q")
+        self._indexed = array("B")
+        self._indexed_count = 0
+
+    def __len__(self) -> int:
+        return len(self._value_ends)
+
+    @property
+    def indexed_count(self) -> int:
+        return self._indexed_count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buffer)
+
+    def append(self, key: bytes, value: bytes, indexed: bool = False):
+        """
+        :param key: the key or the key prefix of an indexed entry
+        :param value:
+        :param indexed: if True, a sequential index is appended to the key on iteration
+        """
+        buffer: bytearray = self._buffer
+        buffer += key
+        self._key_ends.append(len(buffer))
+        buffer += value
+        self._value_ends.append(len(buffer))
+
+        self._indexed.append(indexed)
+        self._indexed_count += indexed
+
+    def extend(self, batch: 'RewardCalcBatch'):
+        offset: int = len(self._buffer)
+        self._buffer += batch._buffer
+        self._key_ends.extend(end + offset for end in batch._key_ends)
+        self._value_ends.extend(end + offset for end in batch._value_ends)
+        self._indexed.extend(batch._indexed)
+        self._indexed_count += batch._indexed_count
+
+    def clear(self):
+        self._buffer = bytearray()
+        self._key_ends = array("Q")
+        self._value_ends = array("Q")
+        self._indexed = array("B")
+        self._indexed_count = 0
+
+    def items(self, last_index: int = -1) -> Iterator[Tuple[bytes, bytes]]:
+        """Iterates (key, value) in the order of appending
+
+        :param last_index: indexed entries get the indices from last_index + 1
+        """
+        index: int = last_index
+        view = memoryview(self._buffer)
+        start: int = 0
+
+        try:
+            for key_end, value_end, indexed in zip(self._key_ends, self._value_ends, self._indexed):
+                key: bytes = view[start:key_end].tobytes()
+                if indexed:
+                    index += 1
+                    key += index.to_bytes(8, DATA_BYTE_ORDER)
+
+                yield key, view[key_end:value_end].tobytes()
+                start = value_end
+        finally:
+            view.release()
@@ -204,6 +204,11 @@ class ContextDatabase(object):
         """
         context_type = context.type
 
+        # Record the keys read while processing a query for QueryCache
+        read_keys: Optional[set] = context.read_keys
+        if read_keys is not None:
+            read_keys.add(key)
+
         if context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
             return self.key_value_db.get(key)
         else:
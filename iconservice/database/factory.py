@@ -19,8 +19,9 @@ import os
 from enum import IntEnum
 
 from ..base.address import Address
-from ..icon_constant import ICON_DEX_DB_NAME
+from ..icon_constant import ICON_DEX_DB_NAME, WRITE_BEHIND_LOG_DIR
 from .db import KeyValueDatabase, ContextDatabase
+from .write_behind import WriteBehindDatabase
 
 
 class ContextDatabaseFactory(object):
@@ -32,19 +33,35 @@ class ContextDatabaseFactory(object):
     _state_db_root_path: str = None
     _mode: 'Mode' = Mode.SINGLE_DB
     _shared_context_db: 'ContextDatabase' = None
+    # Batches are applied to the shared db in the background if it is positive
+    _write_behind_block_count: int = 0
+    _write_behind_size: int = 0
 
     @classmethod
-    def open(cls, state_db_root_path: str, mode: 'Mode'):
+    def open(cls,
+             state_db_root_path: str,
+             mode: 'Mode',
+             write_behind_block_count: int = 0,
+             write_behind_size: int = 0):
         cls.close()
 
         cls._state_db_root_path = state_db_root_path
         cls._mode = mode
+        cls._write_behind_block_count = write_behind_block_count
+        cls._write_behind_size = write_behind_size
 
     @classmethod
     def get_shared_db(cls) -> ContextDatabase:
         if cls._shared_context_db is None:
             path = os.path.join(cls._state_db_root_path, ICON_DEX_DB_NAME)
-            key_value_db = KeyValueDatabase.from_path(path)
+            if cls._write_behind_block_count > 0:
+                key_value_db = WriteBehindDatabase.from_path(
+                    path,
+                    log_dir=os.path.join(cls._state_db_root_path, WRITE_BEHIND_LOG_DIR),
+                    max_block_count=cls._write_behind_block_count,
+                    max_size=cls._write_behind_size)
+            else:
+                key_value_db = KeyValueDatabase.from_path(path)
             cls._shared_context_db = ContextDatabase(
                 key_value_db, is_shared=True)
 
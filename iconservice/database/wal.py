@@ -12,16 +12,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from enum import Flag, auto
+from enum import Flag, IntEnum, auto
 
 from ..icon_constant import DATA_BYTE_ORDER
-from ..iiss.reward_calc.msg_data import TxData
 from ..iiss.reward_calc.storage import Storage, get_rc_version
 from ..utils.msgpack_for_db import MsgPackForDB
 
 __all__ = ("WriteAheadLogWriter", "WriteAheadLogReader", "WALogable", "StateWAL", "IissWAL", "WALState")
 
+import mmap
 import struct
+import zlib
 from abc import ABCMeta
 from typing import Optional, Tuple, Iterable, List
 import os
@@ -33,23 +34,36 @@ from ..base.block import Block
 from ..base.exception import AccessDeniedException, InvalidParamsException
 from ..base.exception import InternalServiceErrorException, IllegalFormatException
 from ..utils import bytes_to_hex
-from ..database.batch import BlockBatch, TransactionBatchValue
+from ..database.batch import BlockBatch, RewardCalcBatch, TransactionBatchValue
 
 
 TAG = "WAL"
 _MAGIC_KEY = b"IWAL"
-_FILE_VERSION = 1
-_HEADER_SIZE = 52
-_HEADER_STRUCT_FORMAT = ">4sIII32sI"
+_FILE_VERSION = 2
+# WAL files written before records have their own checksums
+_LEGACY_FILE_VERSION = 1
+_HEADER_STRUCT_FORMAT = ">4sII32s"
+_HEADER_SIZE = struct.calcsize(_HEADER_STRUCT_FORMAT) + 4
+_LEGACY_HEADER_SIZE = 52
+_LEGACY_HEADER_STRUCT_FORMAT = ">4sIII32sI"
+_RECORD_HEADER_STRUCT_FORMAT = ">BI"
+_RECORD_HEADER_SIZE = struct.calcsize(_RECORD_HEADER_STRUCT_FORMAT)
+_FEED_CHUNK_SIZE = 1024 * 1024
 
 # FILE OFFSET
 _OFFSET_MAGIC_KEY = 0
 _OFFSET_VERSION = _OFFSET_MAGIC_KEY + 4
 _OFFSET_REVISION = _OFFSET_VERSION + 4
-_OFFSET_STATE = _OFFSET_REVISION + 4
-_OFFSET_INSTANT_BLOCK_HASH = _OFFSET_STATE + 4
-_OFFSET_LOG_COUNT = _OFFSET_INSTANT_BLOCK_HASH + 32
-_OFFSET_LOG_START_OFFSETS = _OFFSET_LOG_COUNT + 4
+_OFFSET_INSTANT_BLOCK_HASH = _OFFSET_REVISION + 4
+_OFFSET_RECORDS = _HEADER_SIZE
+_OFFSET_LEGACY_LOG_COUNT = 48
+
+
+class _RecordType(IntEnum):
+    BLOCK = 1
+    LOG = 2
+    # State transition appended whenever a phase of commit is done
+    STATE = 3
 
 
 class WALState(Flag):
@@ -71,6 +85,9 @@ def tx_batch_value_to_bytes(tx_batch_value: 'TransactionBatchValue') -> Optional
 
 
 class WALogable(metaclass=ABCMeta):
+    # msgpack-encoded entries which have been written to WAL, reused not to encode them again
+    encoded: Optional[bytes] = None
+
     def __iter__(self) -> Tuple[bytes, Optional[bytes]]:
         pass
 
@@ -88,8 +105,8 @@ class StateWAL(WALogable):
 
 
 class IissWAL(WALogable):
-    def __init__(self, rc_batch: list, tx_index: int, revision: int = -1):
-        self._rc_batch: list = rc_batch
+    def __init__(self, rc_batch: 'RewardCalcBatch', tx_index: int, revision: int = -1):
+        self._rc_batch: 'RewardCalcBatch' = rc_batch
         self._tx_index: int = tx_index
         # If revision is not -1, should put revision and version to rc db
         self._revision: int = revision
@@ -120,14 +137,9 @@ class IissWAL(WALogable):
             value: bytes = MsgPackForDB.dumps([self._version, self._revision])
             yield key, value
 
-        for iiss_data in self._rc_batch:
-            if isinstance(iiss_data, TxData):
-                tx_index += 1
-                key: bytes = iiss_data.make_key(tx_index)
-            else:
-                key: bytes = iiss_data.make_key()
-            value: bytes = iiss_data.make_value()
-            yield key, value
+        # Entries have been encoded on put and TxData keys are suffixed with tx_index here
+        yield from self._rc_batch.items(tx_index)
+        tx_index += self._rc_batch.indexed_count
 
         if tx_index > self._tx_index:
             key: bytes = Storage.KEY_FOR_GETTING_LAST_TRANSACTION_INDEX
@@ -148,9 +160,13 @@ def _bytes_to_uint32(data: bytes):
 class WriteAheadLogWriter(object):
     """Write write-ahead-logging for block, state_db and rc_db on commit
 
-    | magic_key(4) | version(4) | revision(4) | state(4) | instant_block_hash(32) |
-    | data count(4) | log start address_0 (4) | log start address_1 (4) | ...
-    | block data size(4) | block data | size(4) | data | size(4) | data | ...
+    | magic_key(4) | version(4) | revision(4) | instant_block_hash(32) | crc32(4) |
+    | record | record | ...
+
+    record: | type(1) | size(4) | data(size) | crc32(4) |
+    The first record is the block and the logs follow it.
+    A state record is appended every time when a phase of commit is done,
+    so only one fsync is needed before applying the logs to dbs.
 
     Every number is written in big endian format
     """
@@ -171,6 +187,7 @@ class WriteAheadLogWriter(object):
         self._instant_block_hash = instant_block_hash
         self._block = block
         self._fp = None
+        self._packer = msgpack.Packer(autoreset=False)
 
         Logger.debug(tag=TAG, msg="__init__() end")
 
@@ -187,23 +204,18 @@ class WriteAheadLogWriter(object):
             raise
 
     def _write_header(self) -> int:
-        values = [
+        data: bytes = struct.pack(
+            _HEADER_STRUCT_FORMAT,
             self._magic_key,
             self._version,
             self._revision,
-            self._state,
-            self._instant_block_hash,
-            self._log_count
-        ]
-
-        for _ in range(self._max_log_count):
-            values.append(0)
-
-        struct_format = _HEADER_STRUCT_FORMAT + "I" * self._max_log_count
-        data: bytes = struct.pack(struct_format, *values)
-        return self._fp.write(data)
+            self._instant_block_hash
+        )
+        return self._fp.write(data) + self._write_uint32(zlib.crc32(data))
 
     def flush(self):
+        """Make the records written so far durable
+        """
         fp = self._fp
 
         if fp:
@@ -216,65 +228,63 @@ class WriteAheadLogWriter(object):
             self._fp = None
 
     def _write_block(self) -> int:
-        block = self._block
-
-        data: bytes = block.to_bytes(self._revision)
-        self._write_uint32(len(data))
-        ret = self._fp.write(data) + 4
-
-        return ret
+        data: bytes = self._block.to_bytes(self._revision)
+        return self._write_record(_RecordType.BLOCK, data)
 
     def write_walogable(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
-        self._fp.seek(0, 2)
-        start_offset: int = self._fp.tell()
+        """Encode the entries into the buffer of one packer and write them as a log record
 
-        size = 0
-        self._write_uint32(size)
+        The encoded entries are kept in WALogable to be reused
+        """
+        if self._log_count >= self._max_log_count:
+            raise InternalServiceErrorException(f"Too many logs: max_log_count={self._max_log_count}")
 
-        for key, value in it:
-            size += self._write_key_value(key, value)
-
-        # Return to the WALogable start offset, writing its data size
-        self._fp.seek(-size - 4, 1)
-        self._write_uint32(size)
+        packer = self._packer
+        try:
+            for key, value in it:
+                assert isinstance(key, bytes)
+                packer.pack_array_header(2)
+                packer.pack(key)
+                packer.pack(value)
 
-        self._write_log_start_offset(self._log_count, start_offset)
-        self._write_log_count()
+            data: bytes = packer.bytes()
+        finally:
+            packer.reset()
 
-        return size
+        self._write_record(_RecordType.LOG, data)
+        self._log_count += 1
 
-    def _write_key_value(self, key: bytes, value: bytes) -> int:
-        assert isinstance(key, bytes)
+        if isinstance(it, WALogable):
+            it.encoded = data
 
-        data: bytes = msgpack.packb([key, value])
-        size = self._fp.write(data)
-        assert size == len(data)
+        return len(data)
 
-        return size
+    def write_state(self, state: int, add: bool = False, sync: bool = False):
+        """Append the state record
 
-    def write_state(self, state: int, add: bool = False):
-        offset = _OFFSET_STATE
+        It is passed to OS without fsync, which is enough for the process to crash.
+        If the record is lost by power failure, recovery applies the logs again.
 
+        :param state:
+        :param add: add state to the current state
+        :param sync: fsync the record
+        """
         if add:
             state |= self._state
 
-        self._fp.seek(offset, 0)
-        self._write_uint32(state)
+        self._write_record(_RecordType.STATE, _uint32_to_bytes(state))
         self._state = state
 
-    def _write_log_count(self) -> int:
-        offset = _OFFSET_LOG_COUNT
-        self._log_count += 1
-
-        self._fp.seek(offset, 0)
-        data: bytes = _uint32_to_bytes(self._log_count)
-        return self._fp.write(data)
+        if sync:
+            self.flush()
+        else:
+            self._fp.flush()
 
-    def _write_log_start_offset(self, index: int, start_offset: int) -> int:
-        offset = _OFFSET_LOG_START_OFFSETS + index * 4
-        self._fp.seek(offset, 0)
+    def _write_record(self, record_type: '_RecordType', data: bytes) -> int:
+        header: bytes = struct.pack(_RECORD_HEADER_STRUCT_FORMAT, record_type, len(data))
+        crc32: int = zlib.crc32(data, zlib.crc32(header))
 
-        return self._write_uint32(start_offset)
+        return self._fp.write(header) + self._fp.write(data) + self._write_uint32(crc32)
 
     def _write_uint32(self, value: int) -> int:
         return self._fp.write(_uint32_to_bytes(value))
@@ -287,6 +297,10 @@ class WriteAheadLogWriter(object):
 class WriteAheadLogReader(object):
     """Read data from a write ahead log file
 
+    The file is memory-mapped and records are parsed from memoryview slices without copies.
+    Records are read until the first torn or corrupted one,
+    which is regarded as not written before a crash.
+    Iterators of logs do not share any file position, so they can be used on different threads at once
     """
 
     def __init__(self):
@@ -294,12 +308,14 @@ class WriteAheadLogReader(object):
         self._version: int = 0
         self._revision: int = 0
         self._state: int = 0
-        self._log_count: int = 0
-        self._log_start_offsets: Optional[List[int]] = None
+        # (start offset, size) of each log
+        self._logs: List[Tuple[int, int]] = []
         self._instant_block_hash: bytes = b""
         self._block: Optional['Block'] = None
 
         self._fp = None
+        self._mm: Optional[mmap.mmap] = None
+        self._buffer: Optional[memoryview] = None
 
     @property
     def magic_key(self) -> Optional[bytes]:
@@ -327,90 +343,132 @@ class WriteAheadLogReader(object):
 
     @property
     def log_count(self) -> int:
-        return self._log_count
+        return len(self._logs)
 
     def __str__(self):
         return f"version={self._version}, " \
                f"state={self._state}, " \
                f"instant_block_hash={bytes_to_hex(self._instant_block_hash)}, " \
-               f"log_count={self._log_count}, " \
+               f"log_count={self.log_count}, " \
                f"block={self._block}"
 
     def open(self, path: str):
         self._fp = open(path, "rb")
-        self._read_header()
-        self._read_block()
+
+        if os.fstat(self._fp.fileno()).st_size < _HEADER_SIZE:
+            raise IllegalFormatException(f"Out of data: {path}")
+
+        self._mm = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mm)
+
+        if self._read_header() == _LEGACY_FILE_VERSION:
+            self._read_legacy_logs()
+        else:
+            self._read_records()
 
     def close(self):
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
         if self._fp:
             self._fp.close()
             self._fp = None
 
-    def _read_header(self):
-        data: bytes = self._fp.read(_HEADER_SIZE)
-        self._check_bytes_data(data, _HEADER_SIZE)
-
-        magic_key, version, revision, state, instant_block_hash, log_count = \
-            struct.unpack_from(_HEADER_STRUCT_FORMAT, data)
+    def _read_header(self) -> int:
+        buffer: memoryview = self._buffer
+        magic_key, version, revision, instant_block_hash = struct.unpack_from(_HEADER_STRUCT_FORMAT, buffer)
 
         if magic_key != _MAGIC_KEY:
-            raise IllegalFormatException(f"Invalid magic key: {bytes_to_hex(data)}")
+            raise IllegalFormatException(f"Invalid magic key: {bytes_to_hex(magic_key)}")
 
-        if version != _FILE_VERSION:
+        if version == _LEGACY_FILE_VERSION:
+            self._check_size(0, _LEGACY_HEADER_SIZE)
+            _, _, revision, self._state, instant_block_hash, _ = \
+                struct.unpack_from(_LEGACY_HEADER_STRUCT_FORMAT, buffer)
+        elif version != _FILE_VERSION:
             raise IllegalFormatException(
                 f"Invalid version: Actual({version}) != Expected({_FILE_VERSION})")
+        elif zlib.crc32(buffer[:_HEADER_SIZE - 4]) != self._read_uint32(_HEADER_SIZE - 4):
+            raise IllegalFormatException(f"Invalid header checksum: {bytes_to_hex(buffer[:_HEADER_SIZE])}")
 
         self._magic_key = magic_key
         self._version = version
         self._revision = revision
-        self._state = state
-        self._log_count = log_count
         self._instant_block_hash = instant_block_hash
-        self._log_start_offsets = []
 
-        for _ in range(self._log_count):
-            offset = self._read_uint32()
-            self._log_start_offsets.append(offset)
+        return version
 
-    def _read_block(self):
-        size: int = self._read_uint32()
-        data: bytes = self._fp.read(size)
-        self._check_bytes_data(data, size)
+    def _read_records(self):
+        buffer: memoryview = self._buffer
+        offset: int = _OFFSET_RECORDS
 
-        self._block = Block.from_bytes(data)
+        while offset + _RECORD_HEADER_SIZE <= len(buffer):
+            record_type, size = struct.unpack_from(_RECORD_HEADER_STRUCT_FORMAT, buffer, offset)
+            data_offset: int = offset + _RECORD_HEADER_SIZE
+            end: int = data_offset + size
 
-    def _read_uint32(self) -> int:
-        size = 4
-        data: bytes = self._fp.read(size)
-        self._check_bytes_data(data, size)
+            if end + 4 > len(buffer) or zlib.crc32(buffer[offset:end]) != self._read_uint32(end):
+                Logger.warning(tag=TAG, msg=f"Torn or corrupted WAL record: offset={offset}")
+                break
 
-        return _bytes_to_uint32(data)
+            if record_type == _RecordType.LOG:
+                self._logs.append((data_offset, size))
+            elif record_type == _RecordType.BLOCK and self._block is None:
+                self._block = Block.from_bytes(bytes(buffer[data_offset:end]))
+            elif record_type == _RecordType.STATE and self._block is not None:
+                self._state = self._read_uint32(data_offset)
+            else:
+                raise IllegalFormatException(f"Invalid record type: {record_type}")
 
-    def get_iterator(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
-        self._seek_to_log_start_offset(index)
-        size: int = self._read_uint32()
+            if self._block is None:
+                raise IllegalFormatException("Block is not the first record")
 
-        unpacker = msgpack.Unpacker(use_list=False, raw=True)
+            offset = end + 4
 
-        while size > 0:
-            size_to_read = min(size, 16384)
-            data: bytes = self._fp.read(size_to_read)
-            self._check_bytes_data(data, size_to_read)
+        if self._block is None:
+            raise IllegalFormatException("No block in WAL")
 
-            size -= size_to_read
+    def _read_legacy_logs(self):
+        log_count: int = self._read_uint32(_OFFSET_LEGACY_LOG_COUNT)
+        offset: int = _LEGACY_HEADER_SIZE
+        log_start_offsets: List[int] = []
+        for _ in range(log_count):
+            log_start_offsets.append(self._read_uint32(offset))
+            offset += 4
 
-            unpacker.feed(data)
-            for key, value in unpacker:
-                yield key, value
+        size: int = self._read_uint32(offset)
+        self._check_size(offset + 4, size)
+        self._block = Block.from_bytes(bytes(self._buffer[offset + 4:offset + 4 + size]))
 
-    def _seek_to_log_start_offset(self, index: int):
-        offset = self._log_start_offsets[index]
-        self._fp.seek(offset, 0)
+        for offset in log_start_offsets:
+            size: int = self._read_uint32(offset)
+            self._check_size(offset + 4, size)
+            self._logs.append((offset + 4, size))
 
-    @classmethod
-    def _check_bytes_data(cls, data: bytes, size: int):
-        if not isinstance(data, bytes):
-            raise IllegalFormatException("Data is not bytes")
+    def _read_uint32(self, offset: int) -> int:
+        self._check_size(offset, 4)
+        return _bytes_to_uint32(self._buffer[offset:offset + 4])
 
-        if len(data) != size:
-            raise IllegalFormatException(f"Out of data: data_size({len(data)}) != size_to_read({size})")
+    def _check_size(self, offset: int, size: int):
+        if offset + size > len(self._buffer):
+            raise IllegalFormatException(
+                f"Out of data: data_size({len(self._buffer) - offset}) != size_to_read({size})")
+
+    def get_iterator(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
+        offset, size = self._logs[index]
+        end: int = offset + size
+
+        unpacker = msgpack.Unpacker(use_list=False, raw=True)
+
+        # The mapped buffer is fed in chunks not to hold the whole log in the buffer of unpacker
+        while offset < end:
+            chunk_end: int = min(end, offset + _FEED_CHUNK_SIZE)
+            with self._buffer[offset:chunk_end] as chunk:
+                unpacker.feed(chunk)
+            offset = chunk_end
+
+            for key, value in unpacker:
+                yield key, value
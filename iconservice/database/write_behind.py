@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("WriteBehindDatabase",)
+
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import msgpack
+import plyvel
+from iconcommons.logger import Logger
+
+from .db import KeyValueDatabase
+from .wal import WALogable
+from ..icon_constant import DATA_BYTE_ORDER
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+TAG = "WRITE_BEHIND"
+_LOG_FILE_SUFFIX = ".log"
+
+
+class WriteBehindDatabase(KeyValueDatabase):
+    """KeyValueDatabase which applies batches to LevelDB on the background
+
+    A batch is appended to the log file and kept in the overlay which is looked up prior to LevelDB.
+    Batches are applied to LevelDB at once every max_block_count batches or max_size bytes,
+    and then a new log file is started and the old one is removed.
+
+    The log files left on open are applied to LevelDB again in order.
+    It is idempotent because every log entry has the whole value of a key.
+
+    log record: | size(4) | msgpack([key, value]) * n | crc32(4) |
+    """
+
+    def __init__(self, db: plyvel.DB, log_dir: str, max_block_count: int, max_size: int) -> None:
+        super().__init__(db)
+
+        self._log_dir: str = log_dir
+        self._max_block_count: int = max_block_count
+        self._max_size: int = max_size
+
+        # Guard the overlay against the background worker which removes the applied values
+        self._lock = threading.Lock()
+        # key: (value, index of the log file where the value is written)
+        self._overlay: Dict[bytes, Tuple[Optional[bytes], int]] = {}
+        # Batches written to the current log file
+        self._batches: List[List[Tuple[bytes, Optional[bytes]]]] = []
+        self._block_count: int = 0
+        self._size: int = 0
+
+        self._log_index: int = 0
+        self._fp = None
+        self._packer = msgpack.Packer(autoreset=False)
+        self._executor = ThreadPoolExecutor(1)
+        self._future: Optional['Future'] = None
+        # The exception raised on the background worker
+        self._error: Optional[BaseException] = None
+
+        os.makedirs(log_dir, exist_ok=True)
+        self._recover()
+
+    @staticmethod
+    def from_path(path: str,
+                  create_if_missing: bool = True,
+                  log_dir: str = "",
+                  max_block_count: int = 1,
+                  max_size: int = 0) -> 'WriteBehindDatabase':
+        """
+
+        :param path: db path
+        :param create_if_missing:
+        :param log_dir: directory where the log files are written
+        :param max_block_count: the number of batches to be applied at once
+        :param max_size: the bytes of batches to be applied at once, 0 means no limit
+        :return: WriteBehindDatabase instance
+        """
+        db = plyvel.DB(path, create_if_missing=create_if_missing)
+        return WriteBehindDatabase(db, log_dir, max_block_count, max_size)
+
+    @property
+    def pending_block_count(self) -> int:
+        return self._block_count
+
+    def get(self, key: bytes) -> bytes:
+        entry: Optional[Tuple[Optional[bytes], int]] = self._overlay.get(key)
+        if entry is not None:
+            return entry[0]
+
+        return self._db.get(key)
+
+    def put(self, key: bytes, value: bytes) -> None:
+        self._write([(key, value)], None)
+
+    def delete(self, key: bytes) -> None:
+        self._write([(key, None)], None)
+
+    def write_batch(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
+        """Append a batch of a block to the log and apply the pending batches if they are enough
+
+        :param it: iterable which return tuple(key, value)
+            The entries encoded to WAL are written to the log as they are
+        :return: the number of key-value pairs written
+        """
+        if it is None:
+            return 0
+
+        encoded: Optional[bytes] = it.encoded if isinstance(it, WALogable) else None
+        size: int = self._write(list(it), encoded)
+        self._block_count += 1
+
+        if self._block_count >= self._max_block_count or 0 < self._max_size <= self._size:
+            self._apply_in_background()
+
+        return size
+
+    def iterator(self) -> iter:
+        # LevelDB iterator cannot see the overlay
+        self.flush()
+        return super().iterator()
+
+    def get_sub_db(self, prefix: bytes) -> 'KeyValueDatabase':
+        """Return a prefixed database of LevelDB after applying the pending batches
+
+        It is only used to iterate the state at the moment
+        """
+        self.flush()
+        return super().get_sub_db(prefix)
+
+    def flush(self):
+        """Apply all pending batches to LevelDB and wait for it
+        """
+        if self._batches:
+            self._apply_in_background()
+
+        future: Optional['Future'] = self._future
+        if future is not None:
+            future.result()
+            self._future = None
+
+    def close(self) -> None:
+        if self._db is None:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+            self._close_log()
+            super().close()
+
+    def _write(self, batch: List[Tuple[bytes, Optional[bytes]]], encoded: Optional[bytes]) -> int:
+        if self._fp is None:
+            self._fp = open(self._get_log_path(self._log_index), "ab")
+
+        packer = self._packer
+        for i, (key, value) in enumerate(batch):
+            # An empty value is regarded as deletion like KeyValueDatabase.write_batch()
+            if not value:
+                value = None
+                batch[i] = (key, value)
+
+            if encoded is None:
+                packer.pack_array_header(2)
+                packer.pack(key)
+                packer.pack(value)
+
+        if encoded is None:
+            data: bytes = packer.bytes()
+            packer.reset()
+        else:
+            data: bytes = encoded
+
+        with self._lock:
+            for key, value in batch:
+                self._overlay[key] = (value, self._log_index)
+
+        # Passed to OS without fsync like the write to LevelDB which it replaces
+        fp = self._fp
+        fp.write(len(data).to_bytes(4, DATA_BYTE_ORDER))
+        fp.write(data)
+        fp.write(zlib.crc32(data).to_bytes(4, DATA_BYTE_ORDER))
+        fp.flush()
+
+        self._batches.append(batch)
+        self._size += len(data)
+
+        return len(batch)
+
+    def _apply_in_background(self):
+        future: Optional['Future'] = self._future
+        if future is not None and future.done():
+            self._future = None
+            # Raise the exception of the previous job not to go further with the state not applied
+            future.result()
+
+        batches, log_index = self._batches, self._log_index
+
+        self._close_log()
+        self._batches = []
+        self._block_count = 0
+        self._size = 0
+        self._log_index += 1
+
+        # The previous job is done first on the single worker, so batches are applied in order
+        self._future = self._executor.submit(self._apply, batches, log_index)
+
+    def _apply(self, batches: List[List[Tuple[bytes, Optional[bytes]]]], log_index: int):
+        """Apply the batches written to a log file to LevelDB and remove the log file
+
+        It is called on the background worker
+        """
+        Logger.debug(tag=TAG, msg=f"_apply() start: log_index={log_index}, batches={len(batches)}")
+
+        if self._error is not None:
+            # Not to apply the later batches without the earlier ones
+            raise self._error
+
+        try:
+            self._write_to_db(batches)
+        except BaseException as e:
+            # The log file is left to apply the batches again on the next open
+            Logger.error(tag=TAG, msg=f"Failed to apply batches: log_index={log_index}, {e}")
+            self._error = e
+            raise
+
+        with self._lock:
+            for batch in batches:
+                for key, _ in batch:
+                    entry = self._overlay.get(key)
+                    # Keep the value overwritten after this log file
+                    if entry is not None and entry[1] == log_index:
+                        del self._overlay[key]
+
+        os.remove(self._get_log_path(log_index))
+
+        Logger.debug(tag=TAG, msg="_apply() end")
+
+    def _write_to_db(self, batches: Iterable[Iterable[Tuple[bytes, Optional[bytes]]]]):
+        with self._db.write_batch() as wb:
+            for batch in batches:
+                for key, value in batch:
+                    if value:
+                        wb.put(key, value)
+                    else:
+                        wb.delete(key)
+
+    def _recover(self):
+        """Apply the batches in the log files left by the last run
+        """
+        log_indices: List[int] = sorted(
+            int(name[:-len(_LOG_FILE_SUFFIX)])
+            for name in os.listdir(self._log_dir) if name.endswith(_LOG_FILE_SUFFIX)
+        )
+
+        for log_index in log_indices:
+            path: str = self._get_log_path(log_index)
+            Logger.info(tag=TAG, msg=f"Recover state_db: {path}")
+
+            with open(path, "rb") as f:
+                self._write_to_db(_read_log(f))
+            os.remove(path)
+
+        if log_indices:
+            self._log_index = log_indices[-1] + 1
+
+    def _close_log(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def _get_log_path(self, log_index: int) -> str:
+        return os.path.join(self._log_dir, f"{log_index:010d}{_LOG_FILE_SUFFIX}")
+
+
+def _read_log(f) -> Iterable[List[Tuple[bytes, Optional[bytes]]]]:
+    """Read batches from a log file until the first torn or corrupted one
+    """
+    while True:
+        header: bytes = f.read(4)
+        if len(header) < 4:
+            break
+
+        size: int = int.from_bytes(header, DATA_BYTE_ORDER)
+        data: bytes = f.read(size)
+        crc32: bytes = f.read(4)
+        if len(data) < size or len(crc32) < 4 or zlib.crc32(data) != int.from_bytes(crc32, DATA_BYTE_ORDER):
+            Logger.warning(tag=TAG, msg=f"Torn or corrupted log record: {f.name}")
+            break
+
+        unpacker = msgpack.Unpacker(use_list=False, raw=True)
+        unpacker.feed(data)
+        yield list(unpacker)
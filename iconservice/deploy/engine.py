@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING
 
 from iconcommons import Logger
 from .icon_score_deployer import IconScoreDeployer
-from .utils import remove_path, get_score_path
+from .utils import get_score_path
 from ..base.ComponentBase import EngineBase
 from ..base.address import Address
 from ..base.address import ZERO_SCORE_ADDRESS
@@ -136,9 +136,8 @@ class Engine(EngineBase):
         if content_type == 'application/tbears':
             if not context.legacy_tbears_mode:
                 raise InvalidParamsException(f'Invalid contentType: application/tbears')
-        elif content_type == 'application/zip':
-            data['content'] = bytes.fromhex(data['content'][2:])
-        else:
+        elif content_type != 'application/zip':
+            # The hex string content of application/zip is decoded while being written to filesystem
             raise InvalidParamsException(
                 f'Invalid contentType: {content_type}')
 
@@ -244,13 +243,13 @@ class Engine(EngineBase):
 
     @staticmethod
     def _write_score_to_score_deploy_path(context: 'IconScoreContext',
-                                          score_address: 'Address', tx_hash: bytes, content: bytes):
+                                          score_address: 'Address', tx_hash: bytes, content: str):
         """Write SCORE code to file system
 
         :param context: IconScoreContext instance
         :param score_address: score address
         :param tx_hash: transaction hash
-        :param content: zipped SCORE code data
+        :param content: hex string of zipped SCORE code data with 0x prefix
         :return:
         """
         revision: int = context.revision
@@ -259,13 +258,7 @@ class Engine(EngineBase):
         score_root_path: str = context.score_root_path
         score_deploy_path: str = get_score_deploy_path(score_root_path, score_address, tx_hash)
 
-        if revision >= Revision.THREE.value:
-            # If the path to deploy a score has been present, remove it before deploying.
-            score_root_path: str = context.score_root_path
-            score_path: str =\
-                os.path.join(score_root_path, score_address.to_bytes().hex(), f'0x{tx_hash.hex()}')
-            remove_path(score_path)
-
+        # If the path to deploy a score has been present, IconScoreDeployer replaces it
         if revision >= Revision.TWO.value:
             IconScoreDeployer.deploy(score_deploy_path, content, revision)
         else:
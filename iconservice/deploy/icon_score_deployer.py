@@ -16,47 +16,118 @@
 
 import io
 import os
+import re
 import shutil
+import tempfile
 import zipfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Union
 
 from ..base.exception import InvalidPackageException
 from ..icon_constant import Revision, PACKAGE_JSON_FILE
 
+# The number of hex digits decoded at once
+HEX_CHUNK_SIZE = 64 * 1024
+
+HEX_STRING_PATTERN = re.compile(r'[0-9a-fA-F]*')
+
 
 class IconScoreDeployer(object):
 
     @staticmethod
-    def deploy(path: str, data: bytes, revision: int = 0):
+    def deploy(path: str, data: Union[bytes, str], revision: int = 0):
         """Deploy SCORE; Stores SCORE on the root path
 
         :param path: the path of directory where score is deployed
-        :param data: Bytes of the zip file.
+        :param data: Bytes of the zip file or its hex string with 0x prefix
         :param revision: Revision num
         """
-        shutil.rmtree(path, ignore_errors=True)
-        os.makedirs(path)
+        IconScoreDeployer._deploy(
+            path, data, lambda zip_file: IconScoreDeployer._extract_files_gen(zip_file, revision))
+
+    @staticmethod
+    def _deploy(path: str, data: Union[bytes, str], extract_files_gen: callable):
+        """Extracts SCORE files to a staging directory and moves it to the path
+
+        The path has either no SCORE files or all of them at any time.
+
+        :param path: the path of directory where score is deployed
+        :param data: Bytes of the zip file or its hex string with 0x prefix
+        :param extract_files_gen: generator function which yields files to extract from a zip file
+        """
+        staging_path = f'{path}.staging'
+        shutil.rmtree(staging_path, ignore_errors=True)
+        os.makedirs(staging_path)
+
+        try:
+            with IconScoreDeployer._open_zip_file(data, os.path.dirname(staging_path)) as zip_file:
+                for name, file_info, parent_dir in extract_files_gen(zip_file):
+                    os.makedirs(os.path.join(staging_path, parent_dir), exist_ok=True)
+                    with file_info as file_info_context, open(os.path.join(staging_path, name), 'wb') as dest:
+                        shutil.copyfileobj(file_info_context, dest)
+        except BaseException:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            raise
+
+        # A directory which is not empty can't be replaced by rename, so the path is missing
+        # between the two renames below. It is not atomic but nothing reads the path then:
+        # SCORE is loaded from it only after the block which deploys it is committed,
+        # and if the process stops in between, the path is written again when the block is invoked again
+        old_path = f'{path}.old'
+        shutil.rmtree(old_path, ignore_errors=True)
+        if os.path.exists(path):
+            os.rename(path, old_path)
+        os.rename(staging_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+
+    @staticmethod
+    @contextmanager
+    def _open_zip_file(data: Union[bytes, str], tmp_dir: str) -> Iterator[BinaryIO]:
+        """Opens the zip file in data
+
+        Hex string is decoded into a temporary file not to hold the whole zip file in memory.
+
+        :param data: Bytes of the zip file or its hex string with 0x prefix
+        :param tmp_dir: directory where the temporary file is created
+        """
+        if isinstance(data, bytes):
+            yield io.BytesIO(data)
+            return
+
+        with tempfile.TemporaryFile(dir=tmp_dir) as f:
+            IconScoreDeployer._write_hex_string(data, f)
+            f.seek(0)
+            yield f
+
+    @staticmethod
+    def _write_hex_string(data: str, f: BinaryIO):
+        """Decodes the hex string with 0x prefix into the file by chunks
+
+        :param data: hex string with 0x prefix
+        :param f: file to write
+        """
+        size: int = len(data) - 2
+        if size % 2 != 0 or not HEX_STRING_PATTERN.fullmatch(data, 2):
+            # Whitespaces are allowed by bytes.fromhex() and it raises the same error as before for invalid data
+            f.write(bytes.fromhex(data[2:]))
+            return
 
-        file_info_generator = IconScoreDeployer._extract_files_gen(data, revision)
-        for name, file_info, parent_dir in file_info_generator:
-            if not os.path.exists(os.path.join(path, parent_dir)):
-                os.makedirs(os.path.join(path, parent_dir))
-            with file_info as file_info_context, open(os.path.join(path, name), 'wb') as dest:
-                contents = file_info_context.read()
-                dest.write(contents)
+        for i in range(2, len(data), HEX_CHUNK_SIZE):
+            f.write(bytes.fromhex(data[i:i + HEX_CHUNK_SIZE]))
 
     @staticmethod
-    def _extract_files_gen(data: bytes, revision: int = 0):
+    def _extract_files_gen(data: Union[bytes, BinaryIO], revision: int = 0):
         """
         Reads all files from the depth lower than where the file 'package.json' is and make the generator.
         The generator has tuples with a filename, file info, parent dir.
         When revision is 2 or more, this method is used.
 
-        :param data: Bytes of the zip file.
+        :param data: Bytes of the zip file or the zip file.
         :param revision: Revision num.
         """
 
         try:
-            with zipfile.ZipFile(io.BytesIO(data)) as memory_zip:
+            with zipfile.ZipFile(io.BytesIO(data) if isinstance(data, bytes) else data) as memory_zip:
                 memory_zip_infolist = memory_zip.infolist()
                 common_prefix = ""
                 has_package = False
@@ -103,34 +174,24 @@ class IconScoreDeployer(object):
             raise InvalidPackageException(f'Error raised from extract_files_gen: {e}')
 
     @staticmethod
-    def deploy_legacy(path: str, data: bytes):
+    def deploy_legacy(path: str, data: Union[bytes, str]):
         """Install score.
         Use 'address', 'block_height', and 'transaction_index' to specify the path where 'Score' will be installed.
 
         :param path: the path of directory where score is deployed
-        :param data: The byte value of the zip file.
+        :param data: The byte value of the zip file or its hex string with 0x prefix
         """
-        shutil.rmtree(path, ignore_errors=True)
-        if not os.path.exists(path):
-            os.makedirs(path)
-
-        file_info_generator = IconScoreDeployer._extract_files_gen_legacy(data)
-        for name, file_info, parent_directory in file_info_generator:
-            if not os.path.exists(os.path.join(path, parent_directory)):
-                os.makedirs(os.path.join(path, parent_directory))
-            with file_info as file_info_context, open(os.path.join(path, name), 'wb') as dest:
-                contents = file_info_context.read()
-                dest.write(contents)
+        IconScoreDeployer._deploy(path, data, IconScoreDeployer._extract_files_gen_legacy)
 
     @staticmethod
-    def _extract_files_gen_legacy(data: bytes):
+    def _extract_files_gen_legacy(data: Union[bytes, BinaryIO]):
         """Yield (filename, file_information, parent_directory_name) tuple.
 
-        :param data: The byte value of the zip file.
+        :param data: The byte value of the zip file or the zip file.
         :return:
         """
         try:
-            with zipfile.ZipFile(io.BytesIO(data)) as memory_zip:
+            with zipfile.ZipFile(io.BytesIO(data) if isinstance(data, bytes) else data) as memory_zip:
                 memory_zip_infolist = memory_zip.infolist()
                 memory_zip_files_path_gen = (path.filename for path in memory_zip_infolist)
                 common_path_len = len(os.path.commonpath(memory_zip_files_path_gen))
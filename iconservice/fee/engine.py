@@ -106,6 +106,9 @@ class Engine(EngineBase):
 
         self._check_score_valid(context, score_address)
 
+        # Available virtual steps and deposits are reduced by expiration according to the block height
+        context.mark_block_dependent()
+
         deposit_meta = self._get_or_create_deposit_meta(context, score_address)
 
         deposit_info = DepositInfo(score_address)
@@ -352,6 +355,7 @@ class Engine(EngineBase):
         deposit_meta: 'DepositMeta' = self._get_or_create_deposit_meta(context, score_address)
 
         if self._is_score_sharing_fee(deposit_meta):
+            context.mark_block_dependent()
             virtual_step_available = \
                 block_height < deposit_meta.expires_of_virtual_step \
                 and deposit_meta.available_head_id_of_virtual_step is not None
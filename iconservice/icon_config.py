@@ -26,6 +26,18 @@ default_icon_config = {
     ConfigKey.AMQP_TARGET: "127.0.0.1",
     ConfigKey.BUILTIN_SCORE_OWNER: "hxebf3a409845cd09dcb5af31ed5be5e34e2af9433",
     ConfigKey.IPC_TIMEOUT: 10,
+    ConfigKey.IPC_READ_BUFFER_SIZE: 64 * 1024,
+    ConfigKey.ASYNC_COMMIT_BLOCK: False,
+    # 0: state_db is written on every commit
+    ConfigKey.WRITE_BEHIND_BLOCK_COUNT: 0,
+    ConfigKey.WRITE_BEHIND_SIZE: 16 * 1024 * 1024,
+    ConfigKey.ISCORE_CACHE_TTL: 2,
+    ConfigKey.QUERY_CACHE_SIZE: 10_000,
+    ConfigKey.PROFILER_FLAG: False,
+    ConfigKey.METRICS_PORT: 0,
+    ConfigKey.SCORE_STATS_FLAG: False,
+    ConfigKey.SCORE_STATS_DUMP_PATH: "",
+    ConfigKey.REPLAY_RECORD_PATH: "",
     ConfigKey.SERVICE: {
         ConfigKey.SERVICE_FEE: False,
         ConfigKey.SERVICE_AUDIT: False,
@@ -57,5 +69,6 @@ default_icon_config = {
     ConfigKey.LOW_PRODUCTIVITY_PENALTY_THRESHOLD: LOW_PRODUCTIVITY_PENALTY_THRESHOLD,
     ConfigKey.BLOCK_VALIDATION_PENALTY_THRESHOLD: BLOCK_VALIDATION_PENALTY_THRESHOLD,
     ConfigKey.STEP_TRACE_FLAG: False,
-    ConfigKey.PRECOMMIT_DATA_LOG_FLAG: False
+    ConfigKey.PRECOMMIT_DATA_LOG_FLAG: False,
+    ConfigKey.ASYNC_LOG_WRITER: False
 }
@@ -46,6 +46,7 @@ MAX_EXTERNAL_CALL_COUNT = 1 + 1024
 MAX_CALL_STACK_SIZE = 64
 
 ICON_DEX_DB_NAME = 'icon_dex'
+WRITE_BEHIND_LOG_DIR = 'write_behind'
 PACKAGE_JSON_FILE = 'package.json'
 
 ICX_TRANSFER_EVENT_LOG = 'ICXTransfer(Address,Address,int)'
@@ -156,12 +157,24 @@ class ConfigKey:
     PREP_MAIN_PREPS = 'mainPRepCount'
     PREP_MAIN_AND_SUB_PREPS = 'mainAndSubPRepCount'
     IPC_TIMEOUT = 'ipcTimeout'
+    IPC_READ_BUFFER_SIZE = 'ipcReadBufferSize'
+    ASYNC_COMMIT_BLOCK = 'asyncCommitBlock'
+    WRITE_BEHIND_BLOCK_COUNT = 'writeBehindBlockCount'
+    WRITE_BEHIND_SIZE = 'writeBehindSize'
+    ISCORE_CACHE_TTL = 'iscoreCacheTTL'
+    QUERY_CACHE_SIZE = 'queryCacheSize'
+    PROFILER_FLAG = 'profilerFlag'
+    METRICS_PORT = 'metricsPort'
+    SCORE_STATS_FLAG = 'scoreStatsFlag'
+    SCORE_STATS_DUMP_PATH = 'scoreStatsDumpPath'
+    REPLAY_RECORD_PATH = 'replayRecordPath'
 
     # log
     LOG = 'log'
     LOG_FILE_PATH = 'filePath'
     STEP_TRACE_FLAG = 'stepTraceFlag'
     PRECOMMIT_DATA_LOG_FLAG = 'precommitDataLogFlag'
+    ASYNC_LOG_WRITER = 'asyncLogWriter'
 
     # Reward calculator executable path
     ICON_RC_DIR_PATH = 'iconRcPath'
@@ -240,6 +253,7 @@ IISS_METHOD_TABLE = [
     "getDelegation",
     "claimIScore",
     "queryIScore",
+    "queryIScoreBatch",
     "estimateUnstakeLockPeriod"
 ]
 
@@ -269,6 +283,7 @@ HASH_TYPE_TABLE = [
 NEW_METHOD_TABLE = IISS_METHOD_TABLE + PREP_METHOD_TABLE + DEBUG_METHOD_TABLE
 
 IISS_MAX_DELEGATIONS = 10
+IISS_MAX_QUERY_ISCORE_ADDRESSES = 100
 PREP_MAIN_PREPS = 22
 PREP_MAIN_AND_SUB_PREPS = 100
 
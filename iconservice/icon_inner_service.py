@@ -14,6 +14,7 @@
 
 import asyncio
 from concurrent.futures.thread import ThreadPoolExecutor
+from functools import partial
 from typing import Any, TYPE_CHECKING, Optional, Tuple
 
 from earlgrey import message_queue_task, MessageQueueStub, MessageQueueService
@@ -26,9 +27,13 @@ from iconservice.base.exception import ExceptionCode, IconServiceBaseException,
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.base.type_converter_templates import ConstantKeys
 from iconservice.icon_constant import ICON_INNER_LOG_TAG, ICON_SERVICE_LOG_TAG, \
-    EnableThreadFlag, ENABLE_THREAD_FLAG
+    EnableThreadFlag, ENABLE_THREAD_FLAG, ConfigKey
 from iconservice.icon_service_engine import IconServiceEngine
-from iconservice.utils import check_error_response, to_camel_case
+from iconservice.iiss.engine import Engine as IISSEngine
+from iconservice.replay import ReplayRecorder, RecordingRewardCalcProxy
+from iconservice.utils import check_error_response
+from iconservice.utils.lazy_logger import DEBUG, INFO, is_log_enabled, summarize_invoke_results, \
+    summarize_text
 
 if TYPE_CHECKING:
     from earlgrey import RobustConnection
@@ -48,6 +53,7 @@ class IconScoreInnerTask(object):
         self._thread_flag = ENABLE_THREAD_FLAG
 
         self._icon_service_engine = IconServiceEngine()
+        self._recorder: Optional['ReplayRecorder'] = None
         self._open()
 
         self._thread_pool = {THREAD_INVOKE: ThreadPoolExecutor(1),
@@ -56,6 +62,13 @@ class IconScoreInnerTask(object):
 
     def _open(self):
         Logger.info("icon_score_service open", ICON_INNER_LOG_TAG)
+
+        record_path: str = self._conf.get(ConfigKey.REPLAY_RECORD_PATH, "")
+        if record_path:
+            self._recorder = ReplayRecorder(record_path)
+            self._recorder.open()
+            IISSEngine.reward_calc_proxy_factory = partial(RecordingRewardCalcProxy, recorder=self._recorder)
+
         self._icon_service_engine.open(self._conf)
 
     def _is_thread_flag_on(self, flag: 'EnableThreadFlag') -> bool:
@@ -96,6 +109,9 @@ class IconScoreInnerTask(object):
         if self._icon_service_engine:
             self._icon_service_engine.close()
             self._icon_service_engine = None
+        if self._recorder:
+            self._recorder.close()
+            self._recorder = None
         MessageQueueService.loop.stop()
 
         Logger.info(tag=_TAG, msg="_close() end")
@@ -110,7 +126,10 @@ class IconScoreInnerTask(object):
 
     @message_queue_task
     async def invoke(self, request: dict):
-        Logger.info(f'invoke request with {request}', ICON_INNER_LOG_TAG)
+        if is_log_enabled(DEBUG):
+            Logger.debug(f'invoke request with {request}', ICON_INNER_LOG_TAG)
+        elif is_log_enabled(INFO):
+            Logger.info(f'invoke request with {summarize_text(request)}', ICON_INNER_LOG_TAG)
 
         self._check_icon_service_ready()
 
@@ -130,6 +149,9 @@ class IconScoreInnerTask(object):
 
         response = None
         try:
+            if self._recorder:
+                self._recorder.begin_invoke()
+
             params = TypeConverter.convert(request, ParamType.INVOKE)
             converted_block_params = params['block']
             block = Block.from_dict(converted_block_params)
@@ -151,23 +173,33 @@ class IconScoreInnerTask(object):
                 prev_block_votes=converted_prev_votes,
                 is_block_editable=converted_is_block_editable)
 
+            # Transaction results are converted for the response by themselves
+            # not to be traversed again by MakeResponse.make_response()
             if convert_tx_result_to_dict:
-                convert_tx_results = [tx_result.to_dict(to_camel_case) for tx_result in tx_results]
+                convert_tx_results = [tx_result.to_response() for tx_result in tx_results]
             else:
                 # old version
-                convert_tx_results = {bytes.hex(tx_result.tx_hash): tx_result.to_dict(to_camel_case)
+                convert_tx_results = {bytes.hex(tx_result.tx_hash): tx_result.to_response()
                                       for tx_result in tx_results}
-            results = {
-                'txResults': convert_tx_results,
+            others = {
                 'stateRootHash': bytes.hex(state_root_hash),
                 'addedTransactions': added_transactions
             }
 
             if main_prep_as_dict:
-                results["prep"] = main_prep_as_dict
+                others["prep"] = main_prep_as_dict
+
+            results = {'txResults': convert_tx_results}
+            results.update(MakeResponse.make_response(others))
+
+            if self._recorder:
+                self._recorder.record_invoke(request, state_root_hash)
 
-            Logger.info(f'invoke origin response with {results}', ICON_INNER_LOG_TAG)
-            response = MakeResponse.make_response(results)
+            if is_log_enabled(DEBUG):
+                Logger.debug(f'invoke origin response with {results}', ICON_INNER_LOG_TAG)
+            elif is_log_enabled(INFO):
+                Logger.info(f'invoke origin response: {summarize_invoke_results(results)}', ICON_INNER_LOG_TAG)
+            response = results
         except FatalException as e:
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
@@ -296,6 +328,8 @@ class IconScoreInnerTask(object):
                 self._get_block_info_for_precommit_state(converted_block_params)
 
             self._icon_service_engine.commit(block_height, instant_block_hash, block_hash)
+            if self._recorder:
+                self._recorder.record_write_precommit_state(request)
             response = MakeResponse.make_response(ExceptionCode.OK)
         except FatalException as e:
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
@@ -332,6 +366,8 @@ class IconScoreInnerTask(object):
                 self._get_block_info_for_precommit_state(converted_block_params)
 
             self._icon_service_engine.rollback(block_height, instant_block_hash)
+            if self._recorder:
+                self._recorder.record_remove_precommit_state(request)
             response = MakeResponse.make_response(ExceptionCode.OK)
         except FatalException as e:
             self._log_exception(e, ICON_SERVICE_LOG_TAG)
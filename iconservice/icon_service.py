@@ -32,6 +32,7 @@ from iconservice.icon_constant import ICON_SERVICE_PROCTITLE_FORMAT, ICON_SCORE_
     ICON_EXCEPTION_LOG_TAG
 from iconservice.icon_inner_service import IconScoreInnerService
 from iconservice.icon_service_cli import ICON_SERVICE_CLI, ExitCode
+from iconservice.utils.lazy_logger import AsyncLogWriter
 
 ICON_SERVICE = 'IconService'
 
@@ -88,6 +89,9 @@ class IconService(object):
             Logger.debug("icon service will be closed while open the icon service engine. "
                          "check if the config is valid")
 
+        if config.get(ConfigKey.ASYNC_LOG_WRITER, False):
+            AsyncLogWriter.start()
+
         loop.create_task(_serve())
         loop.add_signal_handler(signal.SIGINT, self.close)
         loop.add_signal_handler(signal.SIGTERM, self.close)
@@ -106,6 +110,7 @@ class IconService(object):
             Logger.debug("loop has been stopped and will be closed")
             loop.run_until_complete(loop.shutdown_asyncgens())
             loop.close()
+            AsyncLogWriter.stop()
 
     def close(self):
         self._inner_service.clean_close()
@@ -15,7 +15,6 @@
 # limitations under the License.
 
 import argparse
-import asyncio
 import os
 import subprocess
 import sys
@@ -36,6 +35,7 @@ ICON_SERVICE_CLI = 'IconServiceCli'
 class ExitCode(IntEnum):
     SUCCEEDED = 0
     COMMAND_IS_WRONG = 1
+    STATE_ROOT_HASH_MISMATCHED = 2
 
 
 def main():
@@ -46,6 +46,8 @@ def main():
     iconservice commands:
         start : iconservice start
         stop : iconservice stop
+        replay : iconservice replay -rf [record file path]
+                 replays a record file against a copy of the score and state db in the config
 
         -c : json configure file path
         -sc : icon score root path ex).score
@@ -55,12 +57,13 @@ def main():
         -ch : loopchain channel ex) loopchain_default
         -fg : foreground process
         -tbears : tbears mode
+        -rf : record file path made with replayRecordPath config to replay
     """)
 
     parser.add_argument('command', type=str,
                         nargs='*',
-                        choices=['start', 'stop'],
-                        help='iconservice type [start|stop]')
+                        choices=['start', 'stop', 'replay'],
+                        help='iconservice type [start|stop|replay]')
     parser.add_argument("-sc", dest=ConfigKey.SCORE_ROOT_PATH, type=str, default=None,
                         help="icon score root path  example : .score")
     parser.add_argument("-st", dest=ConfigKey.STATE_DB_ROOT_PATH, type=str, default=None,
@@ -78,6 +81,8 @@ def main():
     parser.add_argument("-tbears", dest=ConfigKey.TBEARS_MODE, action='store_true',
                         help="tbears mode")
     parser.add_argument("-steptrace", dest=ConfigKey.STEP_TRACE_FLAG, action="store_true", help="enable step tracing")
+    parser.add_argument("-rf", dest='replay_file', type=str, default=None,
+                        help="record file path to replay")
 
     args = parser.parse_args()
 
@@ -104,6 +109,8 @@ def main():
         result = _start(conf)
     elif command == 'stop' and len(args.command) == 1:
         result = _stop(conf)
+    elif command == 'replay' and len(args.command) == 1 and args.replay_file:
+        result = _replay(conf, args.replay_file)
     else:
         parser.print_help()
         result = ExitCode.COMMAND_IS_WRONG.value
@@ -122,6 +129,7 @@ def _stop(conf: 'IconConfig') -> int:
         await stop_process(conf)
 
     if _check_if_process_running(conf):
+        import asyncio
         loop = asyncio.get_event_loop()
         loop.run_until_complete(__stop())
 
@@ -129,6 +137,20 @@ def _stop(conf: 'IconConfig') -> int:
     return ExitCode.SUCCEEDED
 
 
+def _replay(conf: 'IconConfig', record_path: str) -> int:
+    from iconservice.replay.replayer import Replayer
+
+    if not os.path.isfile(record_path):
+        print(f'invalid record file : {record_path}')
+        return ExitCode.COMMAND_IS_WRONG
+
+    report = Replayer(conf, record_path).run()
+    print(report)
+
+    Logger.info(f'replay_command done!', ICON_SERVICE_CLI)
+    return ExitCode.STATE_ROOT_HASH_MISMATCHED if report.mismatches else ExitCode.SUCCEEDED
+
+
 def _start_process(conf: 'IconConfig'):
     Logger.info('start_server() start')
     python_module_string = 'iconservice.icon_service'
@@ -14,6 +14,9 @@
 # limitations under the License.
 
 import os
+from collections import namedtuple
+from concurrent.futures import Future, wait
+from concurrent.futures.thread import ThreadPoolExecutor
 from copy import deepcopy
 from typing import TYPE_CHECKING, List, Any, Optional, Tuple
 
@@ -25,7 +28,7 @@ from .base.exception import (
     ExceptionCode, IconServiceBaseException, ScoreNotFoundException,
     AccessDeniedException, IconScoreException, InvalidParamsException, InvalidBaseTransactionException,
     MethodNotFoundException,
-    DatabaseException)
+    DatabaseException, IllegalFormatException)
 from .base.message import Message
 from .base.transaction import Transaction
 from .database.factory import ContextDatabaseFactory
@@ -48,6 +51,7 @@ from .iconscore.icon_score_engine import IconScoreEngine
 from .iconscore.icon_score_event_log import EventLogEmitter
 from .iconscore.icon_score_mapper import IconScoreMapper
 from .iconscore.icon_score_result import TransactionResult
+from .iconscore.icon_score_stats import ScoreStats
 from .iconscore.icon_score_step import IconScoreStepCounterFactory, StepType, get_input_data_size, \
     get_deploy_content_size
 from .iconscore.icon_score_trace import Trace, TraceType
@@ -56,16 +60,20 @@ from .icx.issue import IssueEngine, IssueStorage
 from .icx.issue.base_transaction_creator import BaseTransactionCreator
 from .iiss import IISSEngine, IISSStorage, check_decentralization_condition
 from .iiss.reward_calc import RewardCalcStorage, RewardCalcDataCreator
+from .iiss.reward_calc.ipc.server import DEFAULT_READ_BUFFER_SIZE
 from .iiss.reward_calc.storage import RewardCalcDBInfo, get_version_and_revision
 from .inner_call import inner_call
 from .meta import MetaDBStorage
 from .precommit_data_manager import PrecommitData, PrecommitDataManager, PrecommitFlag
 from .prep import PRepEngine, PRepStorage
 from .prep.data import PRep
+from .profiler import Counter, MetricsServer, Phase, Profiler
+from .query_cache import QueryCache
 from .utils import print_log_with_level
 from .utils import sha3_256, int_to_bytes, ContextEngine, ContextStorage
 from .utils import to_camel_case, bytes_to_hex
 from .utils.bloom import BloomFilter
+from .utils.lazy_logger import INFO, is_log_enabled
 
 if TYPE_CHECKING:
     from .iconscore.icon_score_event_log import EventLog
@@ -76,6 +84,9 @@ if TYPE_CHECKING:
     from .database.db import KeyValueDatabase
     from .iiss.reward_calc.msg_data import BlockProduceInfoData
 
+# COMMIT_BLOCK whose response is verified later than the commit of the block
+_PendingCommitBlock = namedtuple('_PendingCommitBlock', ['wal_writer', 'future', 'block_height', 'block_hash'])
+
 
 class IconServiceEngine(ContextContainer):
     """The entry of all icon service related components
@@ -85,6 +96,7 @@ class IconServiceEngine(ContextContainer):
     """
     TAG = "ISE"
     WAL_FILE = "block.wal"
+    PREP_SNAPSHOT_FILE = "prep.snapshot"
 
     def __init__(self):
         """Constructor
@@ -97,6 +109,17 @@ class IconServiceEngine(ContextContainer):
         self._context_factory = None
         self._state_db_root_path: Optional[str] = None
         self._wal_reader: Optional['WriteAheadLogReader'] = None
+        self._query_cache = QueryCache()
+        self._profiler = Profiler()
+        self._metrics_server: Optional['MetricsServer'] = None
+        # Compacts standby_rc_db and sends CALCULATE off the commit
+        self._rc_db_executor: Optional['ThreadPoolExecutor'] = None
+        self._standby_rc_db_future: Optional['Future'] = None
+        # iiss_rc_db recovered on open whose CALCULATE is sent on hello()
+        self._pending_calculate: Optional['RewardCalcDBInfo'] = None
+        # If True, commit returns without waiting for the response of COMMIT_BLOCK
+        self._async_commit_block: bool = False
+        self._pending_commit_block: Optional['_PendingCommitBlock'] = None
 
         # JSON-RPC handlers
         self._handlers = {
@@ -106,7 +129,8 @@ class IconServiceEngine(ContextContainer):
             'icx_sendTransaction': self._handle_icx_send_transaction,
             'debug_estimateStep': self._handle_estimate_step,
             'icx_getScoreApi': self._handle_icx_get_score_api,
-            'ise_getStatus': self._handle_ise_get_status
+            'ise_getStatus': self._handle_ise_get_status,
+            'debug_getScoreStats': self._handle_debug_get_score_stats
         }
 
         self._precommit_data_manager = PrecommitDataManager()
@@ -131,7 +155,10 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(rc_data_path, exist_ok=True)
 
         # Share one context db with all SCORE
-        ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
+        ContextDatabaseFactory.open(state_db_root_path,
+                                    ContextDatabaseFactory.Mode.SINGLE_DB,
+                                    conf.get(ConfigKey.WRITE_BEHIND_BLOCK_COUNT, 0),
+                                    conf.get(ConfigKey.WRITE_BEHIND_SIZE, 0))
         self._state_db_root_path = state_db_root_path
 
         self._icx_context_db = ContextDatabaseFactory.create_by_name(ICON_DEX_DB_NAME)
@@ -140,6 +167,10 @@ class IconServiceEngine(ContextContainer):
 
         self._deposit_handler = DepositHandler()
         self._icon_pre_validator = IconPreValidator()
+        self._query_cache = QueryCache(conf.get(ConfigKey.QUERY_CACHE_SIZE, 0))
+        self._profiler = Profiler(conf.get(ConfigKey.PROFILER_FLAG, False))
+        self._rc_db_executor = ThreadPoolExecutor(1)
+        self._async_commit_block = conf.get(ConfigKey.ASYNC_COMMIT_BLOCK, False)
 
         IconScoreClassLoader.init(score_root_path)
         IconScoreContext.score_root_path = score_root_path
@@ -154,9 +185,12 @@ class IconServiceEngine(ContextContainer):
         IconScoreContext.step_trace_flag = conf.get(ConfigKey.STEP_TRACE_FLAG, False)
         IconScoreContext.log_level = conf[ConfigKey.LOG].get("level", "debug")
         IconScoreContext.precommitdata_log_flag = conf[ConfigKey.PRECOMMIT_DATA_LOG_FLAG]
+        IconScoreContext.score_stats = ScoreStats(conf.get(ConfigKey.SCORE_STATS_FLAG, False),
+                                                  conf.get(ConfigKey.SCORE_STATS_DUMP_PATH))
         self._init_component_context()
 
         self._recover_dbs(rc_data_path)
+        self._recover_standby_rc_db(rc_data_path)
 
         # load last_block_info
         context = IconScoreContext(IconScoreContextType.DIRECT)
@@ -181,7 +215,10 @@ class IconServiceEngine(ContextContainer):
                                      conf[ConfigKey.LOW_PRODUCTIVITY_PENALTY_THRESHOLD],
                                      conf[ConfigKey.BLOCK_VALIDATION_PENALTY_THRESHOLD],
                                      conf[ConfigKey.IPC_TIMEOUT],
-                                     conf[ConfigKey.ICON_RC_DIR_PATH])
+                                     conf[ConfigKey.ICON_RC_DIR_PATH],
+                                     conf.get(ConfigKey.ISCORE_CACHE_TTL, 0),
+                                     conf.get(ConfigKey.IPC_READ_BUFFER_SIZE, DEFAULT_READ_BUFFER_SIZE),
+                                     os.path.join(state_db_root_path, self.PREP_SNAPSHOT_FILE))
 
         self._post_open_component_context(context)
 
@@ -189,6 +226,11 @@ class IconServiceEngine(ContextContainer):
             context, Address.from_string(conf[ConfigKey.BUILTIN_SCORE_OWNER]))
         self._init_global_value_by_governance_score(context)
 
+        metrics_port: int = conf.get(ConfigKey.METRICS_PORT, 0)
+        if self._profiler.enabled and metrics_port > 0:
+            self._metrics_server = MetricsServer(self._profiler, metrics_port)
+            self._metrics_server.start()
+
     def _init_component_context(self):
         engine: 'ContextEngine' = ContextEngine(deploy=DeployEngine(),
                                                 fee=FeeEngine(),
@@ -229,7 +271,10 @@ class IconServiceEngine(ContextContainer):
                                 low_productivity_penalty_threshold: int,
                                 block_validation_penalty_threshold: int,
                                 ipc_timeout: int,
-                                icon_rc_path: str):
+                                icon_rc_path: str,
+                                iscore_cache_ttl: float,
+                                ipc_read_buffer_size: int,
+                                prep_snapshot_path: str):
 
         IconScoreContext.engine.deploy.open(context)
         IconScoreContext.engine.fee.open(context)
@@ -239,13 +284,16 @@ class IconServiceEngine(ContextContainer):
                                           rc_data_path,
                                           rc_socket_path,
                                           ipc_timeout,
-                                          icon_rc_path)
+                                          icon_rc_path,
+                                          iscore_cache_ttl,
+                                          ipc_read_buffer_size)
         IconScoreContext.engine.prep.open(context,
                                           term_period,
                                           irep,
                                           penalty_grace_period,
                                           low_productivity_penalty_threshold,
-                                          block_validation_penalty_threshold)
+                                          block_validation_penalty_threshold,
+                                          prep_snapshot_path)
         IconScoreContext.engine.issue.open(context)
 
         IconScoreContext.storage.deploy.open(context)
@@ -417,6 +465,14 @@ class IconServiceEngine(ContextContainer):
         try:
             self._push_context(context)
 
+            if self._rc_db_executor is not None:
+                # Wait for the background worker. If it has failed, standby_rc_db is recovered with its marker on open
+                self._rc_db_executor.shutdown()
+                self._rc_db_executor = None
+                self._standby_rc_db_future = None
+
+            self._close_pending_commit_block()
+
             IconScoreContext.icon_score_mapper.close()
             IconScoreContext.icon_score_mapper = None
 
@@ -426,6 +482,10 @@ class IconServiceEngine(ContextContainer):
         finally:
             self._pop_context()
             ContextDatabaseFactory.close()
+
+            if self._metrics_server is not None:
+                self._metrics_server.stop()
+                self._metrics_server = None
             self._clear_context()
 
     def invoke(self,
@@ -446,19 +506,34 @@ class IconServiceEngine(ContextContainer):
         :param is_block_editable: boolean which imply whether creating base transaction or not
         :return: (TransactionResult[], bytes, added transaction{}, main prep as dict{})
         """
-
+        with self._profiler.timer(Phase.INVOKE):
+            return self._invoke_block(block,
+                                      tx_requests,
+                                      prev_block_generator,
+                                      prev_block_validators,
+                                      prev_block_votes,
+                                      is_block_editable)
+
+    def _invoke_block(self,
+                      block: 'Block',
+                      tx_requests: list,
+                      prev_block_generator: Optional['Address'],
+                      prev_block_validators: Optional[List['Address']],
+                      prev_block_votes: Optional[List[Tuple['Address', int]]],
+                      is_block_editable: bool) -> Tuple[List['TransactionResult'], bytes, dict, Optional[dict]]:
         # If the block has already been processed,
         # return the result from PrecommitDataManager
         precommit_data: 'PrecommitData' = self._precommit_data_manager.get(block.hash)
         if precommit_data is not None:
-            if not precommit_data.already_exists:
-                Logger.info(tag=ICON_SERVICE_LOG_TAG,
-                            msg=f"Block result already exists: \n{precommit_data}")
-                precommit_data.already_exists = True
-            else:
-                Logger.info(tag=ICON_SERVICE_LOG_TAG,
-                            msg=f"Block result already exists: \n"
-                                f"state_root_hash={bytes_to_hex(precommit_data.state_root_hash)}")
+            if is_log_enabled(INFO):
+                if not precommit_data.already_exists:
+                    Logger.info(tag=ICON_SERVICE_LOG_TAG,
+                                msg=f"Block result already exists: \n{precommit_data}")
+                else:
+                    Logger.info(tag=ICON_SERVICE_LOG_TAG,
+                                msg=f"Block result already exists: \n"
+                                    f"state_root_hash={bytes_to_hex(precommit_data.state_root_hash)}")
+            precommit_data.already_exists = True
 
             return \
                 precommit_data.block_result, \
@@ -469,6 +544,13 @@ class IconServiceEngine(ContextContainer):
         # Check for block validation before invoke
         self._precommit_data_manager.validate_block_to_invoke(block)
 
+        profiler: 'Profiler' = self._profiler
+        profiler.increment(Counter.BLOCKS)
+        profiler.increment(Counter.TRANSACTIONS, len(tx_requests))
+
+        score_stats: 'ScoreStats' = IconScoreContext.score_stats
+        score_stats.start_block(block.height)
+
         context: 'IconScoreContext' = self._context_factory.create(IconScoreContextType.INVOKE, block=block)
 
         # TODO: prev_block_votes must be support to low version about prev_block_validators by using meta storage.
@@ -486,12 +568,13 @@ class IconServiceEngine(ContextContainer):
         precommit_flag = PrecommitFlag.NONE
         added_transactions = {}
 
-        self._before_transaction_process(context,
-                                         is_block_editable,
-                                         tx_requests,
-                                         added_transactions,
-                                         prev_block_generator,
-                                         prev_block_votes)
+        with profiler.timer(Phase.INVOKE_BEFORE_TX):
+            self._before_transaction_process(context,
+                                             is_block_editable,
+                                             tx_requests,
+                                             added_transactions,
+                                             prev_block_generator,
+                                             prev_block_votes)
 
         if block.height == 0:
             # Assume that there is only one tx in genesis_block
@@ -500,25 +583,34 @@ class IconServiceEngine(ContextContainer):
             context.block_batch.update(context.tx_batch)
             context.tx_batch.clear()
         else:
-            for index, tx_request in enumerate(tx_requests):
-                if index == BASE_TRANSACTION_INDEX and context.is_decentralized():
-                    if not tx_request['params'].get('dataType') == "base":
-                        raise InvalidBaseTransactionException(
-                            "Invalid block: first transaction must be an base transaction")
-                    tx_result = self._invoke_base_request(context, tx_request, is_block_editable)
-                else:
-                    tx_result = self._invoke_request(context, tx_request, index)
-
-                self._log_step_trace(context)
-                block_result.append(tx_result)
-                context.update_batch()
-
-                precommit_flag = self._update_revision_if_necessary(precommit_flag, context, tx_result)
-                precommit_flag = self._generate_precommit_flag(precommit_flag, tx_result)
-                self._update_step_properties_if_necessary(context, precommit_flag)
-
-                if context.revision >= Revision.IISS.value:
-                    context.block_batch.block.cumulative_fee += tx_result.step_price * tx_result.step_used
+            # Send CLAIM requests of all claimIScore txs at once instead of a round-trip per tx
+            is_claim_pipelined: bool = context.revision >= Revision.IISS.value
+            if is_claim_pipelined:
+                context.engine.iiss.start_claim_pipeline(context, tx_requests)
+            try:
+                for index, tx_request in enumerate(tx_requests):
+                    with profiler.timer(Phase.INVOKE_TX):
+                        if index == BASE_TRANSACTION_INDEX and context.is_decentralized():
+                            if not tx_request['params'].get('dataType') == "base":
+                                raise InvalidBaseTransactionException(
+                                    "Invalid block: first transaction must be an base transaction")
+                            tx_result = self._invoke_base_request(context, tx_request, is_block_editable)
+                        else:
+                            tx_result = self._invoke_request(context, tx_request, index)
+
+                    self._log_step_trace(context)
+                    block_result.append(tx_result)
+                    context.update_batch()
+
+                    precommit_flag = self._update_revision_if_necessary(precommit_flag, context, tx_result)
+                    precommit_flag = self._generate_precommit_flag(precommit_flag, tx_result)
+                    self._update_step_properties_if_necessary(context, precommit_flag)
+
+                    if context.revision >= Revision.IISS.value:
+                        context.block_batch.block.cumulative_fee += tx_result.step_price * tx_result.step_used
+            finally:
+                if is_claim_pipelined:
+                    context.engine.iiss.end_claim_pipeline()
 
         if self._check_end_block_height_of_calc(context):
             precommit_flag |= PrecommitFlag.IISS_CALC
@@ -531,32 +623,35 @@ class IconServiceEngine(ContextContainer):
                 # change the reward calculation period from 43200 to 43120 which is the same as term_period
                 context.storage.iiss.put_calc_period(context, context.term_period)
 
-        main_prep_as_dict, term, rc_state_hash = self._after_transaction_process(context,
-                                                                                 precommit_flag,
-                                                                                 rc_db_revision,
-                                                                                 prev_block_generator,
-                                                                                 prev_block_votes)
+        with profiler.timer(Phase.INVOKE_AFTER_TX):
+            main_prep_as_dict, term, rc_state_hash = self._after_transaction_process(context,
+                                                                                     precommit_flag,
+                                                                                     rc_db_revision,
+                                                                                     prev_block_generator,
+                                                                                     prev_block_votes)
 
         # Save precommit data
         # It will be written to levelDB on commit
-        precommit_data = PrecommitData(context.revision,
-                                       rc_db_revision,
-                                       context.block_batch,
-                                       block_result,
-                                       context.rc_block_batch,
-                                       context.preps,
-                                       term,
-                                       prev_block_generator,
-                                       prev_block_validators,
-                                       context.new_icon_score_mapper,
-                                       precommit_flag,
-                                       rc_state_hash,
-                                       added_transactions,
-                                       main_prep_as_dict)
-        if context.precommitdata_log_flag:
+        with profiler.timer(Phase.INVOKE_PRECOMMIT_DATA):
+            precommit_data = PrecommitData(context.revision,
+                                           rc_db_revision,
+                                           context.block_batch,
+                                           block_result,
+                                           context.rc_block_batch,
+                                           context.preps,
+                                           term,
+                                           prev_block_generator,
+                                           prev_block_validators,
+                                           context.new_icon_score_mapper,
+                                           precommit_flag,
+                                           rc_state_hash,
+                                           added_transactions,
+                                           main_prep_as_dict)
+        if context.precommitdata_log_flag and is_log_enabled(INFO):
             Logger.info(tag=ICON_SERVICE_LOG_TAG,
                         msg=f"Created precommit_data: \n{precommit_data}")
         self._precommit_data_manager.push(precommit_data)
+        score_stats.end_block()
 
         return \
             block_result, \
@@ -1136,10 +1231,30 @@ class IconServiceEngine(ContextContainer):
         :param params:
         :return: the result of query
         """
+        self._profiler.increment(Counter.QUERIES)
+
+        with self._profiler.timer(Phase.QUERY):
+            return self._query(method, params)
+
+    def _query(self, method: str, params: dict) -> Any:
+        query_cache: 'QueryCache' = self._query_cache
+        cache_key: Optional[tuple] = None
+
+        if query_cache.enabled and query_cache.is_cacheable(method, params):
+            cache_key = query_cache.make_key(method, params)
+            is_cached, ret = query_cache.get(cache_key)
+            if is_cached:
+                return ret
+
+        generation: int = query_cache.generation
+
         context: 'IconScoreContext' = self._context_factory.create(
             IconScoreContextType.QUERY,
             block=self._get_last_block()
         )
+        if cache_key is not None:
+            context.read_keys = set()
+
         self._set_revision_to_context(context)
         step_limit: int = context.step_counter.max_step_limit
 
@@ -1152,6 +1267,10 @@ class IconServiceEngine(ContextContainer):
         context.step_counter.reset(step_limit)
 
         ret = self._call(context, method, params)
+
+        if cache_key is not None:
+            query_cache.put(cache_key, ret, context.read_keys, generation)
+
         return ret
 
     def validate_transaction(self, request: dict) -> None:
@@ -1167,6 +1286,12 @@ class IconServiceEngine(ContextContainer):
             in IconInnerService
         :return:
         """
+        self._profiler.increment(Counter.VALIDATIONS)
+
+        with self._profiler.timer(Phase.VALIDATE_TRANSACTION):
+            self._validate_transaction(request)
+
+    def _validate_transaction(self, request: dict) -> None:
         assert self._get_context_stack_size() == 0
 
         method = request['method']
@@ -1383,12 +1508,13 @@ class IconServiceEngine(ContextContainer):
             context.func_type = IconScoreFuncType.WRITABLE
 
             # Charge a fee to from account
-            step_used_details, final_step_price = \
-                self._charge_transaction_fee(
-                    context,
-                    params,
-                    tx_result.status,
-                    context.step_counter.step_used)
+            with self._profiler.timer(Phase.INVOKE_CHARGE_FEE):
+                step_used_details, final_step_price = \
+                    self._charge_transaction_fee(
+                        context,
+                        params,
+                        tx_result.status,
+                        context.step_counter.step_used)
 
             # Finalize tx_result
             tx_result.step_price = final_step_price
@@ -1769,8 +1895,25 @@ class IconServiceEngine(ContextContainer):
         if not bool(params) or params.get('filter'):
             last_block_status = self._make_last_block_status()
             response['lastBlock'] = last_block_status
+
+        filters = (params or {}).get('filter') or ()
+
+        if self._profiler.enabled and (not bool(params) or 'profile' in filters):
+            response['profile'] = self._profiler.get_summary()
+
+        if 'ipc' in filters:
+            response['ipc'] = IconScoreContext.engine.iiss.get_ipc_metrics()
+
         return response
 
+    @staticmethod
+    def _handle_debug_get_score_stats(_context: 'IconScoreContext', _params: dict) -> dict:
+        score_stats: 'ScoreStats' = IconScoreContext.score_stats
+        if not score_stats.enabled:
+            raise MethodNotFoundException("Method not found: debug_getScoreStats")
+
+        return score_stats.get_stats()
+
     def _make_last_block_status(self) -> Optional[dict]:
         block = self._get_last_block()
         if block is None:
@@ -1801,17 +1944,21 @@ class IconServiceEngine(ContextContainer):
         # Check for block validation before commit
         self._precommit_data_manager.validate_precommit_block(instant_block_hash)
 
-        precommit_data: 'PrecommitData' = self._get_updated_precommit_data(instant_block_hash, block_hash)
-        context = self._context_factory.create(IconScoreContextType.DIRECT, block=precommit_data.block)
+        self._profiler.increment(Counter.COMMITS)
 
-        if precommit_data.revision < Revision.IISS.value:
-            self._commit_before_iiss(context, precommit_data)
-        else:
-            self._commit_after_iiss(context, precommit_data, instant_block_hash)
+        with self._profiler.timer(Phase.COMMIT):
+            precommit_data: 'PrecommitData' = self._get_updated_precommit_data(instant_block_hash, block_hash)
+            context = self._context_factory.create(IconScoreContextType.DIRECT, block=precommit_data.block)
+
+            if precommit_data.revision < Revision.IISS.value:
+                self._commit_before_iiss(context, precommit_data)
+            else:
+                self._commit_after_iiss(context, precommit_data, instant_block_hash)
 
     def _commit_before_iiss(self, context: 'IconScoreContext', precommit_data: 'PrecommitData'):
         state_wal: 'StateWAL' = StateWAL(precommit_data.block_batch)
-        self._process_state_commit(context, precommit_data, state_wal)
+        with self._profiler.timer(Phase.COMMIT_STATE_DB):
+            self._process_state_commit(context, precommit_data, state_wal)
 
     def _commit_after_iiss(self,
                            context: 'IconScoreContext',
@@ -1821,23 +1968,48 @@ class IconServiceEngine(ContextContainer):
         start_calc_block_height: int = context.engine.iiss.get_start_block_of_calc(context)
         is_calc_period_start_block: bool = context.block.height == start_calc_block_height
 
-        wal_writer, state_wal, iiss_wal = \
-            self._process_wal(context, precommit_data, is_calc_period_start_block, instant_block_hash)
-        wal_writer.flush()
+        profiler: 'Profiler' = self._profiler
+
+        # The WAL of the previous block is kept until its COMMIT_BLOCK is acknowledged
+        self._wait_for_pending_commit_block()
+        # standby_rc_db of the previous calc period is prepared on the background worker
+        # and only the start block of the next calc period waits for it
+        self._check_standby_rc_db(wait=is_calc_period_start_block)
+
+        with profiler.timer(Phase.COMMIT_WAL):
+            wal_writer, state_wal, iiss_wal = \
+                self._process_wal(context, precommit_data, is_calc_period_start_block, instant_block_hash)
+            # The only fsync on commit: state records appended below are regenerated on recovery if lost
+            wal_writer.flush()
 
         # Write iiss_wal to rc_db
-        standby_db_info: Optional['RewardCalcDBInfo'] = \
-            self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
-        wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
-        wal_writer.flush()
+        with profiler.timer(Phase.COMMIT_RC_DB):
+            standby_db_info: Optional['RewardCalcDBInfo'] = \
+                self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
+            wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
 
         # Write state_wal to state_db
-        self._process_state_commit(context, precommit_data, state_wal)
-        wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
-        wal_writer.flush()
+        with profiler.timer(Phase.COMMIT_STATE_DB):
+            self._process_state_commit(context, precommit_data, state_wal)
+            wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
 
         # send IPC
-        self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
+        with profiler.timer(Phase.COMMIT_IPC):
+            pending_commit_block: Optional['_PendingCommitBlock'] = self._process_ipc(
+                context, wal_writer, precommit_data, instant_block_hash, not self._async_commit_block)
+
+        if pending_commit_block is not None:
+            self._pending_commit_block = pending_commit_block
+        else:
+            self._close_write_ahead_log(wal_writer)
+
+        if standby_db_info is not None:
+            # Compaction of standby_rc_db can take long, so it is done on the background worker.
+            # Its marker written by replace_db() is used to recover it instead of WAL
+            self._standby_rc_db_future = self._rc_db_executor.submit(
+                self._prepare_standby_rc_db, self._get_rc_data_path(), standby_db_info, pending_commit_block)
+
+    def _close_write_ahead_log(self, wal_writer: 'WriteAheadLogWriter'):
         wal_writer.close()
 
         try:
@@ -1845,6 +2017,98 @@ class IconServiceEngine(ContextContainer):
         except BaseException as e:
             Logger.error(tag=self.TAG, msg=str(e))
 
+    @staticmethod
+    def _prepare_standby_rc_db(rc_data_path: str,
+                               standby_db_info: 'RewardCalcDBInfo',
+                               pending_commit_block: Optional['_PendingCommitBlock']):
+        """Compact standby_rc_db, hand it over to reward calculator and send CALCULATE
+
+        It is called on the background worker and does not touch WAL which is owned by commit
+        The marker of standby_rc_db is left on failure so that it is recovered on the next open
+
+        :param rc_data_path: The directory where iiss_dbs are contained
+        :param standby_db_info:
+        :param pending_commit_block: COMMIT_BLOCK to be acknowledged prior to CALCULATE
+        """
+        Logger.info(tag=IconServiceEngine.TAG, msg=f"_prepare_standby_rc_db() start: {standby_db_info}")
+
+        iiss_engine: 'IISSEngine' = IconScoreContext.engine.iiss
+        if pending_commit_block is not None:
+            _, future, block_height, block_hash = pending_commit_block
+            iiss_engine.check_commit_ack(future, block_height, block_hash)
+
+        iiss_db_path: str = RewardCalcStorage.prepare_standby_db(standby_db_info.path)
+        iiss_engine.send_calculate(iiss_db_path, standby_db_info.block_height)
+        # The marker is removed by commit after WAL of the calc period start block is removed
+        RewardCalcStorage.write_standby_rc_db_marker(rc_data_path, standby_db_info, calculate_sent=True)
+
+        Logger.info(tag=IconServiceEngine.TAG, msg="_prepare_standby_rc_db() end")
+
+    def _check_standby_rc_db(self, wait: bool):
+        """Check the result of _prepare_standby_rc_db() and remove the marker of standby_rc_db
+
+        :param wait: wait for the background worker if it has not finished yet
+        """
+        future: Optional['Future'] = self._standby_rc_db_future
+        if future is None or not (wait or future.done()):
+            return
+
+        self._standby_rc_db_future = None
+        with self._profiler.timer(Phase.COMMIT_RC_DB_WAIT):
+            e: Optional[BaseException] = future.exception()
+
+        if e is not None:
+            Logger.error(tag=self.TAG, msg=f"Failed to prepare standby_rc_db: {e}")
+            raise e
+
+        RewardCalcStorage.remove_standby_rc_db_marker(self._get_rc_data_path())
+
+    @staticmethod
+    def _check_commit_block_ack(pending_commit_block: '_PendingCommitBlock'):
+        wal_writer, future, block_height, block_hash = pending_commit_block
+
+        IconScoreContext.engine.iiss.check_commit_ack(future, block_height, block_hash)
+        wal_writer.write_state(WALState.SEND_COMMIT_BLOCK.value, add=True)
+
+    def _wait_for_pending_commit_block(self):
+        """Verify the response of COMMIT_BLOCK sent on the previous commit and remove its WAL
+
+        WAL is left on failure so that COMMIT_BLOCK is sent again on the next open
+        """
+        pending_commit_block: Optional['_PendingCommitBlock'] = self._pending_commit_block
+        if pending_commit_block is None:
+            return
+
+        self._pending_commit_block = None
+        try:
+            with self._profiler.timer(Phase.COMMIT_ACK_WAIT):
+                self._check_commit_block_ack(pending_commit_block)
+        except BaseException as e:
+            Logger.error(tag=self.TAG, msg=f"Failed to commit block to reward calculator: {e}")
+            pending_commit_block.wal_writer.close()
+            raise
+
+        self._close_write_ahead_log(pending_commit_block.wal_writer)
+
+    def _close_pending_commit_block(self):
+        """It is called on close() which can share the thread with IPC,
+        so the response of COMMIT_BLOCK is not waited for
+        """
+        pending_commit_block: Optional['_PendingCommitBlock'] = self._pending_commit_block
+        if pending_commit_block is None:
+            return
+
+        if pending_commit_block.future.done():
+            try:
+                self._wait_for_pending_commit_block()
+            except BaseException:
+                pass
+            return
+
+        # COMMIT_BLOCK is sent again on the next open
+        self._pending_commit_block = None
+        pending_commit_block.wal_writer.close()
+
     def _process_wal(self, context: 'IconScoreContext',
                      precommit_data: 'PrecommitData',
                      is_calc_period_start_block: bool,
@@ -1911,6 +2175,10 @@ class IconServiceEngine(ContextContainer):
         if precommit_data.precommit_flag & PrecommitFlag.STEP_ALL_CHANGED != PrecommitFlag.NONE:
             context.block = precommit_data.block_batch.block
             self._init_global_value_by_governance_score(context)
+            # Max step limit for query can be changed
+            self._query_cache.clear()
+        else:
+            self._query_cache.invalidate(precommit_data.block_batch.keys())
 
     @staticmethod
     def _process_iiss_commit(context: 'IconScoreContext',
@@ -1941,8 +2209,12 @@ class IconServiceEngine(ContextContainer):
     def _process_ipc(context: 'IconScoreContext',
                      wal_writer: 'WriteAheadLogWriter',
                      precommit_data: 'PrecommitData',
-                     standby_db_info: Optional['RewardCalcDBInfo'],
-                     instant_block_hash: bytes):
+                     instant_block_hash: bytes,
+                     wait_for_ack: bool = True) -> Optional['_PendingCommitBlock']:
+        """Send COMMIT_BLOCK to reward calculator
+
+        :return: COMMIT_BLOCK to be acknowledged later if wait_for_ack is False
+        """
         assert precommit_data.revision >= Revision.IISS.value
 
         commit_block_hash: bytes = precommit_data.block.hash
@@ -1950,15 +2222,14 @@ class IconServiceEngine(ContextContainer):
             # Leader node must use instant_block_hash which is used in invoke()
             commit_block_hash: bytes = instant_block_hash
 
-        context.engine.iiss.send_commit(
-            precommit_data.block.height, commit_block_hash)
-        wal_writer.write_state(WALState.SEND_COMMIT_BLOCK.value, add=True)
-        wal_writer.flush()
+        future: Optional['Future'] = context.engine.iiss.send_commit(
+            precommit_data.block.height, commit_block_hash, wait_for_ack)
+        if future is not None:
+            # SEND_COMMIT_BLOCK is written on acknowledgement, so COMMIT_BLOCK is sent again on recovery until then
+            return _PendingCommitBlock(wal_writer, future, precommit_data.block.height, commit_block_hash)
 
-        if standby_db_info is not None:
-            iiss_db_path: str = context.storage.rc.rename_standby_db_to_iiss_db(standby_db_info.path)
-            context.engine.iiss.send_calculate(iiss_db_path, standby_db_info.block_height)
-            wal_writer.write_state(WALState.SEND_CALCULATE.value, add=True)
+        wal_writer.write_state(WALState.SEND_COMMIT_BLOCK.value, add=True)
+        return None
 
     def rollback(self, block_height: int, instant_block_hash: bytes) -> None:
         """Throw away a precommit state
@@ -2020,8 +2291,14 @@ class IconServiceEngine(ContextContainer):
             Logger.info(tag=WAL_LOG_TAG, msg=f"reader=({reader})")
 
             if reader.log_count == 2:
-                self._recover_rc_db(reader, rc_data_path)
-                self._recover_state_db(reader)
+                # rc_db and state_db are different databases, so they are recovered at the same time
+                future: 'Future' = self._rc_db_executor.submit(self._recover_rc_db, reader, rc_data_path)
+                try:
+                    self._recover_state_db(reader)
+                finally:
+                    # Wait for the background worker not to close the reader which it is using
+                    wait((future,))
+                future.result()
                 self._wal_reader = reader
             else:
                 Logger.debug(tag=WAL_LOG_TAG, msg=f"Incomplete WAL file: {path}")
@@ -2040,10 +2317,14 @@ class IconServiceEngine(ContextContainer):
         Logger.debug(tag=WAL_LOG_TAG, msg="_recover_dbs() end")
 
     @staticmethod
-    def _is_need_to_recover_rc_db(wal_state: 'WALState', is_calc_period_start_block: bool) -> bool:
+    def _is_need_to_recover_rc_db(wal_state: 'WALState',
+                                  is_calc_period_start_block: bool,
+                                  is_standby_rc_db_marked: bool = False) -> bool:
+        # On the start block, the marker is written before WRITE_RC_DB and tracks standby_rc_db from then.
+        # SEND_CALCULATE is only found in WAL written by the previous versions
         if wal_state & WALState.WRITE_RC_DB:
             if not is_calc_period_start_block or \
-                    (is_calc_period_start_block and wal_state & WALState.SEND_CALCULATE):
+                    (is_calc_period_start_block and (wal_state & WALState.SEND_CALCULATE or is_standby_rc_db_marked)):
                 return False
 
         return True
@@ -2056,7 +2337,9 @@ class IconServiceEngine(ContextContainer):
         is_calc_period_start_block = bool(wal_state & WALState.CALC_PERIOD_START_BLOCK)
         Logger.info(tag=WAL_LOG_TAG, msg=f"reader state={wal_state}")
 
-        if not cls._is_need_to_recover_rc_db(wal_state, is_calc_period_start_block):
+        is_standby_rc_db_marked: bool = \
+            os.path.isfile(os.path.join(rc_data_path, RewardCalcStorage.STANDBY_RC_DB_MARKER_NAME))
+        if not cls._is_need_to_recover_rc_db(wal_state, is_calc_period_start_block, is_standby_rc_db_marked):
             Logger.info(tag=WAL_LOG_TAG, msg="rc_db has already been up-to-date")
             return
 
@@ -2079,10 +2362,6 @@ class IconServiceEngine(ContextContainer):
                 rc_version: int = max(rc_version, 0)
                 prev_calc_db.close()
 
-                # Process compaction before send the RC DB to reward calculator
-                prev_calc_db_path: str = os.path.join(rc_data_path, RewardCalcStorage.CURRENT_IISS_DB_NAME)
-                RewardCalcStorage.process_db_compaction(prev_calc_db_path)
-
                 calculate_block_height: int = reader.block.height - 1
                 standby_rc_db_path: str = RewardCalcStorage.rename_current_db_to_standby_db(rc_data_path,
                                                                                             calculate_block_height,
@@ -2094,7 +2373,9 @@ class IconServiceEngine(ContextContainer):
 
             current_db: 'KeyValueDatabase' = RewardCalcStorage.create_current_db(rc_data_path)
             if is_standby_exists:
-                RewardCalcStorage.rename_standby_db_to_iiss_db(standby_rc_db_path)
+                # It is prepared and sent to reward calculator by _recover_standby_rc_db()
+                standby_db_info = RewardCalcDBInfo(standby_rc_db_path, reader.block.height - 1)
+                RewardCalcStorage.write_standby_rc_db_marker(rc_data_path, standby_db_info)
         else:
             current_db: 'KeyValueDatabase' = RewardCalcStorage.create_current_db(rc_data_path)
 
@@ -2117,9 +2398,45 @@ class IconServiceEngine(ContextContainer):
 
         Logger.debug(tag=WAL_LOG_TAG, msg="_recover_state_db() end")
 
+    def _recover_standby_rc_db(self, rc_data_path: str):
+        """Prepare standby_rc_db which was not handed over to reward calculator before close
+
+        CALCULATE for it is sent on hello()
+
+        :param rc_data_path: The directory where iiss_dbs are contained
+        """
+        try:
+            marker: Optional[Tuple['RewardCalcDBInfo', bool]] = \
+                RewardCalcStorage.read_standby_rc_db_marker(rc_data_path)
+        except IllegalFormatException as e:
+            Logger.error(tag=WAL_LOG_TAG, msg=f"Invalid standby_rc_db marker: {e}")
+            marker = None
+
+        if marker is None:
+            return
+
+        standby_db_info, calculate_sent = marker
+        Logger.info(tag=WAL_LOG_TAG, msg=f"_recover_standby_rc_db(): {standby_db_info} calculate_sent={calculate_sent}")
+
+        if not calculate_sent:
+            iiss_db_path: str = RewardCalcStorage.get_iiss_db_path(standby_db_info.path)
+            if os.path.isdir(standby_db_info.path):
+                iiss_db_path: str = RewardCalcStorage.prepare_standby_db(standby_db_info.path)
+
+            if os.path.isdir(iiss_db_path):
+                self._pending_calculate = RewardCalcDBInfo(iiss_db_path, standby_db_info.block_height)
+                return
+
+            Logger.error(tag=WAL_LOG_TAG, msg=f"No rc_db for CALCULATE: {iiss_db_path}")
+
+        RewardCalcStorage.remove_standby_rc_db_marker(rc_data_path)
+
     def _get_write_ahead_log_path(self) -> str:
         return os.path.join(self._state_db_root_path, self.WAL_FILE)
 
+    def _get_rc_data_path(self) -> str:
+        return os.path.join(self._state_db_root_path, IISS_DB)
+
     def hello(self) -> dict:
         """If state_db and rc_db are recovered, send COMMIT_BLOCK message to reward calculator
         It is called on INVOKE thread
@@ -2136,8 +2453,8 @@ class IconServiceEngine(ContextContainer):
         if isinstance(self._wal_reader, WriteAheadLogReader):
             wal_state = WALState(self._wal_reader.state)
 
-            # If only writing rc_db is done on commit without sending COMMIT_BLOCK to rc,
-            # send COMMIT_BLOCK to rc prior to invoking a block
+            # If only writing rc_db is done on commit without sending COMMIT_BLOCK to rc
+            # or its response has not been verified, send COMMIT_BLOCK to rc prior to invoking a block
             if not (wal_state & WALState.SEND_COMMIT_BLOCK):
                 iiss_engine.send_commit(
                     self._wal_reader.block.height, self._wal_reader.instant_block_hash)
@@ -2147,6 +2464,12 @@ class IconServiceEngine(ContextContainer):
             # No need to use
             self._wal_reader = None
 
+        if self._pending_calculate is not None:
+            # CALCULATE follows COMMIT_BLOCK of the last block
+            iiss_engine.send_calculate(self._pending_calculate.path, self._pending_calculate.block_height)
+            self._pending_calculate = None
+            RewardCalcStorage.remove_standby_rc_db_marker(self._get_rc_data_path())
+
         # iiss_engine.init_reward_calculator(last_block)
 
         Logger.debug(tag=self.TAG, msg="hello() end")
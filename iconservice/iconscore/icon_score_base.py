@@ -482,6 +482,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
             if value:
                 length = len(value)
             context.step_counter.apply_step(StepType.GET, length)
+            context.score_stats.on_db_read(context, len(value) if value else 0)
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -509,6 +510,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
                 # newly storing a value
                 context.step_counter.apply_step(
                     StepType.SET, len(new_value))
+            context.score_stats.on_db_write(context, len(new_value))
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -527,6 +529,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
         if context and context.step_counter and not context.readonly:
             context.step_counter.apply_step(
                 StepType.DELETE, len(old_value))
+            context.score_stats.on_db_write(context, 0)
 
     @property
     def msg(self) -> 'Message':
@@ -568,6 +571,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
         Use block_height and now() instead.
         """
         warnings.warn("Use block_height and now() instead", DeprecationWarning, stacklevel=2)
+        self._context.mark_block_dependent()
         return Block(self._context.block.height, self._context.block.timestamp)
 
     @property
@@ -621,6 +625,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
 
         :return: current block height
         """
+        self._context.mark_block_dependent()
         return self._context.block.height
 
     def now(self) -> int:
@@ -629,6 +634,7 @@ class IconScoreBase(IconScoreObject, ContextGetter,
 
         :return: timestamp in microseconds
         """
+        self._context.mark_block_dependent()
         return self._context.block.timestamp
 
     def call(self, addr_to: 'Address', func_name: str, kw_dict: dict, amount: int = 0):
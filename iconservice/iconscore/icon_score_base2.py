@@ -329,6 +329,9 @@ def get_main_prep_info() -> Tuple[List[PRepInfo], int]:
     context = ContextContainer._get_context()
     assert context
 
+    # Term is changed only on a block basis
+    context.mark_block_dependent()
+
     term = context.term
     if term is None:
         return [], -1
@@ -348,6 +351,9 @@ def get_sub_prep_info() -> Tuple[List[PRepInfo], int]:
     context = ContextContainer._get_context()
     assert context
 
+    # Term is changed only on a block basis
+    context.mark_block_dependent()
+
     term = context.term
     if term is None:
         return [], -1
@@ -18,29 +18,72 @@ import importlib
 import json
 import os
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from .utils import get_package_name_by_address_and_tx_hash, get_score_deploy_path
+from iconcommons.logger import Logger
+
+from .score_code_cache import ScoreCodeFinder, compile_score_package, load_score_code, save_score_code
+from .utils import get_package_name_by_address_and_tx_hash, get_score_deploy_path, get_score_code_cache_path
 from ..base.address import Address
 from ..base.exception import IllegalFormatException
 from ..icon_constant import PACKAGE_JSON_FILE
 
 if TYPE_CHECKING:
     from ..base.address import Address
+    from .score_code_cache import ScoreCode
 
 
 class IconScoreClassLoader(object):
     """IconScoreBase subclass Loader
 
     """
+    # Imports SCORE modules from their compiled code instead of scanning score_root_path
+    _finder = ScoreCodeFinder()
+
     @staticmethod
     def init(score_root_path: str):
         if score_root_path not in sys.path:
             sys.path.append(score_root_path)
+        if IconScoreClassLoader._finder not in sys.meta_path:
+            sys.meta_path.insert(0, IconScoreClassLoader._finder)
 
     @staticmethod
     def exit(score_root_path: str):
         sys.path.remove(score_root_path)
+        if IconScoreClassLoader._finder in sys.meta_path:
+            sys.meta_path.remove(IconScoreClassLoader._finder)
+        IconScoreClassLoader._finder.clear()
+
+    @staticmethod
+    def get_score_code(score_address: 'Address', tx_hash: bytes, score_root_path: str) -> 'ScoreCode':
+        """Returns the compiled code of a SCORE package
+
+        SCORE package is compiled only once after being written to score_deploy_path
+        and its code objects are cached in a file next to score_deploy_path for restart
+
+        :param score_address:
+        :param tx_hash:
+        :param score_root_path:
+        :return: code objects by module name relative to SCORE package
+        """
+        package_name: str = get_package_name_by_address_and_tx_hash(score_address, tx_hash)
+        modules: Optional['ScoreCode'] = IconScoreClassLoader._finder.get(package_name)
+        if modules is not None:
+            return modules
+
+        score_deploy_path: str = get_score_deploy_path(score_root_path, score_address, tx_hash)
+        cache_path: str = get_score_code_cache_path(score_root_path, score_address, tx_hash)
+
+        modules = load_score_code(cache_path, score_deploy_path, tx_hash)
+        if modules is None:
+            modules = compile_score_package(score_deploy_path)
+            try:
+                save_score_code(cache_path, score_deploy_path, tx_hash, modules)
+            except OSError as e:
+                Logger.warning(tag="SCORE_CODE_CACHE", msg=f"Failed to save SCORE code cache: {cache_path} {e}")
+
+        IconScoreClassLoader._finder.register(package_name, score_deploy_path, modules)
+        return modules
 
     @staticmethod
     def _load_package_json(score_deploy_path: str) -> dict:
@@ -89,8 +132,7 @@ class IconScoreClassLoader(object):
         package_json: dict = IconScoreClassLoader._load_package_json(score_deploy_path)
         main_module, main_score = IconScoreClassLoader._get_package_info(package_json)
 
-        # In order for the new module to be noticed by the import system
-        importlib.invalidate_caches()
+        IconScoreClassLoader.get_score_code(score_address, tx_hash, score_root_path)
         module = importlib.import_module(f".{main_module}", package_name)
 
         return getattr(module, main_score)
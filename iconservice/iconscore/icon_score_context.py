@@ -22,16 +22,18 @@ from typing import TYPE_CHECKING, Optional, List
 from iconcommons.logger import Logger
 
 from .icon_score_mapper import IconScoreMapper
+from .icon_score_stats import ScoreStats
 from .icon_score_trace import Trace
 from ..base.block import Block
 from ..base.exception import FatalException
 from ..base.message import Message
 from ..base.transaction import Transaction
-from ..database.batch import BlockBatch, TransactionBatch
+from ..database.batch import BlockBatch, RewardCalcBatch, TransactionBatch
 from ..icon_constant import (
     IconScoreContextType, IconScoreFuncType, TERM_PERIOD, PRepGrade, PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS,
     Revision, PRepFlag)
 from ..icx.issue.regulator import Regulator
+from ..icx.storage import Storage as IcxStorage
 
 if TYPE_CHECKING:
     from .icon_score_base import IconScoreBase
@@ -121,6 +123,7 @@ class IconScoreContext(object):
     precommitdata_log_flag = False
     step_trace_flag: bool = False
     log_level: str = None
+    score_stats: 'ScoreStats' = ScoreStats()
 
     """Contains the useful information to process user's JSON-RPC request
     """
@@ -140,8 +143,8 @@ class IconScoreContext(object):
         self.revision: int = 0
         self.block_batch: Optional['BlockBatch'] = None
         self.tx_batch: Optional['TransactionBatch'] = None
-        self.rc_block_batch: list = []
-        self.rc_tx_batch: list = []
+        self.rc_block_batch = RewardCalcBatch()
+        self.rc_tx_batch = RewardCalcBatch()
         self.new_icon_score_mapper: Optional['IconScoreMapper'] = None
         self.cumulative_step_used: int = 0
         self.step_counter: Optional['IconScoreStepCounter'] = None
@@ -161,6 +164,9 @@ class IconScoreContext(object):
 
         self.regulator: Optional['Regulator'] = None
 
+        # State keys read while processing a query, which are used by QueryCache
+        self.read_keys: Optional[set] = None
+
     @classmethod
     def set_decentralize_trigger(cls, decentralize_trigger: float):
         decentralize_trigger: float = decentralize_trigger
@@ -186,6 +192,15 @@ class IconScoreContext(object):
     def term(self) -> Optional['Term']:
         return self._term
 
+    def mark_block_dependent(self):
+        """Mark that the query result being made depends on the current block as well as states
+
+        LAST_BLOCK_KEY is changed on every block commit,
+        so the result is invalidated whenever a new block is committed
+        """
+        if self.read_keys is not None:
+            self.read_keys.add(IcxStorage.LAST_BLOCK_KEY)
+
     def is_decentralized(self) -> bool:
         return self.engine.prep.term is not None
 
@@ -20,7 +20,6 @@ from typing import TYPE_CHECKING, Optional, Tuple
 from .icon_score_class_loader import IconScoreClassLoader
 from .icon_score_mapper_object import IconScoreInfo
 from .score_package_validator import ScorePackageValidator
-from .utils import get_package_name_by_address_and_tx_hash, get_score_deploy_path
 from ..base.address import Address, ZERO_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
 from ..base.exception import ScoreNotFoundException, AccessDeniedException, FatalException
 from ..database.db import IconScoreDatabase
@@ -31,6 +30,7 @@ if TYPE_CHECKING:
     from .icon_score_context import IconScoreContext
     from .icon_score_base import IconScoreBase
     from .icon_score_mapper import IconScoreMapper
+    from .score_code_cache import ScoreCode
     from ..deploy.storage import IconScoreDeployTXParams, IconScoreDeployInfo
 
 
@@ -151,11 +151,11 @@ class IconScoreContextUtil(object):
         if not IconScoreContextUtil.is_service_flag_on(context, IconServiceFlag.SCORE_PACKAGE_VALIDATOR):
             return
 
-        score_deploy_path: str = get_score_deploy_path(context.score_root_path, address, tx_hash)
-        score_package_name: str = get_package_name_by_address_and_tx_hash(address, tx_hash)
+        # The compiled code is reused when the SCORE is imported
+        modules: 'ScoreCode' = IconScoreClassLoader.get_score_code(address, tx_hash, context.score_root_path)
         import_whitelist: dict = IconScoreContextUtil._get_import_whitelist(context)
 
-        ScorePackageValidator.execute(import_whitelist, score_deploy_path, score_package_name)
+        ScorePackageValidator.execute(import_whitelist, modules)
 
     @staticmethod
     def _get_import_whitelist(context: 'IconScoreContext') -> dict:
@@ -111,7 +111,8 @@ class IconScoreEngine(object):
         context.current_address: 'Address' = icon_score_address
 
         score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        ret = score_func(func_name=func_name, kw_params=converted_params)
+        with context.score_stats.measure(context, icon_score_address, func_name):
+            ret = score_func(func_name=func_name, kw_params=converted_params)
 
         # No problem even though ret is None
         return deepcopy(ret)
@@ -139,7 +140,8 @@ class IconScoreEngine(object):
         icon_score = IconScoreEngine._get_icon_score(context, score_address)
 
         score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        score_func(STR_FALLBACK)
+        with context.score_stats.measure(context, score_address, STR_FALLBACK):
+            score_func(STR_FALLBACK)
 
     @staticmethod
     def _get_icon_score(context: 'IconScoreContext', icon_score_address: 'Address'):
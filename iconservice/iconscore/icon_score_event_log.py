@@ -19,8 +19,9 @@ from typing import TYPE_CHECKING, List, Optional, Any
 from .icon_score_step import StepType
 from ..base.address import Address, ICON_ADDRESS_BYTES_SIZE, ICON_ADDRESS_BODY_SIZE
 from ..base.exception import InvalidEventLogException
+from ..base.type_converter import TypeConverter
 from ..icon_constant import DATA_BYTE_ORDER, Revision
-from ..utils import int_to_bytes, byte_length_of_int
+from ..utils import int_to_bytes, byte_length_of_int, to_camel_case
 
 if TYPE_CHECKING:
     from .icon_score_constant import BaseType
@@ -31,6 +32,11 @@ class EventLog(object):
     """ A DataClass of a event log.
     """
 
+    __slots__ = ("score_address", "indexed", "data")
+
+    # (attribute, camelCase key) in order of the dict properties
+    _KEYS = (("score_address", "scoreAddress"), ("indexed", "indexed"), ("data", "data"))
+
     def __init__(
             self,
             score_address: 'Address',
@@ -52,7 +58,7 @@ class EventLog(object):
         self.data: 'List[BaseType]' = data
 
     def __str__(self) -> str:
-        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
+        return '\n'.join([f'{k}: {getattr(self, k)}' for k in self.__slots__])
 
     def to_dict(self, casing: Optional = None) -> dict:
         """
@@ -60,15 +66,33 @@ class EventLog(object):
         :return: a dict
         """
         new_dict = {}
-        for key, value in self.__dict__.items():
+        for key, camel_case_key in self._KEYS:
+            value = getattr(self, key)
             if value is None:
                 # Excludes properties which have `None` value
                 continue
 
-            new_dict[casing(key) if casing else key] = value
+            if casing is to_camel_case:
+                key = camel_case_key
+            elif casing:
+                key = casing(key)
+            new_dict[key] = value
 
         return new_dict
 
+    def to_response(self) -> dict:
+        """Returns camelCase properties converted for the response
+
+        It equals to TypeConverter.convert_type_reverse(self.to_dict(to_camel_case))
+        without making an intermediate dict
+        """
+        convert = TypeConverter.convert_type_reverse
+        return {
+            "scoreAddress": convert(self.score_address),
+            "indexed": [convert(value) for value in self.indexed],
+            "data": [convert(value) for value in self.data]
+        }
+
 
 class EventLogEmitter(object):
     @staticmethod
@@ -20,7 +20,9 @@ from .icon_score_event_log import EventLog
 from ..base.address import Address
 from ..base.block import Block
 from ..base.exception import ExceptionCode
+from ..base.type_converter import TypeConverter
 from ..icon_constant import DATA_BYTE_ORDER
+from ..utils import to_camel_case
 from ..utils.bloom import BloomFilter
 
 if TYPE_CHECKING:
@@ -34,7 +36,19 @@ class TransactionResult(object):
     SUCCESS = 1
     FAILURE = 0
 
+    __slots__ = (
+        "tx_hash", "block_height", "block_hash", "tx_index", "to", "score_address",
+        "step_used", "step_price", "cumulative_step_used", "event_logs", "logs_bloom", "status",
+        "step_used_details", "failure", "traces"
+    )
+
+    # (attribute, camelCase key) in order of the dict properties
+    # traces are excluded from dict property
+    _KEYS = tuple((key, to_camel_case(key)) for key in __slots__ if key != "traces")
+
     class Failure(object):
+        __slots__ = ("code", "message")
+
         def __init__(self, code: int, message: str):
             """MUST check arguments type strictly
 
@@ -98,7 +112,7 @@ class TransactionResult(object):
         self.traces = None
 
     def __str__(self) -> str:
-        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
+        return '\n'.join([f'{k}: {getattr(self, k)}' for k in self.__slots__])
 
     def to_dict(self, casing: Optional = None) -> dict:
         """
@@ -106,12 +120,16 @@ class TransactionResult(object):
         :return: a dict
         """
         new_dict = {}
-        for key, value in self.__dict__.items():
+        for key, camel_case_key in self._KEYS:
+            value = getattr(self, key)
             # Excludes properties which have `None` value
             if value is None:
                 continue
 
-            new_key = casing(key) if casing else key
+            if casing is to_camel_case:
+                new_key = camel_case_key
+            else:
+                new_key = casing(key) if casing else key
             if key == 'event_logs':
                 new_dict[new_key] = [v.to_dict(casing) for v in value if
                                      isinstance(v, EventLog)]
@@ -130,10 +148,37 @@ class TransactionResult(object):
 
                 for address in value:
                     step_used_details[str(address)] = value[address]
-            elif key == 'traces':
-                # traces are excluded from dict property
-                continue
             else:
                 new_dict[new_key] = value
 
         return new_dict
+
+    def to_response(self) -> dict:
+        """Returns camelCase properties converted for the response to loopchain
+
+        It equals to TypeConverter.convert_type_reverse(self.to_dict(to_camel_case))
+        but converts each value once without making an intermediate dict
+        """
+        convert = TypeConverter.convert_value_reverse
+        new_dict = {}
+        for key, camel_case_key in self._KEYS:
+            value = getattr(self, key)
+            if value is None:
+                continue
+
+            if key == 'event_logs':
+                new_dict[camel_case_key] = [v.to_response() for v in value if isinstance(v, EventLog)]
+            elif isinstance(value, BloomFilter):
+                new_dict[camel_case_key] = f'0x{int(value).to_bytes(256, byteorder=DATA_BYTE_ORDER).hex()}'
+            elif key == 'failure':
+                if self.status == self.FAILURE:
+                    new_dict[camel_case_key] = {
+                        'code': convert('code', value.code),
+                        'message': convert('message', value.message)
+                    }
+            elif key == 'step_used_details':
+                new_dict[camel_case_key] = {str(address): convert(None, step) for address, step in value.items()}
+            else:
+                new_dict[camel_case_key] = convert(camel_case_key, value)
+
+        return new_dict
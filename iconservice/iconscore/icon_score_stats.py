@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from ..icon_constant import IconScoreContextType, ICON_SERVICE_LOG_TAG
+
+if TYPE_CHECKING:
+    from .icon_score_context import IconScoreContext
+    from ..base.address import Address
+
+_TAG = f"{ICON_SERVICE_LOG_TAG}_ScoreStats"
+
+# (SCORE address, method name)
+StatsKey = Tuple['Address', str]
+
+
+class ScoreMethodStats(object):
+    """Execution statistics of a SCORE method
+
+    Time, steps and DB accesses of nested SCORE calls are excluded
+    so that each of them is accounted to the SCORE method which has actually consumed it.
+    """
+    __slots__ = ("count", "time", "steps", "reads", "writes", "read_bytes", "written_bytes")
+
+    def __init__(self):
+        self.count: int = 0
+        # nanoseconds
+        self.time: int = 0
+        self.steps: int = 0
+        self.reads: int = 0
+        self.writes: int = 0
+        self.read_bytes: int = 0
+        self.written_bytes: int = 0
+
+    def merge(self, other: 'ScoreMethodStats'):
+        self.count += other.count
+        self.time += other.time
+        self.steps += other.steps
+        self.reads += other.reads
+        self.writes += other.writes
+        self.read_bytes += other.read_bytes
+        self.written_bytes += other.written_bytes
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "time": self.time // 1000,
+            "steps": self.steps,
+            "timePerStep": self.time // self.steps if self.steps > 0 else 0,
+            "reads": self.reads,
+            "writes": self.writes,
+            "readBytes": self.read_bytes,
+            "writtenBytes": self.written_bytes
+        }
+
+
+class _NullMeasure(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_MEASURE = _NullMeasure()
+
+
+def _perf_counter_ns() -> int:
+    # time.perf_counter_ns() is not supported before python 3.7
+    return int(time.perf_counter() * 1_000_000_000)
+
+
+class _Measure(object):
+    """A frame of a SCORE method call
+    """
+    __slots__ = ("_owner", "_context", "_key", "_start_time", "_start_steps",
+                 "child_time", "child_steps", "stats")
+
+    def __init__(self, owner: 'ScoreStats', context: 'IconScoreContext', key: StatsKey):
+        self._owner = owner
+        self._context = context
+        self._key = key
+        self._start_time: int = 0
+        self._start_steps: int = 0
+        self.child_time: int = 0
+        self.child_steps: int = 0
+        self.stats = ScoreMethodStats()
+
+    def __enter__(self):
+        self._owner.frames.append(self)
+        self._start_steps = self._context.step_counter.step_used
+        self._start_time = _perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed: int = _perf_counter_ns() - self._start_time
+        steps: int = self._context.step_counter.step_used - self._start_steps
+
+        frames: List['_Measure'] = self._owner.frames
+        frames.pop()
+        if frames:
+            parent: '_Measure' = frames[-1]
+            parent.child_time += elapsed
+            parent.child_steps += steps
+
+        stats: 'ScoreMethodStats' = self.stats
+        stats.count = 1
+        stats.time = elapsed - self.child_time
+        stats.steps = steps - self.child_steps
+        self._owner.add(self._key, stats)
+        return False
+
+
+class ScoreStats(object):
+    """Aggregates execution statistics per (SCORE address, method) while invoking a block
+
+    Only SCOREs called in INVOKE contexts are measured.
+    Those are processed by the invoke thread, so the frames of nested calls are kept in a list.
+    Statistics of the block being invoked are rolled over to the last block on end_block().
+    """
+
+    def __init__(self, enabled: bool = False, dump_path: Optional[str] = None):
+        self._enabled: bool = enabled
+        self._dump_path: Optional[str] = dump_path if dump_path else None
+        self._lock = Lock()
+
+        self.frames: List['_Measure'] = []
+
+        self._block_height: int = -1
+        self._current: Dict[StatsKey, 'ScoreMethodStats'] = {}
+
+        self._last_block_height: int = -1
+        self._last_block: Dict[StatsKey, 'ScoreMethodStats'] = {}
+        self._total: Dict[StatsKey, 'ScoreMethodStats'] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def measure(self, context: 'IconScoreContext', score_address: 'Address', method: str):
+        """Returns a context manager which measures a SCORE method call
+
+        :param context: the context which calls the SCORE
+        :param score_address: SCORE address
+        :param method: method name
+        """
+        if not self._enabled or context.type != IconScoreContextType.INVOKE:
+            return _NULL_MEASURE
+
+        return _Measure(self, context, (score_address, method))
+
+    def on_db_read(self, context: 'IconScoreContext', size: int):
+        if self._enabled and self.frames and context.type == IconScoreContextType.INVOKE:
+            stats: 'ScoreMethodStats' = self.frames[-1].stats
+            stats.reads += 1
+            stats.read_bytes += size
+
+    def on_db_write(self, context: 'IconScoreContext', size: int):
+        if self._enabled and self.frames and context.type == IconScoreContextType.INVOKE:
+            stats: 'ScoreMethodStats' = self.frames[-1].stats
+            stats.writes += 1
+            stats.written_bytes += size
+
+    def add(self, key: StatsKey, stats: 'ScoreMethodStats'):
+        with self._lock:
+            current: Optional['ScoreMethodStats'] = self._current.get(key)
+            if current is None:
+                current = self._current[key] = ScoreMethodStats()
+            current.merge(stats)
+
+    def start_block(self, block_height: int):
+        """Discards the statistics of the block which has not been finished
+        """
+        if not self._enabled:
+            return
+
+        self.frames.clear()
+        with self._lock:
+            self._block_height = block_height
+            self._current = {}
+
+    def end_block(self):
+        """Rolls over the statistics of the invoked block
+        """
+        if not self._enabled:
+            return
+
+        with self._lock:
+            self._last_block_height = self._block_height
+            self._last_block = self._current
+            self._current = {}
+
+            for key, stats in self._last_block.items():
+                total: Optional['ScoreMethodStats'] = self._total.get(key)
+                if total is None:
+                    total = self._total[key] = ScoreMethodStats()
+                total.merge(stats)
+
+            if self._dump_path is not None:
+                self._dump(self._dump_path, self._last_block_height, self._last_block)
+
+    def get_stats(self) -> dict:
+        """Returns the statistics of the last invoked block and the total ones since the service started
+        """
+        with self._lock:
+            return {
+                "blockHeight": self._last_block_height,
+                "lastBlock": self._to_list(self._last_block),
+                "total": self._to_list(self._total)
+            }
+
+    @staticmethod
+    def _to_list(stats_map: Dict[StatsKey, 'ScoreMethodStats']) -> List[dict]:
+        ret = []
+
+        # The most time-consuming one comes first
+        for (score_address, method), stats in sorted(stats_map.items(), key=lambda item: -item[1].time):
+            item: dict = stats.to_dict()
+            item["score"] = score_address
+            item["method"] = method
+            ret.append(item)
+
+        return ret
+
+    @classmethod
+    def _dump(cls, path: str, block_height: int, stats_map: Dict[StatsKey, 'ScoreMethodStats']):
+        items: List[dict] = cls._to_list(stats_map)
+        for item in items:
+            item["score"] = str(item["score"])
+
+        try:
+            with open(path, "a") as f:
+                f.write(json.dumps({"blockHeight": block_height, "stats": items}))
+                f.write("\n")
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to dump score stats: {e}")
@@ -142,7 +142,8 @@ class InternalCall(object):
             icon_score = IconScoreContextUtil.get_icon_score(context, addr_to)
             context.set_func_type_by_icon_score(icon_score, func_name)
             score_func = getattr(icon_score, ATTR_SCORE_CALL)
-            return score_func(func_name=func_name, arg_params=arg_params, kw_params=kw_params)
+            with context.score_stats.measure(context, addr_to, func_name):
+                return score_func(func_name=func_name, arg_params=arg_params, kw_params=kw_params)
         finally:
             context.func_type = prev_func_type
             context.current_address = addr_from
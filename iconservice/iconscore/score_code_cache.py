@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("compile_score_package", "save_score_code", "load_score_code", "ScoreCodeFinder")
+
+import importlib.util
+import marshal
+import os
+import struct
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import CodeType
+from typing import Dict, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from ..base.exception import IllegalFormatException
+from ..icon_constant import DATA_BYTE_ORDER
+from ..utils.checksum_file import read_checksum_file, write_checksum_file
+
+_TAG = "SCORE_CODE_CACHE"
+
+_MAGIC_KEY = b"SCCC"
+_FILE_VERSION = 2
+
+# python_magic(4) | tx_hash(32) | deploy_path_stamp(16)
+_HEADER_STRUCT_FORMAT = ">4s32s16s"
+_HEADER_SIZE = struct.calcsize(_HEADER_STRUCT_FORMAT)
+
+_INIT_MODULE = "__init__"
+
+# {module name relative to SCORE package: (is_package, code or None for a directory without __init__.py)}
+ScoreCode = Dict[str, Tuple[bool, Optional[CodeType]]]
+
+
+def compile_score_package(score_deploy_path: str) -> 'ScoreCode':
+    """Compile all python files in a deployed SCORE package
+
+    :param score_deploy_path: score_root_path/score_address/tx_hash
+    :return: code objects by module name relative to SCORE package, "" for SCORE package itself
+    """
+    modules: 'ScoreCode' = {"": (True, None)}
+
+    for dir_path, _, file_names in os.walk(score_deploy_path):
+        sub_pkg_path: str = os.path.relpath(dir_path, score_deploy_path)
+        package: str = "" if sub_pkg_path == "." else sub_pkg_path.replace(os.sep, ".")
+
+        for file_name in file_names:
+            module, extension = os.path.splitext(file_name)
+            if extension != ".py":
+                continue
+
+            path: str = os.path.join(dir_path, file_name)
+            with open(path, "rb") as f:
+                code: 'CodeType' = compile(f.read(), path, "exec", dont_inherit=True)
+
+            if module == _INIT_MODULE:
+                modules[package] = (True, code)
+            else:
+                modules[f"{package}.{module}" if package else module] = (False, code)
+
+            # Sub packages without __init__.py are importable as well
+            parent: str = package
+            while parent not in modules:
+                modules[parent] = (True, None)
+                parent = parent.rpartition(".")[0]
+
+    return modules
+
+
+def _get_deploy_path_stamp(score_deploy_path: str) -> bytes:
+    """Returns what identifies the directory where a SCORE package is written
+
+    SCORE package is always written to a newly created directory,
+    so the cache of the previous one is detected without reading source files
+    """
+    stat = os.stat(score_deploy_path)
+    return stat.st_ino.to_bytes(8, DATA_BYTE_ORDER) + stat.st_ctime_ns.to_bytes(8, DATA_BYTE_ORDER)
+
+
+def save_score_code(path: str, score_deploy_path: str, tx_hash: bytes, modules: 'ScoreCode'):
+    """Write the compiled code of a SCORE package to a cache file
+
+    header: | python_magic | tx_hash | deploy_path_stamp |
+    payload: marshal(modules)
+
+    :param path: cache file path
+    :param score_deploy_path: score_root_path/score_address/tx_hash
+    :param tx_hash: tx hash which deployed the SCORE package
+    :param modules: returned by compile_score_package()
+    """
+    payload: bytes = marshal.dumps(modules)
+    header: bytes = struct.pack(
+        _HEADER_STRUCT_FORMAT, importlib.util.MAGIC_NUMBER, tx_hash, _get_deploy_path_stamp(score_deploy_path))
+    write_checksum_file(path, _MAGIC_KEY, _FILE_VERSION, header, payload)
+
+
+def load_score_code(path: str, score_deploy_path: str, tx_hash: bytes) -> Optional['ScoreCode']:
+    """Read the compiled code of a SCORE package from a cache file
+
+    :param path: cache file path
+    :param score_deploy_path: score_root_path/score_address/tx_hash
+    :param tx_hash: tx hash which deployed the SCORE package
+    :return: code objects or None if the cache is missing, stale, compiled by another python version or broken
+    """
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        header, payload = read_checksum_file(path, _MAGIC_KEY, _FILE_VERSION)
+        return _load_score_code(header, payload, _get_deploy_path_stamp(score_deploy_path), tx_hash)
+    except IllegalFormatException as e:
+        Logger.warning(tag=_TAG, msg=f"Invalid SCORE code cache: {path} {e}")
+        return None
+
+
+def _load_score_code(header: bytes, payload: bytes,
+                     deploy_path_stamp: bytes, tx_hash: bytes) -> Optional['ScoreCode']:
+    if len(header) != _HEADER_SIZE:
+        raise IllegalFormatException(f"Invalid header size: {len(header)}")
+
+    python_magic, cached_tx_hash, cached_deploy_path_stamp = struct.unpack(_HEADER_STRUCT_FORMAT, header)
+    if cached_tx_hash != tx_hash:
+        raise IllegalFormatException(f"Tx hash mismatch: 0x{cached_tx_hash.hex()}")
+
+    if cached_deploy_path_stamp != deploy_path_stamp:
+        Logger.info(tag=_TAG, msg=f"Stale SCORE code cache: package redeployed with tx_hash=0x{tx_hash.hex()}")
+        return None
+    if python_magic != importlib.util.MAGIC_NUMBER:
+        # Code objects are not compatible between python versions
+        return None
+
+    return marshal.loads(payload)
+
+
+class ScoreCodeLoader(Loader):
+    """Executes the code objects of a SCORE package instead of reading its source files
+    """
+    def __init__(self, package_name: str, score_deploy_path: str, modules: 'ScoreCode'):
+        self.package_name = package_name
+        self.score_deploy_path = score_deploy_path
+        self.modules = modules
+
+    def find_spec(self, fullname: str) -> Optional['ModuleSpec']:
+        name: str = fullname[len(self.package_name) + 1:]
+        if name not in self.modules:
+            return None
+
+        is_package, code = self.modules[name]
+        path: str = os.path.join(self.score_deploy_path, *name.split(".")) if name else self.score_deploy_path
+
+        if is_package:
+            origin: str = os.path.join(path, f"{_INIT_MODULE}.py") if code else None
+            spec = ModuleSpec(fullname, self, origin=origin, is_package=True)
+            spec.submodule_search_locations = [path]
+        else:
+            spec = ModuleSpec(fullname, self, origin=f"{path}.py")
+        spec.has_location = spec.origin is not None
+
+        return spec
+
+    def create_module(self, spec: 'ModuleSpec'):
+        # Use default module creation semantics
+        return None
+
+    def exec_module(self, module):
+        _, code = self.modules[module.__name__[len(self.package_name) + 1:]]
+        if code is not None:
+            exec(code, module.__dict__)
+
+
+class ScoreCodeFinder(MetaPathFinder):
+    """Finds the modules of registered SCORE packages without scanning score_root_path
+
+    SCORE package name: score_address.tx_hash
+    """
+    def __init__(self):
+        self._loaders: Dict[str, 'ScoreCodeLoader'] = {}
+        # score_address: score_root_path/score_address
+        self._score_paths: Dict[str, str] = {}
+
+    def register(self, package_name: str, score_deploy_path: str, modules: 'ScoreCode'):
+        self._loaders[package_name] = ScoreCodeLoader(package_name, score_deploy_path, modules)
+        self._score_paths[package_name.partition(".")[0]] = os.path.dirname(score_deploy_path)
+
+    def get(self, package_name: str) -> Optional['ScoreCode']:
+        loader: Optional['ScoreCodeLoader'] = self._loaders.get(package_name)
+        return None if loader is None else loader.modules
+
+    def clear(self):
+        self._loaders.clear()
+        self._score_paths.clear()
+
+    def find_spec(self, fullname: str, path=None, target=None) -> Optional['ModuleSpec']:
+        score_path: Optional[str] = self._score_paths.get(fullname)
+        if score_path is not None:
+            # Namespace package which contains all tx_hash packages of a SCORE
+            spec = ModuleSpec(fullname, None, is_package=True)
+            spec.submodule_search_locations = [score_path]
+            return spec
+
+        package_name: str = ".".join(fullname.split(".", 2)[:2])
+        loader: Optional['ScoreCodeLoader'] = self._loaders.get(package_name)
+        if loader is None:
+            return None
+
+        return loader.find_spec(fullname)
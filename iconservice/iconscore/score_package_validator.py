@@ -14,11 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import importlib.util
-import os
+import importlib
+from typing import TYPE_CHECKING
 
 from ..base.exception import IllegalFormatException
 
+if TYPE_CHECKING:
+    from .score_code_cache import ScoreCode
+
 CODE_ATTR = 'co_code'
 CODE_NAMES_ATTR = 'co_names'
 
@@ -41,7 +44,6 @@ OPCODE_HEADER_END_INDEX = 4
 
 class ScorePackageValidator(object):
     WHITELIST_IMPORT = {}
-    CUSTOM_IMPORT_LIST = []
     ICONSERVICE_WHITELIST = []
 
     @classmethod
@@ -53,72 +55,29 @@ class ScorePackageValidator(object):
 
     @classmethod
     def _load_iconservice_whitelist(cls):
-        spec = importlib.util.find_spec(BASE_PACKAGE)
-        code = spec.loader.get_code(BASE_PACKAGE)
-
-        if not hasattr(code, CODE_ATTR):
-            return
-
-        byte_code_list = [x for x in code.co_code]
-
-        length_byte_code_list = len(byte_code_list)
-        for code_index in range(OPCODE_HEADER_END_INDEX, length_byte_code_list, 2):
-            key = byte_code_list[code_index]
-            if IMPORT_NAME == key:
-                # import_name_index = byte_code_list[code_index + 1]
-                from_list_index = byte_code_list[code_index - 1]
-                level_index = byte_code_list[code_index - 3]
-
-                level = code.co_consts[level_index]
-                if level == 0:
-                    continue
-
-                from_list = code.co_consts[from_list_index]
-                cls.ICONSERVICE_WHITELIST.extend(from_list)
+        # SCORE APIs are imported lazily by iconservice package, so they are looked up in its table
+        package = importlib.import_module(BASE_PACKAGE)
+        cls.ICONSERVICE_WHITELIST.extend(
+            name for name, module_name in package.SCORE_API_MODULES.items() if module_name.startswith("."))
         return cls.ICONSERVICE_WHITELIST
 
     @classmethod
     def execute(cls,
                 whitelist_table: dict,
-                pkg_root_path: str,
-                pkg_root_package: str) -> callable:
+                modules: 'ScoreCode') -> callable:
 
         cls.WHITELIST_IMPORT = whitelist_table
-        cls.CUSTOM_IMPORT_LIST = cls._make_custom_import_list(pkg_root_path)
         cls._init_iconservice_whitelist()
 
-        # in order for the new module to be noticed by the import system
-        importlib.invalidate_caches()
-
-        for imp in cls.CUSTOM_IMPORT_LIST:
-            full_name = f'{pkg_root_package}.{imp}'
-
-            spec = importlib.util.find_spec(full_name)
-            code = spec.loader.get_code(full_name)
+        # Validate the code objects which are going to be imported
+        for _, code in modules.values():
+            if code is None:
+                continue
 
             cls._validate_import_from_code(code)
             cls._validate_import_from_const(code.co_consts)
             cls._validate_blacklist_keyword_from_names(code.co_names)
 
-    @classmethod
-    def _make_custom_import_list(cls,
-                                 pkg_root_path: str) -> list:
-        tmp_list = []
-        for dirpath, _, filenames in os.walk(pkg_root_path):
-            for file in filenames:
-                file_name, extension = os.path.splitext(file)
-                if extension != '.py':
-                    continue
-                sub_pkg_path = os.path.relpath(dirpath, pkg_root_path)
-                if sub_pkg_path == '.':
-                    pkg_path = file_name
-                else:
-                    # sub_package
-                    sub_pkg_path = sub_pkg_path.replace('/', '.')
-                    pkg_path = f'{sub_pkg_path}.{file_name}'
-                tmp_list.append(pkg_path)
-        return tmp_list
-
     @classmethod
     def _validate_blacklist_keyword_from_names(cls,
                                                co_names: tuple):
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 from ...base.type_converter import TypeConverter
@@ -44,6 +43,5 @@ class BaseTransactionCreator(object):
 
     @staticmethod
     def _generate_transaction_hash(transaction_params: dict) -> bytes:
-        copied_transaction_params: dict = deepcopy(transaction_params)
-        converted_transaction_params: dict = TypeConverter.convert_type_reverse(copied_transaction_params)
-        return HashGenerator.generate_hash(converted_transaction_params)
+        # Values are converted while being serialized instead of converting a copy of transaction_params
+        return HashGenerator.generate_hash(transaction_params, TypeConverter.convert_value_reverse)
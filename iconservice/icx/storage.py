@@ -262,6 +262,8 @@ class Storage(StorageBase):
 
         if AccountPartFlag.STAKE in part_flags:
             stake_part: 'StakePart' = self._get_part(context, StakePart, address)
+            # Unstaked coin is returned to balance according to the current block height
+            context.mark_block_dependent()
 
         if AccountPartFlag.DELEGATION in part_flags:
             delegation_part: 'DelegationPart' = self._get_part(context, DelegationPart, address)
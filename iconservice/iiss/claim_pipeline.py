@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from iconcommons.logger import Logger
+
+from ..base.address import Address, ZERO_SCORE_ADDRESS
+from ..icon_constant import IISS_LOG_TAG, INVALID_CLAIM_TX
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from ..base.block import Block
+    from .reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+
+_TAG = IISS_LOG_TAG
+
+
+def is_claim_tx_request(params: dict) -> bool:
+    if params.get("to") != ZERO_SCORE_ADDRESS or params.get("dataType") != "call":
+        return False
+
+    data = params.get("data")
+    return isinstance(data, dict) and data.get("method") == "claimIScore"
+
+
+class ClaimPipeline(object):
+    """Pipelines the claimIScore round-trips to the reward calculator in a block
+
+    CLAIM requests for all claimIScore txs in a block are sent at once before the txs are executed,
+    and their responses are consumed in tx order.
+    COMMIT_CLAIM messages are coalesced into one COMMIT_CLAIM_BATCH message.
+
+    Only the first claimIScore tx of each address is prefetched.
+    The others are claimed on execution after the pending COMMIT_CLAIMs are flushed,
+    so that the reward calculator handles the claims of an address in tx order.
+    """
+
+    def __init__(self, proxy: 'RewardCalcProxy', block: 'Block'):
+        self._proxy = proxy
+        self._block = block
+        # tx_hash: (address, tx_index, future of CLAIM response)
+        self._claims: Dict[bytes, Tuple['Address', int, 'Future']] = OrderedDict()
+        # (success, address, block_height, block_hash, tx_index, tx_hash)
+        self._commits: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def prefetch(self, tx_requests: list):
+        """Sends CLAIM requests for the claimIScore txs in a block
+
+        :param tx_requests: converted tx requests of a block in order
+        """
+        block: 'Block' = self._block
+        addresses: Set['Address'] = set()
+
+        for index, tx_request in enumerate(tx_requests):
+            params: dict = tx_request.get("params", {})
+            if not is_claim_tx_request(params):
+                continue
+
+            address: 'Address' = params.get("from")
+            tx_hash: bytes = params.get("txHash")
+            if not isinstance(address, Address) or not isinstance(tx_hash, bytes):
+                continue
+            if address in addresses or tx_hash in self._claims or tx_hash in INVALID_CLAIM_TX:
+                continue
+
+            addresses.add(address)
+            future: 'Future' = self._proxy.claim_iscore_async(address, block.height, block.hash, index, tx_hash)
+            self._claims[tx_hash] = (address, index, future)
+
+        Logger.debug(tag=_TAG, msg=f"prefetch() end: block_height={block.height} claims={len(self._claims)}")
+
+    def claim(self, address: 'Address', tx_index: int, tx_hash: bytes) -> Optional[Tuple[int, int]]:
+        """Returns the response of the prefetched CLAIM request
+
+        Pending COMMIT_CLAIMs are flushed if the claim has not been prefetched
+
+        :return: (iscore, block_height) or None if not prefetched
+        """
+        claim: Optional[tuple] = self._claims.get(tx_hash)
+        if claim is None or claim[0] != address or claim[1] != tx_index:
+            self.flush()
+            return None
+
+        del self._claims[tx_hash]
+        return self._proxy.get_claim_iscore_result(claim[2])
+
+    def commit(self, success: bool, address: 'Address', tx_index: int, tx_hash: bytes):
+        self._commits.append((success, address, self._block.height, self._block.hash, tx_index, tx_hash))
+
+    def flush(self):
+        """Sends the pending COMMIT_CLAIMs with one COMMIT_CLAIM_BATCH message
+        """
+        if not self._commits:
+            return
+
+        commits: List[tuple] = self._commits
+        self._commits = []
+        self._proxy.commit_claim_batch(commits)
+
+    def close(self):
+        """Rolls back the prefetched claims which have not been consumed and flushes pending COMMIT_CLAIMs
+
+        A prefetched claimIScore tx may fail before claiming (ex: out of step)
+        """
+        for tx_hash, (address, tx_index, future) in self._claims.items():
+            try:
+                iscore, _ = self._proxy.get_claim_iscore_result(future)
+            except BaseException as e:
+                Logger.warning(tag=_TAG, msg=f"Failed to get a prefetched claim: {e}")
+                continue
+
+            # Nothing to roll back if there is no I-Score to claim
+            if iscore > 0:
+                self.commit(False, address, tx_index, tx_hash)
+
+        self._claims.clear()
+        self.flush()
@@ -17,12 +17,15 @@
 import time
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, Optional, List, Dict, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, List, Dict, Set, Tuple, Union
 
 from iconcommons.logger import Logger
+from .claim_pipeline import ClaimPipeline
+from .iscore_cache import IScoreCache
 from .reward_calc.data_creator import DataCreator as RewardCalcDataCreator
 from .reward_calc.ipc.message import CalculateDoneNotification, ReadyNotification
 from .reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from .reward_calc.ipc.server import DEFAULT_READ_BUFFER_SIZE
 from ..base.ComponentBase import EngineBase
 from ..base.address import Address
 from ..base.address import ZERO_SCORE_ADDRESS
@@ -30,7 +33,8 @@ from ..base.exception import \
     InvalidParamsException, InvalidRequestException, OutOfBalanceException, FatalException
 from ..base.type_converter import TypeConverter
 from ..base.type_converter_templates import ConstantKeys, ParamType
-from ..icon_constant import IISS_MAX_DELEGATIONS, ISCORE_EXCHANGE_RATE, IISS_MAX_REWARD_RATE, \
+from ..icon_constant import IISS_MAX_DELEGATIONS, IISS_MAX_QUERY_ISCORE_ADDRESSES, ISCORE_EXCHANGE_RATE, \
+    IISS_MAX_REWARD_RATE, \
     IconScoreContextType, IISS_LOG_TAG, RCCalculateResult, INVALID_CLAIM_TX, Revision
 from ..iconscore.icon_score_context import IconScoreContext
 from ..iconscore.icon_score_event_log import EventLogEmitter
@@ -42,6 +46,7 @@ from ..precommit_data_manager import PrecommitFlag
 from ..utils import bytes_to_hex
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from .reward_calc.msg_data import TxData, DelegationInfo, DelegationTx, Header, BlockProduceInfoData, PRepsData
     from .reward_calc.msg_data import GovernanceVariable
     from ..iiss.storage import RewardRate
@@ -49,6 +54,7 @@ if TYPE_CHECKING:
     from ..prep.data import Term
     from ..base.block import Block
     from ..base.transaction import Transaction
+    from ..database.batch import RewardCalcBatch
 
 _TAG = IISS_LOG_TAG
 
@@ -71,6 +77,10 @@ class Engine(EngineBase):
     """
     TAG = "IISS"
 
+    # Creates the proxy to communicate with the reward calculator
+    # It can be replaced with the one which records or replays reward calculator responses
+    reward_calc_proxy_factory: Callable[..., 'RewardCalcProxy'] = RewardCalcProxy
+
     def __init__(self):
         super().__init__()
 
@@ -84,14 +94,21 @@ class Engine(EngineBase):
             'getStake': self.handle_get_stake,
             'getDelegation': self.handle_get_delegation,
             'queryIScore': self.handle_query_iscore,
+            'queryIScoreBatch': self.handle_query_iscore_batch,
             'estimateUnstakeLockPeriod': self.handle_estimate_unstake_lock_period
         }
 
         self._reward_calc_proxy: Optional['RewardCalcProxy'] = None
+        # Only used on invoke thread
+        self._claim_pipeline: Optional['ClaimPipeline'] = None
+        self._iscore_cache = IScoreCache()
+        # The addresses which have claimed I-Score since the last COMMIT_BLOCK
+        self._claimed_addresses: Set['Address'] = set()
         self._listeners: List['EngineListener'] = []
 
     def open(self, context: 'IconScoreContext',
-             log_dir: str, data_path: str, socket_path: str, ipc_timeout: int, icon_rc_path: str):
+             log_dir: str, data_path: str, socket_path: str, ipc_timeout: int, icon_rc_path: str,
+             iscore_cache_ttl: float = 0, ipc_read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE):
         """
 
         :param context:
@@ -100,9 +117,13 @@ class Engine(EngineBase):
         :param socket_path:
         :param ipc_timeout:
         :param icon_rc_path: ex) "/usr/local/bin"
+        :param iscore_cache_ttl: seconds to cache the I-Scores queried from the reward calculator
+        :param ipc_read_buffer_size: bytes to read from the IPC socket at once
         :return:
         """
-        self._init_reward_calc_proxy(log_dir, data_path, socket_path, ipc_timeout, icon_rc_path)
+        self._iscore_cache = IScoreCache(iscore_cache_ttl)
+        self._init_reward_calc_proxy(
+            log_dir, data_path, socket_path, ipc_timeout, icon_rc_path, ipc_read_buffer_size)
 
     def add_listener(self, listener: 'EngineListener'):
         assert isinstance(listener, EngineListener)
@@ -134,6 +155,9 @@ class Engine(EngineBase):
     def is_reward_calculator_ready(self):
         return self._reward_calc_proxy.is_reward_calculator_ready()
 
+    def get_ipc_metrics(self) -> dict:
+        return self._reward_calc_proxy.get_ipc_metrics()
+
     def query_calculate_result(self,
                                calc_bh: int,
                                repeat_cnt: int = QUERY_CALCULATE_REPEAT_COUNT) -> Tuple[int, int, bytes]:
@@ -204,13 +228,17 @@ class Engine(EngineBase):
         self.check_calculate_request_block_height(cb_data.block_height, latest_calculate_bh)
 
         IconScoreContext.storage.rc.put_calc_response_from_rc(cb_data.iscore, cb_data.block_height, cb_data.state_hash)
+        # I-Scores of all accounts are changed by the calculation
+        self._iscore_cache.clear()
         Logger.info(tag=_TAG, msg=f"calculate done callback called with {cb_data}")
 
-    def _init_reward_calc_proxy(self, log_dir: str, data_path: str, socket_path: str, ipc_timeout: int, icon_rc_path: str):
-        self._reward_calc_proxy = RewardCalcProxy(calc_done_callback=self.calculate_done_callback,
-                                                  ready_callback=self.ready_callback,
-                                                  ipc_timeout=ipc_timeout,
-                                                  icon_rc_path=icon_rc_path)
+    def _init_reward_calc_proxy(self, log_dir: str, data_path: str, socket_path: str, ipc_timeout: int, icon_rc_path: str,
+                                ipc_read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE):
+        self._reward_calc_proxy = self.reward_calc_proxy_factory(calc_done_callback=self.calculate_done_callback,
+                                                                 ready_callback=self.ready_callback,
+                                                                 ipc_timeout=ipc_timeout,
+                                                                 icon_rc_path=icon_rc_path,
+                                                                 ipc_read_buffer_size=ipc_read_buffer_size)
         self._reward_calc_proxy.open(log_dir=log_dir, sock_path=socket_path, iiss_db_path=data_path)
         self._reward_calc_proxy.start()
 
@@ -638,8 +666,14 @@ class Engine(EngineBase):
         tx: 'Transaction' = context.tx
 
         if context.type == IconScoreContextType.INVOKE and self._check_claim_tx(context):
-            iscore, block_height = self._reward_calc_proxy.claim_iscore(
-                address, block.height, block.hash, tx.index, tx.hash)
+            ret: Optional[Tuple[int, int]] = None
+            if self._claim_pipeline is not None:
+                ret = self._claim_pipeline.claim(address, tx.index, tx.hash)
+
+            if ret is None:
+                ret = self._reward_calc_proxy.claim_iscore(address, block.height, block.hash, tx.index, tx.hash)
+
+            iscore, block_height = ret
         else:
             # For debug_estimateStep request
             iscore, block_height = 0, 0
@@ -664,12 +698,48 @@ class Engine(EngineBase):
             context.storage.icx.put_account(context, treasury_account)
             context.storage.icx.put_account(context, from_account)
 
+            self._iscore_cache.invalidate((address,))
+            self._claimed_addresses.add(address)
         except BaseException as e:
             Logger.exception(tag=_TAG, msg=str(e))
             success = False
             raise e
         finally:
-            self._reward_calc_proxy.commit_claim(success, address, block.height, block.hash, tx.index, tx.hash)
+            if self._claim_pipeline is not None:
+                self._claim_pipeline.commit(success, address, tx.index, tx.hash)
+            else:
+                self._reward_calc_proxy.commit_claim(success, address, block.height, block.hash, tx.index, tx.hash)
+
+    def start_claim_pipeline(self, context: 'IconScoreContext', tx_requests: list):
+        """Sends CLAIM requests for all claimIScore txs in a block before executing them
+
+        It is available only if the reward calculator supports COMMIT_CLAIM_BATCH.
+        Otherwise, claimIScore txs are handled one by one with CLAIM and COMMIT_CLAIM round-trips.
+
+        :param context:
+        :param tx_requests: converted tx requests of the block to invoke
+        """
+        self.end_claim_pipeline()
+
+        if context.type != IconScoreContextType.INVOKE:
+            return
+        if not self._reward_calc_proxy.is_commit_claim_batch_supported():
+            return
+
+        pipeline = ClaimPipeline(self._reward_calc_proxy, context.block)
+        pipeline.prefetch(tx_requests)
+        if len(pipeline) > 0:
+            self._claim_pipeline = pipeline
+
+    def end_claim_pipeline(self):
+        """Sends the pending COMMIT_CLAIMs of the invoked block at once
+        """
+        pipeline: Optional['ClaimPipeline'] = self._claim_pipeline
+        if pipeline is None:
+            return
+
+        self._claim_pipeline = None
+        pipeline.close()
 
     def handle_query_iscore(self,
                             _context: 'IconScoreContext',
@@ -681,16 +751,81 @@ class Engine(EngineBase):
             raise InvalidParamsException(f"Invalid address: {address}")
 
         # TODO: error handling
-        iscore, block_height = self._reward_calc_proxy.query_iscore(address)
+        iscore, block_height = self._query_iscores([address])[address]
 
-        data = {
+        return self._make_query_iscore_response(iscore, block_height)
+
+    def handle_query_iscore_batch(self,
+                                  _context: 'IconScoreContext',
+                                  params: dict) -> list:
+        """Handles queryIScoreBatch JSON-RPC request
+
+        :param _context:
+        :param params: {"addresses": [address, ...]}
+        :return: the results of queryIScore with address in the order of addresses
+        """
+        ret_params: dict = TypeConverter.convert(params, ParamType.IISS_QUERY_ISCORE_BATCH)
+        addresses: list = ret_params.get(ConstantKeys.ADDRESSES)
+
+        if not isinstance(addresses, list) or len(addresses) == 0:
+            raise InvalidParamsException(f"Invalid addresses: {addresses}")
+        if len(addresses) > IISS_MAX_QUERY_ISCORE_ADDRESSES:
+            raise InvalidParamsException(
+                f"Too many addresses: {len(addresses)} > {IISS_MAX_QUERY_ISCORE_ADDRESSES}")
+        for address in addresses:
+            if not isinstance(address, Address):
+                raise InvalidParamsException(f"Invalid address: {address}")
+
+        iscores: Dict['Address', Tuple[int, int]] = self._query_iscores(addresses)
+
+        ret = []
+        for address in addresses:
+            data: dict = self._make_query_iscore_response(*iscores[address])
+            data["address"] = address
+            ret.append(data)
+
+        return ret
+
+    def _query_iscores(self, addresses: List['Address']) -> Dict['Address', Tuple[int, int]]:
+        """Returns I-Scores from the cache or the reward calculator
+
+        The I-Scores which are not cached are queried with one QUERY_BATCH request
+        if the reward calculator supports it
+
+        :param addresses:
+        :return: {address: (iscore, block_height)}
+        """
+        iscore_cache: 'IScoreCache' = self._iscore_cache
+        generation: int = iscore_cache.generation
+
+        ret: Dict['Address', Tuple[int, int]] = {}
+        for address in addresses:
+            if address not in ret:
+                ret[address] = iscore_cache.get(address)
+
+        missing: List['Address'] = [address for address, iscore in ret.items() if iscore is None]
+        if not missing:
+            return ret
+
+        if len(missing) > 1 and self._reward_calc_proxy.is_query_batch_supported():
+            results: List[Tuple[int, int]] = self._reward_calc_proxy.query_iscore_batch(missing)
+        else:
+            results: List[Tuple[int, int]] = [self._reward_calc_proxy.query_iscore(address) for address in missing]
+
+        for address, (iscore, block_height) in zip(missing, results):
+            ret[address] = iscore, block_height
+            iscore_cache.put(address, iscore, block_height, generation)
+
+        return ret
+
+    @classmethod
+    def _make_query_iscore_response(cls, iscore: int, block_height: int) -> dict:
+        return {
             "iscore": iscore,
-            "estimatedICX": self._iscore_to_icx(iscore),
+            "estimatedICX": cls._iscore_to_icx(iscore),
             "blockHeight": block_height
         }
 
-        return data
-
     def update_db(self,
                   context: 'IconScoreContext',
                   term: Optional['Term'],
@@ -751,8 +886,41 @@ class Engine(EngineBase):
         self._put_end_calc_block_height(context)
         self._put_rrep(context)
 
-    def send_commit(self, block_height: int, block_hash: bytes):
-        self._reward_calc_proxy.commit_block(True, block_height, block_hash)
+    def send_commit(self, block_height: int, block_hash: bytes, wait_for_ack: bool = True) -> Optional['Future']:
+        """Send COMMIT_BLOCK to reward calculator
+
+        :param block_height:
+        :param block_hash:
+        :param wait_for_ack: if False, return the future of the response without waiting for it
+            Pass the future to check_commit_ack() before the next CALCULATE
+        :return: the future of CommitBlockResponse or None
+        """
+        future: Optional['Future'] = None
+        if wait_for_ack:
+            self._reward_calc_proxy.commit_block(True, block_height, block_hash)
+        else:
+            future = self._reward_calc_proxy.commit_block_async(True, block_height, block_hash)
+
+        # I-Scores queried before the claims are applied to the reward calculator may be cached
+        if self._claimed_addresses:
+            self._iscore_cache.invalidate(self._claimed_addresses)
+            self._claimed_addresses = set()
+
+        return future
+
+    def check_commit_ack(self, future: 'Future', block_height: int, block_hash: bytes):
+        """Wait for the response of COMMIT_BLOCK sent by send_commit(wait_for_ack=False) and verify it
+
+        :exception FatalException: reward calculator has failed to commit the block
+        """
+        success, ack_block_height, ack_block_hash = self._reward_calc_proxy.get_commit_block_result(future)
+        if not success or ack_block_height != block_height or ack_block_hash != block_hash:
+            raise FatalException(f"Invalid COMMIT_BLOCK response: "
+                                 f"success={success} "
+                                 f"block_height={ack_block_height} "
+                                 f"block_hash={bytes_to_hex(ack_block_hash)} "
+                                 f"expected_block_height={block_height} "
+                                 f"expected_block_hash={bytes_to_hex(block_hash)}")
 
     def send_calculate(self, iiss_db_path: str, block_height: int):
         self._reward_calc_proxy.calculate(iiss_db_path, block_height)
@@ -848,7 +1016,7 @@ class Engine(EngineBase):
     @classmethod
     def put_block_produce_info_to_rc_db(cls,
                                         context: 'IconScoreContext',
-                                        rc_block_batch: list,
+                                        rc_block_batch: 'RewardCalcBatch',
                                         prev_block_generator: Optional['Address'] = None,
                                         prev_block_votes: Optional[List[Tuple['Address', int]]] = None):
         """Called on every block
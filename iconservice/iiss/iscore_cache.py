@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..base.address import Address
+
+_DEFAULT_MAX_SIZE = 100_000
+
+
+class IScoreCache(object):
+    """Caches the I-Scores queried from the reward calculator for a short time
+
+    The I-Score of an address is changed only when the reward calculator finishes calculating a period
+    or when the address claims its I-Score, so the cached I-Scores are invalidated on those events.
+    TTL bounds how long an I-Score can be stale for the other cases (ex: reward calculator restart).
+    """
+
+    def __init__(self, ttl: float = 0, max_size: int = _DEFAULT_MAX_SIZE):
+        """Constructor
+
+        :param ttl: seconds to keep an I-Score. 0 means disabled
+        :param max_size: the max number of cached I-Scores
+        """
+        self._ttl: float = max(ttl, 0)
+        self._max_size: int = max_size
+        self._lock = Lock()
+        # address: (iscore, block_height, expiry)
+        self._entries: 'OrderedDict' = OrderedDict()
+        # Incremented on invalidation, to discard I-Scores queried before it
+        self._generation: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, address: 'Address') -> Optional[Tuple[int, int]]:
+        """Returns a cached I-Score
+
+        :param address:
+        :return: (iscore, block_height) or None if not cached or expired
+        """
+        with self._lock:
+            entry: Optional[tuple] = self._entries.get(address)
+            if entry is None:
+                return None
+
+            if entry[2] <= time.monotonic():
+                del self._entries[address]
+                return None
+
+        return entry[0], entry[1]
+
+    def put(self, address: 'Address', iscore: int, block_height: int, generation: int) -> bool:
+        """Caches an I-Score queried from the reward calculator
+
+        :param address:
+        :param iscore:
+        :param block_height: the block height of the I-Score
+        :param generation: the generation which was taken before querying the I-Score
+        :return: True if the I-Score is cached
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            # The I-Score has been invalidated while querying it
+            if generation != self._generation:
+                return False
+
+            self._entries.pop(address, None)
+            self._entries[address] = (iscore, block_height, time.monotonic() + self._ttl)
+
+            # Entries are ordered by expiry because ttl is fixed
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return True
+
+    def invalidate(self, addresses: Iterable['Address']):
+        with self._lock:
+            self._generation += 1
+
+            for address in addresses:
+                self._entries.pop(address, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
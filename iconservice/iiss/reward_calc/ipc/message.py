@@ -15,6 +15,7 @@
 
 from abc import ABCMeta, abstractmethod
 from enum import IntEnum
+from typing import List, Tuple
 
 import msgpack
 
@@ -24,6 +25,12 @@ from iconservice.utils.msgpack_for_ipc import MsgPackForIpc, TypeTag
 
 _next_msg_id: int = 1
 
+# The reward calculator with this IPC version or later
+# handles pipelined CLAIM requests and COMMIT_CLAIM_BATCH
+IPC_VERSION_COMMIT_CLAIM_BATCH = 10
+# The reward calculator with this IPC version or later handles QUERY_BATCH
+IPC_VERSION_QUERY_BATCH = 11
+
 
 def reset_next_msg_id(msg_id: int):
     """Only used for unittest
@@ -56,6 +63,8 @@ class MessageType(IntEnum):
     QUERY_CALCULATE_RESULT = 7
     ROLLBACK = 8
     INIT = 9
+    COMMIT_CLAIM_BATCH = 10
+    QUERY_BATCH = 11
     READY = 100
     CALCULATE_DONE = 101
 
@@ -246,6 +255,52 @@ class CommitClaimResponse(Response):
         return CommitClaimResponse(msg_id)
 
 
+class CommitClaimBatchRequest(Request):
+    """Send the results of claimIScore txs in a block to reward calculator at once
+
+    Each item of claims is (success, address, block_height, block_hash, tx_index, tx_hash)
+    """
+    def __init__(self, claims: list):
+        super().__init__(MessageType.COMMIT_CLAIM_BATCH)
+
+        self.claims = claims
+
+    def _to_list(self) -> tuple:
+        return self.msg_type, self.msg_id, \
+               tuple(
+                   (
+                       success,
+                       address.to_bytes_including_prefix(),
+                       block_height,
+                       block_hash,
+                       tx_index,
+                       tx_hash
+                   )
+                   for success, address, block_height, block_hash, tx_index, tx_hash in self.claims
+               )
+
+    def __str__(self) -> str:
+        return f"{self.msg_type.name}({self.msg_id}, {len(self.claims)})"
+
+
+class CommitClaimBatchResponse(Response):
+    MSG_TYPE = MessageType.COMMIT_CLAIM_BATCH
+
+    def __init__(self, msg_id: int):
+        super().__init__()
+
+        self.msg_id = msg_id
+
+    def __str__(self) -> str:
+        return f"COMMIT_CLAIM_BATCH({self.msg_id})"
+
+    @staticmethod
+    def from_list(items: list) -> 'CommitClaimBatchResponse':
+        msg_id: int = items[1]
+
+        return CommitClaimBatchResponse(msg_id)
+
+
 class QueryCalculateStatusRequest(Request):
     def __init__(self):
         super().__init__(MessageType.QUERY_CALCULATE_STATUS)
@@ -369,6 +424,56 @@ class QueryResponse(Response):
         return QueryResponse(msg_id, address, block_height, iscore)
 
 
+class QueryBatchRequest(Request):
+    """queryIScoreBatch
+    """
+
+    def __init__(self, addresses: List['Address']):
+        super().__init__(MessageType.QUERY_BATCH)
+
+        self.addresses = addresses
+
+    def __str__(self) -> str:
+        return f"{self.msg_type.name}({self.msg_id}, {len(self.addresses)})"
+
+    def _to_list(self) -> tuple:
+        return self.msg_type, \
+               self.msg_id, \
+               tuple(address.to_bytes_including_prefix() for address in self.addresses)
+
+
+class QueryBatchResponse(Response):
+    """Each item of payload is the same as the payload of QueryResponse
+    """
+    MSG_TYPE = MessageType.QUERY_BATCH
+
+    def __init__(self, msg_id: int, results: List[Tuple['Address', int, int]]):
+        super().__init__()
+
+        self.msg_id: int = msg_id
+        # (address, iscore, block_height)
+        self.results: List[Tuple['Address', int, int]] = results
+
+    def __str__(self) -> str:
+        return f"QUERY_BATCH({self.msg_id}, {len(self.results)})"
+
+    @staticmethod
+    def from_list(items: list) -> 'QueryBatchResponse':
+        msg_id: int = items[1]
+        payload: list = items[2]
+
+        results = [
+            (
+                MsgPackForIpc.decode(TypeTag.ADDRESS, item[0]),
+                MsgPackForIpc.decode(TypeTag.INT, item[1]),
+                item[2]
+            )
+            for item in payload
+        ]
+
+        return QueryBatchResponse(msg_id, results)
+
+
 class CalculateRequest(Request):
     def __init__(self, db_path: str, block_height: int):
         super().__init__(MessageType.CALCULATE)
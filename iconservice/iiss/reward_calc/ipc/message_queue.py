@@ -14,7 +14,7 @@
 # limitations under the License.
 
 import asyncio
-from typing import Callable, Any, Optional, Dict
+from typing import Callable, Any, Optional, Dict, List
 
 from iconcommons.logger import Logger
 from iconservice.base.exception import InvalidParamsException, ServiceNotReadyException
@@ -37,6 +37,15 @@ class MessageQueue(object):
     async def get(self) -> 'Request':
         return await self._requests.get()
 
+    def get_all_nowait(self) -> List['Request']:
+        """Returns all the requests in the queue without waiting
+        """
+        requests: List['Request'] = []
+        while not self._requests.empty():
+            requests.append(self._requests.get_nowait())
+
+        return requests
+
     def put(self, request, wait_for_response: bool = True) -> Optional[asyncio.Future]:
         assert isinstance(request, Request)
 
@@ -30,6 +30,8 @@ class MessageUnpacker(object):
             MessageType.QUERY_CALCULATE_STATUS: QueryCalculateStatusResponse,
             MessageType.QUERY_CALCULATE_RESULT: QueryCalculateResultResponse,
             MessageType.INIT: InitResponse,
+            MessageType.COMMIT_CLAIM_BATCH: CommitClaimBatchResponse,
+            MessageType.QUERY_BATCH: QueryBatchResponse,
             MessageType.READY: ReadyNotification,
             MessageType.CALCULATE_DONE: CalculateDoneNotification
         }
@@ -19,15 +19,15 @@ import asyncio
 import concurrent.futures
 import os
 from subprocess import Popen
-from typing import TYPE_CHECKING, Optional, Callable, Any, Tuple
+from typing import TYPE_CHECKING, Optional, Callable, Any, Dict, List, Tuple
 
 from iconcommons.logger import Logger
 
 from .message import *
 from .message_queue import MessageQueue
-from .server import IPCServer
+from .server import DEFAULT_READ_BUFFER_SIZE, IPCServer
 from ....base.address import Address
-from ....base.exception import TimeoutException
+from ....base.exception import TimeoutException, InternalServiceErrorException
 from ....icon_constant import RCStatus
 from ....utils import bytes_to_hex
 
@@ -47,16 +47,19 @@ class RewardCalcProxy(object):
                  icon_rc_path: str,
                  ipc_timeout: int,
                  ready_callback: Callable[['ReadyNotification'], Any] = None,
-                 calc_done_callback: Callable[['CalculateDoneNotification'], Any] = None):
+                 calc_done_callback: Callable[['CalculateDoneNotification'], Any] = None,
+                 ipc_read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE):
         Logger.debug(tag=_TAG, msg="__init__() start")
-        Logger.info(tag=_TAG, msg=f"ipc_timeout: {ipc_timeout}")
+        Logger.info(tag=_TAG, msg=f"ipc_timeout: {ipc_timeout}, ipc_read_buffer_size: {ipc_read_buffer_size}")
 
         self._loop = None
-        self._ipc_server = IPCServer()
+        self._ipc_server = IPCServer(ipc_read_buffer_size)
         self._message_queue: Optional['MessageQueue'] = None
         self._reward_calc: Optional[Popen] = None
 
         self._ready_future: Optional[asyncio.Future] = None
+        # IPC version of the reward calculator
+        self._version: int = -1
 
         self._ready_callback: Optional[Callable] = ready_callback
         self._calculate_done_callback: Optional[Callable] = calc_done_callback
@@ -199,9 +202,31 @@ class RewardCalcProxy(object):
                 f"address({address}) block_height({block_height}) block_hash({block_hash.hex()})"
         )
 
-        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(
+        future: concurrent.futures.Future = \
+            self.claim_iscore_async(address, block_height, block_hash, tx_index, tx_hash)
+
+        return self.get_claim_iscore_result(future)
+
+    def claim_iscore_async(self, address: 'Address',
+                           block_height: int, block_hash: bytes,
+                           tx_index: int, tx_hash: bytes) -> concurrent.futures.Future:
+        """Send a CLAIM request without waiting for its response
+
+        It is called on invoke thread
+        Pass the returned future to get_claim_iscore_result() to get the response
+
+        :return: future of ClaimResponse
+        """
+        return asyncio.run_coroutine_threadsafe(
             self._claim_iscore(address, block_height, block_hash, tx_index, tx_hash), self._loop)
 
+    def get_claim_iscore_result(self, future: concurrent.futures.Future) -> Tuple[int, int]:
+        """Wait for the response of a CLAIM request
+
+        :param future: the future returned by claim_iscore_async()
+        :return: [i-score(int), block_height(int)]
+        :exception TimeoutException: The operation has timed-out
+        """
         try:
             response: 'ClaimResponse' = future.result(self._ipc_timeout)
         except asyncio.TimeoutError:
@@ -284,6 +309,43 @@ class RewardCalcProxy(object):
 
         return future.result()
 
+    def commit_claim_batch(self, claims: list):
+        """Send the results of claimIScore txs in a block at once
+
+        It is called on invoke thread
+        Available only if is_commit_claim_batch_supported() is True
+
+        :param claims: list of (success, address, block_height, block_hash, tx_index, tx_hash)
+        :exception TimeoutException: The operation has timed-out
+        """
+        Logger.debug(tag=_TAG, msg=f"commit_claim_batch() start: claims={len(claims)}")
+
+        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(
+            self._commit_claim_batch(claims), self._loop)
+
+        try:
+            future.result(self._ipc_timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise TimeoutException("COMMIT_CLAIM_BATCH message to RewardCalculator has timed-out")
+
+        Logger.debug(tag=_TAG, msg="commit_claim_batch() end")
+
+    async def _commit_claim_batch(self, claims: list) -> 'CommitClaimBatchResponse':
+        request = CommitClaimBatchRequest(claims)
+
+        future: asyncio.Future = self._message_queue.put(request)
+        await future
+
+        return future.result()
+
+    def is_commit_claim_batch_supported(self) -> bool:
+        """Returns True if the reward calculator handles pipelined CLAIM requests and COMMIT_CLAIM_BATCH
+
+        The IPC version of the reward calculator is notified with READY message
+        """
+        return self._version >= IPC_VERSION_COMMIT_CLAIM_BATCH
+
     def query_iscore(self, address: 'Address') -> tuple:
         """Returns the I-Score of a given address
 
@@ -327,6 +389,50 @@ class RewardCalcProxy(object):
 
         return future.result()
 
+    def query_iscore_batch(self, addresses: List['Address']) -> List[Tuple[int, int]]:
+        """Returns the I-Scores of given addresses with one QUERY_BATCH round-trip
+
+        It should be called on query thread
+
+        :param addresses: the addresses to query
+        :return: [(i-score(int), block_height(int))] in the order of addresses
+        :exception TimeoutException: The operation has timed-out
+        """
+        Logger.debug(tag=_TAG, msg=f"query_iscore_batch() start: addresses={len(addresses)}")
+
+        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(
+            self._query_iscore_batch(addresses), self._loop)
+
+        try:
+            response: 'QueryBatchResponse' = future.result(self._ipc_timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise TimeoutException("query_iscore_batch message to RewardCalculator has timed-out")
+
+        results: Dict['Address', Tuple[int, int]] = {
+            address: (iscore, block_height) for address, iscore, block_height in response.results
+        }
+
+        try:
+            ret = [results[address] for address in addresses]
+        except KeyError as e:
+            raise InternalServiceErrorException(f"I-Score not found in QUERY_BATCH response: {e}")
+
+        Logger.debug(tag=_TAG, msg="query_iscore_batch() end")
+
+        return ret
+
+    async def _query_iscore_batch(self, addresses: List['Address']) -> 'QueryBatchResponse':
+        request = QueryBatchRequest(addresses)
+
+        future: asyncio.Future = self._message_queue.put(request)
+        await future
+
+        return future.result()
+
+    def is_query_batch_supported(self) -> bool:
+        return self._version >= IPC_VERSION_QUERY_BATCH
+
     def query_calculate_status(self) -> tuple:
         Logger.debug(tag=_TAG, msg="query_calculate_status() start")
 
@@ -401,9 +507,28 @@ class RewardCalcProxy(object):
                 f"block_hash={bytes_to_hex(block_hash)}"
         )
 
-        future: concurrent.futures.Future = asyncio.run_coroutine_threadsafe(
+        future: concurrent.futures.Future = self.commit_block_async(success, block_height, block_hash)
+
+        return self.get_commit_block_result(future)
+
+    def commit_block_async(self, success: bool, block_height: int, block_hash: bytes) -> concurrent.futures.Future:
+        """Send a COMMIT_BLOCK request without waiting for its response
+
+        It is called on invoke thread
+        Pass the returned future to get_commit_block_result() to get the response
+
+        :return: future of CommitBlockResponse
+        """
+        return asyncio.run_coroutine_threadsafe(
             self._commit_block(success, block_height, block_hash), self._loop)
 
+    def get_commit_block_result(self, future: concurrent.futures.Future) -> tuple:
+        """Wait for the response of a COMMIT_BLOCK request
+
+        :param future: the future returned by commit_block_async()
+        :return: [success(bool), block_height(int), block_hash(bytes)]
+        :exception TimeoutException: The operation has timed-out
+        """
         try:
             response: 'CommitBlockResponse' = future.result(self._ipc_timeout)
         except asyncio.TimeoutError:
@@ -457,6 +582,8 @@ class RewardCalcProxy(object):
     def ready_handler(self, response: 'Response'):
         Logger.debug(tag=_TAG, msg=f"ready_handler() start {response}")
 
+        self._version = response.version
+
         if self._ready_callback is not None:
             self._ready_callback(response)
 
@@ -465,6 +592,9 @@ class RewardCalcProxy(object):
     def get_ready_future(self):
         return self._ready_future
 
+    def get_ipc_metrics(self) -> dict:
+        return self._ipc_server.metrics.get_summary()
+
     def calculate_done_handler(self, response: 'Response'):
         Logger.debug(tag=_TAG, msg=f"calculate_done_handler() start {response}")
         if self._calculate_done_callback is not None:
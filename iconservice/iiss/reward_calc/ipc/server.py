@@ -14,26 +14,75 @@
 # limitations under the License.
 
 import asyncio
+import time
 from asyncio import StreamReader, StreamWriter
-from typing import Optional
+from typing import List, Optional
 
 from iconcommons import Logger
 
 from .message import MessageType, Request
 from .message_queue import MessageQueue
 from .message_unpacker import MessageUnpacker
+from ....utils.lazy_logger import DEBUG, INFO, is_log_enabled, summarize_bytes
 
 _TAG = "RCP"
 
+DEFAULT_READ_BUFFER_SIZE = 64 * 1024
+
+
+class IPCMetrics(object):
+    """Counts the bytes and messages on the IPC channel
+
+    Rates are averaged since the IPC channel is opened
+    """
 
-class IPCServer(object):
     def __init__(self):
+        self.start_time: float = time.monotonic()
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+        self.messages_sent: int = 0
+        self.messages_received: int = 0
+        # The number of write() and read() calls on the socket
+        self.writes: int = 0
+        self.reads: int = 0
+
+    def on_sent(self, size: int, messages: int):
+        self.writes += 1
+        self.bytes_sent += size
+        self.messages_sent += messages
+
+    def on_received(self, size: int, messages: int):
+        self.reads += 1
+        self.bytes_received += size
+        self.messages_received += messages
+
+    def get_summary(self) -> dict:
+        elapsed: float = max(time.monotonic() - self.start_time, 1e-9)
+
+        return {
+            "bytesSent": self.bytes_sent,
+            "bytesReceived": self.bytes_received,
+            "messagesSent": self.messages_sent,
+            "messagesReceived": self.messages_received,
+            "writes": self.writes,
+            "reads": self.reads,
+            "bytesSentPerSec": int(self.bytes_sent / elapsed),
+            "bytesReceivedPerSec": int(self.bytes_received / elapsed),
+            "messagesSentPerSec": int(self.messages_sent / elapsed),
+            "messagesReceivedPerSec": int(self.messages_received / elapsed)
+        }
+
+
+class IPCServer(object):
+    def __init__(self, read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE):
         self._running = False
         self._loop = None
         self._path = None
         self._queue: Optional['MessageQueue'] = None
         self._unpacker: Optional['MessageUnpacker'] = MessageUnpacker()
         self._tasks = []
+        self._read_buffer_size: int = read_buffer_size
+        self.metrics = IPCMetrics()
 
     def open(self, loop,  message_queue: 'MessageQueue', path: str):
         Logger.info(tag=_TAG, msg="open() start")
@@ -55,7 +104,9 @@ class IPCServer(object):
             return
 
         self._running = True
-        co = asyncio.start_unix_server(self._on_accepted, self._path)
+        # limit is the buffer size of StreamReader which has to hold a read at least
+        co = asyncio.start_unix_server(
+            self._on_accepted, self._path, limit=max(self._read_buffer_size, 2 ** 16))
         asyncio.ensure_future(co)
 
         Logger.info(tag=_TAG, msg="start() end")
@@ -92,20 +143,33 @@ class IPCServer(object):
     async def _on_send(self, writer: 'StreamWriter'):
         Logger.info(tag=_TAG, msg="_on_send() start")
 
-        while self._running:
+        stopping = False
+        while self._running and not stopping:
             try:
-                request: 'Request' = await self._queue.get()
-                self._queue.task_done()
-
-                if request.msg_type == MessageType.NONE:
-                    # Stopping IPCServer
-                    break
-
-                data: bytes = request.to_bytes()
-                Logger.debug(tag=_TAG, msg=f"on_send(): data({data.hex()}")
-                Logger.info(tag=_TAG, msg=f"Sending Data : {request}")
-                writer.write(data)
-                await writer.drain()
+                requests: List['Request'] = [await self._queue.get()]
+                # Coalesce the requests queued while waiting for the previous drain into one write
+                requests.extend(self._queue.get_all_nowait())
+
+                chunks: List[bytes] = []
+                for request in requests:
+                    self._queue.task_done()
+
+                    if request.msg_type == MessageType.NONE:
+                        # Stopping IPCServer after sending the requests ahead of it
+                        stopping = True
+                        continue
+
+                    data: bytes = request.to_bytes()
+                    if is_log_enabled(DEBUG):
+                        Logger.debug(tag=_TAG, msg=f"on_send(): data({summarize_bytes(data)})")
+                    if is_log_enabled(INFO):
+                        Logger.info(tag=_TAG, msg=f"Sending Data : {request}")
+                    chunks.append(data)
+
+                if chunks:
+                    writer.writelines(chunks)
+                    self.metrics.on_sent(sum(map(len, chunks)), len(chunks))
+                    await writer.drain()
 
             except asyncio.CancelledError:
                 pass
@@ -121,17 +185,24 @@ class IPCServer(object):
 
         while self._running:
             try:
-                data: bytes = await reader.read(1024)
+                data: bytes = await reader.read(self._read_buffer_size)
                 if not isinstance(data, bytes) or len(data) == 0:
                     break
 
-                Logger.debug(tag=_TAG, msg=f"_on_recv(): data({data.hex()})")
+                if is_log_enabled(DEBUG):
+                    Logger.debug(tag=_TAG, msg=f"_on_recv(): data({summarize_bytes(data)})")
 
                 self._unpacker.feed(data)
 
-                for response in self._unpacker:
-                    Logger.info(tag=_TAG, msg=f"Received Data : {response}")
-                    self._queue.message_handler(response)
+                messages: int = 0
+                try:
+                    for response in self._unpacker:
+                        messages += 1
+                        if is_log_enabled(INFO):
+                            Logger.info(tag=_TAG, msg=f"Received Data : {response}")
+                        self._queue.message_handler(response)
+                finally:
+                    self.metrics.on_received(len(data), messages)
 
             except asyncio.CancelledError:
                 pass
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A stand-in for the reward calculator (icon_rc) which is used for tests and benchmarks
+
+It speaks the same IPC protocol as icon_rc over the unix domain socket,
+but calculates I-Scores with a simplified deterministic model instead of the real reward rules.
+Its states are kept in memory only.
+
+Set iconRcPath to an executable which runs this module to use it in place of icon_rc:
+    #!/bin/sh
+    exec python -m iconservice.iiss.reward_calc.stand_in -latency 0.001 "$@"
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+from hashlib import sha3_256
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import msgpack
+from iconcommons.logger import Logger
+
+from .msg_data import DelegationTx, GovernanceVariable, Header, TxData
+from .ipc.message import IPC_VERSION_QUERY_BATCH, MessageType
+from ...database.db import KeyValueDatabase
+from ...icon_constant import IISS_ANNUAL_BLOCK, IISS_MAX_REWARD_RATE, ISCORE_EXCHANGE_RATE, RCCalculateResult
+from ...utils.msgpack_for_ipc import MsgPackForIpc, TypeTag
+
+if TYPE_CHECKING:
+    from ...base.address import Address
+
+__all__ = ("IScoreModel", "StandInRewardCalculator", "main")
+
+_TAG = "RCS"
+
+
+class IScoreModel(object):
+    """Deterministic I-Score model of the stand-in reward calculator
+
+    A delegator earns I-Score for every block while its delegation is kept:
+        delegated * reward_rep * ISCORE_EXCHANGE_RATE / (IISS_ANNUAL_BLOCK * IISS_MAX_REWARD_RATE)
+    reward_rep of a block is the one in the latest governance variable before the block.
+    P-Rep rewards are not modeled.
+    """
+
+    def __init__(self):
+        # The end block height of the last calculation
+        self.block_height: int = 0
+        # The last committed block
+        self.commit_block_height: int = 0
+        self.commit_block_hash: bytes = bytes(32)
+
+        self._iscores: Dict['Address', int] = {}
+        # delegator: (the total amount of delegation, the block height since when I-Score has not been accrued)
+        self._delegations: Dict['Address', Tuple[int, int]] = {}
+        # (block_height, reward_rep) ordered by block_height
+        self._gvs: List[Tuple[int, int]] = []
+        # block_hash: (block_height, {address: claimed I-Score})
+        self._claims: Dict[bytes, Tuple[int, Dict['Address', int]]] = {}
+
+    def query(self, address: 'Address') -> int:
+        return self._iscores.get(address, 0)
+
+    def claim(self, address: 'Address', block_height: int, block_hash: bytes) -> int:
+        """Claims I-Score in the unit of ISCORE_EXCHANGE_RATE
+
+        Claimed I-Score is deducted on COMMIT_BLOCK
+
+        :return: claimed I-Score. 0 if the address has already claimed in the block
+        """
+        _, claims = self._claims.setdefault(block_hash, (block_height, {}))
+        if address in claims:
+            return 0
+
+        iscore: int = self.query(address) // ISCORE_EXCHANGE_RATE * ISCORE_EXCHANGE_RATE
+        claims[address] = iscore
+        return iscore
+
+    def commit_claim(self, success: bool, address: 'Address', block_hash: bytes):
+        if success:
+            return
+
+        claim: Optional[tuple] = self._claims.get(block_hash)
+        if claim is not None:
+            claim[1].pop(address, None)
+
+    def commit_block(self, success: bool, block_height: int, block_hash: bytes):
+        claim: Optional[tuple] = self._claims.pop(block_hash, None)
+        if success:
+            if claim is not None:
+                for address, iscore in claim[1].items():
+                    self._iscores[address] = self._iscores.get(address, 0) - iscore
+
+            self.commit_block_height = block_height
+            self.commit_block_hash = block_hash
+
+        # Claims of the blocks which will never be committed
+        for stale_hash in [k for k, v in self._claims.items() if v[0] <= block_height]:
+            del self._claims[stale_hash]
+
+    def calculate(self, db_path: str, block_height: int) -> Tuple[int, bytes]:
+        """Calculates I-Scores of the period which ends at block_height with the given rc_db
+
+        :param db_path: the path of iiss_rc_db
+        :param block_height: the end block height of the period
+        :return: (the total I-Score issued in the period, state_hash)
+        """
+        header: Optional['Header'] = None
+        txs: List['TxData'] = []
+
+        db = KeyValueDatabase.from_path(db_path, create_if_missing=False)
+        try:
+            # Keys are iterated in order. TxData are ordered by tx index
+            for key, value in db.iterator():
+                if key == Header.PREFIX:
+                    header = Header.from_bytes(value)
+                elif key[:2] == GovernanceVariable.PREFIX:
+                    gv: 'GovernanceVariable' = GovernanceVariable.from_bytes(key, value)
+                    self._put_gv(gv.block_height, gv.reward_rep)
+                elif key[:2] == TxData.PREFIX:
+                    txs.append(TxData.from_bytes(value))
+        finally:
+            db.close()
+
+        if header is not None and header.block_height != block_height:
+            raise ValueError(f"Mismatched block height: header={header.block_height} request={block_height}")
+
+        before: int = sum(self._iscores.values())
+
+        for tx in txs:
+            if isinstance(tx.data, DelegationTx):
+                self._accrue(tx.address, tx.block_height)
+                delegated: int = sum(info.value for info in tx.data.delegation_info)
+                self._delegations[tx.address] = (delegated, tx.block_height)
+
+        for address in self._delegations:
+            self._accrue(address, block_height)
+
+        self.block_height = block_height
+
+        return sum(self._iscores.values()) - before, self.get_state_hash()
+
+    def get_state_hash(self) -> bytes:
+        iscores: list = sorted(
+            [address.to_bytes_including_prefix(), MsgPackForIpc.encode(iscore)]
+            for address, iscore in self._iscores.items())
+        return sha3_256(msgpack.dumps([self.block_height, iscores])).digest()
+
+    def _put_gv(self, block_height: int, reward_rep: int):
+        self._gvs = [gv for gv in self._gvs if gv[0] != block_height]
+        self._gvs.append((block_height, reward_rep))
+        self._gvs.sort()
+
+    def _accrue(self, address: 'Address', block_height: int):
+        delegated, since = self._delegations.get(address, (0, block_height))
+        self._delegations[address] = (delegated, block_height)
+        if delegated == 0:
+            return
+
+        self._iscores[address] = self._iscores.get(address, 0) + self._calculate_iscore(delegated, since, block_height)
+
+    def _calculate_iscore(self, delegated: int, start: int, end: int) -> int:
+        """Calculates I-Score for the blocks in (start, end]
+        """
+        iscore: int = 0
+        gvs: List[Tuple[int, int]] = self._gvs
+
+        for i, (gv_block_height, reward_rep) in enumerate(gvs):
+            # The governance variable is applied to the blocks in (gv_block_height, next gv_block_height]
+            begin: int = max(start, gv_block_height)
+            until: int = end if i + 1 == len(gvs) else min(end, gvs[i + 1][0])
+            if until > begin:
+                iscore += delegated * reward_rep * (until - begin) * ISCORE_EXCHANGE_RATE \
+                    // (IISS_ANNUAL_BLOCK * IISS_MAX_REWARD_RATE)
+
+        return iscore
+
+
+class StandInRewardCalculator(object):
+    """Serves IPC messages from iconservice with IScoreModel
+
+    Like icon_rc, it connects to the unix domain socket which iconservice listens on
+    and sends READY notification first.
+    """
+
+    def __init__(self,
+                 ipc_addr: str,
+                 latency: float = 0,
+                 calculate_latency: float = 0,
+                 version: int = IPC_VERSION_QUERY_BATCH,
+                 model: Optional['IScoreModel'] = None):
+        """Constructor
+
+        :param ipc_addr: the path of the unix domain socket
+        :param latency: seconds to respond to a message. Messages in flight are handled concurrently
+        :param calculate_latency: seconds to calculate I-Scores of a period
+        :param version: the IPC version to report
+        :param model:
+        """
+        self._ipc_addr: str = ipc_addr
+        self._latency: float = latency
+        self._calculate_latency: float = calculate_latency
+        self._version: int = version
+        self.model: 'IScoreModel' = model if model else IScoreModel()
+
+        self._writer: Optional['asyncio.StreamWriter'] = None
+        # block_height: (status, iscore, state_hash)
+        self._calculate_results: Dict[int, Tuple[int, int, bytes]] = {}
+        self._tasks: List['asyncio.Future'] = []
+
+        self._handlers: dict = {
+            MessageType.VERSION: self._handle_version,
+            MessageType.CLAIM: self._handle_claim,
+            MessageType.QUERY: self._handle_query,
+            MessageType.QUERY_BATCH: self._handle_query_batch,
+            MessageType.CALCULATE: self._handle_calculate,
+            MessageType.COMMIT_BLOCK: self._handle_commit_block,
+            MessageType.COMMIT_CLAIM: self._handle_commit_claim,
+            MessageType.COMMIT_CLAIM_BATCH: self._handle_commit_claim_batch,
+            MessageType.QUERY_CALCULATE_STATUS: self._handle_query_calculate_status,
+            MessageType.QUERY_CALCULATE_RESULT: self._handle_query_calculate_result,
+            MessageType.INIT: self._handle_init,
+        }
+
+    async def run(self, connect_timeout: float = 10):
+        """Serves messages until the connection is closed
+        """
+        reader, self._writer = await self._connect(connect_timeout)
+
+        model: 'IScoreModel' = self.model
+        self._send(MessageType.READY, 0, (self._version, model.commit_block_height, model.commit_block_hash))
+
+        unpacker = msgpack.Unpacker(raw=True)
+        try:
+            while True:
+                data: bytes = await reader.read(65536)
+                if not data:
+                    break
+
+                unpacker.feed(data)
+                for msg_type, msg_id, *payload in unpacker:
+                    self._handle(msg_type, msg_id, payload[0] if payload else None)
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            self._writer.close()
+
+        Logger.info(tag=_TAG, msg="run() end")
+
+    async def _connect(self, timeout: float) -> tuple:
+        # iconservice may not be listening yet
+        loop = asyncio.get_event_loop()
+        deadline: float = loop.time() + timeout
+
+        while True:
+            try:
+                return await asyncio.open_unix_connection(self._ipc_addr)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if loop.time() > deadline:
+                    raise
+                await asyncio.sleep(0.05)
+
+    def _send(self, msg_type: int, msg_id: int, payload=None):
+        if self._writer.transport.is_closing():
+            # The connection is closed before a delayed response is sent
+            return
+
+        message: tuple = (msg_type, msg_id) if payload is None else (msg_type, msg_id, payload)
+        self._writer.write(msgpack.dumps(message))
+
+    def _handle(self, msg_type: int, msg_id: int, payload):
+        handler = self._handlers.get(msg_type)
+        if handler is None:
+            Logger.warning(tag=_TAG, msg=f"Unsupported message: type={msg_type} id={msg_id}")
+            return
+
+        try:
+            response = handler(payload)
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=f"Failed to handle a message: type={msg_type} id={msg_id} {e}")
+            return
+
+        if response is None:
+            return
+
+        payload = None if response is _NO_PAYLOAD else response
+        if self._latency > 0:
+            # Messages are handled in order, but their responses are not waiting for each other
+            # so that the requests in flight overlap like the ones to icon_rc
+            asyncio.get_event_loop().call_later(self._latency, self._send, msg_type, msg_id, payload)
+        else:
+            self._send(msg_type, msg_id, payload)
+
+    def _handle_version(self, _payload) -> tuple:
+        return self._version, self.model.commit_block_height
+
+    def _handle_claim(self, payload: list) -> tuple:
+        address, block_height, block_hash, tx_index, tx_hash = payload
+        iscore: int = self.model.claim(_decode_address(address), block_height, block_hash)
+        return address, block_height, block_hash, tx_index, tx_hash, MsgPackForIpc.encode(iscore)
+
+    def _handle_query(self, payload: bytes) -> tuple:
+        iscore: int = self.model.query(_decode_address(payload))
+        return payload, MsgPackForIpc.encode(iscore), self.model.block_height
+
+    def _handle_query_batch(self, payload: list) -> list:
+        return [self._handle_query(address) for address in payload]
+
+    def _handle_commit_claim(self, payload: list) -> object:
+        success, address, _block_height, block_hash, _tx_index, _tx_hash = payload
+        self.model.commit_claim(success, _decode_address(address), block_hash)
+        return _NO_PAYLOAD
+
+    def _handle_commit_claim_batch(self, payload: list) -> object:
+        for success, address, _block_height, block_hash, _tx_index, _tx_hash in payload:
+            self.model.commit_claim(success, _decode_address(address), block_hash)
+        return _NO_PAYLOAD
+
+    def _handle_commit_block(self, payload: list) -> tuple:
+        success, block_height, block_hash = payload
+        self.model.commit_block(success, block_height, block_hash)
+        return True, block_height, block_hash
+
+    def _handle_init(self, payload: int) -> tuple:
+        return True, payload
+
+    def _handle_calculate(self, payload: list) -> tuple:
+        db_path, block_height = payload
+        if isinstance(db_path, bytes):
+            db_path = db_path.decode()
+
+        self._calculate_results[block_height] = (RCCalculateResult.IN_PROGRESS, 0, b"")
+        self._tasks.append(asyncio.ensure_future(self._calculate(db_path, block_height)))
+        return RCCalculateResult.SUCCESS, block_height
+
+    async def _calculate(self, db_path: str, block_height: int):
+        # CALCULATE_DONE follows the response to CALCULATE
+        if self._latency + self._calculate_latency > 0:
+            await asyncio.sleep(self._latency + self._calculate_latency)
+
+        try:
+            iscore, state_hash = self.model.calculate(db_path, block_height)
+            self._calculate_results[block_height] = (RCCalculateResult.SUCCESS, iscore, state_hash)
+        except BaseException as e:
+            Logger.exception(tag=_TAG, msg=f"Failed to calculate: block_height={block_height} {e}")
+            self._calculate_results[block_height] = (RCCalculateResult.FAIL, 0, b"")
+            iscore, state_hash = 0, b""
+        finally:
+            # The reward calculator owns iiss_rc_db and removes it after calculation
+            shutil.rmtree(db_path, ignore_errors=True)
+
+        success: bool = self._calculate_results[block_height][0] == RCCalculateResult.SUCCESS
+        self._send(MessageType.CALCULATE_DONE, 0, (success, block_height, MsgPackForIpc.encode(iscore), state_hash))
+
+    def _handle_query_calculate_status(self, _payload) -> tuple:
+        if not self._calculate_results:
+            return RCCalculateResult.SUCCESS, self.model.commit_block_height, self.model.block_height
+
+        block_height: int = max(self._calculate_results)
+        return self._calculate_results[block_height][0], self.model.commit_block_height, block_height
+
+    def _handle_query_calculate_result(self, payload: int) -> tuple:
+        status, iscore, state_hash = \
+            self._calculate_results.get(payload, (RCCalculateResult.INVALID_BLOCK_HEIGHT, 0, b""))
+        return status, payload, MsgPackForIpc.encode(iscore), state_hash
+
+
+# Marks the response of a message which has no payload
+_NO_PAYLOAD = object()
+
+
+def _decode_address(data: bytes) -> 'Address':
+    return MsgPackForIpc.decode(TypeTag.ADDRESS, data)
+
+
+def main():
+    # Accepts the same arguments as icon_rc to be launched by RewardCalcProxy
+    parser = argparse.ArgumentParser(prog="icon_rc_stand_in")
+    parser.add_argument("-client", action="store_true", help="connect to iconservice")
+    parser.add_argument("-monitor", action="store_true", help="ignored")
+    parser.add_argument("-db-count", dest="db_count", type=int, default=16, help="ignored")
+    parser.add_argument("-db", type=str, default="", help="ignored. I-Scores are kept in memory")
+    parser.add_argument("-iissdata", type=str, default="", help="ignored")
+    parser.add_argument("-ipc-addr", dest="ipc_addr", type=str, required=True, help="unix domain socket path")
+    parser.add_argument("-log-file", dest="log_file", type=str, default="", help="log file path")
+    parser.add_argument("-latency", type=float, default=0, help="seconds to respond to a message")
+    parser.add_argument("-calculate-latency", dest="calculate_latency", type=float, default=0,
+                        help="seconds to calculate I-Scores of a period")
+    args = parser.parse_args()
+
+    if args.log_file:
+        os.makedirs(os.path.dirname(os.path.abspath(args.log_file)), exist_ok=True)
+        Logger.load_config({"log": {"name": "icon_rc_stand_in", "filePath": args.log_file, "outputType": "file"}})
+
+    reward_calc = StandInRewardCalculator(args.ipc_addr, args.latency, args.calculate_latency)
+    loop = asyncio.get_event_loop()
+    try:
+        loop.run_until_complete(reward_calc.run())
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,28 +15,37 @@
 # limitations under the License.
 
 import os
+import struct
 from collections import namedtuple
 from typing import TYPE_CHECKING, Optional, Tuple, List, Set
 
 from iconcommons import Logger
 from ..reward_calc.msg_data import Header, TxData, PRepsData, TxType
-from ...base.exception import DatabaseException, InternalServiceErrorException
+from ...base.exception import DatabaseException, IllegalFormatException, InternalServiceErrorException
 from ...database.db import KeyValueDatabase
 from ...icon_constant import (
     DATA_BYTE_ORDER, Revision, RC_DATA_VERSION_TABLE, RC_DB_VERSION_0, IISS_LOG_TAG, WAL_LOG_TAG
 )
 from ...iconscore.icon_score_context import IconScoreContext
 from ...iiss.reward_calc.data_creator import DataCreator
+from ...utils.checksum_file import read_checksum_file, write_checksum_file
+from ...utils.lazy_logger import DEBUG, is_log_enabled, summarize_text
 from ...utils.msgpack_for_db import MsgPackForDB
 
 if TYPE_CHECKING:
     from ...base.address import Address
+    from ...database.batch import RewardCalcBatch
     from ...database.wal import IissWAL
     from ..reward_calc.msg_data import Data, DelegationInfo
 
 
 RewardCalcDBInfo = namedtuple('RewardCalcDBInfo', ['path', 'block_height'])
 
+_STANDBY_RC_DB_MARKER_MAGIC_KEY = b"SRDM"
+_STANDBY_RC_DB_MARKER_VERSION = 1
+# block_height(8) | calculate_sent(1)
+_STANDBY_RC_DB_MARKER_HEADER_FORMAT = ">Q?"
+
 
 def get_rc_version(revision: int) -> int:
     while revision >= Revision.IISS.value:
@@ -66,6 +75,8 @@ class Storage(object):
     CURRENT_IISS_DB_NAME = "current_db"
     STANDBY_IISS_DB_NAME_PREFIX = "standby_rc_db_"
     IISS_RC_DB_NAME_PREFIX = "iiss_rc_db_"
+    # Tracks standby_db from replace_db() until CALCULATE for it is sent to reward calculator
+    STANDBY_RC_DB_MARKER_NAME = "standby_rc_db.marker"
 
     KEY_FOR_GETTING_LAST_TRANSACTION_INDEX = b'last_transaction_index'
     KEY_FOR_CALC_RESPONSE_FROM_RC = b'calc_response_from_rc'
@@ -170,9 +181,18 @@ class Storage(object):
             return self._db_iiss_tx_index
 
     @staticmethod
-    def put(batch: list, iiss_data: 'Data'):
-        Logger.debug(tag=IISS_LOG_TAG, msg=f"put data: {str(iiss_data)}")
-        batch.append(iiss_data)
+    def put(batch: 'RewardCalcBatch', iiss_data: 'Data'):
+        """Encode iiss_data and append it to batch
+
+        The key of TxData is suffixed with tx_index on commit
+        """
+        if is_log_enabled(DEBUG):
+            Logger.debug(tag=IISS_LOG_TAG, msg=f"put data: {summarize_text(iiss_data)}")
+
+        if isinstance(iiss_data, TxData):
+            batch.append(TxData.PREFIX, iiss_data.make_value(), indexed=True)
+        else:
+            batch.append(iiss_data.make_key(), iiss_data.make_value())
 
     def commit(self, iiss_wal: 'IissWAL'):
         self._db.write_batch(iiss_wal)
@@ -207,7 +227,11 @@ class Storage(object):
     def replace_db(self, block_height: int) -> 'RewardCalcDBInfo':
         """
         1. Rename current_db to standby_db_{block_height}_{rc_version}
-        2. Create a new current_db for the next calculation period
+        2. Write the marker of standby_db
+        3. Create a new current_db for the next calculation period
+
+        standby_db is not compacted here to keep compaction off the commit.
+        Call prepare_standby_db() before sending it to reward calculator
 
         :param block_height: End block height of the current calc period
         :return:
@@ -219,13 +243,26 @@ class Storage(object):
         rc_version, _ = self.get_version_and_revision()
         rc_version: int = max(rc_version, 0)
         self._db.close()
-        # Process compaction before send the RC DB to reward calculator
-        self.process_db_compaction(os.path.join(self._path, self.CURRENT_IISS_DB_NAME))
 
         standby_db_path: str = self.rename_current_db_to_standby_db(self._path, block_height, rc_version)
+        standby_db_info = RewardCalcDBInfo(standby_db_path, block_height)
+        self.write_standby_rc_db_marker(self._path, standby_db_info)
         self._db = self.create_current_db(self._path)
 
-        return RewardCalcDBInfo(standby_db_path, block_height)
+        return standby_db_info
+
+    @classmethod
+    def prepare_standby_db(cls, standby_db_path: str) -> str:
+        """Compact standby_db and rename it to iiss_db which reward calculator reads
+
+        It can take long on a large standby_db, so it is called on a background worker
+
+        :param standby_db_path:
+        :return: iiss_db path
+        """
+        # Process compaction before send the RC DB to reward calculator
+        cls.process_db_compaction(standby_db_path)
+        return cls.rename_standby_db_to_iiss_db(standby_db_path)
 
     @classmethod
     def process_db_compaction(cls, path: str):
@@ -255,16 +292,64 @@ class Storage(object):
 
         return standby_db_path
 
+    @classmethod
+    def get_iiss_db_path(cls, standby_db_path: str) -> str:
+        return cls.IISS_RC_DB_NAME_PREFIX.join(standby_db_path.rsplit(cls.STANDBY_IISS_DB_NAME_PREFIX, 1))
+
     @classmethod
     def rename_standby_db_to_iiss_db(cls, standby_db_path: str) -> str:
         # After change the db name, reward calc manage this db (icon service does not have a authority)
-        iiss_db_path: str = cls.IISS_RC_DB_NAME_PREFIX.\
-            join(standby_db_path.rsplit(cls.STANDBY_IISS_DB_NAME_PREFIX, 1))
+        iiss_db_path: str = cls.get_iiss_db_path(standby_db_path)
 
         cls._rename_db(standby_db_path, iiss_db_path)
 
         return iiss_db_path
 
+    @classmethod
+    def write_standby_rc_db_marker(cls,
+                                   rc_data_path: str,
+                                   standby_db_info: 'RewardCalcDBInfo',
+                                   calculate_sent: bool = False):
+        """Record standby_db which is to be prepared and sent to reward calculator with CALCULATE
+
+        It is kept apart from block WAL, so that the next block can be committed
+        while standby_db is being prepared
+
+        :param rc_data_path: the parent directory of rc_dbs
+        :param standby_db_info: standby_db path and the end block height of its calc period
+        :param calculate_sent: CALCULATE has been sent to reward calculator
+        """
+        header: bytes = struct.pack(
+            _STANDBY_RC_DB_MARKER_HEADER_FORMAT, standby_db_info.block_height, calculate_sent)
+        payload: bytes = os.path.basename(standby_db_info.path).encode()
+        write_checksum_file(os.path.join(rc_data_path, cls.STANDBY_RC_DB_MARKER_NAME),
+                            _STANDBY_RC_DB_MARKER_MAGIC_KEY, _STANDBY_RC_DB_MARKER_VERSION, header, payload,
+                            sync=True)
+
+    @classmethod
+    def read_standby_rc_db_marker(cls, rc_data_path: str) -> Optional[Tuple['RewardCalcDBInfo', bool]]:
+        """
+        :param rc_data_path: the parent directory of rc_dbs
+        :return: (standby_db_info, calculate_sent) or None if no marker exists
+        """
+        path: str = os.path.join(rc_data_path, cls.STANDBY_RC_DB_MARKER_NAME)
+        if not os.path.isfile(path):
+            return None
+
+        header, payload = read_checksum_file(path, _STANDBY_RC_DB_MARKER_MAGIC_KEY, _STANDBY_RC_DB_MARKER_VERSION)
+        try:
+            block_height, calculate_sent = struct.unpack(_STANDBY_RC_DB_MARKER_HEADER_FORMAT, header)
+        except struct.error as e:
+            raise IllegalFormatException(f"Invalid standby_rc_db marker: {e}")
+
+        return RewardCalcDBInfo(os.path.join(rc_data_path, payload.decode()), block_height), calculate_sent
+
+    @classmethod
+    def remove_standby_rc_db_marker(cls, rc_data_path: str):
+        path: str = os.path.join(rc_data_path, cls.STANDBY_RC_DB_MARKER_NAME)
+        if os.path.isfile(path):
+            os.remove(path)
+
     @classmethod
     def scan_rc_db(cls, rc_data_path: str) -> Tuple[str, str, str]:
         """Scan directories that are managed by RewardCalcStorage
@@ -20,11 +20,10 @@ from typing import TYPE_CHECKING, Optional, List
 
 from .base.block import Block, EMPTY_BLOCK
 from .base.exception import InvalidParamsException
-from .database.batch import BlockBatch
+from .database.batch import BlockBatch, RewardCalcBatch
 from .database.batch import TransactionBatchValue
 from .icon_constant import Revision
 from .iconscore.icon_score_mapper import IconScoreMapper
-from .iiss.reward_calc.msg_data import TxData
 from .utils import bytes_to_hex, sha3_256
 
 if TYPE_CHECKING:
@@ -52,19 +51,11 @@ def _print_block_batch(block_batch: 'BlockBatch') -> List[str]:
     return lines
 
 
-def _print_rc_block_batch(rc_block_batch: list) -> List[str]:
+def _print_rc_block_batch(rc_block_batch: 'RewardCalcBatch') -> List[str]:
     lines = []
 
     try:
-        tx_index = 0
-        for i, data in enumerate(rc_block_batch):
-            if isinstance(data, TxData):
-                key: bytes = data.make_key(tx_index)
-                tx_index += 1
-            else:
-                key: bytes = data.make_key()
-
-            value: bytes = data.make_value()
+        for i, (key, value) in enumerate(rc_block_batch.items()):
             lines.append(f"{i}: {key.hex()} - {value.hex()}")
     except:
         pass
@@ -95,7 +86,7 @@ class PrecommitData(object):
                  rc_db_revision: int,
                  block_batch: 'BlockBatch',
                  block_result: list,
-                 rc_block_batch: list,
+                 rc_block_batch: 'RewardCalcBatch',
                  preps: 'PRepContainer',
                  term: Optional['Term'],
                  prev_block_generator: Optional['Address'],
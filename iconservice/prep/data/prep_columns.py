@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("PRepColumns",)
+
+from itertools import islice
+from operator import mul
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from ...base.address import Address
+    from .prep import PRep
+
+
+class PRepColumns(object):
+    """Columnar snapshot of the active P-Reps ordered by ranking
+
+    Term creation reads a few properties of the top-ranked P-Reps,
+    so they are gathered into columns in a single pass over PRep objects.
+    delegated and irep are kept as python ints because amounts in loop exceed 64 bits
+    """
+
+    def __init__(self):
+        self.addresses: List['Address'] = []
+        self.delegated: List[int] = []
+        self.irep: List[int] = []
+
+    @classmethod
+    def from_preps(cls, preps: Iterable['PRep']) -> 'PRepColumns':
+        columns = cls()
+
+        for prep in preps:
+            # active and no penalty
+            assert prep.is_electable()
+
+            columns.addresses.append(prep.address)
+            columns.delegated.append(prep.delegated)
+            columns.irep.append(prep.irep)
+
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def total_delegated(self, start: int = 0, end: Optional[int] = None) -> int:
+        """Returns the sum of delegated amounts of the P-Reps ranked in [start, end)
+        """
+        return sum(islice(self.delegated, start, end))
+
+    def weighted_average_of_irep(self, count: int, default: int) -> int:
+        """Returns the average of irep weighted by delegated amount of the top count P-Reps
+
+        :param count: the number of P-Reps from the top
+        :param default: returned if no P-Rep has delegated amount
+        """
+        total_delegated: int = self.total_delegated(0, count)
+        if total_delegated <= 0:
+            return default
+
+        total_weighted_irep: int = sum(map(mul, islice(self.irep, count), islice(self.delegated, count)))
+        return total_weighted_irep // total_delegated
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from iconcommons import Logger
 
@@ -191,6 +191,13 @@ class PRepContainer(object):
         """
         return self._active_prep_list[start_index:start_index + size]
 
+    def get_all_preps(self) -> Iterable['PRep']:
+        """Returns all P-Reps regardless of their status in the order they were added
+
+        :return: P-Rep iterable
+        """
+        return self._prep_dict.values()
+
     def get_inactive_preps(self) -> List['PRep']:
         """Returns inactive P-Reps which is unregistered or receiving prep disqualification or low productivity penalty.
         This method does not care about the order of P-Rep list
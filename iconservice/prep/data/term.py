@@ -16,6 +16,7 @@
 __all__ = ("Term", "PRepSnapshot")
 
 import copy
+from itertools import islice
 from typing import TYPE_CHECKING, List, Iterable, Optional, Dict
 
 from iconcommons.logger import Logger
@@ -23,8 +24,9 @@ from iconcommons.logger import Logger
 from ... import utils
 from ...base.exception import AccessDeniedException
 from ...icon_constant import PRepStatus, PenaltyReason, TermFlag
+from .prep_columns import PRepColumns
 from ...utils import bytes_to_hex
-from ...utils.hashing.hash_generator import RootHashGenerator
+from ...utils.hashing.merkle_tree import IncrementalMerkleTree
 
 if TYPE_CHECKING:
     from ...base.address import Address
@@ -83,6 +85,8 @@ class Term(object):
 
         # made from main P-Rep addresses
         self._merkle_root_hash: Optional[bytes] = None
+        # Shared with the copies of this term. Copy it before updating
+        self._merkle_tree: Optional['IncrementalMerkleTree'] = None
         self._is_frozen: bool = False
         self._flags: 'TermFlag' = TermFlag.NONE
 
@@ -254,31 +258,33 @@ class Term(object):
         :param elected_prep_count:
         :return:
         """
+        self.set_prep_columns(PRepColumns.from_preps(islice(it, elected_prep_count)), main_prep_count)
 
+    def set_prep_columns(self, columns: 'PRepColumns', main_prep_count: int):
+        """Set elected P-Rep data to term with the columns of electable P-Reps
+
+        This method MUST BE called at the end of the term
+
+        :param columns: main and sub P-Reps ordered by ranking
+        :param main_prep_count:
+        :return:
+        """
         self._main_preps.clear()
         self._sub_preps.clear()
         self._preps_dict.clear()
 
         # Main and sub P-Reps
-        total_elected_prep_delegated: int = 0
-
-        for i, prep in enumerate(it):
-            if i >= elected_prep_count:
-                break
-
-            # active and no penalty
-            assert prep.is_electable()
-
-            snapshot = PRepSnapshot(prep.address, prep.delegated)
-            total_elected_prep_delegated += prep.delegated
+        for i, (address, delegated) in enumerate(zip(columns.addresses, columns.delegated)):
+            snapshot = PRepSnapshot(address, delegated)
 
-            if len(self._main_preps) < main_prep_count:
+            if i < main_prep_count:
                 self._main_preps.append(snapshot)
             else:
                 self._sub_preps.append(snapshot)
 
-            self._preps_dict[snapshot.address] = snapshot
+            self._preps_dict[address] = snapshot
 
+        total_elected_prep_delegated: int = columns.total_delegated()
         self._total_elected_prep_delegated_snapshot = total_elected_prep_delegated
         self._total_elected_prep_delegated = total_elected_prep_delegated
 
@@ -305,9 +311,6 @@ class Term(object):
 
             raise AssertionError(f"{prep.address} not in elected P-Reps: {self}")
 
-        if utils.is_all_flag_on(flags, TermFlag.MAIN_PREPS):
-            self._generate_root_hash()
-
         self._flags |= flags
 
     def _remove_invalid_main_prep(self, invalid_prep: 'PRep') -> int:
@@ -327,10 +330,12 @@ class Term(object):
 
         if len(self._sub_preps) == 0:
             self._main_preps.pop(index)
+            self._update_root_hash(index, removed=True)
             Logger.warning(tag=self.TAG,
                            msg=f"Not enough sub P-Rep to replace an invalid main P-Rep")
         else:
             self._main_preps[index] = self._sub_preps.pop(0)
+            self._update_root_hash(index)
             Logger.info(
                 tag=self.TAG,
                 msg=f"Replace a main P-Rep: "
@@ -395,8 +400,25 @@ class Term(object):
             for snapshot in snapshots:
                 yield snapshot.address.to_bytes_including_prefix()
 
-        self._merkle_root_hash: bytes = \
-            RootHashGenerator.generate_root_hash(values=_gen(self._main_preps), do_hash=True)
+        merkle_tree = IncrementalMerkleTree(_gen(self._main_preps), do_hash=True)
+
+        self._merkle_tree = merkle_tree
+        self._merkle_root_hash: bytes = merkle_tree.get_merkle_root()
+
+    def _update_root_hash(self, index: int, removed: bool = False):
+        """Update the root hash after the main P-Rep at a given index is replaced or removed
+
+        :param index: the index of the replaced main P-Rep
+        :param removed: True if the main P-Rep is removed without replacement
+        """
+        merkle_tree: 'IncrementalMerkleTree' = self._merkle_tree.copy()
+        if removed:
+            merkle_tree.delete(index)
+        else:
+            merkle_tree.update(index, self._main_preps[index].address.to_bytes_including_prefix(), do_hash=True)
+
+        self._merkle_tree = merkle_tree
+        self._merkle_root_hash: bytes = merkle_tree.get_merkle_root()
 
     @classmethod
     def from_list(cls, data: List, total_elected_prep_delegated_from_rc: int) -> 'Term':
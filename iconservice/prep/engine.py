@@ -19,7 +19,9 @@ from iconcommons.logger import Logger
 from .data import Term
 from .data.prep import PRep, PRepDictType
 from .data.prep_container import PRepContainer
+from .data.prep_columns import PRepColumns
 from .penalty_imposer import PenaltyImposer
+from .snapshot import load_preps, save_preps
 from .validator import validate_prep_data, validate_irep
 from ..base.ComponentBase import EngineBase
 from ..base.address import Address, ZERO_SCORE_ADDRESS
@@ -37,9 +39,11 @@ from ..iiss import IISSEngineListener
 from ..iiss.reward_calc import RewardCalcDataCreator
 
 if TYPE_CHECKING:
+    from ..base.block import Block
     from ..iiss.reward_calc.msg_data import PRepRegisterTx, PRepUnregisterTx, TxData
     from ..icx import IcxStorage
     from ..precommit_data_manager import PrecommitData
+    from ..database.batch import RewardCalcBatch
 
 _TAG = "PREP"
 
@@ -77,6 +81,10 @@ class Engine(EngineBase, IISSEngineListener):
         self.term: Optional['Term'] = None
         self._initial_irep: Optional[int] = None
         self._penalty_imposer: Optional['PenaltyImposer'] = None
+        # The file where self.preps is saved on close to be loaded on the next open
+        self._snapshot_path: Optional[str] = None
+        # The hash of the block at which self.preps is committed
+        self._preps_block_hash: Optional[bytes] = None
 
         Logger.debug(tag=_TAG, msg="PRepEngine.__init__() end")
 
@@ -86,14 +94,15 @@ class Engine(EngineBase, IISSEngineListener):
              irep: int,
              penalty_grace_period: int,
              low_productivity_penalty_threshold: int,
-             block_validation_penalty_threshold: int):
+             block_validation_penalty_threshold: int,
+             snapshot_path: str = ""):
 
         # This logic doesn't need to save to DB yet
         self._init_penalty_imposer(penalty_grace_period,
                                    low_productivity_penalty_threshold,
                                    block_validation_penalty_threshold)
 
-        self._load_preps(context)
+        self._load_preps(context, snapshot_path)
         self._initial_irep = irep
 
         context.engine.iiss.add_listener(self)
@@ -117,12 +126,30 @@ class Engine(EngineBase, IISSEngineListener):
                                                low_productivity_penalty_threshold,
                                                block_validation_penalty_threshold)
 
-    def _load_preps(self, context: 'IconScoreContext'):
+    def _load_preps(self, context: 'IconScoreContext', snapshot_path: str):
+        """Load preps from the snapshot saved on the last close or from db
+
+        :param snapshot_path: the snapshot file path, an empty string means not to use it
+        :return:
+        """
+        last_block: 'Block' = context.storage.icx.last_block
+
+        preps: Optional['PRepContainer'] = load_preps(snapshot_path, last_block) if snapshot_path else None
+        if preps is None:
+            preps = self._load_preps_from_db(context)
+
+        self.preps = preps
+        self._snapshot_path = snapshot_path
+        self._preps_block_hash = last_block.hash
+
+    @staticmethod
+    def _load_preps_from_db(context: 'IconScoreContext') -> 'PRepContainer':
         """Load a prep from db
 
         :return:
         """
         icx_storage: 'IcxStorage' = context.storage.icx
+        preps = PRepContainer()
 
         for prep in context.storage.prep.get_prep_iterator():
             account: 'Account' = icx_storage.get_account(context, prep.address, Intent.ALL)
@@ -130,12 +157,31 @@ class Engine(EngineBase, IISSEngineListener):
             prep.stake = account.stake
             prep.delegated = account.delegated_amount
 
-            self.preps.add(prep)
+            preps.add(prep)
 
-        self.preps.freeze()
+        preps.freeze()
+        return preps
 
     def close(self):
         IconScoreContext.engine.iiss.remove_listener(self)
+        self._save_preps()
+
+    def _save_preps(self):
+        """Save preps to the snapshot file if they are committed at the last block
+        """
+        if not self._snapshot_path:
+            return
+
+        last_block: 'Block' = IconScoreContext.storage.icx.last_block
+        if last_block.height < 0 or last_block.hash != self._preps_block_hash:
+            # preps are not committed together with the last block on failure or before IISS revision
+            return
+
+        try:
+            save_preps(self._snapshot_path, last_block, self.preps)
+        except BaseException as e:
+            # preps are loaded from db without the snapshot on the next open
+            Logger.warning(tag=_TAG, msg=f"Failed to save P-Rep snapshot: {e}")
 
     def invoke(self, context: 'IconScoreContext', data: dict):
         method: str = data['method']
@@ -162,6 +208,7 @@ class Engine(EngineBase, IISSEngineListener):
         """
         # Updated every block
         self.preps = precommit_data.preps
+        self._preps_block_hash = precommit_data.block_batch.block.hash
 
         # Exchange a term instance for some reasons:
         # - penalty for elected P-Reps(main, sub)
@@ -432,7 +479,7 @@ class Engine(EngineBase, IISSEngineListener):
         :return:
         """
 
-        rc_tx_batch: list = context.rc_tx_batch
+        rc_tx_batch: 'RewardCalcBatch' = context.rc_tx_batch
         block_height: int = context.block.height
 
         tx: 'PRepRegisterTx' = RewardCalcDataCreator.create_tx_prep_reg()
@@ -490,8 +537,8 @@ class Engine(EngineBase, IISSEngineListener):
         :param context:
         :return:
         """
-        new_preps: List['PRep'] = context.preps.get_preps(
-            start_index=0, size=context.main_and_sub_prep_count)
+        new_preps: 'PRepColumns' = PRepColumns.from_preps(context.preps.get_preps(
+            start_index=0, size=context.main_and_sub_prep_count))
 
         sequence = 0 if prev_term is None else prev_term.sequence + 1
         start_block_height = context.block.height + 1
@@ -499,7 +546,7 @@ class Engine(EngineBase, IISSEngineListener):
             assert start_block_height == prev_term.end_block_height + 1
 
         # The current P-Rep term is over. Prepare the next P-Rep term
-        irep: int = cls._calculate_weighted_average_of_irep(new_preps[:context.main_prep_count])
+        irep: int = new_preps.weighted_average_of_irep(context.main_prep_count, IISS_MIN_IREP)
 
         term = Term(
             sequence,
@@ -510,21 +557,10 @@ class Engine(EngineBase, IISSEngineListener):
             context.preps.total_delegated
         )
 
-        term.set_preps(new_preps, context.main_prep_count, context.main_and_sub_prep_count)
+        term.set_prep_columns(new_preps, context.main_prep_count)
 
         return term
 
-    @classmethod
-    def _calculate_weighted_average_of_irep(cls, new_main_preps: List['PRep']) -> int:
-        total_delegated = 0  # total delegated of top 22 preps
-        total_weighted_irep = 0
-
-        for prep in new_main_preps:
-            total_weighted_irep += prep.irep * prep.delegated
-            total_delegated += prep.delegated
-
-        return total_weighted_irep // total_delegated if total_delegated > 0 else IISS_MIN_IREP
-
     def handle_get_prep(self, _context: 'IconScoreContext', params: dict) -> dict:
         """Returns the details of a P-Rep including information on registration, delegation and statistics
 
@@ -722,7 +758,7 @@ class Engine(EngineBase, IISSEngineListener):
 
     @classmethod
     def _put_unreg_prep_for_iiss_db(cls, context: 'IconScoreContext', address: 'Address'):
-        rc_tx_batch: list = context.rc_tx_batch
+        rc_tx_batch: 'RewardCalcBatch' = context.rc_tx_batch
         block_height: int = context.block.height
 
         tx: 'PRepUnregisterTx' = RewardCalcDataCreator.create_tx_prep_unreg()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("save_preps", "load_preps")
+
+import os
+import struct
+from typing import TYPE_CHECKING, Optional
+
+from iconcommons.logger import Logger
+from msgpack.exceptions import UnpackException
+
+from .data.prep import PRep
+from .data.prep_container import PRepContainer
+from ..base.exception import IllegalFormatException
+from ..icon_constant import Revision
+from ..utils.checksum_file import read_checksum_file, write_checksum_file
+from ..utils.msgpack_for_db import MsgPackForDB
+
+if TYPE_CHECKING:
+    from ..base.block import Block
+
+_TAG = "PREP"
+
+_MAGIC_KEY = b"PRSS"
+_FILE_VERSION = 2
+
+# block_height(8) | block_hash(32)
+_HEADER_STRUCT_FORMAT = ">Q32s"
+_HEADER_SIZE = struct.calcsize(_HEADER_STRUCT_FORMAT)
+
+
+def save_preps(path: str, block: 'Block', preps: 'PRepContainer'):
+    """Write the P-Reps committed at a given block to a snapshot file
+
+    Stake and delegated amounts which come from accounts are written with each P-Rep,
+    so that the container is restored without reading all P-Rep accounts on open
+
+    header: | block_height | block_hash |
+    payload: msgpack([[prep, stake, delegated], ...])
+
+    :param path: snapshot file path
+    :param block: the last committed block where preps are valid
+    :param preps: frozen P-Rep container
+    """
+    assert preps.is_frozen()
+
+    revision: int = Revision.LATEST.value
+    payload: bytes = MsgPackForDB.dumps(
+        [[prep.to_bytes(revision), prep.stake, prep.delegated] for prep in preps.get_all_preps()]
+    )
+    header: bytes = struct.pack(_HEADER_STRUCT_FORMAT, block.height, block.hash)
+    write_checksum_file(path, _MAGIC_KEY, _FILE_VERSION, header, payload)
+
+    Logger.info(tag=_TAG, msg=f"P-Rep snapshot saved: block={block.height} preps={preps.size()}")
+
+
+def load_preps(path: str, block: 'Block') -> Optional['PRepContainer']:
+    """Read the P-Reps from a snapshot file taken at a given block
+
+    The snapshot file is removed after being read.
+    The state is changed by the blocks committed after loading it,
+    so it is only valid on the first open after it is saved.
+
+    :param path: snapshot file path
+    :param block: the last committed block
+    :return: frozen P-Rep container or None if the snapshot is missing, stale, broken or undecodable
+    """
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        header, payload = read_checksum_file(path, _MAGIC_KEY, _FILE_VERSION)
+        return _load_preps(header, payload, block)
+    except IllegalFormatException as e:
+        Logger.warning(tag=_TAG, msg=f"Invalid P-Rep snapshot: {path} {e}")
+        return None
+    except (UnpackException, ValueError, KeyError, IndexError, TypeError) as e:
+        # The payload passed the checksum but cannot be decoded to P-Reps.
+        # P-Reps are loaded from state_db instead
+        Logger.warning(tag=_TAG, msg=f"Failed to decode P-Rep snapshot: {path} {type(e).__name__}: {e}")
+        return None
+    finally:
+        os.remove(path)
+
+
+def _load_preps(header: bytes, payload: bytes, block: 'Block') -> Optional['PRepContainer']:
+    if len(header) != _HEADER_SIZE:
+        raise IllegalFormatException(f"Invalid header size: {len(header)}")
+
+    block_height, block_hash = struct.unpack(_HEADER_STRUCT_FORMAT, header)
+
+    if block_height != block.height or block_hash != block.hash:
+        Logger.info(tag=_TAG, msg=f"Stale P-Rep snapshot: block={block_height} last_block={block.height}")
+        return None
+
+    preps = PRepContainer()
+    for prep_bytes, stake, delegated in MsgPackForDB.loads(payload):
+        prep: 'PRep' = PRep.from_bytes(prep_bytes)
+        prep.stake = stake
+        prep.delegated = delegated
+        preps.add(prep)
+    preps.freeze()
+
+    Logger.info(tag=_TAG, msg=f"P-Rep snapshot loaded: block={block_height} preps={preps.size()}")
+    return preps
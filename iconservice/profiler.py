@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from bisect import bisect_left
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from iconcommons import Logger
+
+from .icon_constant import ICON_SERVICE_LOG_TAG
+
+if TYPE_CHECKING:
+    from http.server import HTTPServer
+
+_TAG = f"{ICON_SERVICE_LOG_TAG}_Profiler"
+
+# Upper bounds of histogram buckets in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+METRIC_PREFIX = "iconservice"
+
+
+class Phase(object):
+    """Names of the measured phases
+    """
+    INVOKE = "invoke"
+    INVOKE_BEFORE_TX = "invoke.before_transaction_process"
+    INVOKE_TX = "invoke.transaction"
+    INVOKE_CHARGE_FEE = "invoke.charge_fee"
+    INVOKE_AFTER_TX = "invoke.after_transaction_process"
+    INVOKE_PRECOMMIT_DATA = "invoke.precommit_data"
+
+    COMMIT = "commit"
+    COMMIT_WAL = "commit.wal"
+    COMMIT_RC_DB = "commit.rc_db"
+    COMMIT_RC_DB_WAIT = "commit.rc_db_wait"
+    COMMIT_STATE_DB = "commit.state_db"
+    COMMIT_IPC = "commit.ipc"
+    COMMIT_ACK_WAIT = "commit.ack_wait"
+
+    QUERY = "query"
+    VALIDATE_TRANSACTION = "validate_transaction"
+
+
+class Counter(object):
+    """Names of the counters
+    """
+    BLOCKS = "blocks"
+    TRANSACTIONS = "transactions"
+    COMMITS = "commits"
+    QUERIES = "queries"
+    VALIDATIONS = "validations"
+
+
+class Histogram(object):
+    """Cumulative histogram of durations
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets: Tuple[float, ...] = buckets
+        # The last one is for +Inf
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def cumulative_counts(self) -> List[int]:
+        ret = []
+        total = 0
+        for count in self.counts:
+            total += count
+            ret.append(total)
+
+        return ret
+
+
+class _NullTimer(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class _Timer(object):
+    __slots__ = ("_profiler", "_phase", "_start")
+
+    def __init__(self, profiler: 'Profiler', phase: str):
+        self._profiler = profiler
+        self._phase = phase
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler.observe(self._phase, time.monotonic() - self._start)
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Profiler(object):
+    """Measures the elapsed time of each phase in invoke, commit, query and validate_transaction
+
+    When disabled, timer() returns a shared no-op context manager
+    and the other methods return without taking a lock.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self._enabled: bool = enabled
+        self._lock = Lock()
+        self._histograms: Dict[str, 'Histogram'] = {}
+        self._counters: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def timer(self, phase: str):
+        """Returns a context manager which measures the elapsed time of the with-block
+
+        :param phase: Phase name
+        """
+        if not self._enabled:
+            return _NULL_TIMER
+
+        return _Timer(self, phase)
+
+    def observe(self, phase: str, seconds: float):
+        if not self._enabled:
+            return
+
+        with self._lock:
+            histogram: Optional['Histogram'] = self._histograms.get(phase)
+            if histogram is None:
+                histogram = self._histograms[phase] = Histogram()
+            histogram.observe(seconds)
+
+    def increment(self, name: str, value: int = 1):
+        if not self._enabled:
+            return
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def get_summary(self) -> dict:
+        """Returns the summary of the measured phases for ise_getStatus
+
+        Durations are in microseconds
+        """
+        with self._lock:
+            phases = {
+                phase: {
+                    "count": histogram.count,
+                    "total": int(histogram.sum * 1_000_000),
+                    "avg": int(histogram.sum * 1_000_000 / histogram.count),
+                    "max": int(histogram.max * 1_000_000)
+                }
+                for phase, histogram in self._histograms.items()
+            }
+            counters = dict(self._counters)
+
+        return {"phases": phases, "counters": counters}
+
+    def export(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format
+        """
+        metric = f"{METRIC_PREFIX}_phase_duration_seconds"
+        lines = [
+            f"# HELP {metric} Elapsed time of each phase",
+            f"# TYPE {metric} histogram"
+        ]
+
+        with self._lock:
+            for phase in sorted(self._histograms):
+                histogram: 'Histogram' = self._histograms[phase]
+                cumulative_counts: List[int] = histogram.cumulative_counts()
+
+                for bound, count in zip(histogram.buckets, cumulative_counts):
+                    lines.append(f'{metric}_bucket{{phase="{phase}",le="{bound}"}} {count}')
+                lines.append(f'{metric}_bucket{{phase="{phase}",le="+Inf"}} {cumulative_counts[-1]}')
+                lines.append(f'{metric}_sum{{phase="{phase}"}} {histogram.sum}')
+                lines.append(f'{metric}_count{{phase="{phase}"}} {histogram.count}')
+
+            for name in sorted(self._counters):
+                counter = f"{METRIC_PREFIX}_{name}_total"
+                lines.append(f"# TYPE {counter} counter")
+                lines.append(f"{counter} {self._counters[name]}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+class MetricsServer(object):
+    """Serves the metrics of a profiler on http://<host>:<port>/metrics with a daemon thread
+    """
+
+    def __init__(self, profiler: 'Profiler', port: int, host: str = "127.0.0.1"):
+        self._profiler = profiler
+        self._address: Tuple[str, int] = (host, port)
+        self._server: Optional['HTTPServer'] = None
+        self._thread: Optional['Thread'] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_port if self._server else self._address[1]
+
+    def start(self):
+        # http.server is imported only if the metrics are served
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        profiler = self._profiler
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body: bytes = profiler.export().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        self._server = HTTPServer(self._address, _Handler)
+        self._thread = Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+        Logger.info(tag=_TAG, msg=f"MetricsServer started: {self._address[0]}:{self.port}")
+
+    def stop(self):
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+        Logger.info(tag=_TAG, msg="MetricsServer stopped")
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from .base.address import ZERO_SCORE_ADDRESS
+
+# Query methods whose results depend only on the states in state_db
+# and on the block which is marked with IconScoreContext.mark_block_dependent()
+CACHEABLE_QUERY_METHODS = (
+    'icx_getBalance',
+    'icx_getTotalSupply',
+    'icx_call',
+    'icx_getScoreApi'
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a query params to a hashable object
+
+    :param value: converted query params
+    :return: hashable object
+    """
+    if isinstance(value, dict):
+        return tuple((k, _freeze(value[k])) for k in sorted(value))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+
+    # Distinguish values which are equal but have different types (ex: 1 == True)
+    return type(value), value
+
+
+def _copy(value: Any) -> Any:
+    """Containers are copied because callers convert query results in place
+    """
+    if isinstance(value, (dict, list, tuple, set)):
+        return deepcopy(value)
+
+    return value
+
+
+class QueryCache(object):
+    """Caches query results with the state keys which have been read while computing them
+
+    A cached result is invalidated only when a committed block changes any of its state keys,
+    so the results which are not affected by the block survive across blocks.
+
+    A result depending on the block itself (ex: block height, timestamp)
+    contains IcxStorage.LAST_BLOCK_KEY in its state keys,
+    which is included in every committed block batch.
+    """
+
+    def __init__(self, max_size: int = 0):
+        """Constructor
+
+        :param max_size: the max number of cached results. 0 means disabled
+        """
+        self._max_size: int = max(max_size, 0)
+        self._lock = Lock()
+        # cache_key: (result, state_keys)
+        self._entries: 'OrderedDict' = OrderedDict()
+        # state_key: cache_keys
+        self._state_key_index: Dict[bytes, Set[tuple]] = {}
+        # Incremented whenever states are changed, to discard results made with old states
+        self._generation: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, cache_key: tuple) -> bool:
+        return cache_key in self._entries
+
+    @staticmethod
+    def is_cacheable(method: str, params: Optional[dict]) -> bool:
+        if method not in CACHEABLE_QUERY_METHODS:
+            return False
+
+        # IISS and P-Rep queries are handled with in-memory data or the reward calculator
+        if method == 'icx_call' and params and params.get('to') == ZERO_SCORE_ADDRESS:
+            return False
+
+        return True
+
+    @staticmethod
+    def make_key(method: str, params: Optional[dict]) -> tuple:
+        return method, _freeze(params)
+
+    def get(self, cache_key: tuple) -> Tuple[bool, Any]:
+        """Returns a cached result
+
+        :param cache_key: the key made with make_key()
+        :return: (True, result) if cached, otherwise (False, None)
+        """
+        with self._lock:
+            entry: Optional[tuple] = self._entries.get(cache_key)
+            if entry is None:
+                return False, None
+
+            self._entries.move_to_end(cache_key)
+
+        return True, _copy(entry[0])
+
+    def put(self, cache_key: tuple, result: Any, state_keys: Iterable[bytes], generation: int) -> bool:
+        """Caches a result with the state keys read while computing it
+
+        :param cache_key: the key made with make_key()
+        :param result: query result
+        :param state_keys: the state keys read while computing the result
+        :param generation: the generation which was taken before computing the result
+        :return: True if the result is cached
+        """
+        if not self.enabled:
+            return False
+
+        state_keys = frozenset(state_keys)
+
+        with self._lock:
+            # States have been changed while computing the result
+            if generation != self._generation:
+                return False
+
+            self._remove(cache_key)
+            self._entries[cache_key] = (_copy(result), state_keys)
+            for key in state_keys:
+                self._state_key_index.setdefault(key, set()).add(cache_key)
+
+            while len(self._entries) > self._max_size:
+                self._remove(next(iter(self._entries)))
+
+        return True
+
+    def invalidate(self, state_keys: Iterable[bytes]) -> int:
+        """Removes the results which depend on any of the given state keys
+
+        :param state_keys: the state keys changed by a committed block
+        :return: the number of removed results
+        """
+        count = 0
+
+        with self._lock:
+            self._generation += 1
+
+            for key in state_keys:
+                cache_keys: Optional[Set[tuple]] = self._state_key_index.get(key)
+                if not cache_keys:
+                    continue
+
+                for cache_key in list(cache_keys):
+                    count += self._remove(cache_key)
+
+        return count
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._state_key_index.clear()
+
+    def _remove(self, cache_key: tuple) -> int:
+        entry: Optional[tuple] = self._entries.pop(cache_key, None)
+        if entry is None:
+            return 0
+
+        for key in entry[1]:
+            cache_keys: Optional[Set[tuple]] = self._state_key_index.get(key)
+            if cache_keys is None:
+                continue
+
+            cache_keys.discard(cache_key)
+            if not cache_keys:
+                del self._state_key_index[key]
+
+        return 1
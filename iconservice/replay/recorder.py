@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Record file of the messages which IconScoreInnerTask has processed
+
+File layout:
+    magic key(4) | version(4) | record | record | ...
+
+Each record is a msgpack list prefixed with its size(4) in big endian.
+The requests are stored as they are received from loopchain.
+"""
+
+__all__ = ("RecordType", "ReplayRecorder", "ReplayReader")
+
+import os
+from enum import IntEnum
+from threading import Lock
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from ..base.exception import IllegalFormatException
+from ..icon_constant import ICON_SERVICE_LOG_TAG
+from ..utils.msgpack_for_db import MsgPackForDB
+
+if TYPE_CHECKING:
+    from ..iiss.reward_calc.ipc.message import CalculateDoneNotification
+
+_TAG = f"{ICON_SERVICE_LOG_TAG}_Replay"
+
+_MAGIC_KEY = b"IRPL"
+_FILE_VERSION = 1
+_HEADER_SIZE = 8
+
+
+class RecordType(IntEnum):
+    # [type, request, state_root_hash, rc_responses]
+    INVOKE = 0
+    # [type, request]
+    WRITE_PRECOMMIT_STATE = 1
+    # [type, request]
+    REMOVE_PRECOMMIT_STATE = 2
+    # [type, [success, block_height, iscore, state_hash]]
+    CALCULATE_DONE = 3
+
+
+def _uint32_to_bytes(value: int) -> bytes:
+    return value.to_bytes(4, "big", signed=False)
+
+
+def _bytes_to_uint32(data: bytes) -> int:
+    return int.from_bytes(data, "big", signed=False)
+
+
+class ReplayRecorder(object):
+    """Appends the messages processed by IconScoreInnerTask to a record file
+
+    The responses from the reward calculator which are received while invoking a block
+    are recorded together with the invoke request, so that the block can be replayed without it.
+
+    The state DB snapshot taken right before recording starts
+    is needed to replay the record file.
+    """
+
+    def __init__(self, path: str):
+        self._path: str = path
+        self._lock = Lock()
+        self._fp: Optional[BinaryIO] = None
+        # [method, result] received from the reward calculator while invoking a block
+        self._rc_responses: List[list] = []
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def open(self):
+        with self._lock:
+            is_new: bool = not os.path.exists(self._path) or os.path.getsize(self._path) == 0
+            self._fp = open(self._path, "ab")
+            if is_new:
+                self._fp.write(_MAGIC_KEY + _uint32_to_bytes(_FILE_VERSION))
+                self._fp.flush()
+
+        Logger.info(tag=_TAG, msg=f"ReplayRecorder opened: {self._path}")
+
+    def close(self):
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+
+    def begin_invoke(self):
+        """Discards the reward calculator responses of a block which has failed to be invoked
+        """
+        self._rc_responses.clear()
+
+    def add_rc_response(self, method: str, result: Tuple[Any, ...]):
+        self._rc_responses.append([method, list(result)])
+
+    def record_invoke(self, request: dict, state_root_hash: bytes):
+        rc_responses: List[list] = self._rc_responses
+        self._rc_responses = []
+        self._write([RecordType.INVOKE.value, request, state_root_hash, rc_responses])
+
+    def record_write_precommit_state(self, request: dict):
+        self._write([RecordType.WRITE_PRECOMMIT_STATE.value, request])
+
+    def record_remove_precommit_state(self, request: dict):
+        self._write([RecordType.REMOVE_PRECOMMIT_STATE.value, request])
+
+    def record_calculate_done(self, notification: 'CalculateDoneNotification'):
+        self._write([RecordType.CALCULATE_DONE.value,
+                     [notification.success, notification.block_height, notification.iscore, notification.state_hash]])
+
+    def _write(self, record: list):
+        try:
+            # RecordType is converted to int in advance because MsgPackForDB packs only exact types
+            data: bytes = MsgPackForDB.dumps(record)
+
+            with self._lock:
+                if self._fp is None:
+                    return
+
+                self._fp.write(_uint32_to_bytes(len(data)) + data)
+                self._fp.flush()
+        except BaseException as e:
+            # A failure of recording should not affect the service
+            Logger.warning(tag=_TAG, msg=f"Failed to record: {e}")
+
+
+class ReplayReader(object):
+    """Iterates over the records in a record file
+    """
+
+    def __init__(self, path: str):
+        self._path: str = path
+
+    def __iter__(self) -> Iterator[Tuple['RecordType', list]]:
+        with open(self._path, "rb") as f:
+            self._read_header(f)
+
+            while True:
+                data: bytes = f.read(4)
+                if len(data) == 0:
+                    break
+
+                size: int = _bytes_to_uint32(data) if len(data) == 4 else -1
+                data: bytes = f.read(size) if size >= 0 else b""
+                # The last record may have been written partially
+                if len(data) != size:
+                    Logger.warning(tag=_TAG, msg=f"Truncated record: {self._path}")
+                    break
+
+                record: list = MsgPackForDB.loads(data)
+                yield RecordType(record[0]), record[1:]
+
+    @classmethod
+    def _read_header(cls, f: BinaryIO):
+        data: bytes = f.read(_HEADER_SIZE)
+        cls._check_bytes_data(data, _HEADER_SIZE)
+
+        if data[:4] != _MAGIC_KEY:
+            raise IllegalFormatException(f"Invalid magic key: {data[:4]}")
+
+        version: int = _bytes_to_uint32(data[4:])
+        if version != _FILE_VERSION:
+            raise IllegalFormatException(f"Invalid version: Actual({version}) != Expected({_FILE_VERSION})")
+
+    @staticmethod
+    def _check_bytes_data(data: bytes, size: int):
+        if len(data) != size:
+            raise IllegalFormatException(f"Invalid data size: Actual({len(data)}) != Expected({size})")
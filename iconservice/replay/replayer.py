@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("Replayer", "ReplayReport")
+
+import copy
+import math
+import os
+import shutil
+import tempfile
+import time
+from functools import partial
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from .recorder import RecordType, ReplayReader
+from .reward_calc_proxy import RecordedResponses, StubRewardCalcProxy
+from ..base.block import Block
+from ..base.type_converter import TypeConverter
+from ..base.type_converter_templates import ConstantKeys, ParamType
+from ..icon_constant import ICON_SERVICE_LOG_TAG, ConfigKey
+from ..icon_service_engine import IconServiceEngine
+from ..iconscore.icon_score_context import IconScoreContext
+from ..iiss.engine import Engine as IISSEngine
+from ..iiss.reward_calc.ipc.message import CalculateDoneNotification
+
+if TYPE_CHECKING:
+    from iconcommons.icon_config import IconConfig
+
+_TAG = f"{ICON_SERVICE_LOG_TAG}_Replay"
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Returns the nearest-rank percentile
+    """
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    index: int = max(math.ceil(len(values) * percent / 100) - 1, 0)
+    return values[index]
+
+
+class ReplayReport(object):
+    """The result of replaying a record file
+
+    Latencies are in seconds
+    """
+
+    def __init__(self):
+        self.blocks: int = 0
+        self.transactions: int = 0
+        self.invoke_latencies: List[float] = []
+        self.commit_latencies: List[float] = []
+        # (block_height, expected state root hash, actual state root hash)
+        self.mismatches: List[Tuple[int, bytes, bytes]] = []
+
+    @property
+    def elapsed(self) -> float:
+        return sum(self.invoke_latencies) + sum(self.commit_latencies)
+
+    @property
+    def blocks_per_sec(self) -> float:
+        elapsed: float = self.elapsed
+        return self.blocks / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def transactions_per_sec(self) -> float:
+        elapsed: float = self.elapsed
+        return self.transactions / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "blocks": self.blocks,
+            "transactions": self.transactions,
+            "elapsed": self.elapsed,
+            "blocksPerSec": self.blocks_per_sec,
+            "transactionsPerSec": self.transactions_per_sec,
+            "invoke": {
+                "p50": _percentile(self.invoke_latencies, 50),
+                "p99": _percentile(self.invoke_latencies, 99)
+            },
+            "commit": {
+                "p50": _percentile(self.commit_latencies, 50),
+                "p99": _percentile(self.commit_latencies, 99)
+            },
+            "mismatches": [
+                {"blockHeight": block_height, "expected": expected.hex(), "actual": actual.hex()}
+                for block_height, expected, actual in self.mismatches
+            ]
+        }
+
+    def __str__(self) -> str:
+        lines = [
+            f"blocks: {self.blocks}",
+            f"transactions: {self.transactions}",
+            f"elapsed: {self.elapsed:.3f}s",
+            f"blocks/sec: {self.blocks_per_sec:.2f}",
+            f"tx/sec: {self.transactions_per_sec:.2f}",
+            f"invoke latency: p50={_percentile(self.invoke_latencies, 50) * 1000:.3f}ms "
+            f"p99={_percentile(self.invoke_latencies, 99) * 1000:.3f}ms",
+            f"commit latency: p50={_percentile(self.commit_latencies, 50) * 1000:.3f}ms "
+            f"p99={_percentile(self.commit_latencies, 99) * 1000:.3f}ms",
+            f"state root hash mismatches: {len(self.mismatches)}"
+        ]
+
+        for block_height, expected, actual in self.mismatches:
+            lines.append(f"  block_height={block_height} expected={expected.hex()} actual={actual.hex()}")
+
+        return "\n".join(lines)
+
+
+class Replayer(object):
+    """Replays a record file against a copy of the state DB
+
+    The score and state DB directories in the config are copied to a work directory,
+    so they should be the snapshot taken right before the record file was started.
+    Blocks are processed directly with IconServiceEngine.invoke and commit
+    without loopchain, message queue and reward calculator.
+    """
+
+    def __init__(self, conf: 'IconConfig', record_path: str, work_dir: Optional[str] = None):
+        self._conf = conf
+        self._record_path: str = record_path
+        self._work_dir: Optional[str] = work_dir
+
+        self._responses = RecordedResponses()
+        self._engine: Optional['IconServiceEngine'] = None
+        self._prev_factory: Optional[callable] = None
+
+    def run(self) -> 'ReplayReport':
+        report = ReplayReport()
+
+        with tempfile.TemporaryDirectory(dir=self._work_dir) as work_dir:
+            try:
+                self._open(work_dir)
+
+                for record_type, record in ReplayReader(self._record_path):
+                    if record_type == RecordType.INVOKE:
+                        self._invoke(report, *record)
+                    elif record_type == RecordType.WRITE_PRECOMMIT_STATE:
+                        self._write_precommit_state(report, *record)
+                    elif record_type == RecordType.REMOVE_PRECOMMIT_STATE:
+                        self._remove_precommit_state(*record)
+                    elif record_type == RecordType.CALCULATE_DONE:
+                        self._calculate_done(*record)
+            finally:
+                self._close()
+
+        return report
+
+    def _open(self, work_dir: str):
+        # Paths are replaced with the ones in the work directory
+        conf = copy.deepcopy(self._conf)
+        score_root_path: str = os.path.join(work_dir, "score")
+        state_db_root_path: str = os.path.join(work_dir, "statedb")
+
+        for src, dst in ((conf[ConfigKey.SCORE_ROOT_PATH], score_root_path),
+                         (conf[ConfigKey.STATE_DB_ROOT_PATH], state_db_root_path)):
+            if os.path.isdir(src):
+                shutil.copytree(src, dst)
+
+        conf.update_conf({ConfigKey.SCORE_ROOT_PATH: score_root_path,
+                          ConfigKey.STATE_DB_ROOT_PATH: state_db_root_path})
+
+        self._prev_factory = IISSEngine.reward_calc_proxy_factory
+        IISSEngine.reward_calc_proxy_factory = partial(StubRewardCalcProxy, responses=self._responses)
+
+        self._engine = IconServiceEngine()
+        self._engine.open(conf)
+        self._engine.hello()
+
+        Logger.info(tag=_TAG, msg=f"Replayer opened: {self._record_path} {work_dir}")
+
+    def _close(self):
+        try:
+            if self._engine is not None:
+                self._engine.close()
+                self._engine = None
+        finally:
+            if self._prev_factory is not None:
+                IISSEngine.reward_calc_proxy_factory = self._prev_factory
+                self._prev_factory = None
+
+    def _invoke(self, report: 'ReplayReport', request: dict, state_root_hash: bytes, rc_responses: list):
+        params: dict = TypeConverter.convert(request, ParamType.INVOKE)
+        block = Block.from_dict(params["block"])
+        self._responses.reset(rc_responses)
+
+        start: float = time.perf_counter()
+        tx_results, actual_state_root_hash, _, _ = self._engine.invoke(
+            block=block,
+            tx_requests=params["transactions"],
+            prev_block_generator=params.get("prevBlockGenerator"),
+            prev_block_validators=params.get("prevBlockValidators"),
+            prev_block_votes=params.get("prevBlockVotes"),
+            is_block_editable=params.get("isBlockEditable", False))
+        report.invoke_latencies.append(time.perf_counter() - start)
+        self._engine.clear_context_stack()
+
+        report.transactions += len(tx_results)
+        if actual_state_root_hash != state_root_hash:
+            Logger.warning(tag=_TAG, msg=f"State root hash mismatch: block_height={block.height} "
+                                         f"expected={state_root_hash.hex()} actual={actual_state_root_hash.hex()}")
+            report.mismatches.append((block.height, state_root_hash, actual_state_root_hash))
+
+    def _write_precommit_state(self, report: 'ReplayReport', request: dict):
+        block_height, instant_block_hash, block_hash = self._get_block_info_for_precommit_state(request)
+
+        start: float = time.perf_counter()
+        self._engine.commit(block_height, instant_block_hash, block_hash)
+        report.commit_latencies.append(time.perf_counter() - start)
+        self._engine.clear_context_stack()
+
+        report.blocks += 1
+
+    def _remove_precommit_state(self, request: dict):
+        block_height, instant_block_hash, _ = self._get_block_info_for_precommit_state(request)
+        self._engine.rollback(block_height, instant_block_hash)
+        self._engine.clear_context_stack()
+
+    @staticmethod
+    def _calculate_done(payload: list):
+        success, block_height, iscore, state_hash = payload
+        IconScoreContext.engine.iiss.calculate_done_callback(
+            CalculateDoneNotification(0, success, block_height, iscore, state_hash))
+
+    @staticmethod
+    def _get_block_info_for_precommit_state(request: dict) -> Tuple[int, bytes, Optional[bytes]]:
+        params: dict = TypeConverter.convert(request, ParamType.WRITE_PRECOMMIT)
+
+        block_height: int = params[ConstantKeys.BLOCK_HEIGHT]
+        block_hash: Optional[bytes] = None
+        if ConstantKeys.BLOCK_HASH in params:
+            instant_block_hash: bytes = params[ConstantKeys.BLOCK_HASH]
+        else:
+            instant_block_hash: bytes = params[ConstantKeys.OLD_BLOCK_HASH]
+            block_hash = params[ConstantKeys.NEW_BLOCK_HASH]
+
+        return block_height, instant_block_hash, block_hash
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("RecordingRewardCalcProxy", "StubRewardCalcProxy", "RecordedResponses")
+
+import asyncio
+import concurrent.futures
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..icon_constant import RCCalculateResult, RCStatus
+from ..iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from ..iiss.reward_calc.ipc.server import DEFAULT_READ_BUFFER_SIZE
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from .recorder import ReplayRecorder
+    from ..base.address import Address
+    from ..iiss.reward_calc.ipc.message import CalculateDoneNotification, ReadyNotification
+
+CLAIM_ISCORE = "claim_iscore"
+QUERY_CALCULATE_RESULT = "query_calculate_result"
+
+
+class RecordingRewardCalcProxy(RewardCalcProxy):
+    """RewardCalcProxy which records the responses affecting the states
+
+    Create it with functools.partial to pass a recorder,
+    because IISSEngine creates a proxy only with the arguments of RewardCalcProxy.
+    """
+
+    def __init__(self,
+                 icon_rc_path: str,
+                 ipc_timeout: int,
+                 ready_callback: Callable[['ReadyNotification'], Any] = None,
+                 calc_done_callback: Callable[['CalculateDoneNotification'], Any] = None,
+                 ipc_read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+                 recorder: 'ReplayRecorder' = None):
+        super().__init__(icon_rc_path=icon_rc_path,
+                         ipc_timeout=ipc_timeout,
+                         ready_callback=ready_callback,
+                         calc_done_callback=calc_done_callback,
+                         ipc_read_buffer_size=ipc_read_buffer_size)
+        self._recorder = recorder
+
+    def get_claim_iscore_result(self, future: 'Future') -> Tuple[int, int]:
+        # Both synchronous and pipelined CLAIM responses are received here in tx order
+        ret = super().get_claim_iscore_result(future)
+        self._recorder.add_rc_response(CLAIM_ISCORE, ret)
+        return ret
+
+    def query_calculate_result(self, block_height) -> tuple:
+        ret = super().query_calculate_result(block_height)
+        self._recorder.add_rc_response(QUERY_CALCULATE_RESULT, ret)
+        return ret
+
+    def calculate_done_handler(self, response: 'CalculateDoneNotification'):
+        self._recorder.record_calculate_done(response)
+        super().calculate_done_handler(response)
+
+
+class RecordedResponses(object):
+    """The reward calculator responses recorded with the block being replayed
+    """
+
+    def __init__(self):
+        self._responses: Dict[str, Deque[tuple]] = {}
+
+    def reset(self, rc_responses: List[list]):
+        self._responses.clear()
+        for method, result in rc_responses:
+            self._responses.setdefault(method, deque()).append(tuple(result))
+
+    def pop(self, method: str) -> Optional[tuple]:
+        responses: Optional[Deque[tuple]] = self._responses.get(method)
+        if not responses:
+            return None
+
+        return responses.popleft()
+
+
+class StubRewardCalcProxy(object):
+    """Replaces RewardCalcProxy while replaying blocks
+
+    It does not launch the reward calculator
+    and returns the recorded responses in order instead of sending requests.
+    The notification of CALCULATE_DONE is replayed by the Replayer at the recorded position.
+    """
+
+    def __init__(self,
+                 icon_rc_path: str,
+                 ipc_timeout: int,
+                 ready_callback: Callable[['ReadyNotification'], Any] = None,
+                 calc_done_callback: Callable[['CalculateDoneNotification'], Any] = None,
+                 ipc_read_buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
+                 responses: 'RecordedResponses' = None):
+        self._responses: 'RecordedResponses' = responses if responses is not None else RecordedResponses()
+        self._ready_future: Optional[asyncio.Future] = None
+
+    def open(self, log_dir: str, sock_path: str, iiss_db_path: str):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+    def get_ready_future(self):
+        if self._ready_future is None:
+            self._ready_future = asyncio.get_event_loop().create_future()
+            self._ready_future.set_result(RCStatus.READY)
+
+        return self._ready_future
+
+    def is_reward_calculator_ready(self) -> bool:
+        return True
+
+    def get_ipc_metrics(self) -> dict:
+        return {}
+
+    def is_commit_claim_batch_supported(self) -> bool:
+        # Claims are replayed one by one with the recorded responses
+        return False
+
+    def init_reward_calculator(self, block_height: int) -> Tuple[bool, int]:
+        return True, block_height
+
+    def claim_iscore(self, address: 'Address',
+                     block_height: int, block_hash: bytes,
+                     tx_index: int, tx_hash: bytes) -> Tuple[int, int]:
+        ret: Optional[tuple] = self._responses.pop(CLAIM_ISCORE)
+        return ret if ret is not None else (0, block_height)
+
+    def commit_claim(self, success: bool, address: 'Address',
+                     block_height: int, block_hash: bytes,
+                     tx_index: int, tx_hash: bytes):
+        pass
+
+    def query_iscore(self, address: 'Address') -> tuple:
+        return 0, 0
+
+    def query_calculate_result(self, block_height) -> tuple:
+        ret: Optional[tuple] = self._responses.pop(QUERY_CALCULATE_RESULT)
+        return ret if ret is not None else (RCCalculateResult.SUCCESS, block_height, 0, None)
+
+    def commit_block(self, success: bool, block_height: int, block_hash: bytes) -> tuple:
+        return success, block_height, block_hash
+
+    def commit_block_async(self, success: bool, block_height: int, block_hash: bytes) -> 'Future':
+        future = concurrent.futures.Future()
+        future.set_result(self.commit_block(success, block_height, block_hash))
+        return future
+
+    def get_commit_block_result(self, future: 'Future') -> tuple:
+        return future.result()
+
+    def calculate(self, db_path: str, block_height: int):
+        pass
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ("write_checksum_file", "read_checksum_file")
+
+import os
+import struct
+import zlib
+from typing import Tuple
+
+from ..base.exception import IllegalFormatException
+from ..icon_constant import DATA_BYTE_ORDER
+
+# magic_key(4) | version(4) | header_size(4) | payload_size(4)
+_PREFIX_STRUCT_FORMAT = ">4sIII"
+_PREFIX_SIZE = struct.calcsize(_PREFIX_STRUCT_FORMAT)
+_CRC32_SIZE = 4
+
+
+def write_checksum_file(path: str, magic_key: bytes, version: int, header: bytes, payload: bytes,
+                        sync: bool = False):
+    """Write a file which is verified with its checksum on read_checksum_file()
+
+    file: | magic_key | version | header_size | payload_size | header | payload | crc32(all before) |
+
+    The file is written to a temporary one which replaces the old one at once,
+    so a partially written file is never left at path
+
+    :param path: file path
+    :param magic_key: 4 bytes which identify the type of the file
+    :param version: the version of the format of header and payload
+    :param header: fields which are checked before payload is decoded
+    :param payload:
+    :param sync: flush the file to disk before replacing the old one
+    """
+    prefix: bytes = struct.pack(_PREFIX_STRUCT_FORMAT, magic_key, version, len(header), len(payload))
+    crc32: int = zlib.crc32(payload, zlib.crc32(header, zlib.crc32(prefix)))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(prefix)
+        f.write(header)
+        f.write(payload)
+        f.write(crc32.to_bytes(_CRC32_SIZE, DATA_BYTE_ORDER))
+
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_checksum_file(path: str, magic_key: bytes, version: int) -> Tuple[bytes, bytes]:
+    """Read a file written by write_checksum_file()
+
+    :param path: file path
+    :param magic_key: expected magic key
+    :param version: expected version
+    :return: (header, payload)
+    :exception IllegalFormatException: the file is broken or written in another format
+    """
+    with open(path, "rb") as f:
+        data: bytes = f.read()
+
+    if len(data) < _PREFIX_SIZE + _CRC32_SIZE:
+        raise IllegalFormatException(f"Too short: {len(data)}")
+
+    file_magic_key, file_version, header_size, payload_size = struct.unpack_from(_PREFIX_STRUCT_FORMAT, data)
+    if file_magic_key != magic_key or file_version != version:
+        raise IllegalFormatException(f"Invalid header: magic_key={file_magic_key} version={file_version}")
+    if len(data) != _PREFIX_SIZE + header_size + payload_size + _CRC32_SIZE:
+        raise IllegalFormatException(f"Invalid size: {len(data)}")
+    if zlib.crc32(data[:-_CRC32_SIZE]) != int.from_bytes(data[-_CRC32_SIZE:], DATA_BYTE_ORDER):
+        raise IllegalFormatException("Checksum mismatch")
+
+    payload_offset: int = _PREFIX_SIZE + header_size
+    return data[_PREFIX_SIZE:payload_offset], data[payload_offset:-_CRC32_SIZE]
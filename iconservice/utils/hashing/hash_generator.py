@@ -14,12 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import hashlib
-from typing import Union, Iterable
+from typing import TYPE_CHECKING, Union, Iterable, Optional
 
 from .hash_origin_generator import HashOriginGeneratorV1
-from .merkle_tree import MerkleTree
+from .merkle_tree import IncrementalMerkleTree
+
+if TYPE_CHECKING:
+    from .hash_origin_generator import ValueConverter
 
 
 class HashGenerator:
@@ -27,28 +29,29 @@ class HashGenerator:
     _ORIGIN_GENERATOR = HashOriginGeneratorV1()
 
     @classmethod
-    def generate_origin(cls, origin_data: dict) -> str:
-        copied_origin_data = copy.deepcopy(origin_data)
-        return cls._ORIGIN_GENERATOR.generate(copied_origin_data)
+    def generate_origin(cls, origin_data: dict, converter: Optional['ValueConverter'] = None) -> str:
+        # origin_data is not modified while being serialized
+        return cls._ORIGIN_GENERATOR.generate(origin_data, converter)
 
     @classmethod
-    def generate_salted_origin(cls, origin_data: dict) -> str:
+    def generate_salted_origin(cls, origin_data: dict, converter: Optional['ValueConverter'] = None) -> str:
         def _gen():
             if HashGenerator._SALT is not None:
                 yield HashGenerator._SALT
-            yield cls.generate_origin(origin_data)
+            yield cls.generate_origin(origin_data, converter)
         return '.'.join(_gen())
 
     @classmethod
-    def generate_hash(cls, origin_data: dict) -> bytes:
-        origin = cls.generate_salted_origin(origin_data)
+    def generate_hash(cls, origin_data: dict, converter: Optional['ValueConverter'] = None) -> bytes:
+        """
+        :param origin_data:
+        :param converter: converts scalar values of origin_data before being serialized
+        """
+        origin = cls.generate_salted_origin(origin_data, converter)
         return hashlib.sha3_256(origin.encode()).digest()
 
 
 class RootHashGenerator:
     @classmethod
     def generate_root_hash(cls, values: Union[Iterable, bytes, bytearray], do_hash=False) -> bytes:
-        merkle_tree = MerkleTree()
-        merkle_tree.add_leaf(values, do_hash)
-        merkle_tree.make_tree()
-        return merkle_tree.get_merkle_root()
+        return IncrementalMerkleTree(values, do_hash).get_merkle_root()
@@ -15,13 +15,19 @@
 # limitations under the License.
 
 import abc
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+# Convert a scalar value with its key in dict (None in list) before being serialized
+ValueConverter = Callable[[Optional[str], Any], Any]
+
+_END = object()
 
 
 class HashOriginGenerator(abc.ABC):
     version = None
 
     @abc.abstractmethod
-    def generate(self, origin_data: dict) -> str:
+    def generate(self, origin_data: dict, converter: Optional['ValueConverter'] = None) -> str:
         pass
 
 
@@ -37,38 +43,61 @@ class HashOriginGeneratorV1(HashOriginGenerator):
         ".": "\\."
     })
 
-    def generate(self, json_data: dict):
+    def generate(self, json_data: dict, converter: Optional['ValueConverter'] = None) -> str:
+        """Serialize json_data into the origin string of its hash
 
-        def encode(data):
-            if isinstance(data, dict):
-                return encode_dict(data)
-            elif isinstance(data, list):
-                return encode_list(data)
-            else:
-                return escape(data)
+        dict: {key.value.key.value} in order of keys, list: [item.item], None: \\0
+        Nested containers are serialized with a stack into one buffer,
+        and json_data is not modified, so it does not have to be copied
 
-        def encode_dict(data: dict):
-            result = ".".join(_encode_dict(data))
-            return "{" + result + "}"
+        :param json_data:
+        :param converter: converts scalar values before being serialized
+        """
+        translator = self._translator
+        buffer: List[str] = []
+        write = buffer.append
 
-        def _encode_dict(data: dict):
-            for key in sorted(data.keys()):
-                yield key
-                yield encode(data[key])
+        # (iterator of items, whether it iterates (key, value) of dict, closing bracket)
+        stack: List[Tuple[Iterator, bool, str]] = [(iter(sorted(json_data.items())), True, "")]
+        is_first = True
 
-        def encode_list(data: list):
-            result = ".".join(_encode_list(data))
-            return f"[" + result + "]"
+        while stack:
+            it, is_dict, closing = stack[-1]
+            item = next(it, _END)
 
-        def _encode_list(data: list):
-            for item in data:
-                yield encode(item)
+            if item is _END:
+                stack.pop()
+                write(closing)
+                is_first = False
+                continue
 
-        def escape(data):
-            if data is None:
-                return "\\0"
+            if is_first:
+                is_first = False
+            else:
+                write(".")
+
+            if is_dict:
+                key, item = item
+                write(key)
+                write(".")
+            else:
+                key = None
+
+            if isinstance(item, dict):
+                write("{")
+                stack.append((iter(sorted(item.items())), True, "}"))
+                is_first = True
+            elif isinstance(item, list):
+                write("[")
+                stack.append((iter(item), False, "]"))
+                is_first = True
+            else:
+                if converter is not None:
+                    item = converter(key, item)
 
-            data = str(data)
-            return data.translate(self._translator)
+                if item is None:
+                    write("\\0")
+                else:
+                    write(str(item).translate(translator))
 
-        return ".".join(_encode_dict(json_data))
+        return "".join(buffer)
@@ -14,7 +14,7 @@
 # link: https://github.com/Tierion/pymerkletools/
 
 import hashlib
-from typing import Union, Iterable, ByteString
+from typing import Union, Iterable, ByteString, List, Optional
 
 
 class MerkleTree:
@@ -100,7 +100,7 @@ class MerkleTree:
                 sibling_pos = "left" if is_right_node else "right"
                 sibling_value = self.levels[x][sibling_index]
                 proof.append({sibling_pos: sibling_value})
-                index = int(index / 2.)
+                index //= 2
             return proof
 
     @classmethod
@@ -121,3 +121,181 @@ class MerkleTree:
                     sibling = bytes(p['right'])
                     proof_hash = cls.hash_function(proof_hash + sibling).digest()
             return proof_hash == merkle_root
+
+
+class IncrementalMerkleTree:
+    """Merkle tree which keeps every level to update the root hash in O(log n)
+
+    It makes the same root hash and proofs as MerkleTree:
+    an odd end node of a level is promoted to the upper level as it is.
+    levels[0] is the leaves and each level is preallocated with the half size of the lower one.
+    """
+    hash_function = hashlib.sha3_256
+
+    def __init__(self, values: Union[Iterable[ByteString], ByteString] = (), do_hash=False):
+        self._size: int = 0
+        self._levels: List[List[Optional[bytes]]] = [[None]]
+        self.extend(values, do_hash)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def height(self) -> int:
+        """The number of levels above the leaves
+        """
+        return (self._size - 1).bit_length() if self._size > 0 else 0
+
+    def _reserve(self, size: int):
+        capacity: int = len(self._levels[0])
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        levels: List[List[Optional[bytes]]] = []
+        k: int = 0
+        while True:
+            level: List[Optional[bytes]] = [None] * (capacity >> k)
+            if k < len(self._levels):
+                old_level = self._levels[k]
+                level[:len(old_level)] = old_level
+            levels.append(level)
+
+            if capacity >> k == 1:
+                break
+            k += 1
+
+        self._levels = levels
+
+    def _to_leaf(self, value: ByteString, do_hash: bool) -> bytes:
+        if do_hash:
+            return self.hash_function(value).digest()
+        return bytes(value)
+
+    def append(self, value: ByteString, do_hash=False):
+        self._reserve(self._size + 1)
+        self._levels[0][self._size] = self._to_leaf(value, do_hash)
+        self._size += 1
+        self._update_path(self._size - 1)
+
+    def extend(self, values: Union[Iterable[ByteString], ByteString], do_hash=False):
+        """Add leaves in bulk and build the nodes depending on them level by level
+        """
+        # check if single leaf
+        if not isinstance(values, Iterable):
+            values = [values]
+
+        leaves: List[bytes] = [self._to_leaf(value, do_hash) for value in values]
+        if len(leaves) == 0:
+            return
+
+        start: int = self._size
+        self._reserve(start + len(leaves))
+        self._levels[0][start:start + len(leaves)] = leaves
+        self._size += len(leaves)
+        self._build(start)
+
+    def update(self, index: int, value: ByteString, do_hash=False):
+        """Replace a leaf and update only the nodes on its path to the root
+        """
+        self._check_index(index)
+        self._levels[0][index] = self._to_leaf(value, do_hash)
+        self._update_path(index)
+
+    def delete(self, index: int):
+        """Remove a leaf. The following leaves are shifted and the nodes depending on them are rebuilt
+        """
+        self._check_index(index)
+        leaves: List[Optional[bytes]] = self._levels[0]
+        leaves[index:self._size - 1] = leaves[index + 1:self._size]
+        self._size -= 1
+        leaves[self._size] = None
+        self._build(index)
+
+    def get_leaf(self, index: int) -> bytes:
+        self._check_index(index)
+        return self._levels[0][index]
+
+    def get_merkle_root(self) -> Optional[bytes]:
+        if self._size == 0:
+            return None
+        return self._levels[self.height][0]
+
+    def get_proof(self, index: int) -> Optional[list]:
+        """Returns the proof of a leaf which can be validated with MerkleTree.validate_proof()
+        """
+        if not 0 <= index < self._size:
+            return None
+
+        proof = []
+        size: int = self._size
+        for level in self._levels[:self.height]:
+            if index == size - 1 and size % 2 == 1:
+                # skip if this is an odd end node
+                pass
+            elif index % 2 == 1:
+                proof.append({"left": level[index - 1]})
+            else:
+                proof.append({"right": level[index + 1]})
+
+            index //= 2
+            size = (size + 1) // 2
+
+        return proof
+
+    def copy(self) -> 'IncrementalMerkleTree':
+        tree = IncrementalMerkleTree()
+        tree._size = self._size
+        tree._levels = [list(level) for level in self._levels]
+        return tree
+
+    def _check_index(self, index: int):
+        if not 0 <= index < self._size:
+            raise IndexError(f"Leaf index out of range: {index}")
+
+    def _update_path(self, index: int):
+        hash_function = self.hash_function
+        levels: List[List[Optional[bytes]]] = self._levels
+        size: int = self._size
+
+        k: int = 0
+        while size > 1:
+            level: List[Optional[bytes]] = levels[k]
+            left: int = index - index % 2
+            if left + 1 < size:
+                node: bytes = hash_function(level[left] + level[left + 1]).digest()
+            else:
+                node: bytes = level[left]
+
+            index //= 2
+            levels[k + 1][index] = node
+            size = (size + 1) // 2
+            k += 1
+
+    def _build(self, start: int):
+        """Rebuild the nodes which depend on the leaves from start to the end
+        """
+        hash_function = self.hash_function
+        levels: List[List[Optional[bytes]]] = self._levels
+        size: int = self._size
+
+        k: int = 0
+        while size > 1:
+            level: List[Optional[bytes]] = levels[k]
+            upper: List[Optional[bytes]] = levels[k + 1]
+            start -= start % 2
+            end: int = size - size % 2
+
+            upper[start // 2:end // 2] = [
+                hash_function(left + right).digest()
+                for left, right in zip(level[start:end:2], level[start + 1:end:2])
+            ]
+            if size % 2 == 1:
+                upper[end // 2] = level[end]
+
+            start //= 2
+            size = (size + 1) // 2
+            k += 1
+
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for logging on hot paths
+
+Logger methods take an already formatted message,
+so a large message is built even if its level is disabled.
+Check the level with is_log_enabled() before formatting it
+and log a bounded summary instead of a whole block data.
+"""
+
+from logging import DEBUG, INFO, WARNING, ERROR, Handler
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from threading import Lock
+from typing import Any, List, Optional
+
+# Logger writes to this logger, which is not registered to logging.getLogger()
+from iconcommons.logger.logger import icon_logger
+
+__all__ = (
+    "DEBUG", "INFO", "WARNING", "ERROR",
+    "is_log_enabled", "summarize_bytes", "summarize_text", "summarize_invoke_results",
+    "AsyncLogWriter"
+)
+
+DEFAULT_SUMMARY_LIMIT = 256
+
+
+def is_log_enabled(level: int) -> bool:
+    """Returns True if a message with the given level will be written
+
+    :param level: logging.DEBUG, logging.INFO, ...
+    """
+    return icon_logger.isEnabledFor(level)
+
+
+def summarize_bytes(data: Optional[bytes], limit: int = DEFAULT_SUMMARY_LIMIT) -> str:
+    """Returns the hex string of at most the first `limit` bytes of data
+
+    :param data: bytes to summarize
+    :param limit: the max number of bytes to convert to hex string
+    """
+    if data is None:
+        return "None"
+
+    size: int = len(data)
+    if size <= limit:
+        return data.hex()
+
+    return f"{data[:limit].hex()}...({size} bytes)"
+
+
+def summarize_text(value: Any, limit: int = DEFAULT_SUMMARY_LIMIT) -> str:
+    """Returns at most the first `limit` characters of str(value)
+    """
+    text: str = str(value)
+    size: int = len(text)
+    if size <= limit:
+        return text
+
+    return f"{text[:limit]}...({size} chars)"
+
+
+def summarize_invoke_results(results: dict) -> str:
+    """Returns a summary of the invoke results which has a bounded size regardless of the number of txs
+
+    :param results: the invoke results which will be sent to loopchain
+    """
+    tx_results = results.get("txResults", ())
+    added_transactions: Optional[dict] = results.get("addedTransactions")
+    tx_count: int = len(tx_results)
+
+    if isinstance(tx_results, dict):
+        tx_results = tx_results.values()
+    # status is converted to a hex string in the response
+    failure_count: int = sum(1 for tx_result in tx_results if tx_result.get("status") in (0, "0x0"))
+
+    return f"txResults={tx_count} " \
+           f"failures={failure_count} " \
+           f"stateRootHash={results.get('stateRootHash')} " \
+           f"addedTransactions={0 if added_transactions is None else len(added_transactions)} " \
+           f"prep={'prep' in results}"
+
+
+class AsyncLogWriter(object):
+    """Writes log records with a background thread
+
+    The handlers of the icon logger are moved to a QueueListener,
+    so that a caller thread only puts a record to the queue
+    instead of waiting for file or console io.
+    """
+
+    _lock = Lock()
+    _listener: Optional['QueueListener'] = None
+    _handlers: List['Handler'] = []
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._listener is not None
+
+    @classmethod
+    def start(cls):
+        with cls._lock:
+            if cls._listener is not None:
+                return
+
+            cls._handlers = list(icon_logger.handlers)
+            queue = Queue(-1)
+
+            icon_logger.handlers.clear()
+            icon_logger.addHandler(QueueHandler(queue))
+
+            cls._listener = QueueListener(queue, *cls._handlers, respect_handler_level=True)
+            cls._listener.start()
+
+    @classmethod
+    def stop(cls):
+        """Writes all queued records and restores the handlers of the icon logger
+        """
+        with cls._lock:
+            if cls._listener is None:
+                return
+
+            cls._listener.stop()
+            cls._listener = None
+
+            icon_logger.handlers.clear()
+            for handler in cls._handlers:
+                icon_logger.addHandler(handler)
+            cls._handlers = []
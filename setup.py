@@ -41,7 +41,8 @@ setup_options = {
     'extras_require': extra_requires,
     'entry_points': {
         'console_scripts': [
-            'iconservice=iconservice.icon_service_cli:main'
+            'iconservice=iconservice.icon_service_cli:main',
+            'icon_rc_stand_in=iconservice.iiss.reward_calc.stand_in:main'
         ],
     },
     'classifiers': [
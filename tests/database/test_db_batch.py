@@ -19,7 +19,7 @@ import unittest
 
 from iconservice.base.block import Block
 from iconservice.base.exception import AccessDeniedException
-from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
+from iconservice.database.batch import BlockBatch, RewardCalcBatch, TransactionBatch, TransactionBatchValue
 from iconservice.utils import sha3_256
 from tests import create_hash_256
 
@@ -173,3 +173,38 @@ class TestBatch(unittest.TestCase):
         expected = sha3_256(b'|'.join(data))
         ret = block_batch.digest()
         self.assertEqual(expected, ret)
+
+
+class TestRewardCalcBatch(unittest.TestCase):
+    def test_append_and_items(self):
+        batch = RewardCalcBatch()
+        batch.append(b'HD', b'header')
+        batch.append(b'TX', b'tx0', indexed=True)
+        batch.append(b'GV' + bytes(8), b'')
+        batch.append(b'TX', b'tx1', indexed=True)
+
+        self.assertEqual(4, len(batch))
+        self.assertEqual(2, batch.indexed_count)
+        self.assertEqual([
+            (b'HD', b'header'),
+            (b'TX' + (5).to_bytes(8, 'big'), b'tx0'),
+            (b'GV' + bytes(8), b''),
+            (b'TX' + (6).to_bytes(8, 'big'), b'tx1')
+        ], list(batch.items(4)))
+
+        # Indices start from 0 by default
+        self.assertEqual(b'TX' + bytes(8), list(batch.items())[1][0])
+
+    def test_extend_and_clear(self):
+        block_batch = RewardCalcBatch()
+        block_batch.append(b'BP', b'block')
+
+        tx_batch = RewardCalcBatch()
+        tx_batch.append(b'TX', b'tx', indexed=True)
+        block_batch.extend(tx_batch)
+        tx_batch.clear()
+
+        self.assertEqual(0, len(tx_batch))
+        self.assertEqual([], list(tx_batch.items()))
+        self.assertEqual([(b'BP', b'block'), (b'TX' + bytes(8), b'tx')], list(block_batch.items()))
+        self.assertEqual(1, block_batch.indexed_count)
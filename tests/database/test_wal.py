@@ -15,14 +15,20 @@
 
 import os
 import random
+import struct
 import unittest
+from itertools import zip_longest
+from typing import List, Tuple
+from unittest.mock import patch
+
+import msgpack
 
 import pytest
 
 from iconservice.base.block import Block
 from iconservice.base.exception import IllegalFormatException
 from iconservice.database.wal import (
-    _MAGIC_KEY, _FILE_VERSION, _OFFSET_VERSION, _HEADER_SIZE,
+    _MAGIC_KEY, _FILE_VERSION, _OFFSET_VERSION, _HEADER_SIZE, _LEGACY_FILE_VERSION,
     WriteAheadLogReader, WriteAheadLogWriter, WALogable, WALState
 )
 from iconservice.icon_constant import Revision
@@ -113,6 +119,41 @@ class TestWriteAheadLog(unittest.TestCase):
 
         reader.close()
 
+    def test_encoded_walogable(self):
+        writer = WriteAheadLogWriter(Revision.IISS.value, 2, self.block, create_block_hash())
+        writer.open(self.path)
+
+        walogables = [WALogableData(data) for data in self.log_data]
+        for walogable in walogables:
+            writer.write_walogable(walogable)
+        writer.close()
+
+        # The entries are encoded once and kept to be reused
+        for walogable, data in zip(walogables, self.log_data):
+            expected: bytes = b"".join(msgpack.packb([key, value]) for key, value in data.items())
+            assert walogable.encoded == expected
+
+    def test_interleaved_iterators(self):
+        writer = WriteAheadLogWriter(Revision.IISS.value, 2, self.block, create_block_hash())
+        writer.open(self.path)
+        for data in self.log_data:
+            writer.write_walogable(WALogableData(data))
+        writer.close()
+
+        reader = WriteAheadLogReader()
+        reader.open(self.path)
+
+        # Logs are unpacked from the mapped buffer in small chunks without sharing a file position
+        with patch("iconservice.database.wal._FEED_CHUNK_SIZE", 5):
+            data = [{}, {}]
+            for items in zip_longest(reader.get_iterator(0), reader.get_iterator(1)):
+                for i, item in enumerate(items):
+                    if item is not None:
+                        data[i][item[0]] = item[1]
+
+        assert data == self.log_data
+        reader.close()
+
     def test_invalid_magic_key(self):
         revision = Revision.IISS.value
         log_count = 2
@@ -168,3 +209,152 @@ class TestWriteAheadLog(unittest.TestCase):
         reader = WriteAheadLogReader()
         with pytest.raises(IllegalFormatException):
             reader.open(self.path)
+
+
+class TestWriteAheadLogCrash(unittest.TestCase):
+    """Simulate a crash at every byte of WAL written on commit
+    """
+
+    def setUp(self) -> None:
+        self.path = "./test_crash.wal"
+        self.revision = Revision.IISS.value
+        self.instant_block_hash = create_block_hash()
+        self.block = Block(
+            block_height=random.randint(0, 1000),
+            block_hash=os.urandom(32),
+            prev_hash=os.urandom(32),
+            timestamp=random.randint(0, 1_000_000),
+            cumulative_fee=random.randint(0, 1_000_000)
+        )
+        self.log_data = [
+            {os.urandom(20): os.urandom(random.randint(0, 100)) for _ in range(10)},
+            {os.urandom(20): None if i % 3 == 0 else os.urandom(50) for i in range(10)}
+        ]
+
+        # (file size, state, log_count) after each step of commit
+        self.steps: List[Tuple[int, int, int]] = self._write_wal()
+        with open(self.path, "rb") as f:
+            self.data: bytes = f.read()
+
+    def tearDown(self) -> None:
+        try:
+            os.remove(self.path)
+        except:
+            pass
+
+    def _write_wal(self) -> List[Tuple[int, int, int]]:
+        writer = WriteAheadLogWriter(self.revision, 2, self.block, self.instant_block_hash)
+        writer.open(self.path)
+        writer.flush()
+
+        steps = [(os.path.getsize(self.path), 0, 0)]
+        state = 0
+
+        def step(log_count: int):
+            writer.flush()
+            steps.append((os.path.getsize(self.path), state, log_count))
+
+        state = WALState.CALC_PERIOD_START_BLOCK.value
+        writer.write_state(state, add=False)
+        step(0)
+
+        for i, data in enumerate(self.log_data):
+            writer.write_walogable(WALogableData(data))
+            step(i + 1)
+
+        for wal_state in (WALState.WRITE_RC_DB, WALState.WRITE_STATE_DB, WALState.SEND_COMMIT_BLOCK):
+            state |= wal_state.value
+            writer.write_state(wal_state.value, add=True)
+            step(2)
+
+        writer.close()
+        return steps
+
+    def _write_file(self, data: bytes):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def _read_wal(self) -> WriteAheadLogReader:
+        reader = WriteAheadLogReader()
+        reader.open(self.path)
+        return reader
+
+    def _check_reader(self, reader: WriteAheadLogReader, state: int, log_count: int):
+        assert reader.block == self.block
+        assert reader.instant_block_hash == self.instant_block_hash
+        assert reader.state == state
+        assert reader.log_count == log_count
+
+        for i in range(log_count):
+            assert dict(reader.get_iterator(i)) == self.log_data[i]
+
+    def test_truncate(self):
+        size_of_block, _, _ = self.steps[0]
+
+        for size in range(len(self.data) + 1):
+            self._write_file(self.data[:size])
+
+            if size < size_of_block:
+                # The block is not written yet, so there is nothing to recover
+                with pytest.raises(IllegalFormatException):
+                    self._read_wal()
+                continue
+
+            _, state, log_count = [step for step in self.steps if step[0] <= size][-1]
+            reader = self._read_wal()
+            self._check_reader(reader, state, log_count)
+            reader.close()
+
+    def test_corrupted_log(self):
+        # Flip a bit in the last log, which makes the states written after it invalid, too
+        size, state, log_count = self.steps[2]
+        data = bytearray(self.data)
+        data[size + 10] ^= 0x01
+        self._write_file(data)
+
+        reader = self._read_wal()
+        self._check_reader(reader, state, log_count)
+        reader.close()
+
+    def test_corrupted_state(self):
+        size, state, log_count = self.steps[-2]
+        data = bytearray(self.data)
+        data[-5] ^= 0x80
+        self._write_file(data)
+
+        reader = self._read_wal()
+        self._check_reader(reader, state, log_count)
+        reader.close()
+
+    def test_corrupted_header(self):
+        data = bytearray(self.data)
+        data[_HEADER_SIZE - 5] ^= 0x01
+        self._write_file(data)
+
+        with pytest.raises(IllegalFormatException):
+            self._read_wal()
+
+    def test_legacy_version(self):
+        block_data: bytes = self.block.to_bytes(self.revision)
+        logs: List[bytes] = [
+            b"".join(msgpack.packb([key, value]) for key, value in data.items()) for data in self.log_data
+        ]
+        state = (WALState.WRITE_RC_DB | WALState.WRITE_STATE_DB).value
+
+        offset: int = 52 + 4 * len(logs) + 4 + len(block_data)
+        offsets: List[int] = []
+        for log in logs:
+            offsets.append(offset)
+            offset += 4 + len(log)
+
+        data: bytes = struct.pack(
+            f">4sIII32sI{len(logs)}I", _MAGIC_KEY, _LEGACY_FILE_VERSION, self.revision, state,
+            self.instant_block_hash, len(logs), *offsets)
+        data += struct.pack(">I", len(block_data)) + block_data
+        data += b"".join(struct.pack(">I", len(log)) + log for log in logs)
+        self._write_file(data)
+
+        reader = self._read_wal()
+        assert reader.version == _LEGACY_FILE_VERSION
+        self._check_reader(reader, state, len(logs))
+        reader.close()
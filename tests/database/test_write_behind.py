@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from unittest.mock import patch
+
+import msgpack
+
+from iconservice.database.db import KeyValueDatabase
+from iconservice.database.wal import WALogable
+from iconservice.database.write_behind import WriteBehindDatabase
+from tests import rmtree
+
+
+class EncodedWALogable(WALogable):
+    def __init__(self, data: dict, encoded: bytes):
+        self._data = data
+        self.encoded = encoded
+
+    def __iter__(self):
+        for key, value in self._data.items():
+            yield key, value
+
+
+class TestWriteBehindDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.db_path = "write_behind_db"
+        self.log_dir = "write_behind_log"
+        rmtree(self.db_path)
+        rmtree(self.log_dir)
+
+        self.db = self._open(max_block_count=3)
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.db_path)
+        rmtree(self.log_dir)
+
+    def _open(self, max_block_count: int, max_size: int = 0) -> 'WriteBehindDatabase':
+        return WriteBehindDatabase.from_path(
+            self.db_path, log_dir=self.log_dir, max_block_count=max_block_count, max_size=max_size)
+
+    def _get_from_level_db(self, key: bytes) -> bytes:
+        return self.db._db.get(key)
+
+    def _crash(self):
+        # Close LevelDB leaving the log files
+        self.db._executor.shutdown()
+        self.db._close_log()
+        KeyValueDatabase.close(self.db)
+
+    def test_write_batch(self):
+        db = self.db
+        db.put(b"key0", b"value0")
+        db.write_batch([(b"key0", b"value1"), (b"key1", b"value1")])
+        db.write_batch([(b"key1", None), (b"key2", b"")])
+
+        # The batches are only in the overlay
+        self.assertEqual(b"value1", db.get(b"key0"))
+        self.assertIsNone(db.get(b"key1"))
+        self.assertIsNone(db.get(b"key2"))
+        self.assertIsNone(self._get_from_level_db(b"key0"))
+        self.assertEqual(2, db.pending_block_count)
+
+        # All batches are applied to LevelDB at the third block
+        db.write_batch([(b"key3", b"value3")])
+        db.flush()
+
+        self.assertEqual(0, db.pending_block_count)
+        self.assertEqual({}, db._overlay)
+        self.assertEqual(b"value1", self._get_from_level_db(b"key0"))
+        self.assertIsNone(self._get_from_level_db(b"key1"))
+        self.assertEqual(b"value3", db.get(b"key3"))
+        self.assertEqual([], os.listdir(self.log_dir))
+
+    def test_write_batch_with_max_size(self):
+        self.db.close()
+        self.db = self._open(max_block_count=100, max_size=64)
+
+        self.db.write_batch([(b"key0", b"0" * 32)])
+        self.assertEqual(1, self.db.pending_block_count)
+        self.db.write_batch([(b"key1", b"1" * 32)])
+        self.assertEqual(0, self.db.pending_block_count)
+
+    def test_keep_value_written_while_applying(self):
+        db = self.db
+        for i in range(3):
+            db.write_batch([(b"key", i.to_bytes(1, "big"))])
+        db.write_batch([(b"key", b"new")])
+        db.flush()
+
+        self.assertEqual(b"new", db.get(b"key"))
+        db.write_batch([(b"key", b"newer")])
+        self.assertEqual(b"newer", db.get(b"key"))
+
+    def test_iterator(self):
+        self.db.write_batch([(b"key0", b"value0"), (b"key1", b"value1")])
+
+        with self.db.iterator() as it:
+            self.assertEqual([(b"key0", b"value0"), (b"key1", b"value1")], list(it))
+
+    def test_recover(self):
+        db = self.db
+        for i in range(4):
+            db.write_batch([(b"key", i.to_bytes(1, "big")), (f"key{i}".encode(), b"value")])
+        db.write_batch([(b"key0", None)])
+        db.flush()
+
+        db.write_batch([(b"key", b"unapplied")])
+        db.write_batch([(b"key4", b"value")])
+        self._crash()
+
+        # Log files are applied to LevelDB on open again
+        self.db = self._open(max_block_count=3)
+        self.assertEqual([], os.listdir(self.log_dir))
+        self.assertEqual(b"unapplied", self._get_from_level_db(b"key"))
+        self.assertIsNone(self._get_from_level_db(b"key0"))
+        for i in range(1, 5):
+            self.assertEqual(b"value", self._get_from_level_db(f"key{i}".encode()))
+
+    def test_write_encoded_walogable(self):
+        data = {b"key0": b"value0", b"key1": b""}
+        encoded: bytes = b"".join(msgpack.packb([key, value]) for key, value in data.items())
+        self.db.write_batch(EncodedWALogable(data, encoded))
+
+        # The encoded entries are written to the log as they are
+        path: str = os.path.join(self.log_dir, os.listdir(self.log_dir)[0])
+        with open(path, "rb") as f:
+            self.assertEqual(encoded, f.read()[4:-4])
+        self.assertEqual(b"value0", self.db.get(b"key0"))
+        self.assertIsNone(self.db.get(b"key1"))
+
+        self._crash()
+        self.db = self._open(max_block_count=3)
+        self.assertEqual(b"value0", self._get_from_level_db(b"key0"))
+        self.assertIsNone(self._get_from_level_db(b"key1"))
+
+    def test_recover_with_torn_log(self):
+        self.db.write_batch([(b"key0", b"value0")])
+        self.db.write_batch([(b"key1", b"value1")])
+        self._crash()
+
+        path: str = os.path.join(self.log_dir, os.listdir(self.log_dir)[0])
+        with open(path, "rb+") as f:
+            f.truncate(os.path.getsize(path) - 1)
+
+        self.db = self._open(max_block_count=3)
+        self.assertEqual(b"value0", self._get_from_level_db(b"key0"))
+        self.assertIsNone(self._get_from_level_db(b"key1"))
+
+    def test_fail_to_apply(self):
+        db = self.db
+        with patch.object(WriteBehindDatabase, "_write_to_db", side_effect=IOError("disk full")):
+            for i in range(3):
+                db.write_batch([(b"key", i.to_bytes(1, "big"))])
+            with self.assertRaises(IOError):
+                db.flush()
+
+        # The values which are not applied are still read from the overlay
+        self.assertEqual(b"\x02", db.get(b"key"))
+        self.assertIsNone(self._get_from_level_db(b"key"))
+
+        # Batches are not applied any more after the failure
+        db.write_batch([(b"key", b"new")])
+        db.write_batch([(b"key", b"newer")])
+        with self.assertRaises(IOError):
+            db.write_batch([(b"key", b"newest")])
+        self.assertEqual(b"newest", db.get(b"key"))
+        self.assertEqual(2, len(os.listdir(self.log_dir)))
+
+        # Log files are left to apply them on open
+        self._crash()
+        self.db = self._open(max_block_count=3)
+        self.assertEqual(b"newest", self._get_from_level_db(b"key"))
@@ -13,7 +13,116 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import hashlib
+import os
+import random
+import string
+from typing import List
+
+from iconservice.base.address import Address
+from iconservice.base.type_converter import TypeConverter
+from iconservice.icon_constant import HASH_TYPE_TABLE
 from iconservice.utils.hashing.hash_generator import HashGenerator
+from iconservice.utils.hashing.hash_origin_generator import HashOriginGeneratorV1
+from tests import create_address
+
+
+class RecursiveHashOriginGenerator:
+    """The recursive implementation of HashOriginGeneratorV1 to check the compatibility
+    """
+    _translator = HashOriginGeneratorV1._translator
+
+    def generate(self, json_data: dict):
+
+        def encode(data):
+            if isinstance(data, dict):
+                return encode_dict(data)
+            elif isinstance(data, list):
+                return encode_list(data)
+            else:
+                return escape(data)
+
+        def encode_dict(data: dict):
+            result = ".".join(_encode_dict(data))
+            return "{" + result + "}"
+
+        def _encode_dict(data: dict):
+            for key in sorted(data.keys()):
+                yield key
+                yield encode(data[key])
+
+        def encode_list(data: list):
+            result = ".".join(_encode_list(data))
+            return f"[" + result + "]"
+
+        def _encode_list(data: list):
+            for item in data:
+                yield encode(item)
+
+        def escape(data):
+            if data is None:
+                return "\\0"
+
+            data = str(data)
+            return data.translate(self._translator)
+
+        return ".".join(_encode_dict(json_data))
+
+
+def _random_str() -> str:
+    letters: str = string.ascii_letters + "\\{}[]." + "\u00e9\uac00"
+    return "".join(random.choice(letters) for _ in range(random.randint(0, 10)))
+
+
+def _random_value(depth: int, python_types: bool):
+    choice: int = random.randint(0, 9 if depth < 4 else 5)
+    if choice == 0:
+        return None
+    if choice == 1:
+        return random.randint(-2 ** 80, 2 ** 80) if python_types else hex(random.randint(0, 2 ** 80))
+    if choice == 2 and python_types:
+        return random.choice([os.urandom(random.randint(0, 32)), create_address(), random.random() < 0.5])
+    if choice <= 5:
+        return _random_str()
+    if choice <= 7:
+        return [_random_value(depth + 1, python_types) for _ in range(random.randint(0, 4))]
+    return _random_dict(depth + 1, python_types)
+
+
+def _random_dict(depth: int, python_types: bool) -> dict:
+    keys = [_random_str() for _ in range(random.randint(0, 5))]
+    if python_types:
+        keys.append(random.choice(HASH_TYPE_TABLE))
+    return {key: _random_value(depth, python_types) for key in keys}
+
+
+def _create_transactions(count: int) -> List[dict]:
+    return [
+        {
+            "version": "0x3",
+            "from": str(create_address()),
+            "to": str(Address.from_data(create_address().prefix, os.urandom(20))),
+            "stepLimit": hex(random.randint(0, 10 ** 8)),
+            "timestamp": hex(random.randint(0, 10 ** 16)),
+            "nid": "0x1",
+            "nonce": hex(i),
+            "dataType": "call",
+            "data": {
+                "method": "transfer",
+                "params": {
+                    "_to": str(create_address()),
+                    "_value": hex(random.randint(0, 10 ** 24)),
+                    "_data": [_random_str() for _ in range(5)]
+                }
+            }
+        }
+        for i in range(count)
+    ]
+
+
+def _generate_hash(origin: str) -> bytes:
+    return hashlib.sha3_256(f"icx_sendTransaction.{origin}".encode()).digest()
 
 
 class TestHashGenerator:
@@ -63,3 +172,37 @@ class TestHashGenerator:
         actual_tx_hash = HashGenerator.generate_hash(main_net_tx_data)
 
         assert actual_tx_hash == main_net_tx_hash
+
+    def test_generate_origin_compatibility(self):
+        random.seed(0)
+        generator = RecursiveHashOriginGenerator()
+
+        for _ in range(1000):
+            data: dict = _random_dict(0, python_types=False)
+            copied_data: dict = copy.deepcopy(data)
+
+            assert HashGenerator.generate_origin(data) == generator.generate(data)
+            assert data == copied_data
+
+    def test_generate_hash_with_converter(self):
+        random.seed(1)
+        generator = RecursiveHashOriginGenerator()
+
+        for _ in range(1000):
+            data: dict = _random_dict(0, python_types=True)
+            copied_data: dict = copy.deepcopy(data)
+
+            expected: bytes = _generate_hash(generator.generate(TypeConverter.convert_type_reverse(copy.deepcopy(data))))
+            assert HashGenerator.generate_hash(data, TypeConverter.convert_value_reverse) == expected
+            # Values are converted without modifying data
+            assert data == copied_data
+
+    def test_generate_hash_of_transactions(self):
+        random.seed(2)
+        transactions = _create_transactions(200)
+
+        generator = RecursiveHashOriginGenerator()
+        expected = [_generate_hash(generator.generate(copy.deepcopy(tx))) for tx in transactions]
+        actual = [HashGenerator.generate_hash(tx) for tx in transactions]
+
+        assert actual == expected
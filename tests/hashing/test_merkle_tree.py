@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+
+import pytest
+
+from iconservice.utils.hashing.merkle_tree import MerkleTree, IncrementalMerkleTree
+
+LEAF_COUNTS = (1, 2, 3, 4, 5, 22, 33, 100)
+
+
+def _make_merkle_tree(leaves: list) -> 'MerkleTree':
+    tree = MerkleTree()
+    tree.add_leaf(leaves)
+    tree.make_tree()
+    return tree
+
+
+def _create_leaves(count: int) -> list:
+    return [os.urandom(32) for _ in range(count)]
+
+
+class TestIncrementalMerkleTree:
+    def test_empty(self):
+        tree = IncrementalMerkleTree()
+        assert len(tree) == 0
+        assert tree.get_merkle_root() is None
+        assert tree.get_proof(0) is None
+
+    @pytest.mark.parametrize("count", LEAF_COUNTS)
+    def test_extend(self, count: int):
+        leaves = _create_leaves(count)
+        tree = IncrementalMerkleTree(leaves[:count // 2])
+        tree.extend(leaves[count // 2:])
+
+        assert len(tree) == count
+        assert tree.get_merkle_root() == _make_merkle_tree(leaves).get_merkle_root()
+
+        values = [os.urandom(20) for _ in range(count)]
+        expected = MerkleTree()
+        expected.add_leaf(values, do_hash=True)
+        expected.make_tree()
+        assert IncrementalMerkleTree(values, do_hash=True).get_merkle_root() == expected.get_merkle_root()
+
+    def test_append(self):
+        leaves = []
+        tree = IncrementalMerkleTree()
+
+        for leaf in _create_leaves(max(LEAF_COUNTS)):
+            leaves.append(leaf)
+            tree.append(leaf)
+            assert tree.get_merkle_root() == _make_merkle_tree(leaves).get_merkle_root()
+
+    @pytest.mark.parametrize("count", LEAF_COUNTS)
+    def test_update(self, count: int):
+        leaves = _create_leaves(count)
+        tree = IncrementalMerkleTree(leaves)
+
+        for index in {0, count // 2, count - 1, random.randrange(count)}:
+            copied_tree = tree.copy()
+            leaves[index] = os.urandom(32)
+            tree.update(index, leaves[index])
+
+            assert tree.get_leaf(index) == leaves[index]
+            assert tree.get_merkle_root() == _make_merkle_tree(leaves).get_merkle_root()
+            assert copied_tree.get_merkle_root() != tree.get_merkle_root()
+
+        with pytest.raises(IndexError):
+            tree.update(count, os.urandom(32))
+
+    @pytest.mark.parametrize("count", LEAF_COUNTS)
+    def test_delete(self, count: int):
+        leaves = _create_leaves(count)
+        tree = IncrementalMerkleTree(leaves)
+
+        while len(leaves) > 1:
+            index: int = random.randrange(len(leaves))
+            del leaves[index]
+            tree.delete(index)
+
+            assert len(tree) == len(leaves)
+            assert tree.get_merkle_root() == _make_merkle_tree(leaves).get_merkle_root()
+
+        tree.delete(0)
+        assert tree.get_merkle_root() is None
+
+    @pytest.mark.parametrize("count", LEAF_COUNTS)
+    def test_get_proof(self, count: int):
+        leaves = _create_leaves(count)
+        tree = IncrementalMerkleTree(leaves)
+        expected = _make_merkle_tree(leaves)
+        root_hash: bytes = tree.get_merkle_root()
+
+        for index in range(count):
+            proof = tree.get_proof(index)
+            assert proof == expected.get_proof(index)
+            assert MerkleTree.validate_proof(proof, leaves[index], root_hash)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+import msgpack
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.iiss.reward_calc.ipc.message import (
+    IPC_VERSION_QUERY_BATCH, MessageType, NoneRequest, QueryBatchRequest, QueryRequest
+)
+from iconservice.iiss.reward_calc.ipc.message_queue import MessageQueue
+from iconservice.iiss.reward_calc.ipc.server import IPCServer
+from iconservice.utils import int_to_bytes
+
+
+class TestIPCServer(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.prev_loop = asyncio.get_event_loop()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.notifications = []
+        self.queue = MessageQueue(self.loop, notify_message=(), notify_handler=self.notifications.append)
+        self.server = IPCServer(read_buffer_size=64 * 1024)
+        self.server.open(self.loop, self.queue, os.path.join(self.dir, "iiss.sock"))
+        self.server.start()
+
+        self.reader, self.writer = self.loop.run_until_complete(self._connect())
+
+    async def _connect(self):
+        # Wait for the unix socket to be created
+        await asyncio.sleep(0.1)
+        reader, writer = await asyncio.open_unix_connection(os.path.join(self.dir, "iiss.sock"))
+        writer.write(msgpack.packb((MessageType.READY, 0, (IPC_VERSION_QUERY_BATCH, 0, bytes(32)))))
+        return reader, writer
+
+    def tearDown(self):
+        self.writer.close()
+        self.server.stop()
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+        self.server.close()
+        self.loop.close()
+
+        asyncio.set_event_loop(self.prev_loop)
+        shutil.rmtree(self.dir)
+
+    async def _read_messages(self, count: int) -> list:
+        unpacker = msgpack.Unpacker(raw=True)
+        messages = []
+        while len(messages) < count:
+            unpacker.feed(await self.reader.read(65536))
+            messages.extend(unpacker)
+
+        return messages
+
+    def test_coalesce_queued_requests(self):
+        addresses = [Address.from_prefix_and_int(AddressPrefix.EOA, i) for i in range(10)]
+        futures = [self.queue.put(QueryRequest(address)) for address in addresses]
+
+        messages: list = self.loop.run_until_complete(self._read_messages(len(addresses)))
+        for msg_type, msg_id, payload in messages:
+            self.writer.write(msgpack.packb((msg_type, msg_id, (payload, int_to_bytes(1000), 100))))
+
+        responses = self.loop.run_until_complete(asyncio.gather(*futures))
+        self.assertEqual(addresses, [response.address for response in responses])
+
+        # The requests queued before the send loop runs are written at once
+        metrics: dict = self.server.metrics.get_summary()
+        self.assertEqual(1, metrics["writes"])
+        self.assertEqual(len(addresses), metrics["messagesSent"])
+        self.assertEqual(len(addresses) + 1, metrics["messagesReceived"])
+
+    def test_receive_large_response(self):
+        addresses = [Address.from_prefix_and_int(AddressPrefix.EOA, i) for i in range(5000)]
+        future = self.queue.put(QueryBatchRequest(addresses))
+
+        msg_type, msg_id, payload = self.loop.run_until_complete(self._read_messages(1))[0]
+        data: bytes = msgpack.packb((msg_type, msg_id, [(address, int_to_bytes(10 ** 20), 100) for address in payload]))
+        self.writer.write(data)
+        self.assertGreater(len(data), 64 * 1024)
+
+        response = self.loop.run_until_complete(future)
+        self.assertEqual(len(addresses), len(response.results))
+
+        metrics: dict = self.server.metrics.get_summary()
+        self.assertGreater(metrics["bytesReceived"], len(data))
+        self.assertLess(metrics["reads"], len(data) // 1024)
+
+    def test_stop_after_sending_queued_requests(self):
+        self.queue.put(QueryRequest(Address.from_prefix_and_int(AddressPrefix.EOA, 1)), wait_for_response=False)
+        self.queue.put(NoneRequest(), wait_for_response=False)
+
+        messages: list = self.loop.run_until_complete(self._read_messages(1))
+        self.assertEqual(MessageType.QUERY, messages[0][0])
+        self.assertEqual(1, self.server.metrics.messages_sent)
@@ -185,3 +185,55 @@ class TestMessageUnpacker(unittest.TestCase):
         for expected_response, response in zip(expected, self.unpacker):
             self.assertEqual(expected_response.MSG_TYPE, response.MSG_TYPE)
             self.assertEqual(msg_id, response.msg_id)
+
+    def test_commit_claim_batch(self):
+        msg_id: int = 1234
+        block_height: int = 100
+        block_hash: bytes = hashlib.sha3_256(b'block_hash').digest()
+        address = Address.from_data(AddressPrefix.EOA, b'')
+        claims = [
+            (True, address, block_height, block_hash, 0, hashlib.sha3_256(b"tx_hash0").digest()),
+            (False, address, block_height, block_hash, 3, hashlib.sha3_256(b"tx_hash3").digest())
+        ]
+
+        request = CommitClaimBatchRequest(claims)
+        items: list = msgpack.unpackb(request.to_bytes(), raw=True)
+        self.assertEqual(MessageType.COMMIT_CLAIM_BATCH, items[0])
+        self.assertEqual(request.msg_id, items[1])
+        self.assertEqual(2, len(items[2]))
+        for claim, item in zip(claims, items[2]):
+            success, _, block_height, block_hash, tx_index, tx_hash = claim
+            self.assertEqual([success, address.to_bytes_including_prefix(), block_height,
+                              block_hash, tx_index, tx_hash], item)
+
+        self.unpacker.feed(msgpack.packb((MessageType.COMMIT_CLAIM_BATCH, msg_id)))
+        response = next(iter(self.unpacker))
+        self.assertIsInstance(response, CommitClaimBatchResponse)
+        self.assertEqual(msg_id, response.msg_id)
+
+    def test_query_batch(self):
+        msg_id: int = 1234
+        block_height: int = 100
+        addresses = [Address.from_data(AddressPrefix.EOA, bytes([i])) for i in range(3)]
+
+        request = QueryBatchRequest(addresses)
+        items: list = msgpack.unpackb(request.to_bytes(), raw=True)
+        self.assertEqual(MessageType.QUERY_BATCH, items[0])
+        self.assertEqual(request.msg_id, items[1])
+        self.assertEqual([address.to_bytes_including_prefix() for address in addresses], items[2])
+
+        payload = [
+            (
+                address.to_bytes_including_prefix(),
+                int_to_bytes(10 ** 20 * i),
+                block_height
+            )
+            for i, address in enumerate(addresses)
+        ]
+        self.unpacker.feed(msgpack.packb((MessageType.QUERY_BATCH, msg_id, payload)))
+        response = next(iter(self.unpacker))
+        self.assertIsInstance(response, QueryBatchResponse)
+        self.assertEqual(msg_id, response.msg_id)
+        self.assertEqual(
+            [(address, 10 ** 20 * i, block_height) for i, address in enumerate(addresses)],
+            response.results)
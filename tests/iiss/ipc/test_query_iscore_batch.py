@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from threading import Thread
+from unittest.mock import patch
+
+import msgpack
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.iiss.reward_calc.ipc.message import IPC_VERSION_QUERY_BATCH, MessageType
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from iconservice.utils import int_to_bytes
+
+
+class StubRewardCalculator(object):
+    """Answers QUERY and QUERY_BATCH requests through the IPC socket like the reward calculator
+    """
+
+    def __init__(self, path: str, block_height: int = 100):
+        self._path = path
+        self._block_height = block_height
+        # (msg_type, payload) in the order of being received
+        self.messages = []
+
+    def _iscore(self, address: bytes) -> bytes:
+        return int_to_bytes(address[-1] * 1000)
+
+    def _handle(self, msg_type: int, msg_id: int, payload) -> tuple:
+        if msg_type == MessageType.QUERY:
+            return msg_type, msg_id, (payload, self._iscore(payload), self._block_height)
+        elif msg_type == MessageType.QUERY_BATCH:
+            return msg_type, msg_id, [
+                (address, self._iscore(address), self._block_height) for address in payload
+            ]
+
+        raise AssertionError(f"Unexpected message: {msg_type}")
+
+    async def run(self):
+        reader, writer = await asyncio.open_unix_connection(self._path)
+        writer.write(msgpack.packb((MessageType.READY, 0, (IPC_VERSION_QUERY_BATCH, 0, bytes(32)))))
+
+        unpacker = msgpack.Unpacker(raw=True)
+        while True:
+            data: bytes = await reader.read(65536)
+            if not data:
+                break
+
+            unpacker.feed(data)
+            for msg_type, msg_id, payload in unpacker:
+                self.messages.append((msg_type, payload))
+                writer.write(msgpack.packb(self._handle(msg_type, msg_id, payload)))
+
+        writer.close()
+
+
+class TestQueryIScoreBatch(unittest.TestCase):
+    """Queries I-Scores through the IPC socket with QUERY and QUERY_BATCH
+    """
+    ADDRESS_COUNT = 250
+    BATCH_SIZE = 100
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.prev_loop = asyncio.get_event_loop()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        sock_path: str = os.path.join(self.dir, "iiss.sock")
+        self.proxy = RewardCalcProxy(icon_rc_path="", ipc_timeout=10)
+        with patch.object(RewardCalcProxy, "start_reward_calc"):
+            self.proxy.open(log_dir=self.dir, sock_path=sock_path, iiss_db_path=self.dir)
+
+        self.thread = Thread(target=self.loop.run_forever)
+        self.thread.start()
+
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result(5)
+        self.stub = StubRewardCalculator(sock_path)
+        self.stub_future = asyncio.run_coroutine_threadsafe(self.stub.run(), self.loop)
+
+        for _ in range(500):
+            if self.proxy.is_reward_calculator_ready():
+                break
+            time.sleep(0.01)
+
+        self.addresses = [Address.from_prefix_and_int(AddressPrefix.EOA, i) for i in range(self.ADDRESS_COUNT)]
+
+    async def _start(self):
+        self.proxy.start()
+        # Wait for the unix socket to be created
+        await asyncio.sleep(0.1)
+
+    async def _stop(self):
+        self.proxy.stop()
+        self.stub_future.cancel()
+        # Wait for the tasks of IPCServer and the stub to be finished
+        await asyncio.sleep(0.1)
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self._stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.proxy.close()
+        self.loop.close()
+
+        asyncio.set_event_loop(self.prev_loop)
+        shutil.rmtree(self.dir)
+
+    def test_query_iscore_batch(self):
+        self.assertTrue(self.proxy.is_query_batch_supported())
+
+        results = [self.proxy.query_iscore(address) for address in self.addresses]
+        self.assertEqual([MessageType.QUERY] * self.ADDRESS_COUNT, [msg_type for msg_type, _ in self.stub.messages])
+
+        self.stub.messages.clear()
+        batch_results = []
+        for i in range(0, len(self.addresses), self.BATCH_SIZE):
+            batch_results.extend(self.proxy.query_iscore_batch(self.addresses[i:i + self.BATCH_SIZE]))
+
+        self.assertEqual(results, batch_results)
+        self.assertEqual((5 * 1000, 100), batch_results[5])
+
+        # One message per batch with the addresses in the requested order
+        self.assertEqual([MessageType.QUERY_BATCH] * 3, [msg_type for msg_type, _ in self.stub.messages])
+        self.assertEqual([address.to_bytes_including_prefix() for address in self.addresses],
+                         [address for _, payload in self.stub.messages for address in payload])
+        self.assertEqual([100, 100, 50], [len(payload) for _, payload in self.stub.messages])
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from concurrent.futures import Future
+from unittest.mock import Mock
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.icon_constant import INVALID_CLAIM_TX
+from iconservice.iiss.claim_pipeline import ClaimPipeline, is_claim_tx_request
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from tests import create_address, create_block_hash, create_tx_hash
+
+
+def _create_claim_tx(address, tx_hash: bytes = None) -> dict:
+    return {
+        "method": "icx_sendTransaction",
+        "params": {
+            "from": address,
+            "to": ZERO_SCORE_ADDRESS,
+            "txHash": tx_hash if tx_hash else create_tx_hash(),
+            "dataType": "call",
+            "data": {"method": "claimIScore"}
+        }
+    }
+
+
+def _create_transfer_tx(address) -> dict:
+    return {
+        "method": "icx_sendTransaction",
+        "params": {"from": address, "to": create_address(), "txHash": create_tx_hash(), "value": 1}
+    }
+
+
+class TestClaimPipeline(unittest.TestCase):
+    def setUp(self):
+        self.block = Block(100, create_block_hash(), 0, create_block_hash(), 0)
+        self.iscores = {}
+
+        self.proxy = Mock(spec=RewardCalcProxy)
+        self.proxy.claim_iscore_async.side_effect = self._claim_iscore_async
+        self.proxy.get_claim_iscore_result.side_effect = lambda future: future.result()
+
+        self.pipeline = ClaimPipeline(self.proxy, self.block)
+
+    def _claim_iscore_async(self, address, block_height, block_hash, tx_index, tx_hash) -> 'Future':
+        future = Future()
+        future.set_result((self.iscores.get(address, 0), block_height - 1))
+        return future
+
+    def test_is_claim_tx_request(self):
+        address = create_address()
+        self.assertTrue(is_claim_tx_request(_create_claim_tx(address)["params"]))
+        self.assertFalse(is_claim_tx_request(_create_transfer_tx(address)["params"]))
+
+        params = _create_claim_tx(address)["params"]
+        params["data"]["method"] = "queryIScore"
+        self.assertFalse(is_claim_tx_request(params))
+
+    def test_prefetch_and_claim(self):
+        addresses = [create_address() for _ in range(3)]
+        for i, address in enumerate(addresses):
+            self.iscores[address] = (i + 1) * 1000
+
+        tx_requests = [
+            _create_transfer_tx(addresses[0]),
+            _create_claim_tx(addresses[0]),
+            _create_claim_tx(addresses[1]),
+            _create_claim_tx(addresses[0]),
+            _create_claim_tx(addresses[2]),
+            _create_claim_tx(addresses[2], INVALID_CLAIM_TX[0])
+        ]
+        self.pipeline.prefetch(tx_requests)
+
+        # All CLAIM requests are sent before execution except for the second claim of the same address
+        self.assertEqual(3, len(self.pipeline))
+        self.assertEqual(
+            [1, 2, 4],
+            [call[0][3] for call in self.proxy.claim_iscore_async.call_args_list])
+
+        def claim(index: int):
+            params: dict = tx_requests[index]["params"]
+            return self.pipeline.claim(params["from"], index, params["txHash"])
+
+        self.assertEqual((1000, 99), claim(1))
+        self.pipeline.commit(True, addresses[0], 1, tx_requests[1]["params"]["txHash"])
+        self.assertEqual((2000, 99), claim(2))
+        self.pipeline.commit(True, addresses[1], 2, tx_requests[2]["params"]["txHash"])
+        self.proxy.commit_claim_batch.assert_not_called()
+
+        # Pending COMMIT_CLAIMs are flushed before claiming a tx which is not prefetched
+        self.assertIsNone(claim(3))
+        self.proxy.commit_claim_batch.assert_called_once()
+        commits: list = self.proxy.commit_claim_batch.call_args[0][0]
+        self.assertEqual([1, 2], [commit[4] for commit in commits])
+        self.assertTrue(all(commit[0] for commit in commits))
+        self.assertTrue(all(commit[2:4] == (self.block.height, self.block.hash) for commit in commits))
+
+    def test_close(self):
+        addresses = [create_address() for _ in range(3)]
+        self.iscores[addresses[0]] = 1000
+        self.iscores[addresses[1]] = 2000
+
+        tx_requests = [_create_claim_tx(address) for address in addresses]
+        self.pipeline.prefetch(tx_requests)
+
+        params: dict = tx_requests[0]["params"]
+        self.assertEqual((1000, 99), self.pipeline.claim(addresses[0], 0, params["txHash"]))
+        self.pipeline.commit(True, addresses[0], 0, params["txHash"])
+
+        # tx 1 and tx 2 have failed before claiming
+        self.pipeline.close()
+
+        self.proxy.commit_claim_batch.assert_called_once()
+        commits: list = self.proxy.commit_claim_batch.call_args[0][0]
+        # The claim without I-Score does not need to be rolled back
+        self.assertEqual(
+            [(True, addresses[0], 0), (False, addresses[1], 1)],
+            [(commit[0], commit[1], commit[4]) for commit in commits])
+        self.assertEqual(0, len(self.pipeline))
+
+    def test_close_without_claims(self):
+        self.pipeline.prefetch([_create_transfer_tx(create_address())])
+        self.pipeline.close()
+
+        self.proxy.claim_iscore_async.assert_not_called()
+        self.proxy.commit_claim_batch.assert_not_called()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import patch
+
+from iconservice.iiss.iscore_cache import IScoreCache
+from tests import create_address
+
+
+class TestIScoreCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.patcher = patch("iconservice.iiss.iscore_cache.time.monotonic", side_effect=lambda: self.now)
+        self.patcher.start()
+
+        self.cache = IScoreCache(ttl=2, max_size=3)
+        self.addresses = [create_address() for _ in range(4)]
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_disabled(self):
+        cache = IScoreCache()
+        self.assertFalse(cache.enabled)
+        self.assertFalse(cache.put(self.addresses[0], 100, 10, cache.generation))
+        self.assertIsNone(cache.get(self.addresses[0]))
+
+    def test_ttl(self):
+        address = self.addresses[0]
+        self.assertTrue(self.cache.put(address, 100, 10, self.cache.generation))
+        self.assertEqual((100, 10), self.cache.get(address))
+
+        self.now += 1.9
+        self.assertEqual((100, 10), self.cache.get(address))
+
+        self.now += 0.1
+        self.assertIsNone(self.cache.get(address))
+        self.assertEqual(0, len(self.cache))
+
+    def test_max_size(self):
+        for i, address in enumerate(self.addresses):
+            self.cache.put(address, i, 10, self.cache.generation)
+
+        self.assertEqual(3, len(self.cache))
+        self.assertIsNone(self.cache.get(self.addresses[0]))
+        self.assertEqual((3, 10), self.cache.get(self.addresses[3]))
+
+    def test_invalidate(self):
+        for i, address in enumerate(self.addresses[:3]):
+            self.cache.put(address, i, 10, self.cache.generation)
+
+        generation: int = self.cache.generation
+        self.cache.invalidate(self.addresses[:2])
+        self.assertIsNone(self.cache.get(self.addresses[0]))
+        self.assertIsNone(self.cache.get(self.addresses[1]))
+        self.assertEqual((2, 10), self.cache.get(self.addresses[2]))
+
+        # The I-Score queried before invalidation is not cached
+        self.assertFalse(self.cache.put(self.addresses[0], 100, 10, generation))
+        self.assertIsNone(self.cache.get(self.addresses[0]))
+
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+        self.assertTrue(self.cache.put(self.addresses[0], 100, 20, self.cache.generation))
+        self.assertEqual((100, 20), self.cache.get(self.addresses[0]))
@@ -20,6 +20,7 @@ from unittest.mock import patch
 
 import pytest
 
+from iconservice.database.batch import RewardCalcBatch
 from iconservice.database.wal import IissWAL
 from iconservice.icon_constant import Revision, RC_DB_VERSION_0, RC_DB_VERSION_2
 from iconservice.iconscore.icon_score_context import IconScoreContext
@@ -35,6 +36,13 @@ from tests.mock_db import MockPlyvelDB
 from tests.mock_generator import KEY_VALUE_DB_PATH
 
 
+def _make_rc_batch(iiss_data: list) -> 'RewardCalcBatch':
+    batch = RewardCalcBatch()
+    for data in iiss_data:
+        RewardCalcStorage.put(batch, data)
+    return batch
+
+
 class TestRcDataStorage(unittest.TestCase):
     @patch('iconservice.iiss.reward_calc.storage.Storage._supplement_db')
     @patch(f'{KEY_VALUE_DB_PATH}.from_path')
@@ -89,7 +97,7 @@ class TestRcDataStorage(unittest.TestCase):
             self.dummy_header.revision = revision
             self.dummy_gv.version = current_version
             iiss_data = [self.dummy_header, self.dummy_gv]
-            iiss_wal: 'IissWAL' = IissWAL(iiss_data, -1, revision)
+            iiss_wal: 'IissWAL' = IissWAL(_make_rc_batch(iiss_data), -1, revision)
             rc_data_storage.commit(iiss_wal)
 
             header: bytes = rc_data_storage._db.get(self.dummy_header.make_key())
@@ -112,7 +120,7 @@ class TestRcDataStorage(unittest.TestCase):
         self.dummy_header.revision = revision
         self.dummy_gv.version = current_version
         iiss_data = [self.dummy_header, self.dummy_gv]
-        iiss_wal: 'IissWAL' = IissWAL(iiss_data, -1, revision)
+        iiss_wal: 'IissWAL' = IissWAL(_make_rc_batch(iiss_data), -1, revision)
         rc_data_storage.commit(iiss_wal)
 
         header: bytes = rc_data_storage._db.get(self.dummy_header.make_key())
@@ -219,7 +227,7 @@ class TestRcDataStorage(unittest.TestCase):
     def test_commit_without_iiss_tx(self):
         # success case: when there is no iiss_tx data, index should not be increased
         dummy_iiss_data_list_without_iiss_tx = [self.dummy_header, self.dummy_gv, self.dummy_prep]
-        iiss_wal: 'IissWAL' = IissWAL(dummy_iiss_data_list_without_iiss_tx, -1, Revision.IISS.value)
+        iiss_wal: 'IissWAL' = IissWAL(_make_rc_batch(dummy_iiss_data_list_without_iiss_tx), -1, Revision.IISS.value)
         self.rc_data_storage.commit(iiss_wal)
 
         expected_index = -1
@@ -232,7 +240,8 @@ class TestRcDataStorage(unittest.TestCase):
         recorded_index: int = -1
         for expected_index in range(0, 10):
             dummy_iiss_data_list = [self.dummy_header, self.dummy_gv, self.dummy_prep, self.dummy_tx]
-            iiss_wal: 'IissWAL' = IissWAL(dummy_iiss_data_list, self.rc_data_storage._db_iiss_tx_index, Revision.IISS.value)
+            iiss_wal: 'IissWAL' = IissWAL(
+                _make_rc_batch(dummy_iiss_data_list), self.rc_data_storage._db_iiss_tx_index, Revision.IISS.value)
             self.rc_data_storage.commit(iiss_wal)
             self.assertEqual(expected_index, self.rc_data_storage._db_iiss_tx_index)
 
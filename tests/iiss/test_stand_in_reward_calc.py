@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+import msgpack
+
+from iconservice.database.db import KeyValueDatabase
+from iconservice.icon_constant import IISS_ANNUAL_BLOCK, IISS_MAX_REWARD_RATE, ISCORE_EXCHANGE_RATE, RC_DB_VERSION_2
+from iconservice.iiss.reward_calc import RewardCalcDataCreator
+from iconservice.iiss.reward_calc.ipc.message import MessageType
+from iconservice.iiss.reward_calc.stand_in import IScoreModel, StandInRewardCalculator
+from iconservice.utils.msgpack_for_ipc import MsgPackForIpc
+from tests import create_address, create_block_hash
+
+
+def _expected_iscore(delegated: int, reward_rep: int, blocks: int) -> int:
+    return delegated * reward_rep * blocks * ISCORE_EXCHANGE_RATE // (IISS_ANNUAL_BLOCK * IISS_MAX_REWARD_RATE)
+
+
+class TestIScoreModel(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.model = IScoreModel()
+        self.delegator = create_address()
+        self.delegated = 10 ** 24
+        self.reward_rep = 6_000
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _create_rc_db(self, block_height: int, gvs: list, delegations: list) -> str:
+        path: str = os.path.join(self.dir, f"iiss_rc_db_{block_height}")
+        db = KeyValueDatabase.from_path(path)
+
+        header = RewardCalcDataCreator.create_header(RC_DB_VERSION_2, block_height, 0)
+        db.put(header.make_key(), header.make_value())
+
+        for gv_block_height, reward_rep in gvs:
+            gv = RewardCalcDataCreator.create_gv_variable(RC_DB_VERSION_2, gv_block_height, 0, reward_rep, 22, 100)
+            db.put(gv.make_key(), gv.make_value())
+
+        for index, (address, tx_block_height, amount) in enumerate(delegations):
+            info = RewardCalcDataCreator.create_delegation_info(create_address(), amount)
+            tx = RewardCalcDataCreator.create_tx(
+                address, tx_block_height, RewardCalcDataCreator.create_tx_delegation([info]))
+            db.put(tx.make_key(index), tx.make_value())
+
+        db.close()
+        return path
+
+    def test_calculate(self):
+        path: str = self._create_rc_db(
+            20, [(0, self.reward_rep)], [(self.delegator, 10, self.delegated)])
+
+        iscore, state_hash = self.model.calculate(path, 20)
+
+        expected: int = _expected_iscore(self.delegated, self.reward_rep, 10)
+        self.assertEqual(expected, iscore)
+        self.assertEqual(expected, self.model.query(self.delegator))
+        self.assertEqual(20, self.model.block_height)
+
+        # The delegation is kept and reward_rep is changed at block 25 in the next period
+        path: str = self._create_rc_db(30, [(25, self.reward_rep * 2)], [])
+        iscore, next_state_hash = self.model.calculate(path, 30)
+
+        expected_in_period: int = \
+            _expected_iscore(self.delegated, self.reward_rep, 5) + \
+            _expected_iscore(self.delegated, self.reward_rep * 2, 5)
+        self.assertEqual(expected_in_period, iscore)
+        self.assertEqual(expected + expected_in_period, self.model.query(self.delegator))
+        self.assertNotEqual(state_hash, next_state_hash)
+
+    def test_calculate_is_deterministic(self):
+        delegations = [(create_address(), i + 1, self.delegated * (i + 1)) for i in range(10)]
+
+        results = []
+        for _ in range(2):
+            model = IScoreModel()
+            path: str = self._create_rc_db(20, [(0, self.reward_rep)], delegations)
+            results.append(model.calculate(path, 20))
+            shutil.rmtree(path)
+
+        self.assertEqual(results[0], results[1])
+
+    def test_claim(self):
+        path: str = self._create_rc_db(
+            20, [(0, self.reward_rep)], [(self.delegator, 10, self.delegated)])
+        self.model.calculate(path, 20)
+        iscore: int = self.model.query(self.delegator)
+
+        block_hash: bytes = create_block_hash()
+        claimed: int = self.model.claim(self.delegator, 21, block_hash)
+        self.assertEqual(iscore // ISCORE_EXCHANGE_RATE * ISCORE_EXCHANGE_RATE, claimed)
+        # An address can claim once in a block
+        self.assertEqual(0, self.model.claim(self.delegator, 21, block_hash))
+
+        # Claimed I-Score is deducted on COMMIT_BLOCK
+        self.assertEqual(iscore, self.model.query(self.delegator))
+        self.model.commit_block(True, 21, block_hash)
+        self.assertEqual(iscore - claimed, self.model.query(self.delegator))
+        self.assertEqual((21, block_hash), (self.model.commit_block_height, self.model.commit_block_hash))
+
+    def test_claim_rollback(self):
+        path: str = self._create_rc_db(
+            20, [(0, self.reward_rep)], [(self.delegator, 10, self.delegated)])
+        self.model.calculate(path, 20)
+        iscore: int = self.model.query(self.delegator)
+
+        # Failed claimIScore tx
+        block_hash: bytes = create_block_hash()
+        self.assertGreater(self.model.claim(self.delegator, 21, block_hash), 0)
+        self.model.commit_claim(False, self.delegator, block_hash)
+        self.model.commit_block(True, 21, block_hash)
+        self.assertEqual(iscore, self.model.query(self.delegator))
+
+        # The block which is not committed
+        block_hash: bytes = create_block_hash()
+        self.assertGreater(self.model.claim(self.delegator, 22, block_hash), 0)
+        self.model.commit_block(True, 22, create_block_hash())
+        self.assertEqual(iscore, self.model.query(self.delegator))
+
+
+class TestStandInRewardCalculator(unittest.TestCase):
+    LATENCY = 0.05
+
+    def setUp(self):
+        self.prev_loop = asyncio.get_event_loop()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.reward_calc = StandInRewardCalculator("", latency=self.LATENCY)
+        self.writer = Mock(spec=asyncio.StreamWriter)
+        self.writer.transport.is_closing.return_value = False
+        self.reward_calc._writer = self.writer
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(self.prev_loop)
+
+    def test_pipelined_requests(self):
+        addresses = [MsgPackForIpc.encode(create_address()) for _ in range(10)]
+        for msg_id, address in enumerate(addresses):
+            self.reward_calc._handle(MessageType.QUERY, msg_id, address)
+
+        # Responses are delayed, but no request waits for the previous ones
+        self.writer.write.assert_not_called()
+        self.loop.run_until_complete(asyncio.sleep(self.LATENCY * 2))
+
+        responses = [msgpack.loads(args[0], raw=True) for args, _ in self.writer.write.call_args_list]
+        self.assertEqual(list(range(10)), [msg_id for _, msg_id, _ in responses])
+        self.assertEqual(addresses, [payload[0] for _, _, payload in responses])
+
+    def test_response_after_closed(self):
+        self.reward_calc._handle(MessageType.QUERY, 0, MsgPackForIpc.encode(create_address()))
+        self.writer.transport.is_closing.return_value = True
+        self.loop.run_until_complete(asyncio.sleep(self.LATENCY * 2))
+
+        self.writer.write.assert_not_called()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""P-Rep snapshot saved on close and loaded on open testcase
+"""
+
+import os
+from unittest.mock import patch
+
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, PREP_MAIN_PREPS
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.prep import PRepEngine
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+
+class TestPRepSnapshot(TestIISSBase):
+    def _make_init_config(self) -> dict:
+        config: dict = super()._make_init_config()
+        config[ConfigKey.PREP_REGISTRATION_FEE] = 0
+        return config
+
+    def setUp(self):
+        super().setUp()
+        self.init_decentralized()
+
+        # Make the P-Reps differ from the initial ones
+        self.distribute_icx(accounts=self._accounts[:1], init_balance=10000 * ICX_IN_LOOP)
+        self.unregister_prep(from_=self._accounts[0])
+        self.set_stake(from_=self._accounts[0], value=5000 * ICX_IN_LOOP)
+        self.set_delegation(from_=self._accounts[0],
+                            origin_delegations=[(self._accounts[PREP_MAIN_PREPS], 5000 * ICX_IN_LOOP)])
+
+    def _get_snapshot_path(self) -> str:
+        return os.path.join(self._state_db_root_path, IconServiceEngine.PREP_SNAPSHOT_FILE)
+
+    def _close_and_reopen_iconservice(self):
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(self._config)
+
+    def _get_preps(self) -> tuple:
+        return self.get_prep_list(), self.get_main_prep_list(), self.get_prep(self._accounts[0])
+
+    def test_load_preps_from_snapshot(self):
+        expected: tuple = self._get_preps()
+
+        with patch.object(PRepEngine, "_load_preps_from_db") as load_preps_from_db:
+            self._close_and_reopen_iconservice()
+            load_preps_from_db.assert_not_called()
+
+        self.assertFalse(os.path.exists(self._get_snapshot_path()))
+        self.assertEqual(expected, self._get_preps())
+
+        # P-Reps go on being updated after loading the snapshot
+        self.set_delegation(from_=self._accounts[0],
+                            origin_delegations=[(self._accounts[PREP_MAIN_PREPS + 1], 5000 * ICX_IN_LOOP)])
+        expected: tuple = self._get_preps()
+        self._close_and_reopen_iconservice()
+        self.assertEqual(expected, self._get_preps())
+
+    def test_load_preps_from_db_with_broken_snapshot(self):
+        expected: tuple = self._get_preps()
+        self.icon_service_engine.close()
+
+        path: str = self._get_snapshot_path()
+        with open(path, "rb+") as f:
+            f.truncate(os.path.getsize(path) - 1)
+
+        with patch.object(PRepEngine, "_load_preps_from_db", wraps=PRepEngine._load_preps_from_db) as load_preps_from_db:
+            self.icon_service_engine = IconServiceEngine()
+            self.icon_service_engine.open(self._config)
+            load_preps_from_db.assert_called_once()
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(expected, self._get_preps())
@@ -16,15 +16,19 @@
 
 """IconScoreEngine testcase
 """
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
 from iconservice.base.address import ZERO_SCORE_ADDRESS
 from iconservice.base.exception import InvalidParamsException
-from iconservice.icon_constant import IISS_MAX_DELEGATIONS, Revision, ICX_IN_LOOP
+from iconservice.icon_constant import IISS_MAX_DELEGATIONS, IISS_MAX_QUERY_ISCORE_ADDRESSES, Revision, ICX_IN_LOOP
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iiss.reward_calc.ipc.message import CalculateDoneNotification
 from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from tests import create_block_hash
 from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
 
 if TYPE_CHECKING:
@@ -122,6 +126,114 @@ class TestIISSClaim(TestIISSBase):
         self.assertEqual([icx, iscore], tx_results[0].event_logs[0].data)
         RewardCalcProxy.commit_claim.assert_not_called()
 
+    def test_iiss_claim_pipeline(self):
+        self.update_governance()
+        self.set_revision(Revision.IISS.value)
+        self.distribute_icx(accounts=self._accounts[:3], init_balance=100 * ICX_IN_LOOP)
+
+        block_height = 10 ** 2
+        iscore = 10 ** 6
+
+        def claim_iscore_async(*_args) -> 'Future':
+            future = Future()
+            future.set_result((iscore, block_height))
+            return future
+
+        tx_list: list = [
+            self.create_claim_tx(self._accounts[0]),
+            self.create_claim_tx(self._accounts[1]),
+            self.create_claim_tx(self._accounts[0]),
+            self.create_claim_tx(self._accounts[2])
+        ]
+
+        with patch.object(RewardCalcProxy, "is_commit_claim_batch_supported", Mock(return_value=True)), \
+                patch.object(RewardCalcProxy, "claim_iscore_async", Mock(side_effect=claim_iscore_async)), \
+                patch.object(RewardCalcProxy, "get_claim_iscore_result", Mock(side_effect=lambda f: f.result())), \
+                patch.object(RewardCalcProxy, "claim_iscore", Mock(return_value=(iscore, block_height))), \
+                patch.object(RewardCalcProxy, "commit_claim", Mock()), \
+                patch.object(RewardCalcProxy, "commit_claim_batch", Mock()):
+            tx_results: List['TransactionResult'] = self.process_confirm_block_tx(tx_list)
+
+            # The second claim of the same address is not prefetched
+            self.assertEqual(3, RewardCalcProxy.claim_iscore_async.call_count)
+            RewardCalcProxy.claim_iscore.assert_called_once()
+            RewardCalcProxy.commit_claim.assert_not_called()
+
+            # Pending COMMIT_CLAIMs are flushed before the second claim of the same address
+            self.assertEqual(2, RewardCalcProxy.commit_claim_batch.call_count)
+            commits: list = [
+                (commit[0], commit[1], commit[4])
+                for call in RewardCalcProxy.commit_claim_batch.call_args_list
+                for commit in call[0][0]
+            ]
+            self.assertEqual(
+                [(True, self._accounts[0].address, 0),
+                 (True, self._accounts[1].address, 1),
+                 (True, self._accounts[0].address, 2),
+                 (True, self._accounts[2].address, 3)],
+                commits)
+
+        for tx_result in tx_results:
+            self.assertEqual([iscore, iscore // 10 ** 3], tx_result.event_logs[0].data)
+
+    def test_query_iscore_batch(self):
+        self.update_governance()
+        self.set_revision(Revision.IISS.value)
+        self.distribute_icx(accounts=self._accounts[:1], init_balance=100 * ICX_IN_LOOP)
+
+        block_height = 10 ** 2
+        addresses = [account.address for account in self._accounts[:3]]
+        iscores = {address: (i + 1) * 10 ** 6 for i, address in enumerate(addresses)}
+
+        def query_iscore_batch(addresses_: list) -> list:
+            return [(iscores[address], block_height) for address in addresses_]
+
+        with patch.object(RewardCalcProxy, "is_query_batch_supported", Mock(return_value=True)), \
+                patch.object(RewardCalcProxy, "query_iscore_batch", Mock(side_effect=query_iscore_batch)), \
+                patch.object(RewardCalcProxy, "query_iscore",
+                             Mock(side_effect=lambda address: (iscores[address], block_height))):
+            response: list = self.query_iscore_batch(addresses + addresses[:1])
+            self.assertEqual(
+                [
+                    {"address": address, "iscore": iscores[address],
+                     "estimatedICX": iscores[address] // 10 ** 3, "blockHeight": block_height}
+                    for address in addresses + addresses[:1]
+                ],
+                response)
+            # Duplicated addresses are queried once with one QUERY_BATCH request
+            RewardCalcProxy.query_iscore_batch.assert_called_once_with(addresses)
+
+            # Cached I-Scores are used for both queryIScore and queryIScoreBatch
+            self.query_iscore_batch(addresses)
+            self.assertEqual(iscores[addresses[1]], self.query_iscore(addresses[1])["iscore"])
+            RewardCalcProxy.query_iscore_batch.assert_called_once()
+            RewardCalcProxy.query_iscore.assert_not_called()
+
+            # The I-Score of the address which has claimed it is queried again
+            with patch.object(RewardCalcProxy, "claim_iscore", Mock(return_value=(iscores[addresses[0]], 1))), \
+                    patch.object(RewardCalcProxy, "commit_claim", Mock()):
+                self.claim_iscore(self._accounts[0])
+            iscores[addresses[0]] = 0
+
+            response: list = self.query_iscore_batch(addresses)
+            self.assertEqual([0, iscores[addresses[1]], iscores[addresses[2]]],
+                             [data["iscore"] for data in response])
+            RewardCalcProxy.query_iscore.assert_called_once_with(addresses[0])
+
+            # I-Scores of all addresses are queried again after calculation
+            iiss_engine = IconScoreContext.engine.iiss
+            with patch.object(iiss_engine, "check_calculate_request_block_height"), \
+                    patch.object(IconScoreContext.storage.rc, "put_calc_response_from_rc"):
+                iiss_engine.calculate_done_callback(
+                    CalculateDoneNotification(0, True, block_height, 0, create_block_hash()))
+            self.query_iscore_batch(addresses)
+            self.assertEqual(2, RewardCalcProxy.query_iscore_batch.call_count)
+
+        # Invalid params
+        for addresses in ([], [self._accounts[0]] * (IISS_MAX_QUERY_ISCORE_ADDRESSES + 1)):
+            with pytest.raises(InvalidParamsException):
+                self.query_iscore_batch(addresses)
+
     def _query_iscore_with_invalid_params(self):
         params = {
             "version": self._version,
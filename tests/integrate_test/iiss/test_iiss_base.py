@@ -346,6 +346,22 @@ class TestIISSBase(TestIntegrateBase):
         }
         return self._query(query_request)
 
+    def query_iscore_batch(self,
+                           addresses: List[Union['EOAAccount', 'Address', str]]) -> list:
+        query_request = {
+            "version": self._version,
+            "from": self._admin,
+            "to": ZERO_SCORE_ADDRESS,
+            "dataType": "call",
+            "data": {
+                "method": "queryIScoreBatch",
+                "params": {
+                    "addresses": [str(self._convert_address_from_address_type(address)) for address in addresses]
+                }
+            }
+        }
+        return self._query(query_request)
+
     def get_iiss_info(self) -> dict:
         query_request = {
             "version": self._version,
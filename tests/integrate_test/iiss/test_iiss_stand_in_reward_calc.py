@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs IISS transactions through IconServiceEngine with the stand-in reward calculator
+
+tools/benchmark_stand_in_reward_calc.py reports the throughput of this test
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+from threading import Thread
+from typing import TYPE_CHECKING, Dict, List
+from unittest.mock import patch
+
+import iconservice
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, Revision
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from tests.integrate_test import root_clear
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+if TYPE_CHECKING:
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+# TestIntegrateBase replaces these methods with mocks for good, so keep the original ones
+_PROXY_METHODS: Dict[str, callable] = {
+    name: RewardCalcProxy.__dict__[name]
+    for name in (
+        "open", "start", "stop", "close", "get_version", "calculate", "claim_iscore", "query_iscore",
+        "commit_block", "commit_claim", "query_calculate_result"
+    )
+}
+
+
+class TestIISSStandInRewardCalc(TestIISSBase):
+    ACCOUNT_COUNT = 50
+    # Seconds for the reward calculator to handle a message
+    LATENCY = 0.0002
+
+    def _make_init_config(self) -> dict:
+        config: dict = super()._make_init_config()
+        config[ConfigKey.ICON_RC_DIR_PATH] = self.rc_path
+        config[ConfigKey.AMQP_KEY] = self.amqp_key
+        # rc.log is written in the directory of the log file
+        config[ConfigKey.LOG] = {ConfigKey.LOG_FILE_PATH: os.path.join(self.dir, "iconservice.log")}
+        return config
+
+    def _mock_ipc(self, *args, **kwargs):
+        for name, method in _PROXY_METHODS.items():
+            patcher = patch.object(RewardCalcProxy, name, method)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.amqp_key = f"stand_in_{os.getpid()}"
+
+        # Launched by RewardCalcProxy in place of icon_rc
+        self.rc_path = os.path.join(self.dir, "icon_rc")
+        with open(self.rc_path, "w") as f:
+            f.write("#!/bin/sh\n"
+                    f"PYTHONPATH={os.path.dirname(os.path.dirname(iconservice.__file__))} "
+                    f"exec {sys.executable} -m iconservice.iiss.reward_calc.stand_in "
+                    f"-latency {self.LATENCY} \"$@\"\n")
+        os.chmod(self.rc_path, 0o755)
+
+        self.prev_loop = asyncio.get_event_loop()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        super().setUp()
+
+        self.thread = Thread(target=self.loop.run_forever)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._wait_for_ready(), self.loop).result(20)
+
+    @staticmethod
+    async def _wait_for_ready():
+        await asyncio.wait_for(asyncio.shield(IconServiceEngine.get_ready_future()), 15)
+
+    async def _close(self):
+        self.icon_service_engine.close()
+        # Wait for the tasks of IPCServer to be finished
+        await asyncio.sleep(0.1)
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self._close(), self.loop).result(10)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(10)
+        self.loop.close()
+        asyncio.set_event_loop(self.prev_loop)
+
+        root_clear(self._score_root_path, self._state_db_root_path, self._iiss_db_root_path)
+        shutil.rmtree(self.dir)
+        sock_path: str = f"/tmp/iiss_{self.amqp_key}.sock"
+        if os.path.exists(sock_path):
+            os.remove(sock_path)
+
+    def _process_txs(self, name: str, tx_list: List[dict]) -> List['TransactionResult']:
+        tx_results: List['TransactionResult'] = self.process_confirm_block_tx(tx_list)
+        self.assertEqual(len(tx_list), len(tx_results), name)
+        return tx_results
+
+    def _query_iscore_batch(self, accounts: list) -> list:
+        return self.query_iscore_batch(accounts)
+
+    def _wait_for_calculation(self, address, timeout: float = 10) -> int:
+        deadline: float = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            iscore: int = self.query_iscore(address)["iscore"]
+            if iscore > 0:
+                return iscore
+            time.sleep(0.05)
+
+        raise AssertionError("I-Score has not been calculated")
+
+    def test_iiss_txs(self):
+        self.update_governance()
+        self.set_revision(Revision.IISS.value)
+
+        accounts = self._accounts[:self.ACCOUNT_COUNT]
+        self.distribute_icx(accounts=accounts, init_balance=100 * ICX_IN_LOOP)
+
+        stake: int = 10 * ICX_IN_LOOP
+        self._process_txs("setStake", [self.create_set_stake_tx(account, stake) for account in accounts])
+        self._process_txs(
+            "setDelegation", [self.create_set_delegation_tx(account, [(account, stake)]) for account in accounts])
+        for account in accounts:
+            self.assertEqual(stake, self.get_stake(account)["stake"])
+            self.assertEqual(stake, self.get_delegation(account)["totalDelegated"])
+
+        # CALCULATE is sent on the first block of the next calculation period
+        calculate_block_height: int = self.make_blocks_to_end_calculation()
+        self.make_blocks(to=self._block_height + 1)
+
+        iscore: int = self._wait_for_calculation(accounts[0])
+        _, block_height, state_hash = IconScoreContext.storage.rc.get_calc_response_from_rc()
+        self.assertEqual(calculate_block_height, block_height)
+        self.assertEqual(32, len(state_hash))
+
+        # Every account has delegated the same amount at the same block
+        response: list = self._query_iscore_batch(accounts)
+        self.assertEqual(len(accounts), len(response))
+        for item in response:
+            self.assertEqual(iscore, item["iscore"])
+            self.assertEqual(block_height, item["blockHeight"])
+
+        tx_results = self._process_txs("claimIScore", [self.create_claim_tx(account) for account in accounts])
+        for tx_result in tx_results:
+            self.assertEqual(1, tx_result.status)
+            claimed_iscore, _ = tx_result.event_logs[0].data
+            self.assertEqual(iscore // 1000 * 1000, claimed_iscore)
+
+        # Claimed I-Scores are deducted on COMMIT_BLOCK
+        self.assertEqual(iscore % 1000, self.query_iscore(accounts[0])["iscore"])
@@ -16,14 +16,20 @@
 
 import os
 import shutil
+from concurrent.futures import Future
 from enum import IntFlag, auto
+from threading import Event
+from unittest.mock import patch
 
 from iconservice.database.db import KeyValueDatabase
-from iconservice.database.wal import WriteAheadLogWriter, StateWAL, IissWAL, WALState
+from iconservice.base.exception import FatalException
+from iconservice.database.wal import WriteAheadLogReader, WriteAheadLogWriter, StateWAL, IissWAL, WALState
 from iconservice.icon_constant import PREP_MAIN_PREPS, IISS_DB, IconScoreContextType
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.iiss.reward_calc import RewardCalcStorage
+from iconservice.iiss.reward_calc.ipc.message import CommitBlockResponse
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
 from iconservice.iiss.reward_calc.msg_data import PRepsData, TxData, \
     TxType, Header, GovernanceVariable
 from iconservice.precommit_data_manager import PrecommitData
@@ -66,6 +72,7 @@ class TestRecoverUsingWAL(TestIISSBase):
         self.stake_amount: int = 100
         self.log_path: str = self.icon_service_engine._get_write_ahead_log_path()
         self.rc_data_path: str = os.path.join(self._state_db_root_path, IISS_DB)
+        self.marker_path: str = os.path.join(self.rc_data_path, RewardCalcStorage.STANDBY_RC_DB_MARKER_NAME)
 
     def tearDown(self):
         super().tearDown()
@@ -175,6 +182,18 @@ class TestRecoverUsingWAL(TestIISSBase):
         self.assertFalse(os.path.exists(self.log_path))
         self._check_the_state_and_rc_db_after_recover(last_block_after_open, is_calc_period_start_block)
 
+    def _get_iiss_db_path(self, calculate_block_height: int) -> str:
+        return os.path.join(os.path.abspath(self.rc_data_path),
+                            f"{RewardCalcStorage.IISS_RC_DB_NAME_PREFIX}{calculate_block_height}_2")
+
+    def _check_calculate_on_hello(self, calculate_block_height: int):
+        # CALCULATE for the recovered iiss_db is sent after the connection to reward calculator is ready
+        self.assertTrue(os.path.isfile(self.marker_path))
+        with patch.object(RewardCalcProxy, "calculate") as calculate:
+            self.icon_service_engine.hello()
+        calculate.assert_called_once_with(self._get_iiss_db_path(calculate_block_height), calculate_block_height)
+        self.assertFalse(os.path.exists(self.marker_path))
+
     def _remove_all_iiss_db_before_reopen(self):
         # For make same environment, remove all iiss_db
         for dir_name in os.listdir(self.rc_data_path):
@@ -236,6 +255,69 @@ class TestRecoverUsingWAL(TestIISSBase):
 
         self._check_the_db_after_recover(last_block_before_close, is_start_block)
 
+    def test_lose_states_written_after_fsync_on_calc_period(self):
+        # Success case: the states appended without fsync are lost by power failure after writing both dbs,
+        # should write rc db and state db again when open
+        self.make_blocks(self._get_last_block_from_icon_service() + 1)
+        is_start_block: bool = False
+        last_block_before_close: int = self._get_last_block_from_icon_service()
+
+        precommit_data: 'PrecommitData' = self._get_precommit_data_after_invoke()
+        context: 'IconScoreContext' = self._get_commit_context(precommit_data.block)
+        wal_writer, state_wal, iiss_wal = self._get_wal_writer(precommit_data, is_start_block)
+        self._write_batch_to_wal(wal_writer, state_wal, iiss_wal, is_start_block)
+        synced_size: int = os.path.getsize(self.log_path)
+
+        self.icon_service_engine._process_iiss_commit(context, precommit_data, iiss_wal, is_start_block)
+        wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
+        self.icon_service_engine._process_state_commit(context, precommit_data, state_wal)
+        wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
+        wal_writer.close()
+
+        self.assertEqual(WALState.WRITE_RC_DB | WALState.WRITE_STATE_DB, self._get_wal_state())
+        with open(self.log_path, "rb+") as f:
+            f.truncate(synced_size)
+        self.assertEqual(WALState(0), self._get_wal_state())
+
+        self._close_and_reopen_iconservice()
+
+        self._check_the_db_after_recover(last_block_before_close, is_start_block)
+
+    def test_lose_states_written_after_fsync_on_the_start(self):
+        # Success case: the states appended without fsync are lost by power failure after writing both dbs
+        # on the calc period start block, should scan standby db and current db again,
+        # change standby db to iiss db and write rc db and state db again when open
+        self.make_blocks_to_end_calculation()
+        is_start_block: bool = True
+        last_block_before_close: int = self._get_last_block_from_icon_service()
+
+        precommit_data: 'PrecommitData' = self._get_precommit_data_after_invoke()
+        context: 'IconScoreContext' = self._get_commit_context(precommit_data.block)
+        wal_writer, state_wal, iiss_wal = self._get_wal_writer(precommit_data, is_start_block)
+        self._write_batch_to_wal(wal_writer, state_wal, iiss_wal, is_start_block)
+        synced_size: int = os.path.getsize(self.log_path)
+
+        self.icon_service_engine._process_iiss_commit(context, precommit_data, iiss_wal, is_start_block)
+        wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
+        self.icon_service_engine._process_state_commit(context, precommit_data, state_wal)
+        wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
+        wal_writer.close()
+
+        self.assertEqual(WALState.CALC_PERIOD_START_BLOCK | WALState.WRITE_RC_DB | WALState.WRITE_STATE_DB,
+                         self._get_wal_state())
+        with open(self.log_path, "rb+") as f:
+            f.truncate(synced_size)
+        self.assertEqual(WALState.CALC_PERIOD_START_BLOCK, self._get_wal_state())
+
+        # Remove all iiss_db
+        self._remove_all_iiss_db_before_reopen()
+        with patch.object(RewardCalcStorage, "scan_rc_db", wraps=RewardCalcStorage.scan_rc_db) as scan_rc_db:
+            self._close_and_reopen_iconservice()
+        scan_rc_db.assert_called_once()
+
+        self._check_the_db_after_recover(last_block_before_close, is_start_block)
+        self._check_calculate_on_hello(last_block_before_close)
+
     def test_close_before_change_current_to_standby_on_the_start(self):
         # Success case: Iconservice is closed before changing current db to standby db,
         # should change current db to iiss db and create new current db (That is before commit data to rc db)
@@ -252,6 +334,7 @@ class TestRecoverUsingWAL(TestIISSBase):
         self._close_and_reopen_iconservice()
 
         self._check_the_db_after_recover(last_block_before_close, is_start_block)
+        self._check_calculate_on_hello(last_block_before_close)
 
     def test_close_only_standby_exists_on_the_start(self):
         # Success case: Iconservice is closed after changing current db to standby db,
@@ -272,6 +355,7 @@ class TestRecoverUsingWAL(TestIISSBase):
         self._close_and_reopen_iconservice()
 
         self._check_the_db_after_recover(last_block_before_close, is_start_block)
+        self._check_calculate_on_hello(last_block_before_close)
 
     def test_close_standby_and_current_exists_on_the_start(self):
         # Success case: Iconservice is closed after changing current db to standby db and create new current db,
@@ -293,6 +377,7 @@ class TestRecoverUsingWAL(TestIISSBase):
         self._close_and_reopen_iconservice()
 
         self._check_the_db_after_recover(last_block_before_close, is_start_block)
+        self._check_calculate_on_hello(last_block_before_close)
 
     def test_close_before_sending_calculate_on_the_start(self):
         # Success case: Iconservice is closed after changing current db to iiss db and create new current db,
@@ -327,3 +412,153 @@ class TestRecoverUsingWAL(TestIISSBase):
         self._close_and_reopen_iconservice()
 
         self._check_the_db_after_recover(last_block_before_close, is_start_block)
+        self._check_calculate_on_hello(last_block_before_close)
+
+    def test_close_before_preparing_standby_db_on_the_start(self):
+        # Success case: Iconservice is closed after commit but before the background worker compacts standby db,
+        # should change standby db to iiss db
+        self.make_blocks_to_end_calculation()
+        is_start_block: bool = True
+        last_block_before_close: int = self._get_last_block_from_icon_service()
+
+        precommit_data: 'PrecommitData' = self._get_precommit_data_after_invoke()
+        context: 'IconScoreContext' = self._get_commit_context(precommit_data.block)
+        wal_writer, state_wal, iiss_wal = self._get_wal_writer(precommit_data, is_start_block)
+        self._write_batch_to_wal(wal_writer, state_wal, iiss_wal, is_start_block)
+
+        self.icon_service_engine._process_iiss_commit(context, precommit_data, iiss_wal, is_start_block)
+        wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
+        self.icon_service_engine._process_state_commit(context, precommit_data, state_wal)
+        wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
+        self.icon_service_engine._process_ipc(context, wal_writer, precommit_data, precommit_data.block.hash)
+        wal_writer.close()
+
+        # Remove all iiss_db
+        self._remove_all_iiss_db_before_reopen()
+        self._close_and_reopen_iconservice()
+
+        self._check_the_db_after_recover(last_block_before_close, is_start_block)
+        self._check_calculate_on_hello(last_block_before_close)
+
+    def test_prepare_standby_db_in_background_on_the_start(self):
+        # Success case: standby db is compacted and sent to RC on the background worker
+        # after commit of the calc period start block and WAL is removed after that
+        self.make_blocks_to_end_calculation()
+        self._remove_all_iiss_db_before_reopen()
+        calculate_block_height: int = self._get_last_block_from_icon_service()
+
+        with patch.object(RewardCalcProxy, "calculate") as calculate:
+            self.make_blocks(calculate_block_height + 1)
+
+        iiss_db_path: str = self._get_iiss_db_path(calculate_block_height)
+        calculate.assert_called_once_with(iiss_db_path, calculate_block_height)
+        self.assertTrue(os.path.isdir(iiss_db_path))
+        self.assertFalse(os.path.exists(self.log_path))
+        self.assertFalse(os.path.exists(self.marker_path))
+
+    def test_commit_while_preparing_standby_db_on_the_start(self):
+        # Success case: the blocks after the calc period start block are committed
+        # while standby db is being compacted on the background worker
+        self.make_blocks_to_end_calculation()
+        self._remove_all_iiss_db_before_reopen()
+        calculate_block_height: int = self._get_last_block_from_icon_service()
+
+        compaction = Event()
+        prepare_standby_db = RewardCalcStorage.prepare_standby_db
+
+        def _prepare_standby_db(standby_db_path: str) -> str:
+            compaction.wait(10)
+            return prepare_standby_db(standby_db_path)
+
+        # Do not wait for the background worker after commit
+        self._commit = lambda block: self.icon_service_engine.commit(block.height, block.hash, None)
+        with patch.object(RewardCalcStorage, "prepare_standby_db", side_effect=_prepare_standby_db), \
+                patch.object(RewardCalcProxy, "calculate") as calculate:
+            self.make_blocks(calculate_block_height + 3)
+
+            calculate.assert_not_called()
+            self.assertTrue(os.path.isfile(self.marker_path))
+            self.assertFalse(os.path.exists(self.log_path))
+
+            compaction.set()
+            self.icon_service_engine._standby_rc_db_future.result()
+
+        calculate.assert_called_once_with(self._get_iiss_db_path(calculate_block_height), calculate_block_height)
+        # The marker is removed on the next commit
+        self.assertTrue(os.path.isfile(self.marker_path))
+        self.make_blocks(self._block_height + 1)
+        self.assertFalse(os.path.exists(self.marker_path))
+
+    def test_close_after_sending_calculate_on_the_start(self):
+        # Success case: Iconservice is closed after CALCULATE is sent but before the marker is removed,
+        # should remove the marker without sending CALCULATE again
+        self.make_blocks_to_end_calculation()
+        self._remove_all_iiss_db_before_reopen()
+        calculate_block_height: int = self._get_last_block_from_icon_service()
+
+        self._commit = lambda block: self.icon_service_engine.commit(block.height, block.hash, None)
+        self.make_blocks(calculate_block_height + 1)
+        self.icon_service_engine._standby_rc_db_future.result()
+        self.assertTrue(os.path.isfile(self.marker_path))
+
+        self._close_and_reopen_iconservice()
+        self.assertFalse(os.path.exists(self.marker_path))
+
+        with patch.object(RewardCalcProxy, "calculate") as calculate:
+            self.icon_service_engine.hello()
+        calculate.assert_not_called()
+
+    def _make_block_with_async_commit_block(self) -> 'Future':
+        self.icon_service_engine._async_commit_block = True
+        future = Future()
+        with patch.object(RewardCalcProxy, "commit_block_async", return_value=future) as commit_block_async:
+            self.make_blocks(self._block_height + 1)
+
+        block = self.icon_service_engine._get_last_block()
+        commit_block_async.assert_called_once_with(True, block.height, block.hash)
+        return future
+
+    def _get_wal_state(self) -> 'WALState':
+        reader = WriteAheadLogReader()
+        reader.open(self.log_path)
+        reader.close()
+        return WALState(reader.state)
+
+    def test_async_commit_block(self):
+        # Success case: commit returns without waiting for the response of COMMIT_BLOCK
+        # and WAL is removed after the response is verified
+        future: 'Future' = self._make_block_with_async_commit_block()
+        block = self.icon_service_engine._get_last_block()
+
+        self.assertTrue(os.path.exists(self.log_path))
+        self.assertFalse(self._get_wal_state() & WALState.SEND_COMMIT_BLOCK)
+
+        future.set_result(CommitBlockResponse(0, True, block.height, block.hash))
+        self.icon_service_engine._wait_for_pending_commit_block()
+        self.assertFalse(os.path.exists(self.log_path))
+
+    def test_invalid_commit_block_ack(self):
+        # Failure case: the next commit fails if reward calculator has failed to commit the previous block
+        # and WAL is left to send COMMIT_BLOCK again on the next open
+        future: 'Future' = self._make_block_with_async_commit_block()
+        block = self.icon_service_engine._get_last_block()
+        future.set_result(CommitBlockResponse(0, False, block.height, block.hash))
+
+        with self.assertRaises(FatalException):
+            self.make_blocks(self._block_height + 1)
+        self.assertTrue(os.path.exists(self.log_path))
+        self.assertFalse(self._get_wal_state() & WALState.SEND_COMMIT_BLOCK)
+
+    def test_close_before_commit_block_ack(self):
+        # Success case: Iconservice is closed before the response of COMMIT_BLOCK arrives,
+        # should send COMMIT_BLOCK again after recovery
+        self._make_block_with_async_commit_block()
+        block = self.icon_service_engine._get_last_block()
+
+        self._close_and_reopen_iconservice()
+        self.assertFalse(os.path.exists(self.log_path))
+        self.assertEqual(block, self.icon_service_engine._get_last_block())
+
+        RewardCalcProxy.commit_block.reset_mock()
+        self.icon_service_engine.hello()
+        RewardCalcProxy.commit_block.assert_called_once_with(True, block.height, block.hash)
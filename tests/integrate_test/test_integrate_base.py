@@ -168,7 +168,7 @@ class TestIntegrateBase(TestCase):
             block,
             [tx]
         )
-        self.icon_service_engine.commit(block.height, block.hash, None)
+        self._commit(block)
         self._block_height += 1
         self._prev_block_hash = block_hash
 
@@ -284,8 +284,13 @@ class TestIntegrateBase(TestCase):
 
         return block, self.get_hash_list_from_tx_list(tx_list)
 
-    def _write_precommit_state(self, block: 'Block') -> None:
+    def _commit(self, block: 'Block') -> None:
         self.icon_service_engine.commit(block.height, block.hash, None)
+        # Check the rc_dbs which are prepared on the background worker after commit of the calc period start block
+        self.icon_service_engine._check_standby_rc_db(wait=True)
+
+    def _write_precommit_state(self, block: 'Block') -> None:
+        self._commit(block)
         self._block_height += 1
         assert block.height == self._block_height
         self._prev_block_hash = block.hash
@@ -15,6 +15,7 @@
 # limitations under the License.
 import unittest
 from typing import TYPE_CHECKING, List
+from unittest.mock import patch
 
 from iconcommons import IconConfig
 from iconservice.base.address import Address, AddressPrefix, GOVERNANCE_SCORE_ADDRESS
@@ -310,6 +311,29 @@ class TestIntegrateFeeSharing(TestIntegrateBase):
         after_destroyed_available_deposit: int = deposit_info['availableDeposit']
         self.assertEqual(after_destroyed_available_deposit, 0)
 
+    def test_query_cache_after_deposit_expired(self):
+        term: int = 2
+        with patch("iconservice.fee.engine.BLOCKS_IN_ONE_MONTH", term), \
+                patch.object(FeeEngine, "_MIN_DEPOSIT_TERM", term), \
+                patch.object(FeeEngine, "_MAX_DEPOSIT_TERM", term):
+            self.deposit_icx(score_address=self.score_address,
+                             amount=MIN_DEPOSIT_AMOUNT,
+                             period=term)
+
+        deposit_info: dict = self._query_score_info(self.score_address)['depositInfo']
+        self.assertGreater(deposit_info['availableVirtualStep'], 0)
+        self.assertGreater(deposit_info['availableDeposit'], 0)
+
+        # Blocks which do not change the deposit but make it expired
+        for _ in range(term):
+            self.transfer_icx(from_=self._admin,
+                              to_=self._accounts[0],
+                              value=10 ** 8)
+
+        deposit_info: dict = self._query_score_info(self.score_address)['depositInfo']
+        self.assertEqual(0, deposit_info['availableVirtualStep'])
+        self.assertEqual(0, deposit_info['availableDeposit'])
+
     def test_deposit_unauthorized_account(self):
         # give icx to tester
         self.transfer_icx(from_=self._admin,
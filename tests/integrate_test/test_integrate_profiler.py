@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine profiler testcase
+"""
+
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP
+from iconservice.profiler import Counter, Phase
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateProfiler(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.PROFILER_FLAG: True}
+
+    def test_ise_get_status(self):
+        self.icon_service_engine._profiler.reset()
+
+        self.transfer_icx(from_=self._admin,
+                          to_=self._accounts[0],
+                          value=1 * ICX_IN_LOOP)
+        self.get_balance(self._accounts[0])
+
+        response: dict = self._query({"filter": ["profile"]}, "ise_getStatus")
+        profile: dict = response["profile"]
+        phases: dict = profile["phases"]
+
+        for phase in (Phase.INVOKE,
+                      Phase.INVOKE_BEFORE_TX,
+                      Phase.INVOKE_TX,
+                      Phase.INVOKE_CHARGE_FEE,
+                      Phase.INVOKE_AFTER_TX,
+                      Phase.INVOKE_PRECOMMIT_DATA,
+                      Phase.COMMIT,
+                      Phase.COMMIT_STATE_DB,
+                      Phase.QUERY):
+            self.assertIn(phase, phases)
+
+        self.assertEqual(1, profile["counters"][Counter.BLOCKS])
+        self.assertEqual(1, profile["counters"][Counter.COMMITS])
+        self.assertEqual(1, phases[Phase.INVOKE]["count"])
+
+        # Without filter, all statuses are returned
+        response: dict = self._query({}, "ise_getStatus")
+        self.assertIn("lastBlock", response)
+        self.assertIn("profile", response)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine query cache testcase
+"""
+
+from typing import TYPE_CHECKING, List
+
+from iconservice.icon_constant import ICX_IN_LOOP
+from iconservice.query_cache import QueryCache
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateQueryCache(TestIntegrateBase):
+    def _deploy_token(self) -> 'Address':
+        tx_results: List['TransactionResult'] = self.deploy_score(
+            score_root="sample_deploy_scores",
+            score_name="install/sample_token",
+            from_=self._accounts[0],
+            deploy_params={"init_supply": hex(1000), "decimal": hex(18)})
+        return tx_results[0].score_address
+
+    def _make_balance_of_request(self, score_address: 'Address', owner: 'Address') -> dict:
+        return {
+            "from": self._admin,
+            "to": score_address,
+            "dataType": "call",
+            "data": {
+                "method": "balance_of",
+                "params": {
+                    "addr_from": str(owner)
+                }
+            }
+        }
+
+    def test_cached_result_survives_untouched_block(self):
+        score_address: 'Address' = self._deploy_token()
+        query_cache: 'QueryCache' = self.icon_service_engine._query_cache
+
+        request: dict = self._make_balance_of_request(score_address, self._accounts[0].address)
+        cache_key: tuple = QueryCache.make_key("icx_call", request)
+
+        init_balance: int = 1000 * ICX_IN_LOOP
+        self.assertEqual(init_balance, self._query(request))
+        self.assertIn(cache_key, query_cache)
+
+        # A block which does not touch the token SCORE
+        self.transfer_icx(from_=self._admin,
+                          to_=self._accounts[2],
+                          value=1 * ICX_IN_LOOP)
+        self.assertIn(cache_key, query_cache)
+        self.assertEqual(init_balance, self._query(request))
+
+        # A block which changes the balance of the holder
+        value: int = 100 * ICX_IN_LOOP
+        self.score_call(from_=self._accounts[0],
+                        to_=score_address,
+                        func_name="transfer",
+                        params={"addr_to": str(self._accounts[1].address), "value": hex(value)})
+        self.assertNotIn(cache_key, query_cache)
+        self.assertEqual(init_balance - value, self._query(request))
+
+    def test_icx_balance(self):
+        request: dict = {"address": self._accounts[0].address}
+        self.assertEqual(0, self._query(request, "icx_getBalance"))
+
+        self.transfer_icx(from_=self._admin,
+                          to_=self._accounts[0],
+                          value=1 * ICX_IN_LOOP)
+        self.assertEqual(1 * ICX_IN_LOOP, self._query(request, "icx_getBalance"))
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine testcase
+"""
+
+import copy
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from iconservice.base.type_converter import TypeConverter
+from iconservice.icon_constant import ConfigKey
+from iconservice.icon_inner_service import IconScoreInnerTask
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iiss.engine import Engine as IISSEngine
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from iconservice.replay import RecordType, ReplayRecorder, ReplayReader
+from iconservice.replay.replayer import Replayer, ReplayReport
+from iconservice.utils import icx_to_loop
+from tests import create_block_hash
+from tests.integrate_test import create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateReplay(TestIntegrateBase):
+    def setUp(self):
+        super().setUp()
+        self.dir = tempfile.mkdtemp()
+        self.record_path = os.path.join(self.dir, "replay.dat")
+
+        # Take a snapshot of the states right before recording
+        self.icon_service_engine.close()
+        self.snapshot_score_root_path = os.path.join(self.dir, "snapshot_score")
+        self.snapshot_state_db_root_path = os.path.join(self.dir, "snapshot_statedb")
+        shutil.copytree(self._score_root_path, self.snapshot_score_root_path)
+        shutil.copytree(self._state_db_root_path, self.snapshot_state_db_root_path)
+        self._reopen_engine()
+
+        with patch('iconservice.icon_inner_service.IconScoreInnerTask._open'):
+            self.inner_task = IconScoreInnerTask(self._config)
+        self.inner_task._icon_service_engine = self.icon_service_engine
+        self.inner_task._recorder = ReplayRecorder(self.record_path)
+        self.inner_task._recorder.open()
+
+    def tearDown(self):
+        self.inner_task._recorder.close()
+        super().tearDown()
+        shutil.rmtree(self.dir)
+
+    def _reopen_engine(self):
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(self._config)
+
+    def _invoke(self, tx_count: int) -> dict:
+        block_hash: bytes = create_block_hash()
+        tx_list = [
+            TypeConverter.convert_type_reverse(
+                self.create_transfer_icx_tx(self._admin, self._accounts[i], icx_to_loop(1)))
+            for i in range(tx_count)
+        ]
+
+        request = {
+            "block": {
+                "blockHeight": hex(self._block_height + 1),
+                "blockHash": block_hash.hex(),
+                "timestamp": hex(create_timestamp()),
+                "prevBlockHash": self._prev_block_hash.hex()
+            },
+            "transactions": tx_list,
+            "isBlockEditable": hex(0)
+        }
+
+        response: dict = self.inner_task._invoke(request)
+        self.assertNotIn("error", response)
+        self.assertEqual(tx_count, len(response["txResults"]))
+        return request["block"]
+
+    def _write_precommit_state(self, block: dict):
+        response = self.inner_task._write_precommit_state(
+            {"blockHeight": block["blockHeight"], "blockHash": block["blockHash"]})
+        self.assertEqual(hex(0), response)
+
+        self._block_height += 1
+        self._prev_block_hash = bytes.fromhex(block["blockHash"])
+
+    def _remove_precommit_state(self, block: dict):
+        response = self.inner_task._remove_precommit_state(
+            {"blockHeight": block["blockHeight"], "blockHash": block["blockHash"]})
+        self.assertEqual(hex(0), response)
+
+    def _record_blocks(self) -> int:
+        tx_count = 0
+        for i in range(3):
+            self._write_precommit_state(self._invoke(i + 1))
+            tx_count += i + 1
+
+        # The block which is invoked but not committed
+        self._remove_precommit_state(self._invoke(5))
+
+        self._write_precommit_state(self._invoke(4))
+        tx_count += 5 + 4
+
+        return tx_count
+
+    def _replay(self, record_path: str) -> 'ReplayReport':
+        self.icon_service_engine.close()
+
+        conf = copy.deepcopy(self._config)
+        conf.update_conf({ConfigKey.SCORE_ROOT_PATH: self.snapshot_score_root_path,
+                          ConfigKey.STATE_DB_ROOT_PATH: self.snapshot_state_db_root_path})
+        report = Replayer(conf, record_path, work_dir=self.dir).run()
+
+        # The factory of the reward calc proxy is restored
+        self.assertIs(RewardCalcProxy, IISSEngine.reward_calc_proxy_factory)
+        self._reopen_engine()
+        return report
+
+    def test_replay(self):
+        tx_count: int = self._record_blocks()
+
+        record_types = [record_type for record_type, _ in ReplayReader(self.record_path)]
+        self.assertEqual(5, record_types.count(RecordType.INVOKE))
+        self.assertEqual(4, record_types.count(RecordType.WRITE_PRECOMMIT_STATE))
+        self.assertEqual(1, record_types.count(RecordType.REMOVE_PRECOMMIT_STATE))
+
+        report = self._replay(self.record_path)
+
+        self.assertEqual(4, report.blocks)
+        self.assertEqual(tx_count, report.transactions)
+        self.assertEqual(5, len(report.invoke_latencies))
+        self.assertEqual(4, len(report.commit_latencies))
+        self.assertEqual([], report.mismatches)
+        self.assertGreater(report.blocks_per_sec, 0)
+
+        # The original states are not changed by replaying
+        self.assertEqual(self._block_height, self.icon_service_engine._get_last_block().height)
+
+    def test_replay_with_mismatched_state_root_hash(self):
+        self._record_blocks()
+
+        # Falsify the state root hash of the first block
+        invalid_record_path = os.path.join(self.dir, "invalid_replay.dat")
+        recorder = ReplayRecorder(invalid_record_path)
+        recorder.open()
+        for i, (record_type, record) in enumerate(ReplayReader(self.record_path)):
+            if record_type == RecordType.INVOKE:
+                request, state_root_hash, _ = record
+                recorder.record_invoke(request, bytes(32) if i == 0 else state_root_hash)
+            elif record_type == RecordType.WRITE_PRECOMMIT_STATE:
+                recorder.record_write_precommit_state(*record)
+            elif record_type == RecordType.REMOVE_PRECOMMIT_STATE:
+                recorder.record_remove_precommit_state(*record)
+        recorder.close()
+
+        report = self._replay(invalid_record_path)
+
+        self.assertEqual(1, len(report.mismatches))
+        block_height, expected, actual = report.mismatches[0]
+        self.assertEqual(1, block_height)
+        self.assertEqual(bytes(32), expected)
+        self.assertNotEqual(bytes(32), actual)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SCORE execution statistics testcase
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, List
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScoreStats(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        self._dump_path: str = os.path.join(self._state_db_root_path, "score_stats.log")
+        return {
+            ConfigKey.SCORE_STATS_FLAG: True,
+            ConfigKey.SCORE_STATS_DUMP_PATH: self._dump_path
+        }
+
+    def test_score_stats(self):
+        tx1: dict = self.create_deploy_score_tx(score_root="sample_internal_call_scores",
+                                                score_name="sample_score",
+                                                from_=self._accounts[0],
+                                                to_=ZERO_SCORE_ADDRESS,
+                                                deploy_params={'value': hex(1 * ICX_IN_LOOP)})
+        tx2: dict = self.create_deploy_score_tx(score_root="sample_internal_call_scores",
+                                                score_name="sample_link_score",
+                                                from_=self._accounts[0],
+                                                to_=ZERO_SCORE_ADDRESS)
+
+        tx_results: List['TransactionResult'] = self.process_confirm_block_tx([tx1, tx2])
+        score_addr1: 'Address' = tx_results[0].score_address
+        score_addr2: 'Address' = tx_results[1].score_address
+
+        self.score_call(from_=self._accounts[0],
+                        to_=score_addr2,
+                        func_name="add_score_func",
+                        params={"score_addr": str(score_addr1)})
+
+        tx_results: List['TransactionResult'] = self.score_call(from_=self._accounts[0],
+                                                                to_=score_addr2,
+                                                                func_name="set_value",
+                                                                params={"value": hex(2 * ICX_IN_LOOP)})
+
+        response: dict = self._query({}, "debug_getScoreStats")
+        self.assertEqual(self._block_height, response["blockHeight"])
+
+        last_block: dict = {(item["score"], item["method"]): item for item in response["lastBlock"]}
+        # sample_link_score.set_value() calls sample_score.set_value() internally
+        self.assertEqual({(score_addr2, "set_value"), (score_addr1, "set_value")}, set(last_block))
+
+        for item in last_block.values():
+            self.assertEqual(1, item["count"])
+            self.assertGreater(item["time"], 0)
+
+        # DB writes are accounted to the SCORE which has written them
+        self.assertEqual(0, last_block[(score_addr2, "set_value")]["writes"])
+        self.assertGreater(last_block[(score_addr1, "set_value")]["writes"], 0)
+
+        total_steps: int = sum(item["steps"] for item in last_block.values())
+        self.assertLessEqual(total_steps, tx_results[0].step_used)
+
+        total: dict = {(item["score"], item["method"]): item for item in response["total"]}
+        self.assertIn((score_addr2, "add_score_func"), total)
+
+        with open(self._dump_path) as f:
+            dumps: list = [json.loads(line) for line in f]
+        self.assertEqual(self._block_height, dumps[-1]["blockHeight"])
+        self.assertEqual(2, len(dumps[-1]["stats"]))
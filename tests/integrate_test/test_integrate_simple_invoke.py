@@ -61,6 +61,13 @@ class TestIntegrateSimpleInvoke(TestIntegrateBase):
         self.assertTrue(isinstance(last_block['timestamp'], int))
         self.assertTrue(last_block['timestamp'])
 
+    def test_ise_get_status_without_filter(self):
+        response = self._query(None, 'ise_getStatus')
+        self.assertEqual(0, response['lastBlock']['blockHeight'])
+
+        response = self._query({'filter': None}, 'ise_getStatus')
+        self.assertNotIn('ipc', response)
+
     def test_invoke_success(self):
         value1 = 3 * ICX_IN_LOOP
         self.transfer_icx(from_=self._admin,
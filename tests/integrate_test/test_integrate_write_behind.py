@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""IconServiceEngine write-behind state_db testcase
+"""
+
+import os
+from unittest.mock import patch
+
+from iconservice.database.write_behind import WriteBehindDatabase
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, WRITE_BEHIND_LOG_DIR
+from iconservice.icon_service_engine import IconServiceEngine
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateWriteBehind(TestIntegrateBase):
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.WRITE_BEHIND_BLOCK_COUNT: 3}
+
+    def _close_and_reopen_iconservice(self):
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(self._config)
+
+    def _transfer_icx(self, count: int) -> int:
+        value: int = 1 * ICX_IN_LOOP
+        for _ in range(count):
+            self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=value)
+
+        return value * count
+
+    def test_write_behind(self):
+        db = self.icon_service_engine._icx_context_db.key_value_db
+        self.assertIsInstance(db, WriteBehindDatabase)
+
+        balance: int = self._transfer_icx(4)
+        self.assertEqual(balance, self.get_balance(self._accounts[0]))
+        self.assertGreater(db.pending_block_count, 0)
+
+        self._close_and_reopen_iconservice()
+
+        log_dir: str = os.path.join(self._state_db_root_path, WRITE_BEHIND_LOG_DIR)
+        self.assertEqual([], os.listdir(log_dir))
+        self.assertEqual(self._block_height, self.icon_service_engine._get_last_block().height)
+        self.assertEqual(balance, self.get_balance(self._accounts[0]))
+
+    def test_recover_unapplied_blocks(self):
+        balance: int = self._transfer_icx(4)
+        self.assertGreater(self.icon_service_engine._icx_context_db.key_value_db.pending_block_count, 0)
+
+        # Close without applying the pending batches as if iconservice is killed
+        with patch.object(WriteBehindDatabase, "flush"):
+            self._close_and_reopen_iconservice()
+
+        self.assertEqual(self._block_height, self.icon_service_engine._get_last_block().height)
+        self.assertEqual(balance, self.get_balance(self._accounts[0]))
+
+        balance += self._transfer_icx(1)
+        self.assertEqual(balance, self.get_balance(self._accounts[0]))
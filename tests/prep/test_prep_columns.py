@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.icon_constant import IISS_MIN_IREP, PREP_MAIN_PREPS, PRepStatus
+from iconservice.prep.data.prep import PRep
+from iconservice.prep.data.prep_columns import PRepColumns
+
+
+def _create_preps(size: int):
+    return [
+        PRep(Address.from_prefix_and_int(AddressPrefix.EOA, i),
+             delegated=random.randint(10 ** 24, 10 ** 27),
+             irep=random.randint(IISS_MIN_IREP, IISS_MIN_IREP * 2))
+        for i in range(size)
+    ]
+
+
+def test_from_preps():
+    preps = _create_preps(100)
+    columns = PRepColumns.from_preps(preps)
+
+    assert len(columns) == len(preps)
+    assert columns.addresses == [prep.address for prep in preps]
+    assert columns.total_delegated() == sum(prep.delegated for prep in preps)
+    assert columns.total_delegated(PREP_MAIN_PREPS, 50) == sum(prep.delegated for prep in preps[PREP_MAIN_PREPS:50])
+
+
+def test_weighted_average_of_irep():
+    preps = _create_preps(100)
+    columns = PRepColumns.from_preps(preps)
+
+    main_preps = preps[:PREP_MAIN_PREPS]
+    expected: int = \
+        sum(prep.irep * prep.delegated for prep in main_preps) // sum(prep.delegated for prep in main_preps)
+    assert columns.weighted_average_of_irep(PREP_MAIN_PREPS, IISS_MIN_IREP) == expected
+
+    # No delegation
+    columns = PRepColumns.from_preps([PRep(prep.address, irep=prep.irep) for prep in main_preps])
+    assert columns.weighted_average_of_irep(PREP_MAIN_PREPS, IISS_MIN_IREP) == IISS_MIN_IREP
+
+
+def test_from_preps_with_unelectable_prep():
+    preps = _create_preps(PREP_MAIN_PREPS)
+    preps[-1].status = PRepStatus.DISQUALIFIED
+
+    with pytest.raises(AssertionError):
+        PRepColumns.from_preps(preps)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+import struct
+
+# noinspection PyPackageRequirements
+import pytest
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.block import Block
+from iconservice.icon_constant import PRepStatus, PenaltyReason, Revision
+from iconservice.prep.data import PRep, PRepContainer
+from iconservice.prep import snapshot
+from iconservice.prep.snapshot import save_preps, load_preps
+from iconservice.utils.checksum_file import write_checksum_file
+from iconservice.utils.msgpack_for_db import MsgPackForDB
+
+
+def _create_dummy_prep(index: int, status: 'PRepStatus') -> 'PRep':
+    return PRep(
+        address=Address(AddressPrefix.EOA, os.urandom(20)),
+        status=status,
+        penalty=PenaltyReason.NONE if status == PRepStatus.ACTIVE else PenaltyReason.LOW_PRODUCTIVITY,
+        name=f"node{index}",
+        country="KOR",
+        city="Seoul",
+        email=f"node{index}@example.com",
+        website=f"https://node{index}.example.com",
+        details=f"https://node{index}.example.com/details",
+        p2p_endpoint=f"node{index}.example.com:7100",
+        stake=random.randint(0, 10 ** 24),
+        delegated=random.randint(0, 10 ** 24),
+        irep=10_000,
+        irep_block_height=index,
+        block_height=index,
+        total_blocks=index * 10,
+        validated_blocks=index * 9,
+    )
+
+
+def _to_list(preps: 'PRepContainer') -> list:
+    return [(prep.to_bytes(Revision.LATEST.value), prep.stake, prep.delegated) for prep in preps.get_all_preps()]
+
+
+@pytest.fixture
+def preps() -> 'PRepContainer':
+    preps = PRepContainer()
+    for i in range(50):
+        preps.add(_create_dummy_prep(i, PRepStatus.ACTIVE if i % 5 else PRepStatus.DISQUALIFIED))
+    preps.freeze()
+    return preps
+
+
+@pytest.fixture
+def block() -> 'Block':
+    return Block(block_height=100, block_hash=os.urandom(32), timestamp=0, prev_hash=os.urandom(32))
+
+
+def test_save_and_load(tmp_path, preps, block):
+    path = str(tmp_path / "prep.snapshot")
+    save_preps(path, block, preps)
+
+    loaded = load_preps(path, block)
+    assert loaded.is_frozen()
+    assert _to_list(preps) == _to_list(loaded)
+    assert [prep.address for prep in preps] == [prep.address for prep in loaded]
+    assert preps.total_delegated == loaded.total_delegated
+
+    # The snapshot is only loaded once
+    assert not os.path.exists(path)
+    assert load_preps(path, block) is None
+
+
+def test_load_stale_snapshot(tmp_path, preps, block):
+    path = str(tmp_path / "prep.snapshot")
+
+    for other_block in (
+        Block(block.height + 1, block.hash, 0, block.prev_hash),
+        Block(block.height, os.urandom(32), 0, block.prev_hash),
+    ):
+        save_preps(path, block, preps)
+        assert load_preps(path, other_block) is None
+        assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: data[:-1],
+    lambda data: data[:10],
+    lambda data: b"XXXX" + data[4:],
+    lambda data: data[:100] + bytes([data[100] ^ 0xFF]) + data[101:],
+])
+def test_load_broken_snapshot(tmp_path, preps, block, corrupt):
+    path = str(tmp_path / "prep.snapshot")
+    save_preps(path, block, preps)
+
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(corrupt(data))
+
+    assert load_preps(path, block) is None
+    assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("payload", [
+    b"\xc1",
+    MsgPackForDB.dumps([[1, 2, 3]]),
+    MsgPackForDB.dumps([[MsgPackForDB.dumps([0]), 0, 0]]),
+    MsgPackForDB.dumps([[MsgPackForDB.dumps([0, None] + [-1] * 16), 0, 0]]),
+    MsgPackForDB.dumps([1]),
+    MsgPackForDB.dumps(1),
+])
+def test_load_undecodable_snapshot(tmp_path, block, payload):
+    # The checksum is valid but the payload is not made by save_preps()
+    path = str(tmp_path / "prep.snapshot")
+    header = struct.pack(snapshot._HEADER_STRUCT_FORMAT, block.height, block.hash)
+    write_checksum_file(path, snapshot._MAGIC_KEY, snapshot._FILE_VERSION, header, payload)
+
+    assert load_preps(path, block) is None
+    assert not os.path.exists(path)
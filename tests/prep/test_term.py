@@ -241,6 +241,28 @@ class TestTerm(unittest.TestCase):
         assert utils.is_all_flag_on(term.flags, TermFlag.MAIN_PREPS | TermFlag.SUB_PREPS)
         assert term.is_dirty()
 
+    def test_update_root_hash_incrementally(self):
+        term = self.term.copy()
+        root_hash: bytes = self.term.root_hash
+
+        for index in (0, PREP_MAIN_PREPS - 1, PREP_MAIN_PREPS // 2):
+            invalid_main_prep = term.main_preps[index]
+            term.update_invalid_elected_preps([PRep(invalid_main_prep.address, delegated=0)])
+
+            expected = Term.from_list(term.to_list(), term.total_elected_prep_delegated_snapshot)
+            assert term.root_hash == expected.root_hash
+
+        # Main P-Reps are removed without sub P-Reps to replace them
+        term.update_invalid_elected_preps([PRep(snapshot.address) for snapshot in term.sub_preps])
+        for index in (PREP_MAIN_PREPS - 1, 0):
+            term.update_invalid_elected_preps([PRep(term.main_preps[index].address)])
+
+            expected = Term.from_list(term.to_list(), term.total_elected_prep_delegated_snapshot)
+            assert term.root_hash == expected.root_hash
+
+        # The root hash of the copied term is not changed
+        assert self.term.root_hash == root_hash
+
     def test_to_list_and_from_list(self):
         self.term.set_preps(self.preps, PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS)
         assert not self.term.is_dirty()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+# noinspection PyPackageRequirements
+import pytest
+
+from iconservice.base.exception import IllegalFormatException
+from iconservice.utils.checksum_file import read_checksum_file, write_checksum_file
+
+MAGIC_KEY = b"TEST"
+VERSION = 1
+HEADER = b"header"
+PAYLOAD = os.urandom(100)
+
+
+@pytest.mark.parametrize("sync", [False, True])
+def test_write_and_read(tmp_path, sync):
+    path = str(tmp_path.joinpath("file"))
+    write_checksum_file(path, MAGIC_KEY, VERSION, HEADER, PAYLOAD, sync=sync)
+
+    assert (HEADER, PAYLOAD) == read_checksum_file(path, MAGIC_KEY, VERSION)
+    assert not os.path.exists(f"{path}.tmp")
+
+
+def test_write_replaces_old_one(tmp_path):
+    path = str(tmp_path.joinpath("file"))
+    write_checksum_file(path, MAGIC_KEY, VERSION, HEADER, PAYLOAD)
+    write_checksum_file(path, MAGIC_KEY, VERSION, b"", b"payload")
+
+    assert (b"", b"payload") == read_checksum_file(path, MAGIC_KEY, VERSION)
+
+
+@pytest.mark.parametrize("magic_key,version", [(b"XXXX", VERSION), (MAGIC_KEY, VERSION + 1)])
+def test_read_another_format(tmp_path, magic_key, version):
+    path = str(tmp_path.joinpath("file"))
+    write_checksum_file(path, MAGIC_KEY, VERSION, HEADER, PAYLOAD)
+
+    with pytest.raises(IllegalFormatException):
+        read_checksum_file(path, magic_key, version)
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: b"",
+    lambda data: data[:-1],
+    lambda data: data[:10],
+    lambda data: data + b"\x00",
+    lambda data: data[:30] + bytes([data[30] ^ 0xFF]) + data[31:],
+])
+def test_read_broken_file(tmp_path, corrupt):
+    path = str(tmp_path.joinpath("file"))
+    write_checksum_file(path, MAGIC_KEY, VERSION, HEADER, PAYLOAD)
+    with open(path, "rb") as f:
+        data: bytes = f.read()
+    with open(path, "wb") as f:
+        f.write(corrupt(data))
+
+    with pytest.raises(IllegalFormatException):
+        read_checksum_file(path, MAGIC_KEY, VERSION)
@@ -19,7 +19,7 @@ import inspect
 import os
 import sys
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from iconservice.deploy import DeployEngine, DeployStorage
 from iconservice.deploy.utils import convert_path_to_package_name
@@ -29,6 +29,7 @@ from iconservice.iconscore.icon_score_constant import ATTR_SCORE_GET_API
 from iconservice.iconscore.icon_score_context import ContextContainer, \
     IconScoreContextType
 from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iconscore.utils import get_package_name_by_address_and_tx_hash, get_score_code_cache_path
 from iconservice.utils import ContextEngine, ContextStorage
 from tests import create_address, create_tx_hash, rmtree
 
@@ -40,7 +41,7 @@ class TestIconScoreClassLoader(unittest.TestCase):
 
     def setUp(self):
         self._score_root_path = self._SCORE_ROOT_PATH
-        sys.path.append(self._score_root_path)
+        IconScoreClassLoader.init(self._score_root_path)
 
         IconScoreContext.engine = ContextEngine(
             icx=None,
@@ -67,14 +68,14 @@ class TestIconScoreClassLoader(unittest.TestCase):
     def tearDown(self):
         ContextContainer._pop_context()
         rmtree(self._score_root_path)
-        sys.path.remove(self._score_root_path)
+        IconScoreClassLoader.exit(self._score_root_path)
 
     @staticmethod
     def __ensure_dir(dir_path):
         if not os.path.exists(dir_path):
             os.makedirs(dir_path)
 
-    def load_proj(self, proj: str) -> callable:
+    def deploy_proj(self, proj: str) -> tuple:
         score_address = create_address(1, data=proj.encode())
         score_path = os.path.join(self._score_root_path, score_address.to_bytes().hex())
         os.makedirs(score_path, exist_ok=True)
@@ -84,6 +85,10 @@ class TestIconScoreClassLoader(unittest.TestCase):
 
         ref_path = os.path.join(TEST_ROOT_PATH, 'tests/sample/{}'.format(proj))
         os.symlink(ref_path, score_deploy_path, target_is_directory=True)
+        return score_address, tx_hash
+
+    def load_proj(self, proj: str) -> callable:
+        score_address, tx_hash = self.deploy_proj(proj)
         return IconScoreClassLoader.run(score_address, tx_hash, self._SCORE_ROOT_PATH)
 
     def test_install(self):
@@ -102,7 +107,30 @@ class TestIconScoreClassLoader(unittest.TestCase):
         ins_score.print_test()
         self.assertTrue(IconScoreBase in inspect.getmro(score))
 
-    def test_make_pkg_root_import(self):
+    def test_load_from_score_code_cache(self):
+        self.__ensure_dir(self._score_root_path)
+        score_address, tx_hash = self.deploy_proj('test_score02')
+        package_name: str = get_package_name_by_address_and_tx_hash(score_address, tx_hash)
+        cache_path: str = get_score_code_cache_path(self._score_root_path, score_address, tx_hash)
+
+        score = IconScoreClassLoader.run(score_address, tx_hash, self._score_root_path)
+        self.assertTrue(os.path.isfile(cache_path))
+
+        # Restart: SCORE modules are imported from the cache without being compiled
+        IconScoreClassLoader.exit(self._score_root_path)
+        IconScoreClassLoader.init(self._score_root_path)
+        for name in [name for name in sys.modules if name.startswith(score_address.to_bytes().hex())]:
+            del sys.modules[name]
+
+        with patch('iconservice.iconscore.icon_score_class_loader.compile_score_package') as compile_score_package:
+            reloaded_score = IconScoreClassLoader.run(score_address, tx_hash, self._score_root_path)
+            compile_score_package.assert_not_called()
+
+        self.assertIsNot(score, reloaded_score)
+        self.assertEqual(score.__name__, reloaded_score.__name__)
+        self.assertEqual(getattr(score, ATTR_SCORE_GET_API)(), getattr(reloaded_score, ATTR_SCORE_GET_API)())
+        self.assertIn(f'{package_name}.test_func.test_func', sys.modules)
+
         address = '010cb2b5d7cca1dec18c51de595155a4468711d4f4'
         tx_hash = '0x49485e08589256a68e02a63fa3484b16edd322a729394fbd6b543d77a7f68621'
         score_root_path = './.score'
@@ -63,7 +63,6 @@ GET_SCORE_INFO_PATCHER = patch('iconservice.iconscore.icon_score_context_util.Ic
 CREATE_SCORE_INFO_PATCHER = patch('iconservice.iconscore.icon_score_context_util.IconScoreContextUtil.create_score_info')
 DEPLOY_PATCHER = patch('iconservice.deploy.icon_score_deployer.IconScoreDeployer.deploy')
 DEPLOY_LEGACY_PATCHER = patch('iconservice.deploy.icon_score_deployer.IconScoreDeployer.deploy_legacy')
-REMOVE_PATH_PATCHER = patch('iconservice.deploy.engine.remove_path')
 MAKE_ANNOTATIONS_FROM_METHOD_PATCHER = patch('iconservice.base.type_converter.'
                                              'TypeConverter.make_annotations_from_method', return_value="annotations")
 CONVERT_DATA_PARAMS_PATCHER = patch('iconservice.base.type_converter.'
@@ -554,7 +553,7 @@ class TestScoreDeployEngine(unittest.TestCase):
         os.symlink.assert_called_with(None, score_deploy_path, target_is_directory=True)
 
     # case when revision3
-    @patch_several(DEPLOY_PATCHER, REMOVE_PATH_PATCHER, GET_SCORE_DEPLOY_PATH_PATCHER, OS_PATH_JOIN_PATCHER)
+    @patch_several(DEPLOY_PATCHER, GET_SCORE_DEPLOY_PATH_PATCHER, OS_PATH_JOIN_PATCHER)
     def test_write_score_to_score_deploy_path_case1(self):
         self._context.revision = 3
         score_path = 'score_path'
@@ -566,14 +565,13 @@ class TestScoreDeployEngine(unittest.TestCase):
 
         isde.get_score_deploy_path.assert_called_with(self._context.score_root_path, GOVERNANCE_SCORE_ADDRESS,
                                                       self._context.tx.hash)
-        os.path.join.assert_called_with(self._context.score_root_path, GOVERNANCE_SCORE_ADDRESS.to_bytes().hex(),
-                                        f"0x{self._context.tx.hash.hex()}")
-        isde.remove_path.assert_called_with(score_path)
+        # The existing path is replaced by IconScoreDeployer.deploy() without being removed in advance
+        os.path.join.assert_not_called()
         IconScoreDeployer.deploy.assert_called_with(score_deploy_path, None, 3)
 
     # case when revision2
-    @patch_several(DEPLOY_PATCHER, REMOVE_PATH_PATCHER, GET_SCORE_DEPLOY_PATH_PATCHER, OS_PATH_JOIN_PATCHER)
-    def test_write_score_to_score_deploy_path_case1(self):
+    @patch_several(DEPLOY_PATCHER, GET_SCORE_DEPLOY_PATH_PATCHER, OS_PATH_JOIN_PATCHER)
+    def test_write_score_to_score_deploy_path_case2(self):
         self._context.revision = 2
         score_path = 'score_path'
         score_deploy_path = 'score_deploy_path'
@@ -585,13 +583,11 @@ class TestScoreDeployEngine(unittest.TestCase):
         isde.get_score_deploy_path.assert_called_with(self._context.score_root_path, GOVERNANCE_SCORE_ADDRESS,
                                                       self._context.tx.hash)
         os.path.join.assert_not_called()
-        isde.remove_path.assert_not_called()
         IconScoreDeployer.deploy.assert_called_with(score_deploy_path, None, 2)
 
     # case when revision0
-    @patch_several(DEPLOY_PATCHER, DEPLOY_LEGACY_PATCHER, REMOVE_PATH_PATCHER,
-                   GET_SCORE_DEPLOY_PATH_PATCHER, OS_PATH_JOIN_PATCHER)
-    def test_write_score_to_score_deploy_path_case1(self):
+    @patch_several(DEPLOY_PATCHER, DEPLOY_LEGACY_PATCHER, GET_SCORE_DEPLOY_PATH_PATCHER, OS_PATH_JOIN_PATCHER)
+    def test_write_score_to_score_deploy_path_case3(self):
         score_path = 'score_path'
         score_deploy_path = 'score_deploy_path'
         isde.get_score_deploy_path.return_value = 'score_deploy_path'
@@ -602,7 +598,6 @@ class TestScoreDeployEngine(unittest.TestCase):
         isde.get_score_deploy_path.assert_called_with(self._context.score_root_path, GOVERNANCE_SCORE_ADDRESS,
                                                       self._context.tx.hash)
         os.path.join.assert_not_called()
-        isde.remove_path.assert_not_called()
         IconScoreDeployer.deploy.assert_not_called()
         IconScoreDeployer.deploy_legacy.assert_called_with(score_deploy_path, None)
 
@@ -16,6 +16,7 @@
 
 import os
 import unittest
+from unittest.mock import patch
 
 from iconservice.base.address import AddressPrefix, Address
 from iconservice.base.exception import ExceptionCode
@@ -90,7 +91,8 @@ class TestIconScoreDeployer(unittest.TestCase):
         with self.assertRaises(BaseException) as e:
             IconScoreDeployer.deploy(score_deploy_path, self.read_zipfile_as_byte(self.bad_zip_file_path))
         self.assertEqual(e.exception.code, ExceptionCode.INVALID_PACKAGE)
-        self.assertTrue(os.path.exists(score_deploy_path))
+        self.assertFalse(os.path.exists(score_deploy_path))
+        self.assertFalse(os.path.exists(f'{score_deploy_path}.staging'))
 
         # Case when the user specifies an installation path that does not have permission.
         score_deploy_path: str = get_score_deploy_path('/', self.address, tx_hash1)
@@ -227,11 +229,70 @@ class TestIconScoreDeployer(unittest.TestCase):
                 IconScoreDeployer.deploy(score_deploy_path, self.read_zipfile_as_byte(self.archive_path), Revision.THREE.value)
             self.assertEqual(e.exception.code, ExceptionCode.INVALID_PACKAGE)
             self.assertEqual(e.exception.message, "package.json not found")
-            self.assertTrue(os.path.exists(score_deploy_path))
+            self.assertFalse(os.path.exists(score_deploy_path))
 
             score_path: str = get_score_path(self.score_root_path, address)
             remove_path(score_path)
 
+    def test_deploy_hex_string(self):
+        self.archive_path = os.path.join(DIRECTORY_PATH, 'sample', 'score_registry.zip')
+        data: bytes = self.read_zipfile_as_byte(self.archive_path)
+
+        for revision in (Revision.TWO.value, Revision.THREE.value):
+            score_deploy_path: str = get_score_deploy_path(self.score_root_path, self.address, create_tx_hash())
+            IconScoreDeployer.deploy(score_deploy_path, data, revision)
+
+            hex_score_deploy_path: str = get_score_deploy_path(self.score_root_path, self.address, create_tx_hash())
+            with patch('iconservice.deploy.icon_score_deployer.HEX_CHUNK_SIZE', 64):
+                IconScoreDeployer.deploy(hex_score_deploy_path, f'0x{data.hex()}', revision)
+
+            installed_files = self.get_installed_files(score_deploy_path)
+            self.assertEqual(installed_files, self.get_installed_files(hex_score_deploy_path))
+            for file in installed_files:
+                with open(os.path.join(score_deploy_path, file), 'rb') as f1, \
+                        open(os.path.join(hex_score_deploy_path, file), 'rb') as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+        score_deploy_path: str = get_score_deploy_path(self.score_root_path, self.address, create_tx_hash())
+        IconScoreDeployer.deploy_legacy(score_deploy_path, f'0x{data.hex()}')
+        self.assertTrue(self.check_package_json_validity(self.get_installed_files(score_deploy_path)))
+
+    def test_deploy_invalid_hex_string(self):
+        score_deploy_path: str = get_score_deploy_path(self.score_root_path, self.address, create_tx_hash())
+        data: str = f'0x{self.read_zipfile_as_byte(os.path.join(DIRECTORY_PATH, "sample", "nodir.zip")).hex()}'
+
+        for invalid_data in (data[:-1], data[:100] + 'x' + data[101:], '0x12 3'):
+            with self.assertRaises(ValueError) as e:
+                IconScoreDeployer.deploy(score_deploy_path, invalid_data, Revision.THREE.value)
+            with self.assertRaises(ValueError) as expected:
+                bytes.fromhex(invalid_data[2:])
+            self.assertEqual(str(expected.exception), str(e.exception))
+            self.assertFalse(os.path.exists(score_deploy_path))
+
+    def test_redeploy(self):
+        score_deploy_path: str = get_score_deploy_path(self.score_root_path, self.address, create_tx_hash())
+
+        IconScoreDeployer.deploy(score_deploy_path,
+                                 self.read_zipfile_as_byte(os.path.join(DIRECTORY_PATH, 'sample', 'score_registry.zip')),
+                                 Revision.THREE.value)
+        IconScoreDeployer.deploy(score_deploy_path,
+                                 self.read_zipfile_as_byte(os.path.join(DIRECTORY_PATH, 'sample', 'nodir.zip')),
+                                 Revision.THREE.value)
+
+        installed_files = self.get_installed_files(score_deploy_path)
+        installed_files.sort()
+        self.assertEqual(['__init__.py', 'package.json', 'sample_token.py'], installed_files)
+        self.assertEqual([os.path.basename(score_deploy_path)], os.listdir(self.score_path))
+
+        # The old SCORE files are kept if the new one is invalid
+        with self.assertRaises(BaseException) as e:
+            IconScoreDeployer.deploy(score_deploy_path,
+                                     self.read_zipfile_as_byte(os.path.join(DIRECTORY_PATH, 'sample', 'badzipfile.zip')),
+                                     Revision.THREE.value)
+        self.assertEqual(e.exception.code, ExceptionCode.INVALID_PACKAGE)
+        self.assertEqual(installed_files, sorted(self.get_installed_files(score_deploy_path)))
+        self.assertEqual([os.path.basename(score_deploy_path)], os.listdir(self.score_path))
+
     def tearDown(self):
         remove_path(self.score_path)
 
@@ -179,7 +179,9 @@ class TestTransactionResult(unittest.TestCase):
         tx_result.logs_bloom.add(b'1')
         tx_result.logs_bloom.add(b'2')
         tx_result.logs_bloom.add(b'3')
-        tx_result.block = Block(123, hashlib.sha3_256(b'block').digest(), 1, None, 0)
+        block = Block(123, hashlib.sha3_256(b'block').digest(), 1, None, 0)
+        tx_result.block_height = block.height
+        tx_result.block_hash = block.hash
 
         camel_dict = tx_result.to_dict(to_camel_case)
 
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import Mock
+
+from iconservice.icon_constant import IconScoreContextType
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.iconscore.icon_score_stats import ScoreStats
+from tests import create_address
+
+
+class TestScoreStats(unittest.TestCase):
+    def setUp(self):
+        self.score_stats = ScoreStats(enabled=True)
+        self.context = IconScoreContext(IconScoreContextType.INVOKE)
+        self.context.step_counter = Mock()
+        self.context.step_counter.step_used = 0
+
+    def _consume(self, step: int):
+        self.context.step_counter.step_used += step
+
+    def test_disabled(self):
+        score_stats = ScoreStats()
+        self.assertIs(score_stats.measure(self.context, create_address(1), "a"),
+                      score_stats.measure(self.context, create_address(1), "b"))
+
+        score_stats.start_block(1)
+        with score_stats.measure(self.context, create_address(1), "a"):
+            score_stats.on_db_read(self.context, 10)
+        score_stats.end_block()
+
+        self.assertEqual({"blockHeight": -1, "lastBlock": [], "total": []}, score_stats.get_stats())
+
+    def test_query_is_not_measured(self):
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        with self.score_stats.measure(context, create_address(1), "a"):
+            pass
+
+        self.score_stats.end_block()
+        self.assertEqual([], self.score_stats.get_stats()["lastBlock"])
+
+    def test_nested_call(self):
+        score_a, score_b = create_address(1), create_address(1)
+
+        self.score_stats.start_block(10)
+        for _ in range(2):
+            with self.score_stats.measure(self.context, score_a, "outer"):
+                self._consume(100)
+                self.score_stats.on_db_read(self.context, 5)
+
+                with self.score_stats.measure(self.context, score_b, "inner"):
+                    self._consume(30)
+                    self.score_stats.on_db_write(self.context, 7)
+
+        self.score_stats.end_block()
+
+        stats: dict = self.score_stats.get_stats()
+        self.assertEqual(10, stats["blockHeight"])
+
+        last_block: dict = {(item["score"], item["method"]): item for item in stats["lastBlock"]}
+        outer: dict = last_block[(score_a, "outer")]
+        inner: dict = last_block[(score_b, "inner")]
+
+        self.assertEqual(2, outer["count"])
+        self.assertEqual(200, outer["steps"])
+        self.assertEqual((2, 10, 0, 0), (outer["reads"], outer["readBytes"], outer["writes"], outer["writtenBytes"]))
+
+        self.assertEqual(2, inner["count"])
+        self.assertEqual(60, inner["steps"])
+        self.assertEqual((0, 0, 2, 14), (inner["reads"], inner["readBytes"], inner["writes"], inner["writtenBytes"]))
+
+        # The next block rolls over the last block
+        self.score_stats.start_block(11)
+        with self.score_stats.measure(self.context, score_a, "outer"):
+            self._consume(100)
+        self.score_stats.end_block()
+
+        stats: dict = self.score_stats.get_stats()
+        self.assertEqual(11, stats["blockHeight"])
+        self.assertEqual(1, len(stats["lastBlock"]))
+
+        total: dict = {(item["score"], item["method"]): item for item in stats["total"]}
+        self.assertEqual(3, total[(score_a, "outer")]["count"])
+        self.assertEqual(300, total[(score_a, "outer")]["steps"])
+
+    def test_unfinished_block_is_discarded(self):
+        self.score_stats.start_block(1)
+        with self.score_stats.measure(self.context, create_address(1), "a"):
+            pass
+
+        # The block is invoked again without end_block()
+        self.score_stats.start_block(1)
+        self.score_stats.end_block()
+        self.assertEqual([], self.score_stats.get_stats()["total"])
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+import iconservice
+
+# Subsystems which are not needed unless the service or a SCORE runs
+HEAVY_MODULES = (
+    "iconservice.icon_service_engine",
+    "iconservice.iconscore.icon_score_base",
+    "iconservice.iiss.engine",
+    "iconservice.prep.engine",
+    "iconservice.database.factory",
+    "earlgrey",
+    "asyncio",
+)
+
+# (statement, module) which must not load HEAVY_MODULES
+LIGHT_IMPORTS = (
+    ("import iconservice.base.address", "iconservice.base.address"),
+    ("from iconservice.base.type_converter import TypeConverter", "iconservice.base.type_converter"),
+    ("import iconservice.icon_service_cli", "iconservice.icon_service_cli"),
+)
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Returns the cumulative import time of each module imported by a statement in a new interpreter
+
+    :return: {module name: cumulative import time in microseconds}
+    """
+    root_path: str = os.path.dirname(os.path.dirname(os.path.abspath(iconservice.__file__)))
+    ret = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                         cwd=root_path, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+    import_times = {}
+    for line in ret.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        prefix, _, columns = line.partition(":")
+        if prefix != "import time":
+            continue
+
+        columns = columns.split("|")
+        if len(columns) != 3 or not columns[1].strip().isdigit():
+            # The header line or output which is not from -X importtime
+            continue
+        import_times[columns[2].strip()] = int(columns[1])
+
+    return import_times
+
+
+class TestImportTime(unittest.TestCase):
+    @unittest.skipIf(sys.version_info < (3, 7), "-X importtime is supported since python 3.7")
+    def test_import_light_modules(self):
+        for statement, module in LIGHT_IMPORTS:
+            import_times: Dict[str, int] = _import_times(statement)
+            self.assertIn(module, import_times, statement)
+
+            for name in HEAVY_MODULES:
+                self.assertNotIn(name, import_times, statement)
+
+    def test_import_score_apis(self):
+        namespace = {}
+        exec("from iconservice import *", namespace)
+
+        for name in iconservice.__all__:
+            self.assertIs(getattr(iconservice, name), namespace[name])
+        self.assertIn("IconScoreBase", dir(iconservice))
+
+        with self.assertRaises(AttributeError):
+            getattr(iconservice, "NotExistentApi")
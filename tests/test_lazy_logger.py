@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import unittest
+from unittest.mock import Mock, patch
+
+from iconcommons import IconConfig, Logger
+from iconcommons.logger.logger import icon_logger
+
+from iconservice.base.block import Block
+from iconservice.base.transaction import Transaction
+from iconservice.base.type_converter_templates import ConstantKeys
+from iconservice.icon_inner_service import IconScoreInnerTask
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.utils.bloom import BloomFilter
+from iconservice.utils.lazy_logger import AsyncLogWriter, is_log_enabled, summarize_bytes, summarize_text, \
+    summarize_invoke_results
+from tests import create_address, create_block_hash, create_tx_hash
+
+
+def _set_level(level: int):
+    icon_logger.setLevel(level)
+    # icon_logger is not registered to the logging manager, so its level cache is not cleared by setLevel()
+    if hasattr(icon_logger, "_cache"):
+        icon_logger._cache.clear()
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: 'logging.LogRecord'):
+        self.records.append(record)
+
+
+class TestLazyLogger(unittest.TestCase):
+    def setUp(self):
+        self.level = icon_logger.level
+        self.handlers = list(icon_logger.handlers)
+
+        self.handler = _RecordingHandler()
+        icon_logger.handlers.clear()
+        icon_logger.addHandler(self.handler)
+
+    def tearDown(self):
+        AsyncLogWriter.stop()
+        _set_level(self.level)
+        icon_logger.handlers.clear()
+        for handler in self.handlers:
+            icon_logger.addHandler(handler)
+
+    def test_is_log_enabled(self):
+        _set_level(logging.WARNING)
+        self.assertFalse(is_log_enabled(logging.DEBUG))
+        self.assertFalse(is_log_enabled(logging.INFO))
+        self.assertTrue(is_log_enabled(logging.WARNING))
+
+        _set_level(logging.DEBUG)
+        self.assertTrue(is_log_enabled(logging.DEBUG))
+
+    def test_summarize_bytes(self):
+        self.assertEqual("None", summarize_bytes(None))
+        self.assertEqual("0102", summarize_bytes(b"\x01\x02", limit=2))
+        self.assertEqual("0102...(3 bytes)", summarize_bytes(b"\x01\x02\x03", limit=2))
+
+    def test_summarize_text(self):
+        self.assertEqual("{'a': 1}", summarize_text({"a": 1}))
+        self.assertEqual("abc...(6 chars)", summarize_text("abcdef", limit=3))
+
+    def test_summarize_invoke_results(self):
+        results = {
+            "txResults": [{"status": 1}, {"status": 0}, {"status": 1}],
+            "stateRootHash": "ab",
+            "addedTransactions": {}
+        }
+        self.assertEqual("txResults=3 failures=1 stateRootHash=ab addedTransactions=0 prep=False",
+                         summarize_invoke_results(results))
+
+        # old version: txResults is a dict of which key is tx hash
+        results["txResults"] = {"00": {"status": 0}}
+        results["prep"] = {}
+        self.assertEqual("txResults=1 failures=1 stateRootHash=ab addedTransactions=0 prep=True",
+                         summarize_invoke_results(results))
+
+    def test_async_log_writer(self):
+        _set_level(logging.INFO)
+
+        AsyncLogWriter.start()
+        self.assertTrue(AsyncLogWriter.is_running())
+        self.assertNotIn(self.handler, icon_logger.handlers)
+
+        for i in range(100):
+            Logger.info(f"message {i}", "TEST")
+
+        # All queued records are written on stop
+        AsyncLogWriter.stop()
+        self.assertFalse(AsyncLogWriter.is_running())
+        self.assertEqual([self.handler], icon_logger.handlers)
+        self.assertEqual(100, len(self.handler.records))
+        self.assertEqual("TEST message 99", self.handler.records[-1].getMessage())
+
+
+class TestInvokeLogging(unittest.TestCase):
+    """Block data is formatted for IconScoreInnerTask._invoke() only if its log level is enabled
+    """
+    TX_COUNT = 10
+
+    def setUp(self):
+        self.level = icon_logger.level
+        self.handlers = list(icon_logger.handlers)
+        icon_logger.handlers.clear()
+        icon_logger.addHandler(logging.NullHandler())
+
+        with patch('iconservice.icon_inner_service.IconScoreInnerTask._open'):
+            self.inner_task = IconScoreInnerTask(Mock(spec=IconConfig))
+        self.inner_task._icon_service_engine = Mock(spec=IconServiceEngine)
+
+        block = Block(1, create_block_hash(), 0, create_block_hash(), 0)
+        tx_results = []
+        for i in range(self.TX_COUNT):
+            tx = Transaction(tx_hash=create_tx_hash(), index=i, origin=create_address(), to=create_address())
+            tx_result = TransactionResult(tx=tx, block=block, to=tx.to,
+                                          step_used=100_000, step_price=10 ** 10,
+                                          cumulative_step_used=100_000 * (i + 1),
+                                          event_logs=[], logs_bloom=BloomFilter(),
+                                          status=TransactionResult.SUCCESS)
+            tx_results.append(tx_result)
+
+        self.inner_task._icon_service_engine.invoke.return_value = (tx_results, create_block_hash(), {}, None)
+
+        block = {
+            ConstantKeys.BLOCK_HEIGHT: hex(1),
+            ConstantKeys.BLOCK_HASH: create_block_hash().hex(),
+            ConstantKeys.TIMESTAMP: hex(0),
+            ConstantKeys.PREV_BLOCK_HASH: create_block_hash().hex()
+        }
+        self.request = {"block": block, "transactions": [], "isBlockEditable": hex(0)}
+
+    def tearDown(self):
+        _set_level(self.level)
+        icon_logger.handlers.clear()
+        for handler in self.handlers:
+            icon_logger.addHandler(handler)
+
+    def _invoke(self, level: int) -> int:
+        """Returns how many times the invoke results are summarized
+        """
+        _set_level(level)
+
+        with patch('iconservice.icon_inner_service.summarize_invoke_results',
+                   wraps=summarize_invoke_results) as summarize:
+            response = self.inner_task._invoke(self.request)
+            self.assertEqual(self.TX_COUNT, len(response["txResults"]))
+            return summarize.call_count
+
+    def test_invoke_log_formatting_by_log_level(self):
+        self.assertEqual(0, self._invoke(logging.WARNING))
+        self.assertEqual(1, self._invoke(logging.INFO))
+        # Whole results are logged instead of their summary
+        self.assertEqual(0, self._invoke(logging.DEBUG))
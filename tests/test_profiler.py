@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from iconservice.profiler import Counter, Histogram, MetricsServer, Phase, Profiler
+
+
+class TestHistogram(unittest.TestCase):
+    def test_observe(self):
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual([2, 1, 1], histogram.counts)
+        self.assertEqual([2, 3, 4], histogram.cumulative_counts())
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(3.65, histogram.sum)
+        self.assertEqual(3.0, histogram.max)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled(self):
+        profiler = Profiler()
+
+        # The shared no-op timer is returned
+        self.assertIs(profiler.timer(Phase.INVOKE), profiler.timer(Phase.COMMIT))
+        with profiler.timer(Phase.INVOKE):
+            pass
+        profiler.increment(Counter.BLOCKS)
+
+        self.assertEqual({"phases": {}, "counters": {}}, profiler.get_summary())
+
+    def test_timer(self):
+        profiler = Profiler(enabled=True)
+        for _ in range(3):
+            with profiler.timer(Phase.INVOKE_TX):
+                pass
+
+        # Elapsed time is recorded even if an exception is raised
+        with self.assertRaises(ValueError):
+            with profiler.timer(Phase.INVOKE_TX):
+                raise ValueError()
+
+        profiler.increment(Counter.TRANSACTIONS, 4)
+
+        summary: dict = profiler.get_summary()
+        self.assertEqual(4, summary["phases"][Phase.INVOKE_TX]["count"])
+        self.assertEqual({Counter.TRANSACTIONS: 4}, summary["counters"])
+
+        profiler.reset()
+        self.assertEqual({"phases": {}, "counters": {}}, profiler.get_summary())
+
+    def test_export(self):
+        profiler = Profiler(enabled=True)
+        profiler.observe(Phase.COMMIT, 0.003)
+        profiler.observe(Phase.COMMIT, 20.0)
+        profiler.increment(Counter.COMMITS, 2)
+
+        lines = profiler.export().splitlines()
+        self.assertIn('iconservice_phase_duration_seconds_bucket{phase="commit",le="0.001"} 0', lines)
+        self.assertIn('iconservice_phase_duration_seconds_bucket{phase="commit",le="0.005"} 1', lines)
+        self.assertIn('iconservice_phase_duration_seconds_bucket{phase="commit",le="+Inf"} 2', lines)
+        self.assertIn('iconservice_phase_duration_seconds_count{phase="commit"} 2', lines)
+        self.assertIn('iconservice_commits_total 2', lines)
+
+
+class TestMetricsServer(unittest.TestCase):
+    def test_metrics(self):
+        profiler = Profiler(enabled=True)
+        profiler.increment(Counter.BLOCKS)
+
+        server = MetricsServer(profiler, port=0)
+        server.start()
+        try:
+            with urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+                self.assertEqual(200, response.status)
+                self.assertIn("iconservice_blocks_total 1", response.read().decode())
+
+            with self.assertRaises(HTTPError):
+                urlopen(f"http://127.0.0.1:{server.port}/unknown")
+        finally:
+            server.stop()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from iconservice.base.address import ZERO_SCORE_ADDRESS
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.icon_constant import IconScoreContextType
+from iconservice.icx.storage import Storage as IcxStorage
+from iconservice.query_cache import QueryCache
+from tests import create_address
+
+
+class TestQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = QueryCache(max_size=3)
+        self.score_address = create_address(1)
+
+    def _make_call_key(self, owner) -> tuple:
+        params = {
+            "to": self.score_address,
+            "dataType": "call",
+            "data": {"method": "balanceOf", "params": {"_owner": str(owner)}}
+        }
+        return QueryCache.make_key("icx_call", params)
+
+    def test_disabled(self):
+        cache = QueryCache()
+        self.assertFalse(cache.enabled)
+
+        key = QueryCache.make_key("icx_getTotalSupply", {})
+        self.assertFalse(cache.put(key, 100, [b"total_supply"], cache.generation))
+        self.assertEqual((False, None), cache.get(key))
+
+    def test_is_cacheable(self):
+        self.assertTrue(QueryCache.is_cacheable("icx_getBalance", {"address": create_address()}))
+        self.assertTrue(QueryCache.is_cacheable("icx_call", {"to": self.score_address}))
+        self.assertFalse(QueryCache.is_cacheable("icx_call", {"to": ZERO_SCORE_ADDRESS}))
+        self.assertFalse(QueryCache.is_cacheable("ise_getStatus", {}))
+
+    def test_make_key(self):
+        owner = create_address()
+        self.assertEqual(self._make_call_key(owner), self._make_call_key(owner))
+        self.assertNotEqual(self._make_call_key(owner), self._make_call_key(create_address()))
+
+        # Equal values with different types are not the same key
+        self.assertNotEqual(QueryCache.make_key("icx_call", {"value": 1}),
+                            QueryCache.make_key("icx_call", {"value": True}))
+
+    def test_invalidate_by_touched_keys(self):
+        owner0, owner1 = create_address(), create_address()
+        key0, key1 = self._make_call_key(owner0), self._make_call_key(owner1)
+
+        self.assertTrue(self.cache.put(key0, 10, [b"score", b"owner0"], self.cache.generation))
+        self.assertTrue(self.cache.put(key1, 20, [b"score", b"owner1"], self.cache.generation))
+
+        # A block which changes owner1 only
+        self.assertEqual(1, self.cache.invalidate([b"owner1", b"others"]))
+        self.assertEqual((True, 10), self.cache.get(key0))
+        self.assertEqual((False, None), self.cache.get(key1))
+
+        # A block which changes the state shared by all results
+        self.assertEqual(1, self.cache.invalidate([b"score"]))
+        self.assertEqual(0, len(self.cache))
+
+    def test_put_with_old_generation(self):
+        key = self._make_call_key(create_address())
+        generation: int = self.cache.generation
+
+        # A block is committed while computing the result
+        self.cache.invalidate([])
+        self.assertFalse(self.cache.put(key, 10, [b"owner"], generation))
+        self.assertNotIn(key, self.cache)
+
+    def test_max_size(self):
+        keys = [QueryCache.make_key("icx_getBalance", {"address": create_address()}) for _ in range(4)]
+        for i, key in enumerate(keys):
+            self.cache.put(key, i, [bytes([i])], self.cache.generation)
+
+        self.assertEqual(3, len(self.cache))
+        self.assertNotIn(keys[0], self.cache)
+
+        # Evicted entry is removed from the index as well
+        self.assertEqual(0, self.cache.invalidate([bytes([0])]))
+        self.assertEqual(1, self.cache.invalidate([bytes([1])]))
+
+    def test_result_is_copied(self):
+        key = QueryCache.make_key("icx_call", {"to": self.score_address})
+        result = {"value": 1, "list": [1, 2]}
+        self.cache.put(key, result, [b"key"], self.cache.generation)
+        result["list"].append(3)
+
+        _, cached = self.cache.get(key)
+        cached["value"] = hex(cached["value"])
+        self.assertEqual((True, {"value": 1, "list": [1, 2]}), self.cache.get(key))
+
+    def test_mark_block_dependent(self):
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        context.mark_block_dependent()
+        self.assertIsNone(context.read_keys)
+
+        context.read_keys = set()
+        context.mark_block_dependent()
+        self.assertEqual({IcxStorage.LAST_BLOCK_KEY}, context.read_keys)
+
+        key = QueryCache.make_key("icx_call", {"to": self.score_address})
+        self.cache.put(key, 1, context.read_keys, self.cache.generation)
+        self.assertEqual(1, self.cache.invalidate([b"key", IcxStorage.LAST_BLOCK_KEY]))
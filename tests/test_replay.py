@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from iconservice.base.exception import IllegalFormatException
+from iconservice.icon_constant import RCCalculateResult
+from iconservice.iiss.reward_calc.ipc.message import CalculateDoneNotification
+from iconservice.replay import RecordType, ReplayRecorder, ReplayReader, StubRewardCalcProxy
+from iconservice.replay.replayer import ReplayReport, _percentile
+from iconservice.replay.reward_calc_proxy import RecordedResponses, CLAIM_ISCORE, QUERY_CALCULATE_RESULT
+from tests import create_address, create_block_hash, create_tx_hash
+
+
+class TestReplayRecorder(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "replay.dat")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_record_and_read(self):
+        invoke_request = {
+            "block": {"blockHeight": "0x1", "blockHash": create_block_hash().hex()},
+            "transactions": [{"method": "icx_sendTransaction", "params": {"txHash": create_tx_hash().hex()}}],
+            "isBlockEditable": "0x0"
+        }
+        precommit_request = {"blockHeight": "0x1", "blockHash": invoke_request["block"]["blockHash"]}
+        state_root_hash: bytes = create_block_hash()
+        calc_state_hash: bytes = create_block_hash()
+
+        recorder = ReplayRecorder(self.path)
+        recorder.open()
+
+        # The responses of a block which has failed to be invoked are discarded
+        recorder.add_rc_response(CLAIM_ISCORE, (1, 0))
+        recorder.begin_invoke()
+        recorder.add_rc_response(CLAIM_ISCORE, (10 ** 30, 1))
+        recorder.record_invoke(invoke_request, state_root_hash)
+        recorder.record_write_precommit_state(precommit_request)
+        recorder.record_calculate_done(CalculateDoneNotification(1, True, 100, 2 ** 70, calc_state_hash))
+        recorder.close()
+
+        # Appended to the existing file
+        recorder = ReplayRecorder(self.path)
+        recorder.open()
+        recorder.record_remove_precommit_state(precommit_request)
+        recorder.close()
+
+        records = list(ReplayReader(self.path))
+        self.assertEqual([RecordType.INVOKE, RecordType.WRITE_PRECOMMIT_STATE,
+                          RecordType.CALCULATE_DONE, RecordType.REMOVE_PRECOMMIT_STATE],
+                         [record_type for record_type, _ in records])
+        self.assertEqual([invoke_request, state_root_hash, [[CLAIM_ISCORE, [10 ** 30, 1]]]], records[0][1])
+        self.assertEqual([precommit_request], records[1][1])
+        self.assertEqual([[True, 100, 2 ** 70, calc_state_hash]], records[2][1])
+        self.assertEqual([precommit_request], records[3][1])
+
+    def test_truncated_record(self):
+        recorder = ReplayRecorder(self.path)
+        recorder.open()
+        recorder.record_write_precommit_state({"blockHeight": "0x1"})
+        recorder.record_write_precommit_state({"blockHeight": "0x2"})
+        recorder.close()
+
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+
+        records = list(ReplayReader(self.path))
+        self.assertEqual([(RecordType.WRITE_PRECOMMIT_STATE, [{"blockHeight": "0x1"}])], records)
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"IWAL\x00\x00\x00\x01")
+
+        with self.assertRaises(IllegalFormatException):
+            list(ReplayReader(self.path))
+
+
+class TestStubRewardCalcProxy(unittest.TestCase):
+    def test_recorded_responses(self):
+        responses = RecordedResponses()
+        proxy = StubRewardCalcProxy(icon_rc_path="", ipc_timeout=0, responses=responses)
+        address = create_address()
+
+        responses.reset([[CLAIM_ISCORE, [100, 9]],
+                         [CLAIM_ISCORE, [200, 9]],
+                         [QUERY_CALCULATE_RESULT, [RCCalculateResult.SUCCESS, 5, 300, b"hash"]]])
+
+        self.assertEqual((100, 9), proxy.claim_iscore(address, 10, create_block_hash(), 0, create_tx_hash()))
+        self.assertEqual((200, 9), proxy.claim_iscore(address, 10, create_block_hash(), 1, create_tx_hash()))
+        self.assertEqual((RCCalculateResult.SUCCESS, 5, 300, b"hash"), proxy.query_calculate_result(5))
+
+        # Defaults when no response is recorded
+        self.assertEqual((0, 10), proxy.claim_iscore(address, 10, create_block_hash(), 2, create_tx_hash()))
+        self.assertEqual((RCCalculateResult.SUCCESS, 5, 0, None), proxy.query_calculate_result(5))
+
+        # Responses of the previous block are discarded
+        responses.reset([])
+        responses.reset([[CLAIM_ISCORE, [1, 11]]])
+        self.assertEqual((1, 11), proxy.claim_iscore(address, 12, create_block_hash(), 0, create_tx_hash()))
+
+        self.assertTrue(proxy.is_reward_calculator_ready())
+        self.assertEqual((True, 10, b"hash"), proxy.commit_block(True, 10, b"hash"))
+
+
+class TestReplayReport(unittest.TestCase):
+    def test_percentile(self):
+        values = [float(i) for i in range(100, 0, -1)]
+        self.assertEqual(50.0, _percentile(values, 50))
+        self.assertEqual(99.0, _percentile(values, 99))
+        self.assertEqual(100.0, _percentile(values, 100))
+        self.assertEqual(1.0, _percentile([1.0], 99))
+        self.assertEqual(0.0, _percentile([], 50))
+
+    def test_report(self):
+        report = ReplayReport()
+        report.blocks = 4
+        report.transactions = 40
+        report.invoke_latencies = [0.5, 0.5, 0.5, 0.5]
+        report.commit_latencies = [0.5, 0.5, 0.5, 0.5]
+        report.mismatches.append((3, b"\x01", b"\x02"))
+
+        self.assertEqual(4.0, report.elapsed)
+        self.assertEqual(1.0, report.blocks_per_sec)
+        self.assertEqual(10.0, report.transactions_per_sec)
+
+        data: dict = report.to_dict()
+        self.assertEqual({"p50": 0.5, "p99": 0.5}, data["invoke"])
+        self.assertEqual([{"blockHeight": 3, "expected": "01", "actual": "02"}], data["mismatches"])
+        self.assertIn("block_height=3 expected=01 actual=02", str(report))
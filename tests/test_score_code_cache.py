@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import unittest
+
+from iconservice.iconscore.score_code_cache import compile_score_package, save_score_code, load_score_code
+from tests import create_tx_hash, rmtree
+
+TEST_ROOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../'))
+
+
+class TestScoreCodeCache(unittest.TestCase):
+    _ROOT_PATH = '.score_code_cache'
+
+    def setUp(self):
+        self._score_deploy_path = os.path.join(self._ROOT_PATH, 'score')
+        self._cache_path = os.path.join(self._ROOT_PATH, 'score.cache')
+        self._tx_hash = create_tx_hash()
+        shutil.copytree(os.path.join(TEST_ROOT_PATH, 'tests/sample/test_score02'), self._score_deploy_path)
+
+    def tearDown(self):
+        rmtree(self._ROOT_PATH)
+
+    def test_compile_score_package(self):
+        modules: dict = compile_score_package(self._score_deploy_path)
+
+        self.assertEqual({'', 'call_class1', 'call_class2', 'print_func', 'print_func.print_func',
+                          'test_func', 'test_func.test_func'}, set(modules))
+        self.assertEqual({'', 'print_func', 'test_func'},
+                         {name for name, (is_package, _) in modules.items() if is_package})
+
+        is_package, code = modules['test_func.test_func']
+        self.assertEqual(os.path.join(self._score_deploy_path, 'test_func', 'test_func.py'), code.co_filename)
+
+    def test_save_and_load(self):
+        modules: dict = compile_score_package(self._score_deploy_path)
+        save_score_code(self._cache_path, self._score_deploy_path, self._tx_hash, modules)
+
+        self.assertEqual(modules, load_score_code(self._cache_path, self._score_deploy_path, self._tx_hash))
+        self.assertIsNone(load_score_code(self._cache_path, self._score_deploy_path, create_tx_hash()))
+        self.assertIsNone(load_score_code(f'{self._cache_path}.none', self._score_deploy_path, self._tx_hash))
+
+    def test_load_after_redeploy(self):
+        modules: dict = compile_score_package(self._score_deploy_path)
+        save_score_code(self._cache_path, self._score_deploy_path, self._tx_hash, modules)
+
+        # SCORE package is written again to the same path
+        rmtree(self._score_deploy_path)
+        shutil.copytree(os.path.join(TEST_ROOT_PATH, 'tests/sample/test_score01'), self._score_deploy_path)
+
+        self.assertIsNone(load_score_code(self._cache_path, self._score_deploy_path, self._tx_hash))
+
+    def test_load_broken_cache(self):
+        modules: dict = compile_score_package(self._score_deploy_path)
+        save_score_code(self._cache_path, self._score_deploy_path, self._tx_hash, modules)
+
+        with open(self._cache_path, 'rb') as f:
+            data: bytes = f.read()
+
+        for broken_data in (data[:-1], data[:10], b'XXXX' + data[4:], data[:100] + bytes([data[100] ^ 0xFF]) + data[101:]):
+            with open(self._cache_path, 'wb') as f:
+                f.write(broken_data)
+            self.assertIsNone(load_score_code(self._cache_path, self._score_deploy_path, self._tx_hash))
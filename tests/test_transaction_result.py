@@ -21,7 +21,11 @@ from iconservice.base.exception import ExceptionCode
 from iconservice.base.address import AddressPrefix
 from iconservice.base.block import Block
 from iconservice.base.transaction import Transaction
+from iconservice.base.type_converter import TypeConverter
+from iconservice.iconscore.icon_score_event_log import EventLog
 from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.utils import to_camel_case
+from iconservice.utils.bloom import BloomFilter
 from tests import create_block_hash, create_tx_hash, create_address
 
 
@@ -75,3 +79,34 @@ class TestTransactionResult(unittest.TestCase):
         print(d)
         print(hex(tx_result.failure.code))
 
+
+    def _create_tx_result(self, tx_index: int) -> 'TransactionResult':
+        tx = Transaction(create_tx_hash(), tx_index)
+        block = Block(block_height=100, block_hash=create_block_hash(), timestamp=0x1234567890,
+                      prev_hash=create_block_hash(), cumulative_fee=0)
+        score_address = create_address(AddressPrefix.CONTRACT)
+
+        tx_result = TransactionResult(tx=tx, block=block, to=score_address, step_used=tx_index * 1000,
+                                      step_price=10 ** 10, cumulative_step_used=tx_index * 2000,
+                                      status=TransactionResult.SUCCESS)
+        tx_result.event_logs = [
+            EventLog(score_address,
+                     ["Transfer(Address,Address,int,bytes)", create_address(), create_address(), tx_index],
+                     [b"data", "message", True, None])
+        ]
+        tx_result.logs_bloom = BloomFilter()
+        tx_result.logs_bloom.add(score_address.to_bytes())
+        tx_result.step_used_details = {score_address: 100, create_address(): tx_index}
+        return tx_result
+
+    def test_to_response(self):
+        tx_results = [self.tx_result] + [self._create_tx_result(i) for i in range(3)]
+        tx_results[1].status = TransactionResult.FAILURE
+        tx_results[1].failure = TransactionResult.Failure(code=ExceptionCode.SCORE_ERROR, message="Out of step")
+        tx_results[2].failure = TransactionResult.Failure(code=ExceptionCode.SCORE_ERROR, message="Not included")
+        tx_results[3].score_address = create_address(AddressPrefix.CONTRACT)
+
+        for tx_result in tx_results:
+            expected = TypeConverter.convert_type_reverse(tx_result.to_dict(to_camel_case))
+            self.assertEqual(expected, tx_result.to_response())
+            self.assertEqual(list(expected), list(tx_result.to_response()))
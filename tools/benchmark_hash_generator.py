@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports the throughput of transaction hash generation by the recursive and iterative serializers
+
+The recursive one deep-copies the data before serializing it as HashGenerator used to do.
+
+Run from the repository root:
+    python -m tools.benchmark_hash_generator [-txs 2000] [-repeat 3]
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from iconservice.base.type_converter import TypeConverter
+from iconservice.utils.hashing.hash_generator import HashGenerator
+from tests.hashing.test_hash_generator import RecursiveHashOriginGenerator, _create_transactions, _generate_hash
+
+
+def _measure(func: Callable[[dict], bytes], transactions: List[dict], repeat: int) -> Tuple[float, List[bytes]]:
+    elapsed = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        hashes: List[bytes] = [func(tx) for tx in transactions]
+        elapsed.append(time.perf_counter() - start)
+
+    return len(transactions) / min(elapsed), hashes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transaction hash generation throughput by serializer")
+    parser.add_argument("-txs", type=int, default=2000, help="number of transactions")
+    parser.add_argument("-repeat", type=int, default=3, help="the best of this number of runs is reported")
+    args = parser.parse_args()
+
+    random.seed(0)
+    transactions: List[dict] = _create_transactions(args.txs)
+    generator = RecursiveHashOriginGenerator()
+
+    cases = [
+        ("recursive",
+         lambda tx: _generate_hash(generator.generate(copy.deepcopy(tx))),
+         lambda tx: HashGenerator.generate_hash(tx)),
+        # Base transaction: python typed values are converted to strings while serializing
+        ("recursive with convert_type_reverse",
+         lambda tx: _generate_hash(generator.generate(TypeConverter.convert_type_reverse(copy.deepcopy(tx)))),
+         lambda tx: HashGenerator.generate_hash(tx, TypeConverter.convert_value_reverse)),
+    ]
+
+    for name, recursive, iterative in cases:
+        recursive_tps, expected = _measure(recursive, transactions, args.repeat)
+        iterative_tps, actual = _measure(iterative, transactions, args.repeat)
+        if actual != expected:
+            print(f"{name}: hash mismatch")
+            sys.exit(1)
+
+        print(f"{name}: {recursive_tps:.0f} tx/s, iterative: {iterative_tps:.0f} tx/s "
+              f"({iterative_tps / recursive_tps:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports the cumulative import time of iconservice modules measured with python -X importtime
+
+Each statement is run in a new interpreter and the minimum of the runs is reported.
+
+Run from the repository root with python 3.7 or later:
+    python -m tools.benchmark_import_time [-repeat 5] [-top 5]
+"""
+
+import argparse
+import sys
+from typing import Dict, List
+
+from tests.test_import_time import HEAVY_MODULES, LIGHT_IMPORTS, _import_times
+
+# The whole SCORE runtime for comparison
+FULL_IMPORTS = (
+    ("import iconservice.iconscore.icon_score_base", "iconservice.iconscore.icon_score_base"),
+    ("import iconservice.icon_service_engine", "iconservice.icon_service_engine"),
+)
+
+
+def _min_import_times(statement: str, repeat: int) -> Dict[str, int]:
+    runs: List[Dict[str, int]] = [_import_times(statement) for _ in range(repeat)]
+    return {name: min(run[name] for run in runs if name in run) for name in runs[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cumulative import time of iconservice modules")
+    parser.add_argument("-repeat", type=int, default=5, help="the minimum of this number of runs is reported")
+    parser.add_argument("-top", type=int, default=5, help="number of the slowest modules to report")
+    args = parser.parse_args()
+
+    if sys.version_info < (3, 7):
+        print("-X importtime is supported since python 3.7")
+        sys.exit(1)
+
+    for statement, module in LIGHT_IMPORTS + FULL_IMPORTS:
+        import_times: Dict[str, int] = _min_import_times(statement, args.repeat)
+        heavy_modules: List[str] = [name for name in HEAVY_MODULES if name in import_times]
+
+        print(f"{statement}: {module}={import_times[module] / 1000:.1f}ms "
+              f"modules={len(import_times)} heavy_modules={heavy_modules}")
+        slowest = sorted(import_times.items(), key=lambda item: item[1], reverse=True)
+        for name, cumulative in slowest[:args.top]:
+            print(f"    {cumulative / 1000:8.1f}ms {name}")
+
+
+if __name__ == "__main__":
+    main()
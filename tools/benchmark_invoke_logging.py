@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports the latency of IconScoreInnerTask._invoke() by log level
+
+Only a bounded summary of the block is formatted at INFO, and nothing is formatted at WARNING.
+
+Run from the repository root:
+    python -m tools.benchmark_invoke_logging [-txs 5000] [-repeat 3]
+"""
+
+import argparse
+import logging
+import sys
+import time
+import unittest
+from typing import Dict
+
+from tests.test_lazy_logger import TestInvokeLogging, _set_level
+
+
+class BenchmarkInvokeLogging(TestInvokeLogging):
+    REPEAT = 3
+    # {level name: the minimum latency in seconds}
+    report: Dict[str, float] = {}
+
+    def _measure(self, level: int) -> float:
+        _set_level(level)
+
+        elapsed = []
+        for _ in range(self.REPEAT):
+            start: float = time.perf_counter()
+            response = self.inner_task._invoke(self.request)
+            elapsed.append(time.perf_counter() - start)
+            self.assertEqual(self.TX_COUNT, len(response["txResults"]))
+
+        return min(elapsed)
+
+    def test_invoke_latency_by_log_level(self):
+        for level in (logging.DEBUG, logging.INFO, logging.WARNING):
+            self.report[logging.getLevelName(level)] = self._measure(level)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IconScoreInnerTask._invoke() latency by log level")
+    parser.add_argument("-txs", type=int, default=5000, help="number of transactions in a block")
+    parser.add_argument("-repeat", type=int, default=BenchmarkInvokeLogging.REPEAT,
+                        help="the minimum of this number of runs is reported")
+    args = parser.parse_args()
+
+    BenchmarkInvokeLogging.TX_COUNT = args.txs
+    BenchmarkInvokeLogging.REPEAT = args.repeat
+
+    result = unittest.TextTestRunner().run(
+        unittest.TestSuite([BenchmarkInvokeLogging("test_invoke_latency_by_log_level")]))
+    if not result.wasSuccessful():
+        sys.exit(1)
+
+    for name, latency in BenchmarkInvokeLogging.report.items():
+        print(f"_invoke() with {args.txs} txs at {name}: {latency * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports the throughput of IISS transactions with the stand-in reward calculator
+
+Run from the repository root:
+    python -m tools.benchmark_stand_in_reward_calc [-accounts 50] [-latency 0.0002]
+"""
+
+import argparse
+import sys
+import time
+import unittest
+from typing import TYPE_CHECKING, Dict, List
+
+from tests.integrate_test.iiss.test_iiss_stand_in_reward_calc import TestIISSStandInRewardCalc
+
+if TYPE_CHECKING:
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class BenchmarkStandInRewardCalc(TestIISSStandInRewardCalc):
+    # {name: count per second}
+    report: Dict[str, float] = {}
+
+    def _process_txs(self, name: str, tx_list: List[dict]) -> List['TransactionResult']:
+        start: float = time.perf_counter()
+        tx_results: List['TransactionResult'] = super()._process_txs(name, tx_list)
+        self.report[name] = len(tx_list) / (time.perf_counter() - start)
+        return tx_results
+
+    def _query_iscore_batch(self, accounts: list) -> list:
+        start: float = time.perf_counter()
+        response: list = super()._query_iscore_batch(accounts)
+        self.report["queryIScoreBatch (addresses)"] = len(accounts) / (time.perf_counter() - start)
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IISS transaction throughput with the stand-in reward calculator")
+    parser.add_argument("-accounts", type=int, default=TestIISSStandInRewardCalc.ACCOUNT_COUNT,
+                        help="number of accounts which send each transaction")
+    parser.add_argument("-latency", type=float, default=TestIISSStandInRewardCalc.LATENCY,
+                        help="seconds for the reward calculator to handle a message")
+    args = parser.parse_args()
+
+    BenchmarkStandInRewardCalc.ACCOUNT_COUNT = args.accounts
+    BenchmarkStandInRewardCalc.LATENCY = args.latency
+
+    result = unittest.TextTestRunner().run(unittest.TestSuite([BenchmarkStandInRewardCalc("test_iiss_txs")]))
+    if not result.wasSuccessful():
+        sys.exit(1)
+
+    for name, count_per_sec in BenchmarkStandInRewardCalc.report.items():
+        print(f"{name}: {count_per_sec:.0f}/sec")
+
+
+if __name__ == "__main__":
+    main()
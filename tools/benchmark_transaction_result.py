@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reports the time to serialize transaction results for the invoke response
+
+to_dict() followed by TypeConverter.convert_type_reverse() is compared with to_response().
+
+Run from the repository root:
+    python -m tools.benchmark_transaction_result [-txs 5000] [-repeat 3]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import unittest
+from typing import Callable, Dict, List
+
+from iconservice.base.type_converter import TypeConverter
+from iconservice.iconscore.icon_score_result import TransactionResult
+from iconservice.utils import to_camel_case
+from tests.test_transaction_result import TestTransactionResult
+
+
+class BenchmarkTransactionResult(TestTransactionResult):
+    TX_COUNT = 5000
+    REPEAT = 3
+    # {name: the minimum elapsed time in seconds}
+    report: Dict[str, float] = {}
+
+    def _measure(self, name: str, func: Callable[[List['TransactionResult']], list],
+                 tx_results: List['TransactionResult']) -> list:
+        # Same as timeit, not to count the garbage collection of the responses made before
+        gc.collect()
+        gc.disable()
+        try:
+            start: float = time.perf_counter()
+            response: list = func(tx_results)
+            elapsed: float = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+        self.report[name] = min(self.report.get(name, elapsed), elapsed)
+        return response
+
+    def test_to_response_latency(self):
+        tx_results: List['TransactionResult'] = [self._create_tx_result(i) for i in range(self.TX_COUNT)]
+
+        # Run them by turns not to favor either of them
+        for _ in range(self.REPEAT):
+            expected: list = self._measure(
+                "to_dict+convert",
+                lambda results: TypeConverter.convert_type_reverse(
+                    [result.to_dict(to_camel_case) for result in results]),
+                tx_results)
+            actual: list = self._measure(
+                "to_response",
+                lambda results: [result.to_response() for result in results],
+                tx_results)
+
+            self.assertEqual(expected, actual)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transaction result serialization latency")
+    parser.add_argument("-txs", type=int, default=BenchmarkTransactionResult.TX_COUNT,
+                        help="number of transaction results")
+    parser.add_argument("-repeat", type=int, default=BenchmarkTransactionResult.REPEAT,
+                        help="the minimum of this number of runs is reported")
+    args = parser.parse_args()
+
+    BenchmarkTransactionResult.TX_COUNT = args.txs
+    BenchmarkTransactionResult.REPEAT = args.repeat
+
+    result = unittest.TextTestRunner().run(
+        unittest.TestSuite([BenchmarkTransactionResult("test_to_response_latency")]))
+    if not result.wasSuccessful():
+        sys.exit(1)
+
+    for name, elapsed in BenchmarkTransactionResult.report.items():
+        print(f"{args.txs} tx results with {name}: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()